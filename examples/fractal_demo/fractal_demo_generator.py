@@ -22,14 +22,18 @@ Usage:
     python fractal_demo_generator.py --zoom-target phi_squared   # Focus on Φ² regions
     python fractal_demo_generator.py --fractal-type julia        # Generate Julia animations
     python fractal_demo_generator.py --fractal-type both         # Generate both types
+    python fractal_demo_generator.py --frames 300 --workers 8    # Long parallel zoom
+    python fractal_demo_generator.py --format apng               # Animated PNG output
 
 Requirements:
-    pip install pillow numpy imageio
+    pip install pillow numpy
 
 Features:
     - Deterministic color palettes from seeds
     - HD static images (1920x1080)
-    - Smooth zoom animations with Phi-focused targets
+    - Smooth zoom animations with Phi-focused targets, rendered in parallel
+      and streamed to GIF/APNG frame by frame (see zoom_pipeline.py)
+    - Perturbation rendering for deep zooms beyond float64 precision
     - Multiple zoom targets: phi, phi_squared, phi_conjugate, golden_spiral
     - Mandelbrot and Julia set animations
     - Golden Ratio mathematical demonstrations (Φ, Φ², 1/Φ)
@@ -49,13 +53,6 @@ except ImportError:
     print("Please run: pip install pillow numpy")
     sys.exit(1)
 
-# Optional: imageio for animations
-try:
-    import imageio
-    HAS_IMAGEIO = True
-except ImportError:
-    HAS_IMAGEIO = False
-
 # Import GoldenSeed
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 from gq import UniversalQKD
@@ -140,6 +137,95 @@ ZOOM_TARGETS = {
 }
 
 
+def escape_time(z, c, max_iter=256, skip_interior=False):
+    """
+    Count escape-time iterations of z -> z² + c over an array of points.
+
+    Only points that have not escaped are iterated: escaped points are
+    parked at the fixed point 0 and dropped from the active set once a
+    quarter of it has escaped, and the bailout test uses the squared
+    magnitude (|z|² > 4) instead of np.abs().
+
+    Args:
+        z: Complex array of starting values
+        c: Complex array (Mandelbrot) or scalar (Julia) constant
+        max_iter: Maximum iterations
+        skip_interior: Assign max_iter - 1 to points in the Mandelbrot
+            main cardioid and period-2 bulb without iterating them
+
+    Returns:
+        Integer array shaped like z: the last iteration before escape
+        (max_iter - 1 for points that never escape)
+    """
+    shape = np.shape(z)
+    zr = np.real(z).astype(np.float64).ravel()
+    zi = np.imag(z).astype(np.float64).ravel()
+    cr = np.broadcast_to(np.real(c), shape).astype(np.float64).ravel()
+    ci = np.broadcast_to(np.imag(c), shape).astype(np.float64).ravel()
+
+    counts = np.full(zr.size, max_iter - 1, dtype=np.int64)
+    active = np.arange(zr.size)
+
+    if skip_interior:
+        # Main cardioid: q(q + x - 1/4) <= y²/4; period-2 bulb: (x + 1)² + y² <= 1/16
+        q = (cr - 0.25) ** 2 + ci * ci
+        inside = (q * (q + (cr - 0.25)) <= 0.25 * ci * ci) | ((cr + 1.0) ** 2 + ci * ci <= 0.0625)
+        keep = ~inside
+        zr, zi, cr, ci, active = zr[keep], zi[keep], cr[keep], ci[keep], active[keep]
+
+    parked = np.zeros(active.size, dtype=bool)
+    zr2 = np.empty_like(zr)
+    zi2 = np.empty_like(zi)
+    magnitude = np.empty_like(zr)
+    escaped = np.empty(zr.size, dtype=bool)
+    for i in range(max_iter):
+        # Reuse buffers: the loop body allocates nothing until a compaction
+        np.multiply(zr, zr, out=zr2)
+        np.multiply(zi, zi, out=zi2)
+        np.add(zr2, zi2, out=magnitude)
+        np.greater(magnitude, 4.0, out=escaped)
+        if escaped.any():
+            counts[active[escaped]] = max(i - 1, 0)
+            parked |= escaped
+            if np.count_nonzero(parked) * 4 > parked.size:
+                # Compact once enough points have escaped to pay for the copy
+                keep = ~parked
+                zr, zi, cr, ci, active = zr[keep], zi[keep], cr[keep], ci[keep], active[keep]
+                zr2 = zr2[keep]
+                zi2 = zi2[keep]
+                magnitude = magnitude[keep]
+                escaped = escaped[keep]
+                parked = np.zeros(active.size, dtype=bool)
+                if not active.size:
+                    break
+            else:
+                # Park escaped points at the fixed point z = c = 0 until then
+                for values in (zr, zi, cr, ci, zr2, zi2):
+                    values[escaped] = 0.0
+        zi *= zr
+        zi *= 2.0
+        zi += ci
+        np.subtract(zr2, zi2, out=zr)
+        zr += cr
+
+    return counts.reshape(shape)
+
+
+def colorize(fractal_data, palette):
+    """
+    Map iteration counts to RGB with one palette lookup.
+
+    Args:
+        fractal_data: 2D array of iteration counts
+        palette: Sequence of RGB tuples or (n, 3) array
+
+    Returns:
+        (height, width, 3) uint8 image array
+    """
+    palette = np.asarray(palette, dtype=np.uint8)
+    return palette[fractal_data % len(palette)]
+
+
 class FractalGenerator:
     """Generate deterministic fractals using GoldenSeed entropy."""
     
@@ -193,16 +279,8 @@ class FractalGenerator:
         y = np.linspace(y_min, y_max, height)
         X, Y = np.meshgrid(x, y)
         C = X + 1j * Y
-        
-        Z = np.zeros_like(C)
-        M = np.zeros(C.shape, dtype=int)
-        
-        for i in range(max_iter):
-            mask = np.abs(Z) <= 2
-            Z[mask] = Z[mask]**2 + C[mask]
-            M[mask] = i
-        
-        return M
+
+        return escape_time(np.zeros_like(C), C, max_iter, skip_interior=True)
     
     def julia(self, width, height, c_real=-0.4, c_imag=0.6,
               x_min=-1.5, x_max=1.5, y_min=-1.5, y_max=1.5, max_iter=256):
@@ -222,16 +300,8 @@ class FractalGenerator:
         y = np.linspace(y_min, y_max, height)
         X, Y = np.meshgrid(x, y)
         Z = X + 1j * Y
-        
-        c = complex(c_real, c_imag)
-        M = np.zeros(Z.shape, dtype=int)
-        
-        for i in range(max_iter):
-            mask = np.abs(Z) <= 2
-            Z[mask] = Z[mask]**2 + c
-            M[mask] = i
-        
-        return M
+
+        return escape_time(Z, complex(c_real, c_imag), max_iter)
     
     def apply_color_palette(self, fractal_data, palette):
         """
@@ -244,18 +314,7 @@ class FractalGenerator:
         Returns:
             PIL Image
         """
-        height, width = fractal_data.shape
-        img = Image.new('RGB', (width, height))
-        pixels = img.load()
-        
-        max_val = len(palette) - 1
-        
-        for y in range(height):
-            for x in range(width):
-                color_idx = fractal_data[y, x] % len(palette)
-                pixels[x, y] = palette[color_idx]
-        
-        return img
+        return Image.fromarray(colorize(fractal_data, palette), 'RGB')
     
     def generate_static_mandelbrot(self, output_path, width=1920, height=1080):
         """Generate static Mandelbrot fractal image."""
@@ -294,110 +353,59 @@ class FractalGenerator:
         print(f"  ✓ Saved: {output_path}")
     
     def generate_zoom_animation(self, output_path, fractal_type='mandelbrot',
-                                frames=30, width=1920, height=1080, zoom_target='phi'):
+                                frames=30, width=1920, height=1080, zoom_target='phi',
+                                workers=None, max_iter=256):
         """
-        Generate zoom animation as GIF focusing on mathematically significant regions.
-        
+        Generate zoom animation focusing on mathematically significant regions.
+
+        Frames are rendered in a process pool and streamed to the output
+        file in order, so memory use does not grow with the frame count.
+
         Args:
-            output_path: Output file path (.gif)
+            output_path: Output file path (.gif, .png or .apng)
             fractal_type: 'mandelbrot' or 'julia'
             frames: Number of frames
-            width, height: Frame dimensions
+            width, height: Frame dimensions (frames are rendered at half size)
             zoom_target: Zoom target configuration ('phi', 'default', 'golden_spiral')
                         'phi' - focuses on Golden Ratio related regions
                         'golden_spiral' - emphasizes golden angle and spiral patterns
                         'default' - classic interesting regions
+            workers: Worker processes (default: all cores)
+            max_iter: Maximum iterations per pixel
         """
-        if not HAS_IMAGEIO:
-            print("  ⚠ Skipping animation: imageio not installed")
-            print("  Install with: pip install imageio")
-            return
-        
+        from zoom_pipeline import frame_specs, open_writer, render_frames
+
         # Get zoom configuration
         if zoom_target not in ZOOM_TARGETS:
             print(f"  ⚠ Unknown zoom target '{zoom_target}', using 'phi'")
             zoom_target = 'phi'
-        
+
         config = ZOOM_TARGETS[zoom_target][fractal_type]
-        
+
         print(f"Generating {fractal_type} zoom animation ({frames} frames)...")
         print(f"  Target: {zoom_target} - {config['description']}")
-        
-        # Generate color palette
+        if fractal_type == 'julia':
+            print(f"  Julia parameter c = {config.get('c_real', -0.4):.4f} + "
+                  f"{config.get('c_imag', 0.6):.4f}i")
+
+        # Generate color palette once for every frame
         palette = self.get_color_palette()
-        
-        # Generate frames with zoom
-        images = []
-        
-        if fractal_type == 'mandelbrot':
-            # Zoom into Phi-related or other interesting region
-            center_x, center_y = config['center']
-            zoom_factor = config['zoom_factor']
-            
-            for i in range(frames):
-                zoom = zoom_factor ** i
-                # Use aspect-ratio-aware spans for proper rendering
-                span_x = 3.5 / zoom
-                span_y = 2.0 / zoom
-                
-                x_min = center_x - span_x / 2
-                x_max = center_x + span_x / 2
-                y_min = center_y - span_y / 2
-                y_max = center_y + span_y / 2
-                
-                # Use lower resolution for animation to keep file size reasonable
-                frame_width = width // 2
-                frame_height = height // 2
-                
-                fractal_data = self.mandelbrot(
-                    frame_width, frame_height, x_min, x_max, y_min, y_max
-                )
-                img = self.apply_color_palette(fractal_data, palette)
-                images.append(np.array(img))
-                
-                if (i + 1) % 10 == 0:
-                    print(f"  Frame {i + 1}/{frames} (zoom: {zoom:.2f}x)")
-        
-        else:  # julia
-            # Use Phi-related Julia parameters if specified
-            c_real = config.get('c_real', -0.4)
-            c_imag = config.get('c_imag', 0.6)
-            center_x, center_y = config['center']
-            zoom_factor = config['zoom_factor']
-            
-            print(f"  Julia parameter c = {c_real:.4f} + {c_imag:.4f}i")
-            
-            for i in range(frames):
-                zoom = zoom_factor ** i
-                span = 3.0 / zoom
-                
-                x_min = center_x - span / 2
-                x_max = center_x + span / 2
-                y_min = center_y - span / 2
-                y_max = center_y + span / 2
-                
-                # Use lower resolution for animation
-                frame_width = width // 2
-                frame_height = height // 2
-                
-                fractal_data = self.julia(
-                    frame_width, frame_height, 
-                    c_real=c_real, c_imag=c_imag,
-                    x_min=x_min, x_max=x_max, 
-                    y_min=y_min, y_max=y_max
-                )
-                img = self.apply_color_palette(fractal_data, palette)
-                images.append(np.array(img))
-                
-                if (i + 1) % 10 == 0:
-                    print(f"  Frame {i + 1}/{frames} (zoom: {zoom:.2f}x)")
-        
-        # Save as GIF
-        imageio.mimsave(output_path, images, duration=0.1, loop=0)
+
+        # Use lower resolution for animation to keep file size reasonable
+        frame_width = width // 2
+        frame_height = height // 2
+        specs = frame_specs(fractal_type, config, frames, frame_width, frame_height, max_iter)
+
+        with open_writer(output_path, frame_width, frame_height, palette, frames,
+                         duration_ms=100, loop=0) as writer:
+            for spec, indices in render_frames(specs, len(palette), workers):
+                writer.append(indices)
+                if (spec['index'] + 1) % 10 == 0:
+                    print(f"  Frame {spec['index'] + 1}/{frames} (zoom: {spec['zoom']:.2f}x)")
+
         print(f"  ✓ Saved: {output_path}")
         print(f"  Mathematical significance: {config['description']}")
 
-
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -425,7 +433,7 @@ Zoom Targets:
     parser.add_argument('--static-only', action='store_true',
                        help='Generate only static images')
     parser.add_argument('--animated-only', action='store_true',
-                       help='Generate only animations (requires imageio)')
+                       help='Generate only animations')
     parser.add_argument('--seed', type=int, default=0,
                        help='Seed offset for color generation (default: 0)')
     parser.add_argument('--output-dir', type=str, default='outputs',
@@ -436,6 +444,14 @@ Zoom Targets:
     parser.add_argument('--fractal-type', type=str, default='mandelbrot',
                        choices=['mandelbrot', 'julia', 'both'],
                        help='Type of fractal animation to generate (default: mandelbrot)')
+    parser.add_argument('--frames', type=int, default=30,
+                       help='Number of animation frames (default: 30)')
+    parser.add_argument('--workers', type=int, default=None,
+                       help='Worker processes for animation frames (default: all cores)')
+    parser.add_argument('--max-iter', type=int, default=256,
+                       help='Maximum iterations per pixel in animations (default: 256)')
+    parser.add_argument('--format', type=str, default='gif', choices=['gif', 'apng'],
+                       help='Animation format (default: gif)')
     
     args = parser.parse_args()
     
@@ -478,31 +494,32 @@ Zoom Targets:
         print("Generating animations...")
         print("-" * 70)
         
-        if not HAS_IMAGEIO:
-            print("⚠ Warning: imageio not installed, skipping animations")
-            print("Install with: pip install imageio")
-        else:
-            # Determine which fractal types to generate
-            generate_mandelbrot = args.fractal_type in ['mandelbrot', 'both']
-            generate_julia_anim = args.fractal_type in ['julia', 'both']
-            
-            if generate_mandelbrot:
-                generator.generate_zoom_animation(
-                    output_dir / f"mandelbrot_zoom_{args.zoom_target}_seed{args.seed}.gif",
-                    fractal_type='mandelbrot',
-                    frames=30,
-                    zoom_target=args.zoom_target
-                )
-                print()
-            
-            if generate_julia_anim:
-                generator.generate_zoom_animation(
-                    output_dir / f"julia_zoom_{args.zoom_target}_seed{args.seed}.gif",
-                    fractal_type='julia',
-                    frames=30,
-                    zoom_target=args.zoom_target
-                )
-                print()
+        # Determine which fractal types to generate
+        generate_mandelbrot = args.fractal_type in ['mandelbrot', 'both']
+        generate_julia_anim = args.fractal_type in ['julia', 'both']
+        extension = 'png' if args.format == 'apng' else 'gif'
+
+        if generate_mandelbrot:
+            generator.generate_zoom_animation(
+                output_dir / f"mandelbrot_zoom_{args.zoom_target}_seed{args.seed}.{extension}",
+                fractal_type='mandelbrot',
+                frames=args.frames,
+                zoom_target=args.zoom_target,
+                workers=args.workers,
+                max_iter=args.max_iter
+            )
+            print()
+
+        if generate_julia_anim:
+            generator.generate_zoom_animation(
+                output_dir / f"julia_zoom_{args.zoom_target}_seed{args.seed}.{extension}",
+                fractal_type='julia',
+                frames=args.frames,
+                zoom_target=args.zoom_target,
+                workers=args.workers,
+                max_iter=args.max_iter
+            )
+            print()
     
     print("=" * 70)
     print("✓ Generation complete!")
@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+"""
+Frame-Parallel Zoom Animation Pipeline for the Fractal Demo
+
+Renders zoom frames in a process pool and streams them to disk in order,
+so memory stays flat however many frames an animation has:
+
+- Frames are described by small picklable specs and rendered by worker
+  processes; results are consumed strictly in frame order with a bounded
+  number of frames in flight
+- Workers return palette indices (M % n, one byte per pixel) and the
+  writers store them as indexed-colour frames, so the seed palette is
+  computed once and never re-applied per pixel
+- GifStreamWriter and ApngStreamWriter append one frame at a time
+  (imageio.mimsave keeps every frame in memory until it is closed)
+
+Deep Zoom:
+- Once the pixel spacing nears float64 resolution, frames switch to
+  perturbation: one reference orbit at the frame centre is computed with
+  Python's decimal module, and every pixel iterates only its float64
+  offset from it, δ' = 2·Z·δ + δ² + δc
+- Glitches are avoided by rebasing (δ ← Z + δ, restart the reference)
+  when a pixel's orbit gets closer to zero than to the reference, so a
+  single reference orbit serves the whole frame
+
+⚠️ NOT FOR CRYPTOGRAPHY: This is for procedural generation demonstrations only.
+"""
+
+import io
+import math
+import os
+import struct
+import zlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal, localcontext
+
+import numpy as np
+
+from fractal_demo_generator import escape_time
+
+
+# Pixel spacing (relative to the centre's magnitude) below which frames are
+# rendered with perturbation instead of direct float64 iteration
+DEEP_ZOOM_SPACING = 1e-13
+
+# Extra decimal digits carried by the reference orbit
+REFERENCE_GUARD_DIGITS = 20
+
+
+def frame_specs(fractal_type, config, frames, width, height, max_iter=256):
+    """
+    Describe every frame of a zoom animation.
+
+    Args:
+        fractal_type: 'mandelbrot' or 'julia'
+        config: Zoom target configuration (center, zoom_factor, and c_real,
+            c_imag for Julia sets)
+        frames: Number of frames
+        width, height: Frame dimensions
+        max_iter: Maximum iterations per pixel
+
+    Returns:
+        List of picklable frame specs, in frame order
+    """
+    center_x, center_y = config['center']
+    zoom_factor = config['zoom_factor']
+    if fractal_type == 'mandelbrot':
+        c = None
+        base_span_x, base_span_y = 3.5, 2.0
+    else:
+        c = (config.get('c_real', -0.4), config.get('c_imag', 0.6))
+        base_span_x = base_span_y = 3.0
+
+    specs = []
+    for i in range(frames):
+        zoom = zoom_factor ** i
+        specs.append({
+            'index': i,
+            'zoom': zoom,
+            'center': (center_x, center_y),
+            'span': (base_span_x / zoom, base_span_y / zoom),
+            'size': (width, height),
+            'c': c,
+            'max_iter': max_iter,
+        })
+    return specs
+
+
+def _pixel_offsets(span, size):
+    """Offsets of pixel centres from the frame centre, matching np.linspace."""
+    (span_x, span_y), (width, height) = span, size
+    dx = np.linspace(-span_x / 2, span_x / 2, width)
+    dy = np.linspace(-span_y / 2, span_y / 2, height)
+    return np.meshgrid(dx, dy)
+
+
+def _reference_orbit(z0, c, max_iter, spacing):
+    """Iterate z -> z² + c at high precision; return the orbit as complex128."""
+    digits = max(17, int(-math.log10(spacing)) + REFERENCE_GUARD_DIGITS)
+    with localcontext() as ctx:
+        ctx.prec = digits
+        zr, zi = Decimal(z0[0]), Decimal(z0[1])
+        cr, ci = Decimal(c[0]), Decimal(c[1])
+        orbit = [complex(float(zr), float(zi))]
+        for _ in range(max_iter):
+            zr, zi = zr * zr - zi * zi + cr, 2 * zr * zi + ci
+            value = complex(float(zr), float(zi))
+            orbit.append(value)
+            if value.real * value.real + value.imag * value.imag > 4.0:
+                break
+    return np.array(orbit)
+
+
+def perturbation_escape_time(z0, c, dz, dc, max_iter=256):
+    """
+    Escape-time counts from a high-precision reference and float64 offsets.
+
+    Args:
+        z0: Reference starting point (x, y) as floats
+        c: Reference constant (x, y) as floats
+        dz: Complex array of starting offsets from z0
+        dc: Complex array (or scalar) of offsets from c
+        max_iter: Maximum iterations
+
+    Returns:
+        Integer array shaped like dz, using the same convention as
+        escape_time()
+    """
+    shape = np.shape(dz)
+    spacing = max(float(np.abs(dz).max()), float(np.abs(dc).max()), 1e-300)
+    orbit = _reference_orbit(z0, c, max_iter, spacing)
+    last = len(orbit) - 1
+
+    delta = np.asarray(dz, dtype=np.complex128).ravel().copy()
+    dc = np.broadcast_to(np.asarray(dc, dtype=np.complex128), shape).ravel().copy()
+    counts = np.full(delta.size, max_iter - 1, dtype=np.int64)
+    active = np.arange(delta.size)
+    ref = np.zeros(delta.size, dtype=np.int64)
+
+    for i in range(max_iter):
+        z = orbit[ref] + delta
+        magnitude = z.real * z.real + z.imag * z.imag
+        escaped = magnitude > 4.0
+        if escaped.any():
+            counts[active[escaped]] = max(i - 1, 0)
+            keep = ~escaped
+            delta, dc, active, ref, z, magnitude = (
+                delta[keep], dc[keep], active[keep], ref[keep], z[keep], magnitude[keep])
+            if not active.size:
+                break
+
+        # Rebase onto the start of the reference when the full orbit is
+        # closer to zero than to the reference, or the reference ran out
+        rebase = (magnitude < delta.real * delta.real + delta.imag * delta.imag) | (ref == last)
+        if rebase.any():
+            delta[rebase] = z[rebase] - orbit[0]
+            ref[rebase] = 0
+
+        reference = orbit[ref]
+        delta = (2.0 * reference + delta) * delta + dc
+        ref += 1
+
+    return counts.reshape(shape)
+
+
+def render_frame(spec, palette_size):
+    """
+    Render one frame to palette indices (worker side).
+
+    Args:
+        spec: Frame spec from frame_specs()
+        palette_size: Number of palette entries
+
+    Returns:
+        (height, width) uint8 array of palette indices
+    """
+    center_x, center_y = spec['center']
+    (width, height), max_iter = spec['size'], spec['max_iter']
+    dx, dy = _pixel_offsets(spec['span'], spec['size'])
+    spacing = spec['span'][0] / max(width - 1, 1)
+    deep = spacing < DEEP_ZOOM_SPACING * max(1.0, math.hypot(center_x, center_y))
+
+    if spec['c'] is None:
+        if deep:
+            counts = perturbation_escape_time((0.0, 0.0), (center_x, center_y),
+                                              np.zeros(dx.shape, dtype=np.complex128),
+                                              dx + 1j * dy, max_iter)
+        else:
+            C = (center_x + dx) + 1j * (center_y + dy)
+            counts = escape_time(np.zeros_like(C), C, max_iter, skip_interior=True)
+    else:
+        if deep:
+            counts = perturbation_escape_time((center_x, center_y), spec['c'],
+                                              dx + 1j * dy, 0.0, max_iter)
+        else:
+            Z = (center_x + dx) + 1j * (center_y + dy)
+            counts = escape_time(Z, complex(*spec['c']), max_iter)
+
+    return (counts % palette_size).astype(np.uint8)
+
+
+def render_frames(specs, palette_size, workers=None):
+    """
+    Render frames in a process pool and yield them in frame order.
+
+    At most two frames per worker are in flight, so finished frames never
+    pile up ahead of a slow writer.
+
+    Args:
+        specs: Frame specs from frame_specs()
+        palette_size: Number of palette entries
+        workers: Worker processes (default: os.cpu_count(); 1 renders in
+            this process)
+
+    Yields:
+        (spec, indices) pairs in frame order
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        for spec in specs:
+            yield spec, render_frame(spec, palette_size)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        remaining = iter(specs)
+        for spec in remaining:
+            pending.append((spec, executor.submit(render_frame, spec, palette_size)))
+            if len(pending) >= 2 * workers:
+                break
+        while pending:
+            spec, future = pending.popleft()
+            indices = future.result()
+            for next_spec in remaining:
+                pending.append((next_spec, executor.submit(render_frame, next_spec, palette_size)))
+                break
+            yield spec, indices
+
+
+def _palette_bytes(palette):
+    """Pad an (n, 3) palette to 256 entries and return the RGB bytes."""
+    palette = np.asarray(palette, dtype=np.uint8).reshape(-1, 3)
+    if len(palette) > 256:
+        raise ValueError(f"Indexed frames support at most 256 colours, got {len(palette)}")
+    padded = np.zeros((256, 3), dtype=np.uint8)
+    padded[:len(palette)] = palette
+    return padded.tobytes()
+
+
+class ApngStreamWriter:
+    """Write indexed-colour frames to an animated PNG one frame at a time."""
+
+    def __init__(self, path, width, height, palette, frames, duration_ms=100, loop=0):
+        """
+        Open the file and write the PNG header.
+
+        Args:
+            path: Output file path (.png or .apng)
+            width, height: Frame dimensions
+            palette: Sequence of RGB tuples (at most 256)
+            frames: Number of frames that will be written
+            duration_ms: Display time per frame in milliseconds
+            loop: Number of loops (0: forever)
+        """
+        self.width = width
+        self.height = height
+        self.frames = frames
+        self.duration_ms = int(duration_ms)
+        self.loop = loop
+        self._written = 0
+        self._sequence = 0
+        self._file = open(path, 'wb')
+        self._file.write(b'\x89PNG\r\n\x1a\n')
+        self._chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 3, 0, 0, 0))
+        self._chunk(b'PLTE', _palette_bytes(palette))
+        self._actl_offset = self._file.tell()
+        self._chunk(b'acTL', struct.pack('>II', frames, loop))
+
+    def _chunk(self, kind, data):
+        self._file.write(struct.pack('>I', len(data)) + kind + data)
+        self._file.write(struct.pack('>I', zlib.crc32(kind + data) & 0xFFFFFFFF))
+
+    def append(self, indices):
+        """
+        Append one frame.
+
+        Args:
+            indices: (height, width) uint8 array of palette indices
+        """
+        if indices.shape != (self.height, self.width):
+            raise ValueError(f"Frame shape {indices.shape} does not match "
+                             f"{(self.height, self.width)}")
+        # Filter type 0 (None) before every row
+        rows = np.zeros((self.height, self.width + 1), dtype=np.uint8)
+        rows[:, 1:] = indices
+        data = zlib.compress(rows.tobytes(), 6)
+
+        self._chunk(b'fcTL', struct.pack('>IIIIIHHBB', self._sequence, self.width,
+                                         self.height, 0, 0, self.duration_ms, 1000, 0, 0))
+        self._sequence += 1
+        if self._written == 0:
+            self._chunk(b'IDAT', data)
+        else:
+            self._chunk(b'fdAT', struct.pack('>I', self._sequence) + data)
+            self._sequence += 1
+        self._written += 1
+
+    def close(self):
+        """Write the trailer, fixing the frame count if fewer were written."""
+        if self._file.closed:
+            return
+        self._chunk(b'IEND', b'')
+        if self._written != self.frames:
+            self._file.seek(self._actl_offset)
+            self._chunk(b'acTL', struct.pack('>II', self._written, self.loop))
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class GifStreamWriter:
+    """Write indexed-colour frames to an animated GIF one frame at a time."""
+
+    def __init__(self, path, width, height, palette, duration_ms=100, loop=0):
+        """
+        Open the file and write the GIF header and global palette.
+
+        Args:
+            path: Output file path (.gif)
+            width, height: Frame dimensions
+            palette: Sequence of RGB tuples (at most 256)
+            duration_ms: Display time per frame in milliseconds
+            loop: Number of loops (0: forever)
+        """
+        from PIL import Image
+        self._image_module = Image
+        self.width = width
+        self.height = height
+        self._palette = _palette_bytes(palette)
+        self._delay = max(1, round(duration_ms / 10))
+        self._file = open(path, 'wb')
+        self._file.write(b'GIF89a' + struct.pack('<HHBBB', width, height, 0xF7, 0, 0))
+        self._file.write(self._palette)
+        self._file.write(b'\x21\xFF\x0BNETSCAPE2.0\x03\x01' + struct.pack('<H', loop) + b'\x00')
+
+    def _encode(self, indices):
+        """LZW-encode a frame with Pillow; return (table, interlace flag, image data)."""
+        image = self._image_module.fromarray(indices, 'P')
+        image.putpalette(self._palette)
+        buffer = io.BytesIO()
+        image.save(buffer, format='GIF', optimize=False, interlace=False)
+        data = buffer.getvalue()
+
+        # Walk the single-frame GIF: header, screen descriptor, global table
+        flags = data[10]
+        table = b''
+        position = 13
+        if flags & 0x80:
+            size = 3 << ((flags & 0x07) + 1)
+            table = data[position:position + size]
+            position += size
+        while data[position] == 0x21:
+            # Skip extensions
+            position += 2
+            while data[position]:
+                position += data[position] + 1
+            position += 1
+        if data[position] != 0x2C:
+            raise ValueError("Unexpected GIF block from the image encoder")
+        local_flags = data[position + 9]
+        position += 10
+        if local_flags & 0x80:
+            size = 3 << ((local_flags & 0x07) + 1)
+            table = data[position:position + size]
+            position += size
+        start = position
+        position += 1
+        while data[position]:
+            position += data[position] + 1
+        return table, local_flags & 0x40, data[start:position + 1]
+
+    def append(self, indices):
+        """
+        Append one frame.
+
+        Args:
+            indices: (height, width) uint8 array of palette indices
+        """
+        if indices.shape != (self.height, self.width):
+            raise ValueError(f"Frame shape {indices.shape} does not match "
+                             f"{(self.height, self.width)}")
+        table, interlace, image_data = self._encode(np.ascontiguousarray(indices))
+        self._file.write(b'\x21\xF9\x04\x00' + struct.pack('<H', self._delay) + b'\x00\x00')
+        descriptor = b'\x2C' + struct.pack('<HHHH', 0, 0, self.width, self.height)
+        if table and table != self._palette[:len(table)]:
+            # The encoder reordered the palette; carry it as a local table
+            bits = max(1, (len(table) // 3 - 1).bit_length())
+            table = table.ljust(3 << bits, b'\x00')
+            self._file.write(descriptor + bytes([0x80 | interlace | (bits - 1)]) + table)
+        else:
+            self._file.write(descriptor + bytes([interlace]))
+        self._file.write(image_data)
+
+    def close(self):
+        """Write the GIF trailer."""
+        if not self._file.closed:
+            self._file.write(b'\x3B')
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def open_writer(path, width, height, palette, frames, duration_ms=100, loop=0):
+    """
+    Open a streaming writer chosen by file extension.
+
+    Args:
+        path: Output path ending in .gif, .png or .apng
+        width, height: Frame dimensions
+        palette: Sequence of RGB tuples (at most 256)
+        frames: Number of frames that will be written
+        duration_ms: Display time per frame in milliseconds
+        loop: Number of loops (0: forever)
+
+    Returns:
+        GifStreamWriter or ApngStreamWriter
+    """
+    extension = os.path.splitext(str(path))[1].lower()
+    if extension == '.gif':
+        return GifStreamWriter(path, width, height, palette, duration_ms, loop)
+    if extension in ('.png', '.apng'):
+        return ApngStreamWriter(path, width, height, palette, frames, duration_ms, loop)
+    raise ValueError(f"Unsupported animation format {extension!r}; use .gif, .png or .apng")
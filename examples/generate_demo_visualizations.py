@@ -28,7 +28,8 @@ sys.path.insert(0, repo_root)
 sys.path.insert(0, os.path.join(repo_root, 'src'))
 
 try:
-    from gq import UniversalQKD
+    from gq import UniversalQKD, GoldenStream, array
+    from gq.noise import CoherentNoise, grid
 except ImportError:
     print("Error: Could not import gq module.")
     print("Run: pip install -e .")
@@ -45,17 +46,15 @@ except ImportError:
     sys.exit(1)
 
 
-def generate_noise_field(width=256, height=256, seed_offset=0):
+def offset_stream(seed_offset=0):
     """
-    Generate a 2D noise field using GoldenSeed.
+    Create a GoldenSeed stream starting seed_offset outputs in.
 
     Args:
-        width: Field width in pixels
-        height: Field height in pixels
-        seed_offset: Seed offset for variation
+        seed_offset: Number of outputs to skip
 
     Returns:
-        2D numpy array of noise values (0-255)
+        GoldenStream positioned after the skipped outputs
     """
     generator = UniversalQKD()
 
@@ -63,17 +62,23 @@ def generate_noise_field(width=256, height=256, seed_offset=0):
     for _ in range(seed_offset):
         next(generator)
 
-    # Generate noise field
-    field = np.zeros((height, width), dtype=np.uint8)
+    return GoldenStream(generator)
+
 
-    for y in range(height):
-        for x in range(0, width, 16):  # Process 16 pixels at a time
-            chunk = next(generator)
-            for i in range(min(16, width - x)):
-                if x + i < width:
-                    field[y, x + i] = chunk[i]
+def generate_noise_field(width=256, height=256, seed_offset=0):
+    """
+    Generate a 2D noise field using GoldenSeed.
+
+    Args:
+        width: Field width in pixels
+        height: Field height in pixels
+        seed_offset: Seed offset for variation
 
-    return field
+    Returns:
+        2D numpy array of noise values (0-255)
+    """
+    # Stream bytes are copied into the array in bulk, row by row
+    return array((height, width), np.uint8, offset_stream(seed_offset))
 
 
 def generate_terrain_heightmap(width=256, height=256, seed_offset=0):
@@ -88,26 +93,11 @@ def generate_terrain_heightmap(width=256, height=256, seed_offset=0):
     Returns:
         2D array representing terrain elevation
     """
-    generator = UniversalQKD()
-
-    for _ in range(seed_offset):
-        next(generator)
-
-    # Generate base heightmap
-    heightmap = np.zeros((height, width), dtype=np.float32)
+    noise = CoherentNoise(offset_stream(seed_offset))
 
-    # Multi-octave generation for more natural terrain
-    octaves = 3
-    for octave in range(octaves):
-        scale = 2 ** octave
-        amplitude = 1.0 / scale
-
-        for y in range(height):
-            for x in range(0, width, 16):
-                chunk = next(generator)
-                for i in range(min(16, width - x)):
-                    if x + i < width:
-                        heightmap[y, x + i] += chunk[i] * amplitude
+    # Multi-octave gradient noise for spatially coherent terrain
+    x, y = grid(width, height, scale=4.0 / max(width, height))
+    heightmap = noise.fbm(x, y, octaves=6).astype(np.float32)
 
     # Normalize to 0-1
     heightmap = (heightmap - heightmap.min()) / (heightmap.max() - heightmap.min())
@@ -127,21 +117,13 @@ def generate_color_pattern(width=256, height=256, seed_offset=0):
     Returns:
         RGB image array
     """
-    generator = UniversalQKD()
-
-    for _ in range(seed_offset):
-        next(generator)
+    stream = offset_stream(seed_offset)
 
     # Generate RGB channels separately
     image = np.zeros((height, width, 3), dtype=np.uint8)
 
     for channel in range(3):
-        for y in range(height):
-            for x in range(0, width, 16):
-                chunk = next(generator)
-                for i in range(min(16, width - x)):
-                    if x + i < width:
-                        image[y, x + i, channel] = chunk[i]
+        image[:, :, channel] = array((height, width), np.uint8, stream)
 
     return image
 
@@ -12,7 +12,34 @@ Usage in Game Engines:
 - Unreal: Adapt to C++ using the C++ examples in releases/
 """
 
-from gq import UniversalQKD
+import functools
+import itertools
+import os
+import tempfile
+import time
+
+from gq.procedural import ProceduralWorld
+from gq.random import GoldenGenerator
+from gq.records import RecordSchema
+
+
+# Entity tables: declared once, generated a column at a time
+ENTITY_FIELDS = {
+    'health': (1, 1001),
+    'speed': (1, 101),
+    'strength': (1, 101),
+    'defense': (1, 101),
+    'rarity': ('choice', [0, 1, 2, 3, 4], [60, 25, 10, 4, 1]),
+    'aggression': ('normal', 0.5, 0.15),
+    'elite': ('bool', 0.05),
+    'color_seed': ('uint64',),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def entity_schema():
+    """RecordSchema of ENTITY_FIELDS, built on first use (needs numpy)."""
+    return RecordSchema(ENTITY_FIELDS)
 
 
 class ProceduralWorldGenerator:
@@ -23,6 +50,9 @@ class ProceduralWorldGenerator:
     - Multiplayer synchronization
     - Reproducible testing
     - Space-efficient world storage
+    
+    Chunks and entities are addressed by coordinates and ids, so they can be
+    generated in any order.
     """
     
     def __init__(self, world_seed_offset=0):
@@ -32,11 +62,7 @@ class ProceduralWorldGenerator:
         Args:
             world_seed_offset: Unique identifier for this world (0-n)
         """
-        self.generator = UniversalQKD()
-        
-        # Skip to world-specific position
-        for _ in range(world_seed_offset):
-            next(self.generator)
+        self.world = ProceduralWorld(seed=world_seed_offset)
     
     def generate_chunk(self, chunk_x, chunk_z):
         """
@@ -45,21 +71,7 @@ class ProceduralWorldGenerator:
         Returns:
             Dictionary with terrain properties
         """
-        # Get deterministic bytes for this chunk
-        chunk_bytes = next(self.generator)
-        
-        # Convert bytes to terrain properties
-        terrain = {
-            'biome': int.from_bytes(chunk_bytes[0:1], 'big') % 10,
-            'base_elevation': int.from_bytes(chunk_bytes[1:3], 'big') % 256,
-            'variation': int.from_bytes(chunk_bytes[3:4], 'big') % 100,
-            'vegetation_density': int.from_bytes(chunk_bytes[4:5], 'big') % 100,
-            'temperature': int.from_bytes(chunk_bytes[5:6], 'big') % 100,
-            'moisture': int.from_bytes(chunk_bytes[6:7], 'big') % 100,
-            'ore_density': int.from_bytes(chunk_bytes[7:8], 'big') % 100,
-        }
-        
-        return terrain
+        return self.world.chunk(chunk_x, chunk_z)
     
     def generate_entity(self, entity_type, spawn_id):
         """
@@ -72,31 +84,41 @@ class ProceduralWorldGenerator:
         Returns:
             Dictionary with entity properties
         """
-        # Skip to entity-specific position
-        for _ in range(spawn_id):
-            next(self.generator)
-        
-        entity_bytes = next(self.generator)
+        return self.world.entity(entity_type, spawn_id)
+    
+    def entity_stream(self, entity_type):
+        """Stream of 64-byte blocks derived for one entity type."""
+        return (
+            self.world.derive('entities:' + entity_type, block, size=64)
+            for block in itertools.count()
+        )
+    
+    def generate_entities(self, entity_type, count):
+        """
+        Generate a table of entities in one bulk read.
         
-        entity = {
-            'type': entity_type,
-            'spawn_id': spawn_id,
-            'health': int.from_bytes(entity_bytes[0:2], 'big') % 1000 + 1,
-            'speed': int.from_bytes(entity_bytes[2:3], 'big') % 100 + 1,
-            'strength': int.from_bytes(entity_bytes[3:4], 'big') % 100 + 1,
-            'defense': int.from_bytes(entity_bytes[4:5], 'big') % 100 + 1,
-            'rarity': int.from_bytes(entity_bytes[5:6], 'big') % 5,  # 0-4
-            'color_seed': int.from_bytes(entity_bytes[6:10], 'big'),
-        }
+        Args:
+            entity_type: Type of entity (e.g., "monster", "npc", "item")
+            count: Number of entities
+            
+        Rows are drawn in order from one stream per entity type, so the
+        same count always gives the same table. They are separate from
+        generate_entity(), which addresses single entities by spawn id.
         
-        return entity
+        Returns:
+            Dictionary of NumPy columns (see ENTITY_FIELDS), count rows
+            
+        Raises:
+            ImportError: If numpy is not installed
+        """
+        return entity_schema().columns(count, self.entity_stream(entity_type))
 
 
 class ProceduralLevelGenerator:
     """Generate infinite procedural game levels."""
     
     def __init__(self):
-        self.generator = UniversalQKD()
+        self.world = ProceduralWorld()
     
     def generate_level(self, level_number):
         """
@@ -108,21 +130,20 @@ class ProceduralLevelGenerator:
         Returns:
             Dictionary with level configuration
         """
-        # Skip to level-specific position
-        for _ in range((level_number - 1) * 100):
-            next(self.generator)
-        
-        # Generate multiple bytes for level properties
-        level_bytes = [next(self.generator) for _ in range(5)]
+        # One stream per level, addressed by level number; the generator
+        # draws unbiased values from it instead of summing bytes modulo N
+        rng = GoldenGenerator(
+            self.world.derive('level', level_number, i, size=64) for i in itertools.count()
+        )
         
         level = {
             'number': level_number,
-            'difficulty': sum(level_bytes[0]) % 10,
-            'enemy_count': sum(level_bytes[1]) % 50 + 5,
-            'treasure_count': sum(level_bytes[2]) % 20 + 1,
-            'trap_count': sum(level_bytes[3]) % 30,
-            'boss_health': sum(level_bytes[4]) * 100,
-            'layout_seed': int.from_bytes(level_bytes[0][:8], 'big'),
+            'difficulty': rng.integers(10),
+            'enemy_count': rng.integers(5, 55),
+            'treasure_count': rng.integers(1, 21),
+            'trap_count': rng.integers(30),
+            'boss_health': rng.integers(4081) * 100,
+            'layout_seed': rng.getrandbits(64),
         }
         
         return level
@@ -152,9 +173,6 @@ def example_world_generation():
     print("Generating entities:")
     print("-" * 60)
     
-    # Reset generator for entity spawning
-    world = ProceduralWorldGenerator(world_seed_offset=42)
-    
     for i in range(5):
         entity = world.generate_entity("monster", spawn_id=i)
         print(f"Monster {i}: HP={entity['health']}, "
@@ -163,6 +181,37 @@ def example_world_generation():
               f"Rarity={entity['rarity']}")
 
 
+def example_entity_tables():
+    """Demonstrate batch entity generation and export."""
+    print()
+    print("=" * 60)
+    print("Entity Table Example")
+    print("=" * 60)
+    print()
+    
+    world = ProceduralWorldGenerator(world_seed_offset=42)
+    count = 100_000
+    
+    start = time.perf_counter()
+    npcs = world.generate_entities("npc", count)
+    seconds = time.perf_counter() - start
+    
+    print(f"Generated {count:,} NPCs in {seconds:.2f}s "
+          f"({count / seconds:,.0f} records/s)")
+    print(f"Elite NPCs: {int(npcs['elite'].sum()):,}")
+    print(f"Mean health: {npcs['health'].mean():.1f}")
+    rarity_counts = [int((npcs['rarity'] == rarity).sum()) for rarity in range(5)]
+    print(f"Rarity counts: {rarity_counts}")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'npcs.csv')
+        entity_schema().write(path, count, world.entity_stream("npc"))
+        with open(path) as f:
+            header, first = f.readline().strip(), f.readline().strip()
+    print(f"CSV header: {header}")
+    print(f"First row:  {first}")
+
+
 def example_level_generation():
     """Demonstrate level generation."""
     print()
@@ -206,6 +255,10 @@ def example_cross_platform_consistency():
 
 if __name__ == "__main__":
     example_world_generation()
+    try:
+        example_entity_tables()
+    except ImportError as e:
+        print(f"\nSkipping entity tables: {e}")
     example_level_generation()
     example_cross_platform_consistency()
     
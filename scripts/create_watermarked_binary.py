@@ -26,7 +26,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 try:
     from src.gq.watermark import (
         WatermarkData,
-        embed_watermark_in_binary,
+        write_watermarked_copy,
         WatermarkError,
     )
 except ImportError:
@@ -49,12 +49,9 @@ def create_watermarked_binary(input_file: Path, output_file: Path,
         secret: Secret key for watermark signature
     """
     try:
-        # Read input binary
-        print(f"Reading input file: {input_file}")
-        with open(input_file, 'rb') as f:
-            binary_data = f.read()
-        
-        print(f"  Size: {len(binary_data)} bytes")
+        input_size = input_file.stat().st_size
+        print(f"Input file: {input_file}")
+        print(f"  Size: {input_size} bytes")
         
         # Create watermark
         print(f"\nCreating watermark...")
@@ -64,25 +61,21 @@ def create_watermarked_binary(input_file: Path, output_file: Path,
         watermark = WatermarkData(license_id, user_info)
         print(f"  Timestamp: {watermark.to_dict()['timestamp_readable']}")
         
-        # Embed watermark
-        print(f"\nEmbedding watermark...")
-        watermarked_data = embed_watermark_in_binary(binary_data, watermark, secret)
-        
-        watermark_size = len(watermarked_data) - len(binary_data)
-        print(f"  Watermark size: {watermark_size} bytes")
-        print(f"  Total size: {len(watermarked_data)} bytes")
-        
         # Ensure output directory exists
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
-        # Write watermarked binary
+        # Copy the input (reflinked or copied by the OS, never loaded into
+        # memory) and append the trailer
         print(f"\nWriting watermarked file: {output_file}")
-        with open(output_file, 'wb') as f:
-            f.write(watermarked_data)
+        write_watermarked_copy(input_file, output_file, watermark, secret)
+        
+        total_size = output_file.stat().st_size
+        print(f"  Watermark size: {total_size - input_size} bytes")
+        print(f"  Total size: {total_size} bytes")
         
         print(f"\n✓ Watermarked binary created successfully!")
         print(f"  Output: {output_file}")
-        print(f"  Size: {len(watermarked_data)} bytes")
+        print(f"  Size: {total_size} bytes")
         
         # Compliance notice
         print("\n" + "=" * 70)
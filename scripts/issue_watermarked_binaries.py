@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Bulk Watermark Issuance Tool
+
+This script issues one watermarked copy of a base binary per license. Each
+copy is produced by the operating system (reflink, copy_file_range or
+sendfile) plus a trailer append, so the base binary is never read into
+memory, and copies are signed and written in parallel. A manifest of the
+issued signatures is written alongside the copies.
+
+Usage:
+    python scripts/issue_watermarked_binaries.py \\
+        --input <base_binary> \\
+        --records <licenses.csv|licenses.json> \\
+        --output-dir <directory> \\
+        --secret <secret_key>
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path to import gq module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    from src.gq.watermark import (
+        issue_watermarked_copies,
+        load_watermark_records,
+        WatermarkError,
+    )
+except ImportError:
+    print("ERROR: Unable to import watermark module. Please install the package first:")
+    print("  pip install -e .")
+    sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Issue watermarked copies of a binary for many licenses",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Issue one copy per row of licenses.csv (columns: license_id, user_info
+  # and optionally timestamp)
+  python scripts/issue_watermarked_binaries.py \\
+      --input formats/golden_seed_256.bin \\
+      --records licenses.csv \\
+      --output-dir output/licensed \\
+      --secret "your-secret-key"
+
+  # JSON records, custom file names and 16 worker threads
+  python scripts/issue_watermarked_binaries.py \\
+      --input formats/golden_seed_256.bin \\
+      --records licenses.json \\
+      --output-dir output/licensed \\
+      --name-template "{license_id}{suffix}" \\
+      --workers 16
+
+Compliance:
+  All watermarked binaries are subject to COMMERCIAL_LICENSE.md terms.
+  Unauthorized redistribution is prohibited.
+        """
+    )
+
+    parser.add_argument(
+        '-i', '--input',
+        type=Path,
+        required=True,
+        help='Base binary file path'
+    )
+
+    parser.add_argument(
+        '-r', '--records',
+        type=Path,
+        required=True,
+        help='CSV or JSON file of watermark records'
+    )
+
+    parser.add_argument(
+        '-o', '--output-dir',
+        type=Path,
+        required=True,
+        help='Directory for the watermarked copies'
+    )
+
+    parser.add_argument(
+        '--name-template',
+        type=str,
+        default='{stem}-{license_id}{suffix}',
+        help='Output file name template: {stem}, {suffix}, {license_id}, {index} '
+             '(default: {stem}-{license_id}{suffix})'
+    )
+
+    parser.add_argument(
+        '--manifest',
+        type=Path,
+        help='Manifest path (default: <output-dir>/manifest.json)'
+    )
+
+    parser.add_argument(
+        '--secret',
+        type=str,
+        help='Secret key for watermark signatures (or set WATERMARK_SECRET env var)'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        metavar='N',
+        help='Worker thread count (default: min(32, CPU count + 4))'
+    )
+
+    args = parser.parse_args()
+
+    # Get secret from args or environment
+    secret = args.secret or os.environ.get('WATERMARK_SECRET')
+
+    if not secret:
+        print("ERROR: Secret key is required. Provide via --secret or WATERMARK_SECRET env var.",
+              file=sys.stderr)
+        sys.exit(1)
+
+    # Validate input file exists
+    if not args.input.exists():
+        print(f"ERROR: Input file not found: {args.input}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.workers is not None and args.workers < 1:
+        print("ERROR: --workers must be at least 1", file=sys.stderr)
+        sys.exit(1)
+
+    manifest_path = args.manifest or args.output_dir / 'manifest.json'
+
+    try:
+        records = load_watermark_records(args.records)
+        print(f"Issuing {len(records)} watermarked copies of {args.input}...")
+
+        start = time.perf_counter()
+        issue_watermarked_copies(
+            args.input, records, secret, args.output_dir,
+            name_template=args.name_template,
+            manifest_path=manifest_path,
+            max_workers=args.workers,
+        )
+        elapsed = time.perf_counter() - start
+    except WatermarkError as e:
+        print(f"\n❌ Watermark error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"\n✓ Issued {len(records)} copies in {elapsed:.2f}s")
+    print(f"  Output: {args.output_dir}")
+    print(f"  Manifest: {manifest_path}")
+
+    # Compliance notice
+    print("\n" + "=" * 70)
+    print("COMPLIANCE NOTICE")
+    print("=" * 70)
+    print("These watermarked binaries are subject to the terms in COMMERCIAL_LICENSE.md.")
+    print("Redistribution without authorization is prohibited.")
+    print("=" * 70)
+
+
+if __name__ == '__main__':
+    main()
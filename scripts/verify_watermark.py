@@ -10,6 +10,14 @@ Usage:
     python scripts/verify_watermark.py \\
         --input <watermarked_binary> \\
         --secret <secret_key>
+
+    python scripts/verify_watermark.py \\
+        --audit <directory> [<directory> ...] \\
+        --secret <new_key> --secret <old_key>
+
+    python scripts/verify_watermark.py \\
+        --scan <archive_or_image> [...] \\
+        --secret <secret_key>
 """
 
 import argparse
@@ -23,25 +31,30 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 try:
     from src.gq.watermark import (
-        extract_watermark_from_binary,
-        check_watermark_present,
+        read_watermark_trailer,
+        file_payload_digest,
+        WatermarkData,
+        WatermarkKeyring,
         WatermarkError,
     )
+    from src.gq.cli.watermark import audit_paths, scan_paths
 except ImportError:
     print("ERROR: Unable to import watermark module. Please install the package first:")
     print("  pip install -e .")
     sys.exit(1)
 
 
-def verify_watermark(input_file: Path, secret: str, 
-                      json_output: bool = False) -> dict:
+def verify_watermark(input_file: Path, secret, 
+                      json_output: bool = False,
+                      verify_payload: bool = True) -> dict:
     """
     Verify watermark in a binary file.
     
     Args:
         input_file: Path to watermarked binary file
-        secret: Secret key for watermark verification
+        secret: Secret key, or list of keys, for watermark verification
         json_output: If True, return JSON-formatted output
+        verify_payload: Hash the payload to check a v2 trailer's digest
         
     Returns:
         Dictionary containing verification results
@@ -50,29 +63,42 @@ def verify_watermark(input_file: Path, secret: str,
         'file': str(input_file),
         'watermarked': False,
         'verified': False,
+        'payload_verified': None,
         'error': None,
         'watermark': None,
     }
     
     try:
-        # Read binary file
-        with open(input_file, 'rb') as f:
-            binary_data = f.read()
-        
-        result['file_size'] = len(binary_data)
+        # Only the trailer is read; the file size comes from the filesystem
+        result['file_size'] = input_file.stat().st_size
         
-        # Check if watermark is present
-        if not check_watermark_present(binary_data):
+        # One tail read; a short or unreadable file, or missing magic,
+        # means there is no watermark
+        try:
+            original_size, trailer = read_watermark_trailer(input_file)
+        except WatermarkError:
+            trailer = b''
+        if trailer[:len(WatermarkData.MAGIC)] != WatermarkData.MAGIC:
             result['error'] = 'No watermark found in binary file'
             return result
         
         result['watermarked'] = True
         
-        # Extract and verify watermark
-        original_data, watermark = extract_watermark_from_binary(binary_data, secret)
+        # Verify the watermark against every secret
+        watermark, key_index = WatermarkKeyring(secret).verify(trailer)
+        result['version'] = watermark.version
+        
+        # v2 trailers commit to the payload; hash it in one streaming pass
+        if verify_payload and watermark.payload_digest:
+            digest = file_payload_digest(input_file, original_size)
+            result['payload_verified'] = digest == watermark.payload_digest
+            if not result['payload_verified']:
+                result['error'] = 'Payload digest mismatch: watermark does not belong to this file'
+                return result
         
         result['verified'] = True
-        result['original_size'] = len(original_data)
+        result['key_index'] = key_index
+        result['original_size'] = original_size
         result['watermark'] = watermark.to_dict()
         
         return result
@@ -114,6 +140,12 @@ def print_verification_result(result: dict, json_output: bool = False) -> None:
     
     if result['verified']:
         print(f"Signature Verified: ✓ YES")
+        if result['payload_verified']:
+            print(f"Payload Digest: ✓ MATCHES (v2 trailer)")
+        elif result['version'] == 1:
+            print(f"Payload Digest: not covered (v1 trailer)")
+        else:
+            print(f"Payload Digest: not checked (--trailer-only)")
         print(f"\nOriginal Binary Size: {result['original_size']:,} bytes")
         print(f"Watermark Size: {result['file_size'] - result['original_size']:,} bytes")
         
@@ -137,6 +169,21 @@ def print_verification_result(result: dict, json_output: bool = False) -> None:
     print("=" * 70)
 
 
+def load_keyring_file(path: Path) -> list:
+    """
+    Read secrets from a keyring file, one per line.
+    
+    Blank lines and lines starting with '#' are ignored.
+    """
+    secrets = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.rstrip('\r\n')
+            if line.strip() and not line.lstrip().startswith('#'):
+                secrets.append(line)
+    return secrets
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Verify watermarks in binary files",
@@ -158,25 +205,82 @@ Examples:
       --input output/watermarked_seed.bin \\
       --secret "your-secret-key" \\
       --json
+  
+  # Find trailers embedded inside archives, images or installers
+  python scripts/verify_watermark.py \\
+      --scan bundle.tar.gz installer.exe \\
+      --secret "your-secret-key"
+  
+  # Audit a release mirror during key rotation (JSON lines + summary)
+  python scripts/verify_watermark.py \\
+      --audit /srv/mirror \\
+      --secret "new-secret-key" --secret "old-secret-key" \\
+      --workers 16 > audit.jsonl
 
 Return Codes:
-  0 - Watermark verified successfully
+  0 - Watermark verified successfully (audit: every file verified;
+      scan: at least one embedded trailer verified)
   1 - Watermark verification failed or error occurred
-  2 - No watermark found in file
+  2 - No watermark found in file (scan: no embedded trailers)
         """
     )
     
-    parser.add_argument(
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument(
         '-i', '--input',
         type=Path,
-        required=True,
         help='Input watermarked binary file path'
     )
     
+    mode.add_argument(
+        '--audit',
+        type=Path,
+        nargs='+',
+        metavar='PATH',
+        help='Audit every file under these files/directories (recursive)'
+    )
+    
+    mode.add_argument(
+        '--scan',
+        type=Path,
+        nargs='+',
+        metavar='FILE',
+        help='Find trailers embedded anywhere in these files (archives, images)'
+    )
+    
     parser.add_argument(
         '--secret',
         type=str,
-        help='Secret key for watermark verification (or set WATERMARK_SECRET env var)'
+        action='append',
+        help='Secret key for watermark verification (or set WATERMARK_SECRET env var); '
+             'repeat to try several keys'
+    )
+    
+    parser.add_argument(
+        '--keyring',
+        type=Path,
+        metavar='FILE',
+        help='File of additional secrets, one per line, tried after --secret'
+    )
+    
+    parser.add_argument(
+        '--trailer-only',
+        action='store_true',
+        help='Check signatures only; skip hashing payloads of v2 trailers '
+             '(always the case for --audit unless --verify-payload is given)'
+    )
+    
+    parser.add_argument(
+        '--verify-payload',
+        action='store_true',
+        help='With --audit: also hash each payload to check v2 digests'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        metavar='N',
+        help='Audit thread count or scan verification process count'
     )
     
     parser.add_argument(
@@ -187,21 +291,41 @@ Return Codes:
     
     args = parser.parse_args()
     
-    # Get secret from args or environment
-    secret = args.secret or os.environ.get('WATERMARK_SECRET')
+    # Get secrets from args, keyring file or environment
+    secrets = list(args.secret or [])
+    if args.keyring:
+        try:
+            secrets.extend(load_keyring_file(args.keyring))
+        except OSError as e:
+            print(f"ERROR: Failed to read keyring: {e}", file=sys.stderr)
+            sys.exit(1)
+    if not secrets and os.environ.get('WATERMARK_SECRET'):
+        secrets.append(os.environ['WATERMARK_SECRET'])
     
-    if not secret:
-        print("ERROR: Secret key is required. Provide via --secret or WATERMARK_SECRET env var.",
+    if not secrets:
+        print("ERROR: Secret key is required. Provide via --secret, --keyring or "
+              "WATERMARK_SECRET env var.",
               file=sys.stderr)
         sys.exit(1)
     
+    if args.workers is not None and args.workers < 1:
+        print("ERROR: --workers must be at least 1", file=sys.stderr)
+        sys.exit(1)
+    
+    if args.scan:
+        sys.exit(scan_paths(args.scan, secrets, args.workers))
+    
+    if args.audit:
+        sys.exit(audit_paths(args.audit, secrets, args.workers, args.verify_payload))
+    
     # Validate input file exists
     if not args.input.exists():
         print(f"ERROR: Input file not found: {args.input}", file=sys.stderr)
         sys.exit(1)
     
     # Verify watermark
-    result = verify_watermark(args.input, secret, args.json)
+    result = verify_watermark(args.input, secrets, args.json,
+                              verify_payload=not args.trailer_only)
     
     # Print results
     print_verification_result(result, args.json)
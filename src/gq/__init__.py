@@ -32,46 +32,88 @@ Example Usage:
     'a01611f01e8207a27c1529c3650c4838'
 """
 
-from .universal_qkd import (
-    universal_qkd_generator as UniversalQKD,
-    generate_keys as generate_universal_keys,
-    HEX_SEED,
-    EXPECTED_CHECKSUM,
-    GOLDEN_RATIO,
-    PI,
-    E,
-    SQRT2,
-    GOLDEN_RATIO_HEX,
-    PI_HEX,
-    E_HEX,
-    SQRT2_HEX,
-)
+import importlib
+from typing import Any, Dict, List, Tuple
 
-from .gqs1 import (
-    generate_test_vectors as generate_gqs1_vectors,
-    GQS1,
-)
+# Public name -> (submodule, attribute). Submodules are imported on first
+# attribute access (PEP 562), so `import gq` stays cheap for processes that
+# only need one generator and never touch numpy, argparse or the watermark
+# stack.
+_LAZY_ATTRIBUTES: Dict[str, Tuple[str, str]] = {
+    "UniversalQKD": (".universal_qkd", "universal_qkd_generator"),
+    "generate_universal_keys": (".universal_qkd", "generate_keys"),
+    "HEX_SEED": (".universal_qkd", "HEX_SEED"),
+    "EXPECTED_CHECKSUM": (".universal_qkd", "EXPECTED_CHECKSUM"),
+    "GOLDEN_RATIO": (".universal_qkd", "GOLDEN_RATIO"),
+    "PI": (".universal_qkd", "PI"),
+    "E": (".universal_qkd", "E"),
+    "SQRT2": (".universal_qkd", "SQRT2"),
+    "GOLDEN_RATIO_HEX": (".universal_qkd", "GOLDEN_RATIO_HEX"),
+    "PI_HEX": (".universal_qkd", "PI_HEX"),
+    "E_HEX": (".universal_qkd", "E_HEX"),
+    "SQRT2_HEX": (".universal_qkd", "SQRT2_HEX"),
+    "generate_gqs1_vectors": (".gqs1", "generate_test_vectors"),
+    "GQS1": (".gqs1", "GQS1"),
+    "GoldenRatioCoinFlip": (".golden_ratio_coin_flip", "GoldenRatioCoinFlip"),
+    "EquidistributionValidator": (".golden_ratio_coin_flip", "EquidistributionValidator"),
+    "CoinFlipValidator": (".golden_ratio_coin_flip", "CoinFlipValidator"),
+    "QuasirandomnessValidator": (".golden_ratio_coin_flip", "QuasirandomnessValidator"),
+    "PerformanceMetricsValidator": (".golden_ratio_coin_flip", "PerformanceMetricsValidator"),
+    "fractional_part": (".golden_ratio_coin_flip", "fractional_part"),
+    "pack_flips": (".golden_ratio_coin_flip", "pack_flips"),
+    "comprehensive_validation": (".golden_ratio_coin_flip", "comprehensive_validation"),
+    "PHI": (".golden_ratio_coin_flip", "PHI"),
+    "GoldenStream": (".stream", "GoldenStream"),
+    "fill_array": (".arrays", "fill_array"),
+    "array": (".arrays", "array"),
+    "KroneckerSequence": (".kronecker", "KroneckerSequence"),
+    "generalized_golden_ratio": (".kronecker", "generalized_golden_ratio"),
+    "l2_star_discrepancy": (".kronecker", "l2_star_discrepancy"),
+    "ProceduralWorld": (".procedural", "ProceduralWorld"),
+    "CoherentNoise": (".noise", "CoherentNoise"),
+    "TiledWorld": (".tiles", "TiledWorld"),
+    "GoldenGenerator": (".random", "GoldenGenerator"),
+    "AliasTable": (".random", "AliasTable"),
+    "GoldenRandom": (".random", "GoldenRandom"),
+    "GoldenSeedBitGenerator": (".numpy", "GoldenSeedBitGenerator"),
+    "RecordSchema": (".records", "RecordSchema"),
+    "write_records": (".records", "write_records"),
+    "WatermarkData": (".watermark", "WatermarkData"),
+    "WatermarkError": (".watermark", "WatermarkError"),
+    "encode_watermark": (".watermark", "encode_watermark"),
+    "decode_watermark": (".watermark", "decode_watermark"),
+    "embed_watermark_in_binary": (".watermark", "embed_watermark_in_binary"),
+    "extract_watermark_from_binary": (".watermark", "extract_watermark_from_binary"),
+    "check_watermark_present": (".watermark", "check_watermark_present"),
+    "embed_watermark_in_file": (".watermark", "embed_watermark_in_file"),
+    "extract_watermark_from_file": (".watermark", "extract_watermark_from_file"),
+    "check_watermark_in_file": (".watermark", "check_watermark_in_file"),
+    "open_watermarked_file": (".watermark", "open_watermarked_file"),
+    "WatermarkKeyring": (".watermark", "WatermarkKeyring"),
+    "audit_watermarks": (".watermark", "audit_watermarks"),
+    "write_watermarked_copy": (".watermark", "write_watermarked_copy"),
+    "issue_watermarked_copies": (".watermark", "issue_watermarked_copies"),
+    "file_payload_digest": (".watermark", "file_payload_digest"),
+    "LicenseRegistry": (".watermark_registry", "LicenseRegistry"),
+    "scan_file_for_watermarks": (".watermark_scan", "scan_file"),
+}
 
-from .golden_ratio_coin_flip import (
-    GoldenRatioCoinFlip,
-    EquidistributionValidator,
-    CoinFlipValidator,
-    QuasirandomnessValidator,
-    PerformanceMetricsValidator,
-    fractional_part,
-    comprehensive_validation,
-    PHI,
-)
 
-from .watermark import (
-    WatermarkData,
-    WatermarkError,
-    encode_watermark,
-    decode_watermark,
-    embed_watermark_in_binary,
-    extract_watermark_from_binary,
-    check_watermark_present,
-)
+def __getattr__(name: str) -> Any:
+    """Import the submodule providing a public name on first access."""
+    try:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attribute)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 __all__ = [
     "UniversalQKD",
@@ -96,8 +138,27 @@ __all__ = [
     "QuasirandomnessValidator",
     "PerformanceMetricsValidator",
     "fractional_part",
+    "pack_flips",
     "comprehensive_validation",
     "PHI",
+    # Streams and low-discrepancy sampling
+    "GoldenStream",
+    "fill_array",
+    "array",
+    "KroneckerSequence",
+    "generalized_golden_ratio",
+    "l2_star_discrepancy",
+    # Coordinate-addressed procedural content
+    "ProceduralWorld",
+    "CoherentNoise",
+    "TiledWorld",
+    # Random variates over streams
+    "GoldenGenerator",
+    "AliasTable",
+    "GoldenRandom",
+    "GoldenSeedBitGenerator",
+    "RecordSchema",
+    "write_records",
     # Watermarking for commercial licensing
     "WatermarkData",
     "WatermarkError",
@@ -106,6 +167,17 @@ __all__ = [
     "embed_watermark_in_binary",
     "extract_watermark_from_binary",
     "check_watermark_present",
+    "embed_watermark_in_file",
+    "extract_watermark_from_file",
+    "check_watermark_in_file",
+    "open_watermarked_file",
+    "WatermarkKeyring",
+    "audit_watermarks",
+    "write_watermarked_copy",
+    "issue_watermarked_copies",
+    "file_payload_digest",
+    "LicenseRegistry",
+    "scan_file_for_watermarks",
 ]
 
 __version__ = "3.0.0"
@@ -0,0 +1,9 @@
+"""
+Allow `python -m gq <command> ...` as an alias for the gq command.
+"""
+
+import sys
+
+from .cli.main import main
+
+sys.exit(main())
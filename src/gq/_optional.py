@@ -0,0 +1,29 @@
+"""
+Optional NumPy Support (internal)
+
+numpy is an optional extra (pip install golden-seed[numpy]). Modules with
+NumPy-backed features import np from here, so they and `from gq import *`
+still import without it, and call require_numpy() at their entry points
+to fail with an install hint instead.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+
+# Scales from 53-bit and 32-bit integers to floats in [0, 1)
+TWO_53 = 1.0 / (1 << 53)
+TWO_32 = 1.0 / (1 << 32)
+
+
+def require_numpy(feature: str) -> None:
+    """
+    Raise ImportError if numpy is not installed.
+
+    Args:
+        feature: What needs numpy, for the message (e.g. 'array fills')
+    """
+    if np is None:
+        raise ImportError(f"numpy is required for {feature}: pip install golden-seed[numpy]")
@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite
+
+Measures the throughput of the generators, validators and watermarking:
+
+- universal: GCP-1 outputs/s
+- gqs1: GQS-1 test vectors/s
+- coin-flip: packed golden ratio coin flips/s
+- validators: each coin flip validator at several sample sizes
+- watermark: embed and verify throughput in bytes/s
+
+Every case is set up once (inputs are built outside the timed region), run
+for a number of warmup iterations, then timed over several repetitions.
+Results carry min/median/mean/p90/max timings and the median throughput,
+and can be saved as JSON and compared against a saved baseline to flag
+regressions.
+
+Example Usage:
+    >>> from gq.benchmark import run_suite, select_cases
+    >>> results = run_suite(select_cases(['gqs1']), repetitions=3)
+    >>> results['gqs1']['items_per_second'] > 0
+    True
+"""
+
+import json
+import platform
+import statistics
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+
+# Version of the JSON results document
+RESULTS_VERSION = 1
+
+# Default items per run of the generator cases at scale 1
+DEFAULT_COUNTS = {
+    'universal': 2000,
+    'gqs1': 2000,
+    'coin-flip': 1000000,
+}
+
+# Sample sizes of every validator case at scale 1
+VALIDATOR_SIZES = (1000, 10000, 100000)
+
+# Payload size of the watermark cases at scale 1
+WATERMARK_PAYLOAD_SIZE = 4 * 1024 * 1024
+
+# Relative throughput drop reported as a regression by default
+DEFAULT_THRESHOLD = 0.10
+
+
+class BenchmarkCase:
+    """
+    One benchmark: a setup function returning the timed callable.
+
+    The setup runs once, outside the timed region; the returned callable
+    processes `items` units of `unit` per call.
+    """
+
+    def __init__(self, name: str, group: str, unit: str, items: int,
+                 setup: Callable[[], Callable[[], Any]]):
+        """
+        Initialize the case.
+
+        Args:
+            name: Unique case name (e.g. 'validators.runs_test/10000')
+            group: Group name selectable as a whole (e.g. 'validators')
+            unit: Unit of work (e.g. 'outputs', 'flips', 'bytes')
+            items: Units processed per call of the timed function
+            setup: Function returning the timed callable
+        """
+        self.name = name
+        self.group = group
+        self.unit = unit
+        self.items = items
+        self.setup = setup
+
+
+def _scaled(count: int, scale: float) -> int:
+    return max(1, int(count * scale))
+
+
+def _generator_cases(scale: float) -> List[BenchmarkCase]:
+    def universal(count):
+        def setup():
+            from .universal_qkd import generate_keys
+            return lambda: generate_keys(count)
+        return setup
+
+    def gqs1(count):
+        def setup():
+            from .gqs1_core import generate_test_vectors
+            return lambda: generate_test_vectors(count)
+        return setup
+
+    def coin_flip(count):
+        def setup():
+            from .golden_ratio_coin_flip import GoldenRatioCoinFlip
+            coin = GoldenRatioCoinFlip()
+            return lambda: coin.generate_packed(count)
+        return setup
+
+    counts = {name: _scaled(count, scale) for name, count in DEFAULT_COUNTS.items()}
+    return [
+        BenchmarkCase('universal', 'universal', 'outputs', counts['universal'],
+                      universal(counts['universal'])),
+        BenchmarkCase('gqs1', 'gqs1', 'vectors', counts['gqs1'], gqs1(counts['gqs1'])),
+        BenchmarkCase('coin-flip', 'coin-flip', 'flips', counts['coin-flip'],
+                      coin_flip(counts['coin-flip'])),
+    ]
+
+
+# Validator case -> (validator class name, method name, input kind)
+VALIDATORS = {
+    'kolmogorov_smirnov_test': ('EquidistributionValidator', 'kolmogorov_smirnov_test', 'samples'),
+    'uniformity_chi_square': ('EquidistributionValidator', 'uniformity_chi_square', 'samples'),
+    'gap_test': ('EquidistributionValidator', 'gap_test', 'samples'),
+    'analyze_balance': ('CoinFlipValidator', 'analyze_balance', 'flips'),
+    'runs_test': ('CoinFlipValidator', 'runs_test', 'flips'),
+    'autocorrelation_test': ('CoinFlipValidator', 'autocorrelation_test', 'flips'),
+    'discrepancy_test': ('QuasirandomnessValidator', 'discrepancy_test', 'samples'),
+    'serial_test': ('QuasirandomnessValidator', 'serial_test', 'flips'),
+    'poker_test': ('QuasirandomnessValidator', 'poker_test', 'flips'),
+}
+
+
+def _validator_cases(scale: float) -> List[BenchmarkCase]:
+    def make_setup(class_name, method_name, kind, size):
+        def setup():
+            from . import golden_ratio_coin_flip as coin_flip_module
+            coin = coin_flip_module.GoldenRatioCoinFlip()
+            if kind == 'samples':
+                data = coin.generate_fractional_sequence(size)
+            else:
+                data = coin.generate_sequence(size)
+            method = getattr(getattr(coin_flip_module, class_name), method_name)
+            return lambda: method(data)
+        return setup
+
+    cases = []
+    for case, (class_name, method_name, kind) in VALIDATORS.items():
+        for size in VALIDATOR_SIZES:
+            size = _scaled(size, scale)
+            cases.append(BenchmarkCase(
+                f'validators.{case}/{size}', 'validators', kind, size,
+                make_setup(class_name, method_name, kind, size)
+            ))
+    return cases
+
+
+def _watermark_cases(scale: float) -> List[BenchmarkCase]:
+    size = _scaled(WATERMARK_PAYLOAD_SIZE, scale)
+    secret = 'benchmark-secret'
+
+    def embed_setup():
+        from .watermark import WatermarkData, embed_watermark_in_binary
+        payload = bytes(size)
+        watermark = WatermarkData('BENCH-001', 'Benchmark', timestamp=0.0)
+        return lambda: embed_watermark_in_binary(payload, watermark, secret)
+
+    def verify_setup():
+        from .watermark import WatermarkData, embed_watermark_in_binary, extract_watermark_from_binary
+        data = embed_watermark_in_binary(
+            bytes(size), WatermarkData('BENCH-001', 'Benchmark', timestamp=0.0), secret
+        )
+        return lambda: extract_watermark_from_binary(data, secret)
+
+    return [
+        BenchmarkCase(f'watermark.embed/{size}', 'watermark', 'bytes', size, embed_setup),
+        BenchmarkCase(f'watermark.verify/{size}', 'watermark', 'bytes', size, verify_setup),
+    ]
+
+
+def build_cases(scale: float = 1.0) -> List[BenchmarkCase]:
+    """
+    Return every benchmark case.
+
+    Args:
+        scale: Multiplier for item counts, sample sizes and payload sizes
+
+    Returns:
+        Benchmark cases in run order
+    """
+    if scale <= 0:
+        raise ValueError(f"Scale must be positive, got {scale}")
+    return (_generator_cases(scale) + _validator_cases(scale)
+            + _watermark_cases(scale))
+
+
+def select_cases(names: Optional[Sequence[str]] = None,
+                 scale: float = 1.0) -> List[BenchmarkCase]:
+    """
+    Select benchmark cases by group or case name.
+
+    Args:
+        names: Group names (universal, gqs1, coin-flip, validators,
+            watermark), case names, or validator names such as runs_test
+            (default: every case)
+        scale: Multiplier for item counts, sample sizes and payload sizes
+
+    Returns:
+        Selected cases in run order
+
+    Raises:
+        ValueError: If a name matches no case
+    """
+    cases = build_cases(scale)
+    if not names:
+        return cases
+
+    def matches(case, name):
+        return name in (case.group, case.name, case.name.split('/')[0],
+                        case.name.split('/')[0].split('.')[-1])
+
+    unknown = [name for name in names if not any(matches(case, name) for case in cases)]
+    if unknown:
+        raise ValueError(f"Unknown benchmark(s): {', '.join(unknown)}")
+    return [case for case in cases if any(matches(case, name) for name in names)]
+
+
+def percentile(values: Sequence[float], fraction: float) -> float:
+    """
+    Return a percentile with linear interpolation between order statistics.
+
+    Args:
+        values: Non-empty sequence of values
+        fraction: Percentile as a fraction in [0, 1]
+
+    Returns:
+        Interpolated percentile
+    """
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize_timings(timings: Sequence[float], items: int) -> Dict[str, Any]:
+    """
+    Summarize repetition timings of one case.
+
+    Args:
+        timings: Seconds per repetition
+        items: Units processed per repetition
+
+    Returns:
+        Dictionary with repetitions, min, median, mean, p90, max, stdev (all
+        seconds) and items_per_second (from the median)
+    """
+    median = statistics.median(timings)
+    return {
+        'repetitions': len(timings),
+        'min': min(timings),
+        'median': median,
+        'mean': statistics.fmean(timings),
+        'p90': percentile(timings, 0.9),
+        'max': max(timings),
+        'stdev': statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        'items_per_second': items / median if median > 0 else float('inf'),
+    }
+
+
+def run_case(case: BenchmarkCase, warmup: int = 1, repetitions: int = 5) -> Dict[str, Any]:
+    """
+    Time one case.
+
+    Args:
+        case: Case to run
+        warmup: Untimed runs before timing
+        repetitions: Timed runs
+
+    Returns:
+        Timing summary with group, unit and items added
+    """
+    if repetitions < 1:
+        raise ValueError(f"Repetitions must be at least 1, got {repetitions}")
+    func = case.setup()
+    for _ in range(warmup):
+        func()
+
+    timings = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    result = {'group': case.group, 'unit': case.unit, 'items': case.items}
+    result.update(summarize_timings(timings, case.items))
+    return result
+
+
+def run_suite(cases: Iterable[BenchmarkCase], warmup: int = 1, repetitions: int = 5,
+              progress: Optional[Callable[[str, Dict[str, Any]], None]] = None
+              ) -> Dict[str, Dict[str, Any]]:
+    """
+    Time several cases.
+
+    Args:
+        cases: Cases to run
+        warmup: Untimed runs per case
+        repetitions: Timed runs per case
+        progress: Called with (name, result) after each case
+
+    Returns:
+        Dictionary mapping case names to results, in run order
+    """
+    results = {}
+    for case in cases:
+        results[case.name] = run_case(case, warmup, repetitions)
+        if progress is not None:
+            progress(case.name, results[case.name])
+    return results
+
+
+def results_document(results: Dict[str, Dict[str, Any]], **config) -> Dict[str, Any]:
+    """
+    Wrap results with environment metadata for saving as JSON.
+
+    Args:
+        results: Results from run_suite()
+        **config: Run settings to record (warmup, repetitions, scale)
+
+    Returns:
+        JSON-serializable results document
+    """
+    from . import __version__
+
+    return {
+        'version': RESULTS_VERSION,
+        'gq_version': __version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'timestamp': time.time(),
+        'config': config,
+        'results': results,
+    }
+
+
+def load_results(path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Load the results of a saved results document.
+
+    Args:
+        path: JSON file written from results_document()
+
+    Returns:
+        Dictionary mapping case names to results
+
+    Raises:
+        ValueError: If the file is not a results document
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        document = json.load(f)
+    if not isinstance(document, dict) or not isinstance(document.get('results'), dict):
+        raise ValueError(f"Not a benchmark results file: {path}")
+    return document['results']
+
+
+def compare_results(current: Dict[str, Dict[str, Any]],
+                    baseline: Dict[str, Dict[str, Any]],
+                    threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """
+    Compare median throughput against a baseline.
+
+    Args:
+        current: Results of this run
+        baseline: Results of the baseline run
+        threshold: Relative throughput drop counted as a regression
+            (0.10 = 10% slower)
+
+    Returns:
+        One dictionary per current case with name, baseline and current
+        items_per_second, change (relative, None without a baseline) and
+        status ('regression', 'improvement', 'ok' or 'new')
+    """
+    comparison = []
+    for name, result in current.items():
+        rate = result['items_per_second']
+        entry = {'name': name, 'baseline': None, 'current': rate, 'change': None, 'status': 'new'}
+        base = baseline.get(name)
+        if base is not None and base.get('items_per_second'):
+            change = rate / base['items_per_second'] - 1.0
+            entry.update(baseline=base['items_per_second'], change=change)
+            if change < -threshold:
+                entry['status'] = 'regression'
+            elif change > threshold:
+                entry['status'] = 'improvement'
+            else:
+                entry['status'] = 'ok'
+        comparison.append(entry)
+    return comparison
+
+
+def format_result(name: str, result: Dict[str, Any]) -> str:
+    """Format one result as a table row."""
+    return (f"{name:<44} {result['items_per_second']:>16,.0f} {result['unit'] + '/s':<10}"
+            f" median {result['median'] * 1000:>9.3f}ms"
+            f"  p90 {result['p90'] * 1000:>9.3f}ms  ({result['items']:,} {result['unit']})")
+
+
+def format_comparison(entry: Dict[str, Any]) -> str:
+    """Format one comparison entry as a table row."""
+    if entry['change'] is None:
+        return f"{entry['name']:<44} {'':>16} {entry['current']:>16,.0f}  {'':>8}  new"
+    return (f"{entry['name']:<44} {entry['baseline']:>16,.0f} {entry['current']:>16,.0f}"
+            f"  {entry['change'] * 100:>+7.1f}%  {entry['status']}")
+
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark CLI
+
+Runs the gq.benchmark suite: generator, validator and watermark
+throughput with warmup, repetitions and percentiles. Results can be saved
+as JSON and compared against a baseline to catch regressions.
+"""
+
+import argparse
+import json
+import sys
+
+from ..benchmark import (
+    DEFAULT_THRESHOLD,
+    compare_results,
+    format_comparison,
+    format_result,
+    load_results,
+    results_document,
+    run_suite,
+    select_cases,
+)
+
+
+def main():
+    """Main CLI function."""
+    parser = argparse.ArgumentParser(
+        description='Measure GoldenSeed generator, validator and watermark throughput',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s                                  # Run every benchmark
+  %(prog)s universal gqs1                   # Run selected groups
+  %(prog)s validators --scale 0.1           # Smaller validator inputs
+  %(prog)s --json baseline.json             # Save results
+  %(prog)s --compare baseline.json          # Exit 1 on >10%% slowdowns
+  %(prog)s --list                           # Show case names
+        """
+    )
+
+    parser.add_argument(
+        'benchmarks',
+        nargs='*',
+        metavar='BENCHMARK',
+        help='groups (universal, gqs1, coin-flip, validators, watermark), '
+             'validator names or case names (default: all)'
+    )
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help='multiply item counts and input sizes (default: 1)')
+    parser.add_argument('--warmup', type=int, default=1,
+                        help='untimed runs per benchmark (default: 1)')
+    parser.add_argument('--repetitions', '-r', type=int, default=5,
+                        help='timed runs per benchmark (default: 5)')
+    parser.add_argument('--json', metavar='PATH',
+                        help="write results as JSON ('-' for stdout)")
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help='compare with a saved results file and exit 1 on regressions')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'relative slowdown counted as a regression '
+                             f'(default: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--list', action='store_true', help='list benchmark cases and exit')
+
+    args = parser.parse_args()
+
+    if args.scale <= 0:
+        print("ERROR: --scale must be positive", file=sys.stderr)
+        return 1
+    if args.warmup < 0 or args.repetitions < 1:
+        print("ERROR: --warmup must be non-negative and --repetitions positive", file=sys.stderr)
+        return 1
+    if args.threshold < 0:
+        print("ERROR: --threshold must be non-negative", file=sys.stderr)
+        return 1
+
+    try:
+        cases = select_cases(args.benchmarks, args.scale)
+        baseline = load_results(args.compare) if args.compare else None
+    except (ValueError, OSError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+
+    if args.list:
+        for case in cases:
+            print(f"{case.name:<44} {case.group:<12} {case.items:,} {case.unit}")
+        return 0
+
+    # Keep stdout clean for JSON when writing it there
+    table = sys.stderr if args.json == '-' else sys.stdout
+    results = run_suite(
+        cases, args.warmup, args.repetitions,
+        progress=lambda name, result: print(format_result(name, result), file=table, flush=True)
+    )
+
+    if args.json:
+        document = results_document(results, warmup=args.warmup,
+                                    repetitions=args.repetitions, scale=args.scale)
+        if args.json == '-':
+            print(json.dumps(document, indent=2))
+        else:
+            with open(args.json, 'w', encoding='utf-8') as f:
+                json.dump(document, f, indent=2)
+                f.write('\n')
+
+    if baseline is None:
+        return 0
+
+    comparison = compare_results(results, baseline, args.threshold)
+    print(f"\n{'benchmark':<44} {'baseline/s':>16} {'current/s':>16}  {'change':>8}  status",
+          file=table)
+    for entry in comparison:
+        print(format_comparison(entry), file=table)
+
+    regressions = [entry['name'] for entry in comparison if entry['status'] == 'regression']
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}: "
+              f"{', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -3,19 +3,35 @@
 Golden Ratio Coin Flip CLI
 
 Command-line interface for generating and validating golden ratio coin flips.
+
+Flips are generated and written in fixed-size chunks, so memory use is
+constant regardless of --num-flips. The raw format packs 8 flips per byte
+(MSB first) for use as a bulk bit source.
 """
 
 import argparse
 import sys
-from typing import List
+from typing import List, Optional, TextIO
 
 from ..golden_ratio_coin_flip import (
     GoldenRatioCoinFlip,
+    PerformanceMetricsValidator,
     comprehensive_validation,
     PHI,
 )
 
 
+# Flips per chunk: a multiple of 8 (raw bytes) and 80 (binary line width)
+CHUNK_FLIPS = 80 * 8 * 1024
+
+# Number of {Z*phi} rows shown by --show-fracs
+SHOW_FRACS_ROWS = 50
+
+# 8-character bit strings for every byte value, MSB first
+_BYTE_BITS = [format(b, '08b') for b in range(256)]
+_TEXT_TABLE = str.maketrans('01', 'HT')
+
+
 def format_flips(flips: List[int], format: str = 'binary') -> str:
     """Format coin flips for output."""
     if format == 'binary':
@@ -28,6 +44,121 @@ def format_flips(flips: List[int], format: str = 'binary') -> str:
         return str(flips)
 
 
+def format_packed_flips(packed: bytes, count: int, format: str = 'binary') -> str:
+    """
+    Format packed coin flips (8 per byte, MSB first) for output.
+
+    Produces the same text as format_flips() on the unpacked flips.
+    """
+    bits = ''.join([_BYTE_BITS[b] for b in packed])[:count]
+    if format == 'binary':
+        return bits
+    elif format == 'text':
+        return bits.translate(_TEXT_TABLE)
+    elif format == 'list':
+        return ', '.join(bits)
+    else:
+        raise ValueError(f"Unsupported format: {format}")
+
+
+def write_flips(out, generator: GoldenRatioCoinFlip, num_flips: int,
+                start: int = 1, format: str = 'binary',
+                chunk_size: int = CHUNK_FLIPS) -> int:
+    """
+    Stream coin flips for Z = start to start + num_flips - 1 to a file.
+
+    Args:
+        out: Binary file for the raw format, text file otherwise
+        generator: Coin flip generator
+        num_flips: Number of flips to write
+        start: First Z value
+        format: 'raw', 'binary', 'text' or 'list'
+        chunk_size: Flips per chunk (multiple of 8; of 80 for binary)
+
+    Returns:
+        Number of heads (0 flips) written
+    """
+    heads = 0
+    for offset in range(0, num_flips, chunk_size):
+        count = min(chunk_size, num_flips - offset)
+        packed = generator.generate_packed(count, start + offset)
+        heads += count - bin(int.from_bytes(packed, 'big')).count('1')
+
+        if format == 'raw':
+            out.write(packed)
+            continue
+
+        text = format_packed_flips(packed, count, format)
+        if format == 'binary':
+            # Break into lines of 80 characters
+            text = '\n'.join(text[i:i + 80] for i in range(0, len(text), 80))
+            separator = '\n'
+        elif format == 'list':
+            separator = ', '
+        else:
+            separator = ''
+        if offset:
+            out.write(separator)
+        out.write(text)
+
+    return heads
+
+
+def print_validation_result(result: dict) -> None:
+    """Print a validation summary to stderr."""
+    eq = result['equidistribution']
+    print(f"Equidistribution (KS): {'✓' if eq['ks_test']['passed'] else '✗'} "
+          f"(D={eq['ks_test']['ks_statistic']:.6f})", file=sys.stderr)
+    print(f"Equidistribution (χ²): {'✓' if eq['chi_square']['passed'] else '✗'} "
+          f"(χ²={eq['chi_square']['chi_square']:.2f})", file=sys.stderr)
+
+    cf = result['coin_flip_fairness']
+    print(f"Fair Coin Flip: {'✓' if cf['balance']['passed'] else '✗'} "
+          f"(ratio={cf['balance']['heads_ratio']:.6f})", file=sys.stderr)
+
+    qr = result['quasirandomness']
+    print(f"Low Discrepancy: {'✓' if qr['discrepancy']['low_discrepancy'] else '✗'} "
+          f"(D*={qr['discrepancy']['star_discrepancy']:.6f})", file=sys.stderr)
+
+
+def run_budgeted_validation(time_budget: Optional[float],
+                            memory_budget_mb: Optional[float]) -> int:
+    """
+    Validate growing Z ranges within a time/memory budget.
+
+    Results of each stage are reported as soon as it completes.
+    """
+    memory_budget = (int(memory_budget_mb * 1024 * 1024)
+                     if memory_budget_mb is not None else None)
+    stages = PerformanceMetricsValidator.progressive_validation(
+        time_budget=time_budget, memory_budget=memory_budget
+    )
+
+    all_passed = True
+    largest = None
+    for result in stages:
+        print(f"Stage z_max={result['z_max']} "
+              f"({result['elapsed_seconds']:.2f}s, "
+              f"~{result['estimated_memory_bytes'] / (1024 * 1024):.1f} MB):",
+              file=sys.stderr)
+        print("-" * 60, file=sys.stderr)
+        print_validation_result(result)
+        print(file=sys.stderr, flush=True)
+        all_passed = all_passed and result['overall_passed']
+        largest = result['z_max']
+
+    if largest is None:
+        print("✗ Budget too small to run any validation stage", file=sys.stderr)
+        return 1
+
+    print(f"Validated up to z_max={largest} within budget", file=sys.stderr)
+    if all_passed:
+        print("✓ All validations PASSED", file=sys.stderr)
+    else:
+        print("✗ Some validations failed (see details above)", file=sys.stderr)
+    return 0
+
+
 def main():
     """Main CLI function."""
     parser = argparse.ArgumentParser(
@@ -40,6 +171,12 @@ Examples:
   %(prog)s --validate                 # Run comprehensive validation
   %(prog)s -n 50 --show-fracs         # Show fractional values too
   %(prog)s -n 10000 -o flips.txt      # Save to file
+  %(prog)s -n 100000000 --format raw -q > flips.bin
+                                      # Stream packed flips (8 per byte)
+  %(prog)s -n 8000 --start 1000001 --format raw -q
+                                      # Flips for Z = 1000001..1008000
+  %(prog)s --validate --time-budget 10
+                                      # Validate growing ranges for ~10s
         """
     )
 
@@ -51,11 +188,20 @@ Examples:
         help='number of coin flips to generate (default: 100)'
     )
 
+    parser.add_argument(
+        '--start',
+        type=int,
+        default=1,
+        metavar='Z',
+        help='first Z value (default: 1)'
+    )
+
     parser.add_argument(
         '--format',
-        choices=['binary', 'text', 'list'],
+        choices=['binary', 'text', 'list', 'raw'],
         default='binary',
-        help='output format: binary (01), text (HT), or list (default: binary)'
+        help='output format: binary (01), text (HT), list, or raw '
+             '(8 flips per byte, MSB first) (default: binary)'
     )
 
     parser.add_argument(
@@ -70,6 +216,20 @@ Examples:
         help='run comprehensive validation tests'
     )
 
+    parser.add_argument(
+        '--time-budget',
+        type=float,
+        metavar='SECONDS',
+        help='with --validate: validate growing Z ranges until the time budget is spent'
+    )
+
+    parser.add_argument(
+        '--memory-budget',
+        type=float,
+        metavar='MB',
+        help='with --validate: largest estimated memory for a validation stage'
+    )
+
     parser.add_argument(
         '-o', '--output',
         type=str,
@@ -92,6 +252,12 @@ Examples:
         print(file=sys.stderr)
 
     if args.validate:
+        if args.time_budget is not None or args.memory_budget is not None:
+            if not args.quiet:
+                print("Running budgeted validation...", file=sys.stderr)
+                print(file=sys.stderr)
+            return run_budgeted_validation(args.time_budget, args.memory_budget)
+
         if not args.quiet:
             print("Running comprehensive validation...", file=sys.stderr)
             print(file=sys.stderr)
@@ -100,19 +266,7 @@ Examples:
 
         print("Validation Results:", file=sys.stderr)
         print("-" * 60, file=sys.stderr)
-        eq = result['equidistribution']
-        print(f"Equidistribution (KS): {'✓' if eq['ks_test']['passed'] else '✗'} "
-              f"(D={eq['ks_test']['ks_statistic']:.6f})", file=sys.stderr)
-        print(f"Equidistribution (χ²): {'✓' if eq['chi_square']['passed'] else '✗'} "
-              f"(χ²={eq['chi_square']['chi_square']:.2f})", file=sys.stderr)
-
-        cf = result['coin_flip_fairness']
-        print(f"Fair Coin Flip: {'✓' if cf['balance']['passed'] else '✗'} "
-              f"(ratio={cf['balance']['heads_ratio']:.6f})", file=sys.stderr)
-
-        qr = result['quasirandomness']
-        print(f"Low Discrepancy: {'✓' if qr['discrepancy']['low_discrepancy'] else '✗'} "
-              f"(D*={qr['discrepancy']['star_discrepancy']:.6f})", file=sys.stderr)
+        print_validation_result(result)
 
         print(file=sys.stderr)
         if result['overall_passed']:
@@ -122,65 +276,73 @@ Examples:
 
         return 0
 
+    if args.num_flips < 1:
+        print("ERROR: Number of flips must be at least 1", file=sys.stderr)
+        return 1
+
     # Generate coin flips
     if not args.quiet:
         print(f"Generating {args.num_flips} coin flips...", file=sys.stderr)
         print(file=sys.stderr)
 
     generator = GoldenRatioCoinFlip()
-    flips = generator.generate_sequence(args.num_flips)
+    raw = args.format == 'raw'
 
-    output_lines = []
+    # Raw output is pure data; informational text goes to stderr instead
+    header_lines = []
 
     if args.show_fracs:
-        fracs = generator.generate_fractional_sequence(args.num_flips)
-        output_lines.append("Z\tFractional\tCoin")
-        output_lines.append("-" * 40)
-        for z in range(1, min(args.num_flips + 1, 51)):  # Show first 50
-            output_lines.append(f"{z}\t{fracs[z-1]:.6f}\t{flips[z-1]}")
-        if args.num_flips > 50:
-            output_lines.append("...")
-        output_lines.append("")
-
-    # Format flips
-    formatted = format_flips(flips, args.format)
-
-    if not args.quiet and not args.show_fracs:
-        output_lines.append("Coin Flips:")
-        output_lines.append("-" * 60)
-
-    if args.format == 'binary':
-        # Break into lines of 80 characters
-        for i in range(0, len(formatted), 80):
-            output_lines.append(formatted[i:i+80])
-    else:
-        output_lines.append(formatted)
+        header_lines.append("Z\tFractional\tCoin")
+        header_lines.append("-" * 40)
+        for z in range(args.start, args.start + min(args.num_flips, SHOW_FRACS_ROWS)):
+            header_lines.append(f"{z}\t{generator.fractional_value(z):.6f}\t"
+                                f"{generator.coin_flip(z)}")
+        if args.num_flips > SHOW_FRACS_ROWS:
+            header_lines.append("...")
+        header_lines.append("")
+
+    if not args.quiet and not args.show_fracs and not raw:
+        header_lines.append("Coin Flips:")
+        header_lines.append("-" * 60)
 
-    if not args.quiet:
-        output_lines.append("")
-        heads = sum(1 for f in flips if f == 0)
-        tails = len(flips) - heads
-        output_lines.append(f"Statistics:")
-        output_lines.append(f"  Heads: {heads} ({heads/len(flips)*100:.2f}%)")
-        output_lines.append(f"  Tails: {tails} ({tails/len(flips)*100:.2f}%)")
+    # Write output
+    try:
+        if args.output:
+            out = open(args.output, 'wb' if raw else 'w')
+        else:
+            out = sys.stdout.buffer if raw else sys.stdout
+    except IOError as e:
+        print(f"ERROR: Failed to write to {args.output}: {e}", file=sys.stderr)
+        return 1
 
-    output_str = "\n".join(output_lines)
+    info: TextIO = sys.stderr if raw else out
+    try:
+        for line in header_lines:
+            info.write(line + "\n")
 
-    # Write output
-    if args.output:
-        try:
-            with open(args.output, 'w') as f:
-                f.write(output_str)
-                if not output_str.endswith('\n'):
-                    f.write('\n')
+        heads = write_flips(out, generator, args.num_flips, args.start, args.format)
 
-            if not args.quiet:
-                print(f"\n✓ Output written to {args.output}", file=sys.stderr)
-        except IOError as e:
-            print(f"ERROR: Failed to write to {args.output}: {e}", file=sys.stderr)
-            return 1
-    else:
-        print(output_str)
+        if not args.quiet:
+            tails = args.num_flips - heads
+            if not raw:
+                info.write("\n")
+            info.write("\nStatistics:\n")
+            info.write(f"  Heads: {heads} ({heads/args.num_flips*100:.2f}%)\n")
+            info.write(f"  Tails: {tails} ({tails/args.num_flips*100:.2f}%)")
+        if not raw:
+            out.write("\n")
+        elif not args.quiet:
+            info.write("\n")
+        out.flush()
+    except IOError as e:
+        print(f"ERROR: Failed to write to {args.output}: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if args.output:
+            out.close()
+
+    if args.output and not args.quiet:
+        print(f"\n✓ Output written to {args.output}", file=sys.stderr)
 
     return 0
 
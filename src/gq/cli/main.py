@@ -0,0 +1,92 @@
+"""
+Unified gq Command
+
+Single entry point for every GoldenSeed command-line tool:
+
+    gq universal ...    GCP-1 universal key generator (gq-universal)
+    gq gqs1 ...         GQS-1 test vector generator (gq-test-vectors)
+    gq coin-flip ...    Golden ratio coin flips (gq-coin-flip)
+    gq watermark ...    Watermark embed/verify/audit/scan/issue
+    gq bench ...        Throughput benchmarks
+    gq serve ...        Local HTTP stream server
+
+The dispatcher itself imports nothing beyond sys and importlib. Each
+subcommand module is imported only when it is dispatched, so short calls
+such as `gq universal -n 1 -q` do not pay for argparse setups, numpy or the
+watermark stack of the other tools.
+"""
+
+import importlib
+import sys
+from typing import List, Optional
+
+
+# Subcommand -> (module relative to gq.cli, one-line description)
+SUBCOMMANDS = {
+    'universal': ('.universal', 'GCP-1 universal key generator'),
+    'gqs1': ('.gqs1', 'GQS-1 test vector generator'),
+    'coin-flip': ('.golden_ratio_coin_flip', 'golden ratio coin flips and validation'),
+    'watermark': ('.watermark', 'embed, verify, audit, scan and issue watermarks'),
+    'bench': ('.bench', 'throughput benchmarks'),
+    'serve': ('.serve', 'serve stream ranges over HTTP on localhost or a Unix socket'),
+}
+
+
+def format_usage() -> str:
+    """Return the top-level help text."""
+    lines = [
+        "usage: gq <command> [options]",
+        "",
+        "GoldenSeed deterministic stream tools.",
+        "",
+        "commands:",
+    ]
+    width = max(len(name) for name in SUBCOMMANDS)
+    for name, (_, description) in SUBCOMMANDS.items():
+        lines.append(f"  {name:<{width}}  {description}")
+    lines.extend([
+        "",
+        "Run 'gq <command> --help' for command options.",
+    ])
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Dispatch to a subcommand.
+
+    Args:
+        argv: Arguments after the program name (default: sys.argv[1:])
+
+    Returns:
+        Exit code of the subcommand
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if not argv or argv[0] in ('-h', '--help'):
+        print(format_usage())
+        return 0 if argv else 2
+
+    if argv[0] == '--version':
+        from .. import __version__
+        print(f"gq {__version__}")
+        return 0
+
+    command = argv[0]
+    if command not in SUBCOMMANDS:
+        print(format_usage(), file=sys.stderr)
+        print(f"\ngq: error: unknown command '{command}'", file=sys.stderr)
+        return 2
+
+    module_name, _ = SUBCOMMANDS[command]
+    module = importlib.import_module(module_name, __package__)
+
+    # Subcommands parse sys.argv; the program name shows up in their --help
+    sys.argv = [f"gq {command}"] + list(argv[1:])
+    result = module.main()
+    return result if isinstance(result, int) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
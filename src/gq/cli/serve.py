@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Stream Server CLI
+
+Serves GoldenSeed stream ranges to local consumers over HTTP:
+
+    GET /stream/{protocol}/{seed}?offset=&length=
+
+on a localhost TCP port or a Unix socket.
+"""
+
+import argparse
+import sys
+
+
+def main():
+    """Main CLI function."""
+    parser = argparse.ArgumentParser(
+        description='Serve GoldenSeed stream ranges over HTTP on localhost or a Unix socket',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s                                   # http://127.0.0.1:8642
+  %(prog)s --unix /run/gq.sock --workers 4
+  curl 'http://127.0.0.1:8642/stream/gcp1/<seed>?offset=0&length=4096'
+  curl -H 'Range: bytes=1024-2047' 'http://127.0.0.1:8642/stream/gqs1/<seed>?length=65536'
+        """
+    )
+
+    parser.add_argument('--host', default='127.0.0.1', help='interface to bind (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8642, help='TCP port (default: 8642)')
+    parser.add_argument('--unix', metavar='PATH', help='serve on a Unix socket instead of TCP')
+    parser.add_argument('--workers', type=int, metavar='N',
+                        help='generator processes (default: CPU count)')
+    parser.add_argument('--cache-mb', type=int, default=256,
+                        help='hot range cache size in MiB (default: 256)')
+    parser.add_argument('--max-length-mb', type=int, default=16,
+                        help='largest response in MiB (default: 16)')
+    parser.add_argument('--max-offset-mb', type=int, default=1024,
+                        help='stream position every range must end by, in MiB (default: 1024)')
+
+    args = parser.parse_args()
+
+    if args.workers is not None and args.workers < 1:
+        print("ERROR: --workers must be at least 1", file=sys.stderr)
+        return 1
+    if args.cache_mb < 0 or args.max_length_mb < 1 or args.max_offset_mb < 1:
+        print("ERROR: --cache-mb must be non-negative and --max-length-mb and "
+              "--max-offset-mb positive", file=sys.stderr)
+        return 1
+
+    from ..stream_server import run_server
+
+    where = args.unix if args.unix else f"http://{args.host}:{args.port}"
+    print(f"Serving GoldenSeed streams on {where}", file=sys.stderr)
+    run_server(
+        host=args.host,
+        port=args.port,
+        unix_path=args.unix,
+        max_workers=args.workers,
+        cache_size=args.cache_mb * 1024 * 1024,
+        max_length=args.max_length_mb * 1024 * 1024,
+        max_offset=args.max_offset_mb * 1024 * 1024,
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
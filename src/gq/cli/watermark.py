@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Watermark CLI
+
+Command-line interface for the commercial licensing watermark tools:
+
+- embed: write a watermarked copy of a file
+- verify: verify one file's trailer (and v2 payload digest)
+- audit: verify every file under directories, as JSON lines
+- scan: find trailers embedded anywhere inside files, as JSON lines
+- issue: issue one watermarked copy per license record, with a manifest
+
+Secrets come from --secret (repeatable, tried in order) or the
+WATERMARK_SECRET environment variable.
+
+Exit codes (shared with scripts/verify_watermark.py, which reuses
+audit_paths() and scan_paths()):
+- 0: verified (audit: every file; scan: at least one embedded trailer)
+- 1: verification failed or an error occurred
+- 2: no watermark found (verify: no trailer; scan: no embedded trailers)
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Iterable, List, Optional, Sequence
+
+from ..watermark import (
+    WatermarkData,
+    WatermarkError,
+    WatermarkKeyring,
+    audit_watermark_file,
+    audit_watermarks,
+    issue_watermarked_copies,
+    load_watermark_records,
+    summarize_audit,
+    write_watermarked_copy,
+)
+
+
+def get_secrets(args: argparse.Namespace) -> List[str]:
+    """Collect secrets from --secret or WATERMARK_SECRET."""
+    secrets = list(args.secret or [])
+    if not secrets and os.environ.get('WATERMARK_SECRET'):
+        secrets.append(os.environ['WATERMARK_SECRET'])
+    if not secrets:
+        raise WatermarkError(
+            "Secret key is required. Provide via --secret or WATERMARK_SECRET env var."
+        )
+    return secrets
+
+
+def audit_paths(paths: Iterable[str], secrets: Sequence[str], workers: Optional[int] = None,
+                verify_payload: bool = False) -> int:
+    """
+    Audit all files under paths, streaming JSON lines to stdout.
+
+    Each file produces one JSON object; a final {"summary": ...} line
+    reports the totals, which are also printed to stderr.
+
+    Returns:
+        Exit code: 0 if every file verified, 1 otherwise
+    """
+    keyring = WatermarkKeyring(secrets)
+
+    def emit(results):
+        for result in results:
+            print(json.dumps(result), flush=True)
+            yield result
+
+    summary = summarize_audit(emit(audit_watermarks(paths, keyring, workers, verify_payload)))
+    print(json.dumps({'summary': summary}), flush=True)
+    print(f"Audited {summary['total']} files: "
+          f"{summary['verified']} verified, {summary['failed']} failed, "
+          f"{summary['unwatermarked']} unwatermarked, {summary['errors']} errors",
+          file=sys.stderr)
+    return 0 if summary['total'] and summary['verified'] == summary['total'] else 1
+
+
+def scan_paths(paths: Iterable[str], secrets: Sequence[str], workers: Optional[int] = None) -> int:
+    """
+    Scan files for trailers embedded anywhere, streaming JSON lines to stdout.
+
+    Each trailer found produces one JSON object with its file and offset;
+    a final {"summary": ...} line reports the totals.
+
+    Returns:
+        Exit code: 0 if any trailer verified, 2 if none were found,
+        1 otherwise
+    """
+    from ..watermark_scan import scan_file
+
+    keyring = WatermarkKeyring(secrets)
+    summary = {'files': 0, 'trailers': 0, 'verified': 0, 'errors': 0}
+    for path in paths:
+        summary['files'] += 1
+        try:
+            found = scan_file(path, keyring, max_workers=workers)
+        except WatermarkError as e:
+            summary['errors'] += 1
+            print(json.dumps({'file': str(path), 'error': str(e)}), flush=True)
+            continue
+        for result in found:
+            summary['trailers'] += 1
+            summary['verified'] += bool(result['verified'])
+            print(json.dumps({'file': str(path), **result}), flush=True)
+
+    print(json.dumps({'summary': summary}), flush=True)
+    print(f"Scanned {summary['files']} files: {summary['trailers']} trailers found, "
+          f"{summary['verified']} verified", file=sys.stderr)
+    if summary['verified']:
+        return 0
+    return 2 if not summary['trailers'] else 1
+
+
+def run_embed(args: argparse.Namespace) -> int:
+    """Write a watermarked copy of a file."""
+    watermark = WatermarkData(args.license_id, args.user_info)
+    original_size = write_watermarked_copy(
+        args.input, args.output, watermark, get_secrets(args)[0], args.trailer_version
+    )
+    print(json.dumps({
+        'file': args.output,
+        'original_size': original_size,
+        'signature': watermark.signature.hex(),
+        'watermark': watermark.to_dict(),
+    }))
+    return 0
+
+
+def run_verify(args: argparse.Namespace) -> int:
+    """Verify one file against each secret in turn."""
+    result = audit_watermark_file(
+        args.input, WatermarkKeyring(get_secrets(args)), verify_payload=not args.trailer_only
+    )
+    if not result['verified']:
+        print(json.dumps({'file': args.input, 'verified': False, 'error': result['error']}))
+        return 1 if result['watermarked'] else 2
+    print(json.dumps({
+        'file': args.input,
+        'verified': True,
+        'key_index': result['key_index'],
+        'version': result['version'],
+        'original_size': result['original_size'],
+        'watermark': result['watermark'],
+    }))
+    return 0
+
+
+def run_audit(args: argparse.Namespace) -> int:
+    """Audit directory trees, streaming JSON lines and a summary."""
+    return audit_paths(args.paths, get_secrets(args), args.workers, args.verify_payload)
+
+
+def run_scan(args: argparse.Namespace) -> int:
+    """Scan files for embedded trailers, streaming JSON lines."""
+    return scan_paths(args.paths, get_secrets(args), args.workers)
+
+
+def run_issue(args: argparse.Namespace) -> int:
+    """Issue one watermarked copy per license record."""
+    records = load_watermark_records(args.records)
+    manifest_path = args.manifest or os.path.join(args.output_dir, 'manifest.json')
+    manifest = issue_watermarked_copies(
+        args.input, records, get_secrets(args)[0], args.output_dir,
+        name_template=args.name_template, manifest_path=manifest_path,
+        max_workers=args.workers, version=args.trailer_version,
+    )
+    print(f"Issued {len(manifest)} copies; manifest: {manifest_path}", file=sys.stderr)
+    return 0
+
+
+def main():
+    """Main CLI function."""
+    parser = argparse.ArgumentParser(
+        description='Embed, verify, audit, scan and issue licensing watermarks',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s embed seed.bin licensed.bin --license-id LIC-001 --user-info "Acme"
+  %(prog)s verify licensed.bin
+  %(prog)s audit /srv/mirror --secret NEW --secret OLD > audit.jsonl
+  %(prog)s scan bundle.tar
+  %(prog)s issue seed.bin licenses.csv output/licensed
+
+Return Codes:
+  0 - Verified (audit: every file; scan: at least one embedded trailer)
+  1 - Verification failed or error occurred
+  2 - No watermark found (verify: no trailer; scan: no embedded trailers)
+        """
+    )
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        '--secret',
+        action='append',
+        help='secret key (or set WATERMARK_SECRET); repeat to try several keys'
+    )
+
+    subparsers = parser.add_subparsers(dest='action', required=True)
+
+    embed = subparsers.add_parser('embed', parents=[common],
+                                  help='write a watermarked copy of a file')
+    embed.add_argument('input', help='input binary file')
+    embed.add_argument('output', help='output watermarked file')
+    embed.add_argument('--license-id', required=True, help='license identifier')
+    embed.add_argument('--user-info', required=True, help='user or organization')
+    embed.add_argument('--trailer-version', type=int, choices=[1, 2],
+                       default=WatermarkData.VERSION,
+                       help=f'trailer version (default: {WatermarkData.VERSION})')
+    embed.set_defaults(run=run_embed)
+
+    verify = subparsers.add_parser('verify', parents=[common],
+                                   help='verify one watermarked file')
+    verify.add_argument('input', help='watermarked file')
+    verify.add_argument('--trailer-only', action='store_true',
+                        help='skip hashing the payload of v2 trailers')
+    verify.set_defaults(run=run_verify)
+
+    audit = subparsers.add_parser('audit', parents=[common],
+                                  help='verify every file under directories')
+    audit.add_argument('paths', nargs='+', help='files or directories')
+    audit.add_argument('--workers', type=int, metavar='N', help='thread count')
+    audit.add_argument('--verify-payload', action='store_true',
+                       help='also hash payloads of v2 trailers')
+    audit.set_defaults(run=run_audit)
+
+    scan = subparsers.add_parser('scan', parents=[common],
+                                 help='find trailers embedded inside files')
+    scan.add_argument('paths', nargs='+', help='files to scan')
+    scan.add_argument('--workers', type=int, metavar='N', help='verification process count')
+    scan.set_defaults(run=run_scan)
+
+    issue = subparsers.add_parser('issue', parents=[common],
+                                  help='issue one copy per license record')
+    issue.add_argument('input', help='base binary file')
+    issue.add_argument('records', help='CSV or JSON license records')
+    issue.add_argument('output_dir', help='directory for the copies')
+    issue.add_argument('--name-template', default='{stem}-{license_id}{suffix}',
+                       help='output file name template')
+    issue.add_argument('--manifest', help='manifest path (default: <output_dir>/manifest.json)')
+    issue.add_argument('--workers', type=int, metavar='N', help='thread count')
+    issue.add_argument('--trailer-version', type=int, choices=[1, 2],
+                       default=WatermarkData.VERSION,
+                       help=f'trailer version (default: {WatermarkData.VERSION})')
+    issue.set_defaults(run=run_issue)
+
+    args = parser.parse_args()
+
+    if getattr(args, 'workers', None) is not None and args.workers < 1:
+        print("ERROR: --workers must be at least 1", file=sys.stderr)
+        return 1
+
+    try:
+        return args.run(args)
+    except WatermarkError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
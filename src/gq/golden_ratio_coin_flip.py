@@ -25,13 +25,28 @@ Date: 2026-01-05
 
 import math
 import struct
+import sys
 import hashlib
-from typing import List, Dict, Any, Tuple
-from collections import Counter
+import time
+from typing import List, Dict, Any, Tuple, Optional, Sequence, Union, Iterator
+
+from . import instrumentation
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
 
 # Golden ratio constant
 PHI = (1 + math.sqrt(5)) / 2  # φ ≈ 1.618033988749895
 
+# Longest bit pattern supported by the serial and poker tests (2^24 counters)
+MAX_PATTERN_LENGTH = 24
+
+# Flip sequences may be given as a list/array of 0/1 values or packed
+# 8 flips per byte, most significant bit first
+FlipSequence = Union[Sequence[int], bytes, bytearray, memoryview]
+
 
 def fractional_part(x: float) -> float:
     """
@@ -46,6 +61,120 @@ def fractional_part(x: float) -> float:
     return x - math.floor(x)
 
 
+def pack_flips(flips: Sequence[int]) -> bytes:
+    """
+    Pack coin flips 8 per byte, most significant bit first.
+    
+    The last byte is zero-padded when the number of flips is not a
+    multiple of 8.
+    
+    Args:
+        flips: Sequence of coin flips (0 or 1)
+        
+    Returns:
+        Packed bytes
+    """
+    if np is not None:
+        return np.packbits(np.asarray(flips, dtype=np.uint8)).tobytes()
+    
+    packed = bytearray()
+    for i in range(0, len(flips), 8):
+        byte = 0
+        for j, flip in enumerate(flips[i:i + 8]):
+            byte |= flip << (7 - j)
+        packed.append(byte)
+    return bytes(packed)
+
+
+def _is_packed(flips: FlipSequence) -> bool:
+    """Return True if flips are packed 8 per byte."""
+    return isinstance(flips, (bytes, bytearray, memoryview))
+
+
+def _flip_bits(flips: FlipSequence, num_flips: Optional[int] = None):
+    """
+    Normalize a flip sequence to one 0/1 value per flip.
+
+    Args:
+        flips: Flips as a 0/1 sequence or packed bytes (MSB first)
+        num_flips: Number of valid flips in packed input (default: 8 per byte)
+
+    Returns:
+        uint8 NumPy array if numpy is available, otherwise a sequence of ints
+    """
+    if _is_packed(flips):
+        total = len(flips) * 8
+        if num_flips is None:
+            num_flips = total
+        elif not 0 <= num_flips <= total:
+            raise ValueError(
+                f"num_flips must be between 0 and {total} for {len(flips)} packed bytes"
+            )
+        if np is not None:
+            return np.unpackbits(np.frombuffer(flips, dtype=np.uint8))[:num_flips]
+        return [(byte >> (7 - j)) & 1 for byte in bytes(flips) for j in range(8)][:num_flips]
+
+    if np is not None:
+        return np.asarray(flips, dtype=np.uint8)
+    return flips
+
+
+def _check_pattern_length(length: int) -> None:
+    """Raise ValueError if a pattern length cannot be counted."""
+    if not 1 <= length <= MAX_PATTERN_LENGTH:
+        raise ValueError(
+            f"Pattern length must be between 1 and {MAX_PATTERN_LENGTH}, got {length}"
+        )
+
+
+def _pattern_counts(bits, length: int, overlapping: bool) -> Tuple[Any, int]:
+    """
+    Count every L-bit pattern using rolling integer window codes.
+
+    Each window is encoded as an integer code (first flip in the most
+    significant bit) and counted in a flat array of 2^L counters, so the cost
+    is O(n) regardless of pattern length.
+
+    Args:
+        bits: Flip values from _flip_bits()
+        length: Pattern length L (1 to MAX_PATTERN_LENGTH)
+        overlapping: Count every window (True) or consecutive blocks (False)
+
+    Returns:
+        Tuple of (counts indexed by window code, number of windows)
+    """
+    _check_pattern_length(length)
+
+    n = len(bits)
+    num_codes = 1 << length
+
+    if np is not None:
+        if overlapping:
+            num_windows = max(n - length + 1, 0)
+            codes = np.zeros(num_windows, dtype=np.uint32)
+            for i in range(length):
+                codes <<= 1
+                codes |= bits[i:i + num_windows]
+        else:
+            num_windows = n // length
+            blocks = bits[:num_windows * length].reshape(num_windows, length)
+            codes = np.zeros(num_windows, dtype=np.uint32)
+            for i in range(length):
+                codes <<= 1
+                codes |= blocks[:, i]
+        return np.bincount(codes, minlength=num_codes), num_windows
+
+    counts = [0] * num_codes
+    mask = num_codes - 1
+    code = 0
+    for i, bit in enumerate(bits):
+        code = ((code << 1) | bit) & mask
+        if i + 1 >= length and (overlapping or (i + 1) % length == 0):
+            counts[code] += 1
+    num_windows = max(n - length + 1, 0) if overlapping else n // length
+    return counts, num_windows
+
+
 class GoldenRatioCoinFlip:
     """
     Generates coin flips using the golden ratio sequence {Z·φ}.
@@ -115,6 +244,38 @@ class GoldenRatioCoinFlip:
             List of fractional values in [0, 1)
         """
         return [self.fractional_value(z) for z in range(1, z_max + 1)]
+    
+    def generate_range(self, start: int, count: int) -> List[int]:
+        """
+        Generate coin flips for Z = start to start + count - 1.
+        
+        Args:
+            start: First Z value
+            count: Number of flips
+            
+        Returns:
+            List of coin flips (0 or 1)
+        """
+        return [self.coin_flip(z) for z in range(start, start + count)]
+    
+    def generate_packed(self, count: int, start: int = 1) -> bytes:
+        """
+        Generate coin flips packed 8 per byte (MSB first).
+        
+        Flips are identical to coin_flip(z) for Z = start to start + count - 1.
+        With numpy available they are computed in one vectorized pass.
+        
+        Args:
+            count: Number of flips
+            start: First Z value (default: 1)
+            
+        Returns:
+            ceil(count / 8) bytes, the last one zero-padded
+        """
+        if np is not None:
+            products = np.arange(start, start + count, dtype=np.float64) * self.phi
+            return np.packbits(products - np.floor(products) >= 0.5).tobytes()
+        return pack_flips(self.generate_range(start, count))
 
 
 class EquidistributionValidator:
@@ -125,6 +286,7 @@ class EquidistributionValidator:
     """
     
     @staticmethod
+    @instrumentation.timed('coin_flip.kolmogorov_smirnov_test')
     def kolmogorov_smirnov_test(samples: List[float]) -> Dict[str, Any]:
         """
         Kolmogorov-Smirnov test for uniform distribution.
@@ -164,6 +326,7 @@ class EquidistributionValidator:
         }
     
     @staticmethod
+    @instrumentation.timed('coin_flip.uniformity_chi_square')
     def uniformity_chi_square(samples: List[float], num_bins: int = 100) -> Dict[str, Any]:
         """
         Chi-square test for uniformity across bins.
@@ -206,6 +369,7 @@ class EquidistributionValidator:
         }
     
     @staticmethod
+    @instrumentation.timed('coin_flip.gap_test')
     def gap_test(samples: List[float], alpha: float = 0.5, beta: float = 0.5) -> Dict[str, Any]:
         """
         Gap test for randomness.
@@ -263,6 +427,7 @@ class CoinFlipValidator:
     """
     
     @staticmethod
+    @instrumentation.timed('coin_flip.analyze_balance')
     def analyze_balance(flips: List[int]) -> Dict[str, Any]:
         """
         Analyze the balance of heads (0) and tails (1) in coin flips.
@@ -308,6 +473,7 @@ class CoinFlipValidator:
         }
     
     @staticmethod
+    @instrumentation.timed('coin_flip.runs_test')
     def runs_test(flips: List[int]) -> Dict[str, Any]:
         """
         Runs test for coin flip sequence.
@@ -355,6 +521,7 @@ class CoinFlipValidator:
         }
     
     @staticmethod
+    @instrumentation.timed('coin_flip.autocorrelation_test')
     def autocorrelation_test(flips: List[int], max_lag: int = 10) -> Dict[str, Any]:
         """
         Autocorrelation test for coin flip sequence.
@@ -408,6 +575,7 @@ class QuasirandomnessValidator:
     """
     
     @staticmethod
+    @instrumentation.timed('coin_flip.discrepancy_test')
     def discrepancy_test(samples: List[float]) -> Dict[str, Any]:
         """
         Compute the star discrepancy of the sequence.
@@ -450,39 +618,56 @@ class QuasirandomnessValidator:
         }
     
     @staticmethod
-    def serial_test(flips: List[int], pattern_length: int = 2) -> Dict[str, Any]:
+    @instrumentation.timed('coin_flip.serial_test')
+    def serial_test(flips: FlipSequence, pattern_length: int = 2,
+                    overlapping: bool = True,
+                    num_flips: Optional[int] = None) -> Dict[str, Any]:
         """
         Serial test for patterns in coin flip sequence.
         
         Tests whether all patterns of given length occur with equal frequency.
+        Patterns are counted with a rolling window code over a flat array of
+        2^L counters, so long patterns (up to MAX_PATTERN_LENGTH bits) and
+        sequences of many millions of flips remain practical.
         
         Args:
-            flips: List of coin flips (0 or 1)
+            flips: List of coin flips (0 or 1), or flips packed 8 per byte
             pattern_length: Length of patterns to test
+            overlapping: Count overlapping windows (default) or disjoint blocks
+            num_flips: Number of valid flips when flips are packed
             
         Returns:
             Dictionary with test results
+            
+        Raises:
+            ValueError: If pattern_length is outside 1..MAX_PATTERN_LENGTH
         """
-        n = len(flips)
+        _check_pattern_length(pattern_length)
+        bits = _flip_bits(flips, num_flips)
+        n = len(bits)
         
         if n < pattern_length:
             return {'test': 'serial', 'error': 'insufficient_data', 'passed': False}
         
         # Count all patterns
         num_patterns = 2 ** pattern_length
-        pattern_counts = Counter()
+        counts, total_patterns = _pattern_counts(bits, pattern_length, overlapping)
         
-        for i in range(n - pattern_length + 1):
-            pattern = tuple(flips[i:i+pattern_length])
-            pattern_counts[pattern] += 1
+        if total_patterns == 0:
+            return {'test': 'serial', 'error': 'insufficient_data', 'passed': False}
         
         # Expected count per pattern
-        total_patterns = n - pattern_length + 1
         expected_count = total_patterns / num_patterns
         
-        # Chi-square statistic
-        chi_square = sum((count - expected_count) ** 2 / expected_count 
-                        for count in pattern_counts.values())
+        # Chi-square statistic over all patterns (unseen patterns included)
+        if np is not None:
+            observed_patterns = int(np.count_nonzero(counts))
+            deviations = counts - expected_count
+            chi_square = float(np.dot(deviations, deviations) / expected_count)
+        else:
+            observed_patterns = sum(1 for count in counts if count)
+            chi_square = sum((count - expected_count) ** 2 / expected_count
+                             for count in counts)
         
         # Degrees of freedom
         df = num_patterns - 1
@@ -494,8 +679,10 @@ class QuasirandomnessValidator:
             'test': 'serial',
             'n_flips': n,
             'pattern_length': pattern_length,
+            'overlapping': overlapping,
             'num_patterns': num_patterns,
-            'observed_patterns': len(pattern_counts),
+            'total_patterns': total_patterns,
+            'observed_patterns': observed_patterns,
             'chi_square': chi_square,
             'degrees_of_freedom': df,
             'critical_value': critical_value,
@@ -503,35 +690,52 @@ class QuasirandomnessValidator:
         }
     
     @staticmethod
-    def poker_test(flips: List[int], hand_size: int = 5) -> Dict[str, Any]:
+    @instrumentation.timed('coin_flip.poker_test')
+    def poker_test(flips: FlipSequence, hand_size: int = 5,
+                   overlapping: bool = False,
+                   num_flips: Optional[int] = None) -> Dict[str, Any]:
         """
         Poker test for randomness.
         
-        Divides sequence into 'hands' and analyzes patterns.
+        Divides sequence into 'hands' and analyzes patterns. Each hand is
+        encoded as a hand_size-bit window code and counted in a flat array;
+        the number of ones per hand is then read off the code's popcount.
         
         Args:
-            flips: List of coin flips (0 or 1)
-            hand_size: Size of each hand
+            flips: List of coin flips (0 or 1), or flips packed 8 per byte
+            hand_size: Size of each hand (1 to MAX_PATTERN_LENGTH)
+            overlapping: Use every window as a hand instead of disjoint hands
+            num_flips: Number of valid flips when flips are packed
             
         Returns:
             Dictionary with test results
+            
+        Raises:
+            ValueError: If hand_size is outside 1..MAX_PATTERN_LENGTH
         """
-        n = len(flips)
-        num_hands = n // hand_size
+        _check_pattern_length(hand_size)
+        bits = _flip_bits(flips, num_flips)
+        n = len(bits)
+        num_hands = (max(n - hand_size + 1, 0) if overlapping
+                     else n // hand_size)
         
         if num_hands < 5:
             return {'test': 'poker', 'error': 'insufficient_data', 'passed': False}
         
-        # Count pattern types in each hand
-        hand_patterns = []
-        for i in range(num_hands):
-            hand = flips[i*hand_size:(i+1)*hand_size]
-            num_ones = sum(hand)
-            hand_patterns.append(num_ones)
-        
-        # Expected distribution is binomial
-        # For simplicity, use chi-square on counts
-        pattern_counts = Counter(hand_patterns)
+        # Count hand patterns, then fold them by number of ones
+        counts, _ = _pattern_counts(bits, hand_size, overlapping)
+        if np is not None:
+            codes = np.arange(len(counts), dtype=np.uint32)
+            ones = np.zeros(len(counts), dtype=np.intp)
+            for i in range(hand_size):
+                ones += (codes >> i) & 1
+            ones_counts = np.bincount(ones, weights=counts,
+                                      minlength=hand_size + 1).tolist()
+        else:
+            ones_counts = [0] * (hand_size + 1)
+            for code, count in enumerate(counts):
+                if count:
+                    ones_counts[bin(code).count('1')] += count
         
         # Expected probabilities from binomial distribution
         from math import comb
@@ -543,7 +747,7 @@ class QuasirandomnessValidator:
         # Chi-square statistic
         chi_square = 0
         for k in range(hand_size + 1):
-            observed = pattern_counts.get(k, 0)
+            observed = ones_counts[k]
             expected = num_hands * expected_probs[k]
             if expected > 0:
                 chi_square += (observed - expected) ** 2 / expected
@@ -558,6 +762,7 @@ class QuasirandomnessValidator:
             'test': 'poker',
             'n_flips': n,
             'hand_size': hand_size,
+            'overlapping': overlapping,
             'num_hands': num_hands,
             'chi_square': chi_square,
             'degrees_of_freedom': df,
@@ -573,6 +778,22 @@ class PerformanceMetricsValidator:
     Tests convergence to expected formal asymptotic results.
     """
     
+    # Peak memory of large_scale_validation per Z value (bytes), from what it
+    # holds at once: the fractional sequence (a list slot and a float object
+    # per Z), the coin flips (a list slot per Z; 0 and 1 are shared small
+    # ints) and the largest per-test working set (the sorted copy of the KS
+    # and discrepancy tests, or the serial test's uint8 flips plus uint32
+    # codes: two slots per Z). That is 56 bytes on 64-bit CPython, which
+    # tracemalloc confirms (53-54 bytes per Z for Z = 1e4..3e5); peak RSS
+    # measured 61-62 bytes per Z for Z = 1e5..3e6, so allocator overhead
+    # adds a quarter on top.
+    _SLOT_BYTES = struct.calcsize('P')
+    VALIDATION_BYTES_PER_Z = math.ceil(1.25 * (
+        (_SLOT_BYTES + sys.getsizeof(0.0))  # fractional sequence
+        + _SLOT_BYTES                       # coin flips
+        + 2 * _SLOT_BYTES                   # largest per-test working set
+    ))
+    
     @staticmethod
     def convergence_analysis(z_max: int, step: int = 1000) -> Dict[str, Any]:
         """
@@ -680,6 +901,67 @@ class PerformanceMetricsValidator:
         results['overall_passed'] = all_tests_passed
         
         return results
+    
+    @staticmethod
+    def progressive_validation(time_budget: Optional[float] = None,
+                               memory_budget: Optional[int] = None,
+                               initial_z: int = 1000,
+                               growth: int = 10,
+                               max_z: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Run large_scale_validation on growing Z ranges within a budget.
+        
+        Each stage multiplies z_max by growth and its results are yielded
+        as soon as they are available. A stage is skipped, ending the run,
+        when its estimated memory exceeds memory_budget or its time
+        (extrapolated linearly from the previous stage) exceeds what is
+        left of time_budget. The first stage always runs if it fits in
+        memory.
+        
+        Args:
+            time_budget: Wall-clock budget in seconds
+            memory_budget: Peak memory budget in bytes
+            initial_z: z_max of the first stage
+            growth: Factor between stage sizes (≥ 2)
+            max_z: Largest z_max to validate
+            
+        Yields:
+            large_scale_validation results with 'elapsed_seconds' and
+            'estimated_memory_bytes' added
+            
+        Raises:
+            ValueError: If no budget or max_z bounds the run
+        """
+        if time_budget is None and memory_budget is None and max_z is None:
+            raise ValueError("Provide time_budget, memory_budget or max_z")
+        if growth < 2:
+            raise ValueError(f"Growth factor must be at least 2, got {growth}")
+        
+        started = time.perf_counter()
+        z_max = initial_z if max_z is None else min(initial_z, max_z)
+        seconds_per_z = None
+        
+        while True:
+            estimated_memory = z_max * PerformanceMetricsValidator.VALIDATION_BYTES_PER_Z
+            if memory_budget is not None and estimated_memory > memory_budget:
+                return
+            if time_budget is not None and seconds_per_z is not None:
+                remaining = time_budget - (time.perf_counter() - started)
+                if seconds_per_z * z_max > remaining:
+                    return
+            
+            stage_start = time.perf_counter()
+            results = PerformanceMetricsValidator.large_scale_validation(z_max)
+            elapsed = time.perf_counter() - stage_start
+            seconds_per_z = elapsed / z_max
+            
+            results['elapsed_seconds'] = elapsed
+            results['estimated_memory_bytes'] = estimated_memory
+            yield results
+            
+            if max_z is not None and z_max >= max_z:
+                return
+            z_max = z_max * growth if max_z is None else min(z_max * growth, max_z)
 
 
 def comprehensive_validation(z_max: int = 10000) -> Dict[str, Any]:
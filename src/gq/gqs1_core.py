@@ -27,6 +27,8 @@ import json
 import sys
 from typing import List
 
+from . import instrumentation
+
 
 # Expected SHA-256 checksum for the seed
 EXPECTED_CHECKSUM = "096412ca0482ab0f519bc0e4ded667475c45495047653a21aa11e2c7c578fa6f"
@@ -140,6 +142,9 @@ def generate_key(state: bytes, counter: int) -> tuple[bytes, bytes]:
     Returns:
         Tuple of (hardened_key, next_state)
     """
+    if instrumentation.enabled:
+        return _generate_key_instrumented(state, counter)
+    
     # Apply Hash-DRBG ratchet to get next state
     next_state = hash_drbg_ratchet(state, counter)
     
@@ -152,6 +157,25 @@ def generate_key(state: bytes, counter: int) -> tuple[bytes, bytes]:
     return hardened_key, next_state
 
 
+def _generate_key_instrumented(state: bytes, counter: int) -> tuple[bytes, bytes]:
+    """generate_key() recording the gqs1.sha256, gqs1.sift and gqs1.fold stages."""
+    timer = instrumentation.perf_counter
+    hash_start = timer()
+    next_state = hash_drbg_ratchet(state, counter)
+    sift_start = timer()
+    output_bits = simulate_quantum_sifting(next_state)
+    fold_start = timer()
+    hardened_key = xor_fold_hardening(output_bits)
+    fold_end = timer()
+    
+    instrumentation.record('gqs1.sha256', sift_start - hash_start)
+    instrumentation.record('gqs1.sift', fold_start - sift_start)
+    instrumentation.record('gqs1.fold', fold_end - fold_start)
+    instrumentation.add('gqs1_hash_calls_total')
+    instrumentation.add('gqs1_outputs_total')
+    return hardened_key, next_state
+
+
 def generate_test_vectors(num_keys: int = 10) -> List[str]:
     """
     Generate the first N test vectors for GQS-1 compliance testing.
@@ -178,6 +202,16 @@ def generate_test_vectors(num_keys: int = 10) -> List[str]:
     test_vectors = []
     
     # Generate keys
+    if instrumentation.enabled:
+        hex_seconds = 0.0
+        for counter in range(1, num_keys + 1):
+            key, state = generate_key(state, counter)
+            hex_start = instrumentation.perf_counter()
+            test_vectors.append(key.hex())
+            hex_seconds += instrumentation.perf_counter() - hex_start
+        instrumentation.record('gqs1.hex', hex_seconds, num_keys)
+        return test_vectors
+    
     for counter in range(1, num_keys + 1):
         key, state = generate_key(state, counter)
         test_vectors.append(key.hex())
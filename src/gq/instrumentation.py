@@ -0,0 +1,209 @@
+"""
+Opt-in Instrumentation for the Generators
+
+Cumulative counters and per-stage timers for universal_qkd (GCP-1),
+gqs1_core (GQS-1) and the coin flip validators, to see where throughput
+goes: SHA-256, basis-matching sifting, XOR folding or hex formatting, and
+how many hash calls each output actually costs.
+
+Instrumentation is off by default. Enable it for a whole process with the
+GQ_INSTRUMENT environment variable (1, true, yes or on), or for a block
+with the instrumented() context manager. When off, instrumented code pays
+one module attribute check per output or validator call.
+
+Counters:
+    gcp1_outputs_total, gcp1_hash_calls_total, gcp1_bits_accepted_total,
+    gcp1_bits_discarded_total (bytes whose bases did not match),
+    gqs1_outputs_total, gqs1_hash_calls_total
+
+Stages (calls and cumulative seconds):
+    gcp1.sha256, gcp1.sift, gcp1.fold, gcp1.hex,
+    gqs1.sha256, gqs1.sift, gqs1.fold, gqs1.hex,
+    coin_flip.<validator method>
+
+Example Usage:
+    >>> from gq import instrumentation
+    >>> from gq.universal_qkd import generate_keys
+    >>> with instrumentation.instrumented():
+    ...     keys = generate_keys(10)
+    ...     stats = instrumentation.snapshot()
+    >>> stats['counters']['gcp1_outputs_total']
+    10
+    >>> print(instrumentation.to_prometheus(stats))  # doctest: +SKIP
+"""
+
+import functools
+import os
+import threading
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+# Environment variable enabling instrumentation at import time
+ENV_VAR = 'GQ_INSTRUMENT'
+
+# Prefix of exported Prometheus metric names
+METRIC_PREFIX = 'gq_'
+
+
+def _env_enabled() -> bool:
+    return os.environ.get(ENV_VAR, '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+# Checked by instrumented code before doing any bookkeeping
+enabled = _env_enabled()
+
+_lock = threading.Lock()
+_counters: Dict[str, int] = {}
+# Stage -> [calls, cumulative seconds]
+_stages: Dict[str, List[float]] = {}
+
+
+def enable() -> None:
+    """Turn instrumentation on for the process."""
+    global enabled
+    enabled = True
+
+
+def disable() -> None:
+    """Turn instrumentation off for the process."""
+    global enabled
+    enabled = False
+
+
+def reset() -> None:
+    """Clear all counters and stage timers."""
+    with _lock:
+        _counters.clear()
+        _stages.clear()
+
+
+@contextmanager
+def instrumented(reset_first: bool = True) -> Iterator[None]:
+    """
+    Enable instrumentation within a block.
+
+    Args:
+        reset_first: Clear counters and timers on entry
+
+    The previous enabled state is restored on exit; collected values are
+    kept for snapshot().
+    """
+    global enabled
+    previous = enabled
+    if reset_first:
+        reset()
+    enabled = True
+    try:
+        yield
+    finally:
+        enabled = previous
+
+
+def add(name: str, value: int = 1) -> None:
+    """
+    Add to a counter.
+
+    Args:
+        name: Counter name (e.g. 'gcp1_outputs_total')
+        value: Amount to add
+    """
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + value
+
+
+def record(stage: str, seconds: float, calls: int = 1) -> None:
+    """
+    Add time spent in a stage.
+
+    Args:
+        stage: Stage name (e.g. 'gcp1.sha256')
+        seconds: Time to add
+        calls: Calls the time covers
+    """
+    with _lock:
+        entry = _stages.get(stage)
+        if entry is None:
+            _stages[stage] = [calls, seconds]
+        else:
+            entry[0] += calls
+            entry[1] += seconds
+
+
+def timed(stage: str) -> Callable[[Callable], Callable]:
+    """
+    Decorate a function to record its calls and time under a stage.
+
+    When instrumentation is off the wrapper calls straight through.
+
+    Args:
+        stage: Stage name
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not enabled:
+                return func(*args, **kwargs)
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(stage, perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+def snapshot() -> Dict[str, Any]:
+    """
+    Return the current counters and stage timers.
+
+    Returns:
+        Dictionary with enabled, counters (name -> value) and stages
+        (name -> {'calls', 'seconds'}), sorted by name
+    """
+    with _lock:
+        return {
+            'enabled': enabled,
+            'counters': dict(sorted(_counters.items())),
+            'stages': {
+                stage: {'calls': int(calls), 'seconds': seconds}
+                for stage, (calls, seconds) in sorted(_stages.items())
+            },
+        }
+
+
+def to_prometheus(stats: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Format a snapshot in the Prometheus text exposition format.
+
+    Counters become gq_<name>; stages become gq_stage_calls_total and
+    gq_stage_seconds_total labelled with stage.
+
+    Args:
+        stats: Snapshot to format (default: snapshot())
+
+    Returns:
+        Exposition text ending in a newline
+    """
+    if stats is None:
+        stats = snapshot()
+
+    lines = []
+    for name, value in stats['counters'].items():
+        metric = METRIC_PREFIX + name
+        lines.append(f"# TYPE {metric} counter")
+        lines.append(f"{metric} {value}")
+
+    if stats['stages']:
+        for field, metric, help_text in (
+            ('calls', 'stage_calls_total', 'Calls recorded per stage'),
+            ('seconds', 'stage_seconds_total', 'Cumulative seconds per stage'),
+        ):
+            metric = METRIC_PREFIX + metric
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} counter")
+            for stage, values in stats['stages'].items():
+                lines.append(f'{metric}{{stage="{stage}"}} {values[field]!r}')
+
+    return "\n".join(lines) + "\n" if lines else ""
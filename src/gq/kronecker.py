@@ -0,0 +1,268 @@
+"""
+Multi-Dimensional Kronecker (R_d) Low-Discrepancy Sequences
+
+This module extends the golden ratio sequence {Z·φ} used by
+GoldenRatioCoinFlip to d dimensions. Point Z of the R_d sequence is
+
+    x_Z = ({Z·α_1}, {Z·α_2}, ..., {Z·α_d})
+
+where α_i = φ_d^(-i) and φ_d is the generalized golden ratio, the unique
+positive root of x^(d+1) = x + 1:
+
+- d = 1: φ_1 = φ ≈ 1.6180339887 (golden ratio, {Z/φ} = {Z·φ})
+- d = 2: φ_2 ≈ 1.3247179572 (plastic number)
+- d = 3: φ_3 ≈ 1.2207440846
+
+Exact Fixed-Point Stepping:
+- Each α_i is stored as a 64-bit fixed-point integer A_i = floor(α_i · 2^64)
+- Point Z is (Z·A_i + S_i) mod 2^64, evaluated in exact integer arithmetic,
+  so coordinates never drift no matter how large Z grows
+- Coordinates are the top 53 bits scaled into [0, 1)
+
+Cranley-Patterson Shifts:
+- Randomized QMC adds a shift S_i to every point modulo 1
+- Shifts are drawn from a GoldenSeed stream, keeping runs reproducible
+
+Batched output (N×d arrays) and the discrepancy estimator require numpy;
+single points are available without it.
+
+⚠️ NOT FOR CRYPTOGRAPHY: This is for sampling and simulation only.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal, localcontext
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from ._optional import np, require_numpy
+from .stream import as_stream
+
+
+# Fixed-point resolution of α_i and shifts
+FIXED_BITS = 64
+FIXED_ONE = 1 << FIXED_BITS
+FIXED_MASK = FIXED_ONE - 1
+
+# Coordinates keep the top 53 bits (the float64 mantissa)
+_FLOAT_SHIFT = FIXED_BITS - 53
+_FLOAT_SCALE = 2.0 ** -53
+
+
+def _generalized_golden_ratio_decimal(dimensions: int) -> Decimal:
+    """Solve x^(d+1) = x + 1 by Newton's method at the current precision."""
+    x = Decimal(2)
+    while True:
+        step = (x ** (dimensions + 1) - x - 1) / ((dimensions + 1) * x ** dimensions - 1)
+        x -= step
+        if abs(step) < Decimal(10) ** -45:
+            return x
+
+
+def generalized_golden_ratio(dimensions: int) -> float:
+    """
+    Compute the generalized golden ratio φ_d.
+
+    Args:
+        dimensions: Number of dimensions d (≥ 1)
+
+    Returns:
+        Unique positive root of x^(d+1) = x + 1
+    """
+    if dimensions < 1:
+        raise ValueError(f"Dimensions must be at least 1, got {dimensions}")
+    with localcontext() as ctx:
+        ctx.prec = 60
+        return float(_generalized_golden_ratio_decimal(dimensions))
+
+
+def kronecker_alphas_fixed(dimensions: int) -> List[int]:
+    """
+    Compute the R_d step sizes α_i = φ_d^(-i) as 64-bit fixed-point integers.
+
+    Args:
+        dimensions: Number of dimensions d (≥ 1)
+
+    Returns:
+        List of d integers A_i = floor(α_i · 2^64)
+    """
+    if dimensions < 1:
+        raise ValueError(f"Dimensions must be at least 1, got {dimensions}")
+    with localcontext() as ctx:
+        ctx.prec = 60
+        inverse = 1 / _generalized_golden_ratio_decimal(dimensions)
+        return [int(inverse ** (i + 1) * FIXED_ONE) for i in range(dimensions)]
+
+
+class KroneckerSequence:
+    """
+    R_d low-discrepancy point generator.
+
+    Generates points {Z·α_1 + s_1}, ..., {Z·α_d + s_d} for integer Z using
+    exact 64-bit fixed-point arithmetic.
+    """
+
+    def __init__(self, dimensions: int, shift: Optional[Sequence[float]] = None):
+        """
+        Initialize the sequence.
+
+        Args:
+            dimensions: Number of dimensions d (≥ 1)
+            shift: Optional per-dimension shift in [0, 1) (default: no shift)
+
+        Raises:
+            ValueError: If dimensions < 1 or shift has the wrong length
+        """
+        self.dimensions = dimensions
+        self.alphas_fixed = kronecker_alphas_fixed(dimensions)
+
+        if shift is None:
+            self.shift_fixed = [0] * dimensions
+        else:
+            if len(shift) != dimensions:
+                raise ValueError(
+                    f"Shift must have {dimensions} components, got {len(shift)}"
+                )
+            self.shift_fixed = [int((s % 1.0) * FIXED_ONE) & FIXED_MASK for s in shift]
+
+    @property
+    def alphas(self) -> Tuple[float, ...]:
+        """Step sizes α_i as floats."""
+        return tuple(a / FIXED_ONE for a in self.alphas_fixed)
+
+    @property
+    def shift(self) -> Tuple[float, ...]:
+        """Cranley-Patterson shift as floats."""
+        return tuple(s / FIXED_ONE for s in self.shift_fixed)
+
+    def cranley_patterson_shift(
+        self, stream: Optional[Iterable[bytes]] = None
+    ) -> "KroneckerSequence":
+        """
+        Return a copy of this sequence with a random shift from a stream.
+
+        Each dimension consumes 8 bytes of the stream (big-endian), giving a
+        full 64-bit fixed-point shift.
+
+        Args:
+            stream: GoldenStream or iterable of outputs (default: GCP-1 stream)
+
+        Returns:
+            New KroneckerSequence with the drawn shift
+        """
+        stream = as_stream(stream)
+        shifted = KroneckerSequence(self.dimensions)
+        shifted.shift_fixed = [
+            int.from_bytes(stream.read(8), 'big') for _ in range(self.dimensions)
+        ]
+        return shifted
+
+    def point_fixed(self, z: int) -> Tuple[int, ...]:
+        """
+        Compute point Z as 64-bit fixed-point coordinates.
+
+        Args:
+            z: Integer index (any integer, including negative)
+
+        Returns:
+            Tuple of d integers in [0, 2^64)
+        """
+        return tuple((z * a + s) & FIXED_MASK
+                     for a, s in zip(self.alphas_fixed, self.shift_fixed))
+
+    def point(self, z: int) -> Tuple[float, ...]:
+        """
+        Compute point Z in the unit cube.
+
+        Args:
+            z: Integer index
+
+        Returns:
+            Tuple of d coordinates in [0, 1)
+        """
+        return tuple((c >> _FLOAT_SHIFT) * _FLOAT_SCALE for c in self.point_fixed(z))
+
+    def points_fixed(self, n: int, start: int = 1):
+        """
+        Compute points Z = start, ..., start + n - 1 as fixed-point integers.
+
+        Args:
+            n: Number of points
+            start: First index (arbitrary offset, reduced modulo 2^64)
+
+        Returns:
+            uint64 NumPy array of shape (n, d)
+        """
+        require_numpy('batched R_d sequences')
+        if n < 0:
+            raise ValueError(f"Number of points must be non-negative, got {n}")
+
+        z = np.arange(n, dtype=np.uint64)
+        z += np.uint64(start & FIXED_MASK)
+        alphas = np.array(self.alphas_fixed, dtype=np.uint64)
+        shift = np.array(self.shift_fixed, dtype=np.uint64)
+
+        # uint64 arithmetic wraps modulo 2^64, which is exactly {·} in fixed point
+        fixed = z[:, None] * alphas[None, :]
+        fixed += shift
+        return fixed
+
+    def points(self, n: int, start: int = 1):
+        """
+        Compute points Z = start, ..., start + n - 1 in the unit cube.
+
+        Args:
+            n: Number of points
+            start: First index (arbitrary offset)
+
+        Returns:
+            float64 NumPy array of shape (n, d) with coordinates in [0, 1)
+        """
+        fixed = self.points_fixed(n, start)
+        fixed >>= np.uint64(_FLOAT_SHIFT)
+        return fixed.astype(np.float64) * _FLOAT_SCALE
+
+    def __repr__(self) -> str:
+        return f"KroneckerSequence(dimensions={self.dimensions}, shift={self.shift})"
+
+
+def l2_star_discrepancy(points, block_size: Optional[int] = None) -> float:
+    """
+    Compute the L2-star discrepancy of a point set with Warnock's formula.
+
+    T² = 3^(-d) - (2^(1-d)/N)·Σ_i Π_k (1 - x_ik²)
+         + (1/N²)·Σ_i Σ_j Π_k (1 - max(x_ik, x_jk))
+
+    The O(N²·d) pairwise term is evaluated in row blocks so memory stays
+    bounded for large N.
+
+    Args:
+        points: Array-like of shape (N, d) with coordinates in [0, 1)
+        block_size: Rows per block (default: about 4M pair entries per block)
+
+    Returns:
+        L2-star discrepancy T (lower is more uniform)
+    """
+    require_numpy('batched R_d sequences')
+    x = np.asarray(points, dtype=np.float64)
+    if x.ndim == 1:
+        x = x[:, None]
+    n, d = x.shape
+    if n == 0:
+        raise ValueError("Point set must not be empty")
+
+    if block_size is None:
+        block_size = max(1, (1 << 22) // n)
+
+    first = 3.0 ** -d
+    second = 2.0 ** (1 - d) / n * np.prod(1.0 - x * x, axis=1).sum()
+
+    pair_sum = 0.0
+    for i0 in range(0, n, block_size):
+        block = x[i0:i0 + block_size]
+        acc = np.ones((len(block), n))
+        for k in range(d):
+            acc *= 1.0 - np.maximum(block[:, k, None], x[None, :, k])
+        pair_sum += acc.sum()
+    third = pair_sum / (n * n)
+
+    return float(np.sqrt(max(first - second + third, 0.0)))
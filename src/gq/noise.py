@@ -0,0 +1,365 @@
+"""
+Coherent Noise Seeded by GoldenSeed Streams
+
+Spatially coherent 2D noise for heightmaps, textures and terrain, evaluated
+over whole NumPy coordinate arrays at once:
+
+- value(): smoothly interpolated random lattice values
+- gradient(): Perlin-style gradient noise with random unit gradients
+- simplex(): simplex noise on a skewed triangular lattice
+- fbm() / ridged(): octave sums (fractal Brownian motion and ridged
+  multifractal) over any of the three
+
+The permutation, lattice value and gradient tables are drawn once from a
+GoldenSeed stream, so the same stream always gives the same noise field.
+
+Tiling:
+- Noise is a pure function of world coordinates. grid() builds the
+  coordinates of a tile at any world offset, and tiles generated
+  separately match the same region of one large grid exactly
+- value() and gradient() also accept an integer lattice period, which
+  makes the field wrap seamlessly (e.g. for textures)
+
+Sampling noise needs the numpy extra.
+
+⚠️ NOT FOR CRYPTOGRAPHY: This is for procedural generation only.
+
+Example Usage:
+    >>> from gq.noise import CoherentNoise, grid
+    >>> noise = CoherentNoise()
+    >>> x, y = grid(256, 256, scale=1 / 64)
+    >>> heights = noise.fbm(x, y, octaves=5)
+    >>> heights.shape
+    (256, 256)
+    >>> tile_x, tile_y = grid(64, 64, x0=128, y0=192, scale=1 / 64)
+    >>> bool((noise.fbm(tile_x, tile_y, octaves=5) == heights[192:, 128:192]).all())
+    True
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Iterable, Optional, Tuple
+
+from ._optional import np, require_numpy
+from .stream import as_stream
+
+
+# Entries in the permutation, value and gradient tables
+DEFAULT_TABLE_SIZE = 256
+
+# Simplex skew/unskew factors for two dimensions
+_F2 = (math.sqrt(3.0) - 1.0) / 2.0
+_G2 = (3.0 - math.sqrt(3.0)) / 6.0
+
+# Scale bringing each noise type to roughly [-1, 1]
+_GRADIENT_SCALE = math.sqrt(2.0)
+_SIMPLEX_SCALE = 99.204334582718712
+
+# Integer lattice shift between octaves, so octaves do not share features
+_OCTAVE_SHIFT = (131, 71)
+
+KINDS = ('value', 'gradient', 'simplex')
+
+
+def grid(width: int, height: int, x0: float = 0.0, y0: float = 0.0,
+         scale: float = 1.0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build world coordinates for a (height, width) tile of pixels.
+
+    Pixel (row, col) maps to ((x0 + col)·scale, (y0 + row)·scale), so
+    tiles at integer offsets line up exactly with one larger grid.
+
+    Args:
+        width: Tile width in pixels
+        height: Tile height in pixels
+        x0: World x of the first column, in pixels
+        y0: World y of the first row, in pixels
+        scale: Lattice units per pixel (1 / feature size)
+
+    Returns:
+        (x, y) float64 arrays of shape (height, width)
+    """
+    require_numpy('coherent noise')
+    if width < 0 or height < 0:
+        raise ValueError(f"Grid size must be non-negative, got {width}x{height}")
+    xs = (x0 + np.arange(width, dtype=np.float64)) * scale
+    ys = (y0 + np.arange(height, dtype=np.float64)) * scale
+    return np.meshgrid(xs, ys)
+
+
+def _fade(t: np.ndarray) -> np.ndarray:
+    """Quintic interpolation curve 6t^5 - 15t^4 + 10t^3."""
+    return t * t * t * (t * (t * 6.0 - 15.0) + 10.0)
+
+
+class CoherentNoise:
+    """
+    Value, gradient and simplex noise with GoldenSeed-drawn tables.
+
+    All methods take coordinate arrays of any broadcastable shapes and
+    return a float64 array of the broadcast shape.
+    """
+
+    def __init__(self, stream: Optional[Iterable[bytes]] = None,
+                 table_size: int = DEFAULT_TABLE_SIZE):
+        """
+        Initialize the noise tables.
+
+        Args:
+            stream: GoldenSeed stream the tables are drawn from (default:
+                GCP-1 golden seed stream); reads 12 bytes per table entry
+            table_size: Table entries, a power of two; the lattice hash
+                repeats every table_size cells along each axis
+
+        Raises:
+            ImportError: If numpy is not installed
+            ValueError: If table_size is not a power of two of at least 2
+        """
+        require_numpy('coherent noise')
+        if table_size < 2 or table_size & (table_size - 1):
+            raise ValueError(f"Table size must be a power of two >= 2, got {table_size}")
+        self.table_size = table_size
+        self._mask = table_size - 1
+
+        words = np.frombuffer(
+            as_stream(stream).read(12 * table_size), dtype='<u4'
+        ).astype(np.uint64).reshape(3, table_size)
+
+        # Fisher-Yates shuffle; each swap index is a multiply-shift of one word
+        perm = np.arange(table_size, dtype=np.int64)
+        for i in range(table_size - 1, 0, -1):
+            j = int((int(words[0, i]) * (i + 1)) >> 32)
+            perm[i], perm[j] = perm[j], perm[i]
+        self._perm = perm
+
+        unit = words[1:].astype(np.float64) / 2.0 ** 32
+        self._values = unit[0] * 2.0 - 1.0
+        angles = unit[1] * (2.0 * math.pi)
+        self._grad_x = np.cos(angles)
+        self._grad_y = np.sin(angles)
+
+    def _hash(self, ix: np.ndarray, iy: np.ndarray) -> np.ndarray:
+        """Hash integer lattice points to table indices."""
+        perm = self._perm
+        mask = self._mask
+        return perm[(perm[ix & mask] + iy) & mask]
+
+    @staticmethod
+    def _coords(x, y) -> Tuple[np.ndarray, np.ndarray]:
+        return np.broadcast_arrays(np.asarray(x, dtype=np.float64),
+                                   np.asarray(y, dtype=np.float64))
+
+    def _corners(self, x, y, period: Optional[int]):
+        """Split coordinates into lattice cells, offsets and corner hashes."""
+        x, y = self._coords(x, y)
+        fx = np.floor(x)
+        fy = np.floor(y)
+        ix = fx.astype(np.int64)
+        iy = fy.astype(np.int64)
+        dx = x - fx
+        dy = y - fy
+        ix1 = ix + 1
+        iy1 = iy + 1
+        if period is not None:
+            ix %= period
+            iy %= period
+            ix1 %= period
+            iy1 %= period
+        hashes = (self._hash(ix, iy), self._hash(ix1, iy),
+                  self._hash(ix, iy1), self._hash(ix1, iy1))
+        return dx, dy, hashes
+
+    @staticmethod
+    def _check_period(period: Optional[int]) -> None:
+        if period is not None and (int(period) != period or period < 1):
+            raise ValueError(f"Period must be a positive integer, got {period}")
+
+    def value(self, x, y, period: Optional[int] = None) -> np.ndarray:
+        """
+        Evaluate value noise.
+
+        Args:
+            x: World x coordinates (lattice units)
+            y: World y coordinates (lattice units)
+            period: Wrap the lattice every period cells along both axes
+
+        Returns:
+            Noise in [-1, 1]
+        """
+        self._check_period(period)
+        dx, dy, (h00, h10, h01, h11) = self._corners(x, y, period)
+        u = _fade(dx)
+        v = _fade(dy)
+        values = self._values
+        bottom = values[h00] + u * (values[h10] - values[h00])
+        top = values[h01] + u * (values[h11] - values[h01])
+        return bottom + v * (top - bottom)
+
+    def gradient(self, x, y, period: Optional[int] = None) -> np.ndarray:
+        """
+        Evaluate Perlin-style gradient noise.
+
+        Args:
+            x: World x coordinates (lattice units)
+            y: World y coordinates (lattice units)
+            period: Wrap the lattice every period cells along both axes
+
+        Returns:
+            Noise in [-1, 1], zero at lattice points
+        """
+        self._check_period(period)
+        dx, dy, (h00, h10, h01, h11) = self._corners(x, y, period)
+        gx = self._grad_x
+        gy = self._grad_y
+        n00 = gx[h00] * dx + gy[h00] * dy
+        n10 = gx[h10] * (dx - 1.0) + gy[h10] * dy
+        n01 = gx[h01] * dx + gy[h01] * (dy - 1.0)
+        n11 = gx[h11] * (dx - 1.0) + gy[h11] * (dy - 1.0)
+        u = _fade(dx)
+        v = _fade(dy)
+        bottom = n00 + u * (n10 - n00)
+        top = n01 + u * (n11 - n01)
+        return (bottom + v * (top - bottom)) * _GRADIENT_SCALE
+
+    def simplex(self, x, y, period: Optional[int] = None) -> np.ndarray:
+        """
+        Evaluate simplex noise.
+
+        Args:
+            x: World x coordinates (lattice units)
+            y: World y coordinates (lattice units)
+            period: Not supported; the skewed lattice does not wrap on
+                axis-aligned periods
+
+        Returns:
+            Noise in about [-1, 1]
+
+        Raises:
+            ValueError: If period is given
+        """
+        if period is not None:
+            raise ValueError("Simplex noise does not support a period")
+        x, y = self._coords(x, y)
+
+        skew = (x + y) * _F2
+        fi = np.floor(x + skew)
+        fj = np.floor(y + skew)
+        unskew = (fi + fj) * _G2
+        x0 = x - (fi - unskew)
+        y0 = y - (fj - unskew)
+        i = fi.astype(np.int64)
+        j = fj.astype(np.int64)
+
+        # Upper or lower triangle of the skewed cell
+        upper = x0 > y0
+        i1 = upper.astype(np.int64)
+        j1 = 1 - i1
+
+        corners = (
+            (x0, y0, self._hash(i, j)),
+            (x0 - i1 + _G2, y0 - j1 + _G2, self._hash(i + i1, j + j1)),
+            (x0 - 1.0 + 2.0 * _G2, y0 - 1.0 + 2.0 * _G2, self._hash(i + 1, j + 1)),
+        )
+        total = np.zeros(x.shape, dtype=np.float64)
+        for cx, cy, h in corners:
+            t = np.maximum(0.5 - cx * cx - cy * cy, 0.0)
+            t *= t
+            total += t * t * (self._grad_x[h] * cx + self._grad_y[h] * cy)
+        return total * _SIMPLEX_SCALE
+
+    def _basis(self, kind: str):
+        if kind not in KINDS:
+            raise ValueError(f"Unknown noise kind {kind!r}, expected one of {', '.join(KINDS)}")
+        return getattr(self, kind)
+
+    def _octaves(self, x, y, octaves: int, lacunarity: float, gain: float,
+                 kind: str, period: Optional[int]):
+        """Yield (amplitude, noise) for each octave."""
+        if octaves < 1:
+            raise ValueError(f"Octaves must be at least 1, got {octaves}")
+        basis = self._basis(kind)
+        self._check_period(period)
+        x, y = self._coords(x, y)
+
+        frequency = 1.0
+        amplitude = 1.0
+        for octave in range(octaves):
+            octave_period = None
+            if period is not None:
+                octave_period = period * frequency
+                if octave_period != int(octave_period):
+                    raise ValueError(
+                        f"Octave {octave} period {octave_period} is not an integer; "
+                        f"use an integer lacunarity with a period"
+                    )
+                octave_period = int(octave_period)
+            shift_x = octave * _OCTAVE_SHIFT[0]
+            shift_y = octave * _OCTAVE_SHIFT[1]
+            yield amplitude, basis(x * frequency + shift_x, y * frequency + shift_y,
+                                   period=octave_period)
+            frequency *= lacunarity
+            amplitude *= gain
+
+    def fbm(self, x, y, octaves: int = 6, lacunarity: float = 2.0,
+            gain: float = 0.5, kind: str = 'gradient',
+            period: Optional[int] = None) -> np.ndarray:
+        """
+        Evaluate fractal Brownian motion: a weighted sum of noise octaves.
+
+        Args:
+            x: World x coordinates (lattice units of the first octave)
+            y: World y coordinates (lattice units of the first octave)
+            octaves: Number of octaves
+            lacunarity: Frequency multiplier between octaves
+            gain: Amplitude multiplier between octaves
+            kind: Basis noise: 'value', 'gradient' or 'simplex'
+            period: Wrap period of the first octave (value and gradient)
+
+        Returns:
+            Noise in about [-1, 1] (normalized by the total amplitude)
+
+        Raises:
+            ValueError: If an argument is invalid
+        """
+        total = None
+        norm = 0.0
+        for amplitude, layer in self._octaves(x, y, octaves, lacunarity, gain, kind, period):
+            layer *= amplitude
+            total = layer if total is None else total + layer
+            norm += amplitude
+        return total / norm
+
+    def ridged(self, x, y, octaves: int = 6, lacunarity: float = 2.0,
+               gain: float = 0.5, kind: str = 'gradient',
+               period: Optional[int] = None) -> np.ndarray:
+        """
+        Evaluate ridged multifractal noise: octaves of (1 - |noise|)².
+
+        Sharp crests form where the basis noise crosses zero, which suits
+        mountain ranges and canyons.
+
+        Args:
+            x: World x coordinates (lattice units of the first octave)
+            y: World y coordinates (lattice units of the first octave)
+            octaves: Number of octaves
+            lacunarity: Frequency multiplier between octaves
+            gain: Amplitude multiplier between octaves
+            kind: Basis noise: 'value', 'gradient' or 'simplex'
+            period: Wrap period of the first octave (value and gradient)
+
+        Returns:
+            Noise in about [0, 1] (normalized by the total amplitude)
+
+        Raises:
+            ValueError: If an argument is invalid
+        """
+        total = None
+        norm = 0.0
+        for amplitude, layer in self._octaves(x, y, octaves, lacunarity, gain, kind, period):
+            layer = 1.0 - np.abs(layer)
+            layer *= layer
+            layer *= amplitude
+            total = layer if total is None else total + layer
+            norm += amplitude
+        return total / norm
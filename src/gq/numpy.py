@@ -0,0 +1,365 @@
+"""
+NumPy BitGenerator over GoldenSeed Streams
+
+GoldenSeedBitGenerator plugs a GCP-1 or GQS-1 stream into
+numpy.random.Generator, so analytics code gets NumPy's optimized
+distributions (integers, normal, gamma, permutation, ...) while staying
+deterministic and reproducible:
+
+    rng = np.random.Generator(GoldenSeedBitGenerator())
+
+How words reach NumPy:
+- The stream is generated in prefilled blocks of outputs; each 16-byte
+  output is two little-endian 64-bit words
+- NumPy calls next_uint64/next_uint32/next_double through a ctypes bitgen_t
+  capsule; each call is an index into the current block
+- random_raw() copies whole slices of blocks into an array
+
+State and Substreams:
+- The state is the protocol state at the start of the current block (a
+  checkpoint, as kept by the stream server) plus the position in the block,
+  so get/set and pickling replay the stream exactly
+- jumped() and spawn() cannot skip ahead in a hash chain; instead they
+  derive fresh protocol states from the current checkpoint (jumped) or the
+  root state (spawn) with SHA-256, giving independent substreams that are
+  reproducible from the parent
+
+Constructing GoldenSeedBitGenerator needs the numpy extra.
+
+⚠️ NOT FOR CRYPTOGRAPHY: Values are deterministic and reproducible.
+
+Example Usage:
+    >>> import numpy as np
+    >>> from gq.numpy import GoldenSeedBitGenerator
+    >>> bit_generator = GoldenSeedBitGenerator(block_outputs=16)
+    >>> int(bit_generator.random_raw()) == int.from_bytes(bytes.fromhex(
+    ...     '3c732e0d04dac163'), 'little')
+    True
+    >>> rng = np.random.Generator(GoldenSeedBitGenerator('gqs1'))
+    >>> workers = rng.spawn(4)  # Generator.spawn needs numpy >= 1.25
+"""
+
+from __future__ import annotations
+
+import ctypes
+import hashlib
+from collections import namedtuple
+from typing import Any, Dict, List, Tuple
+
+from ._optional import TWO_53, np, require_numpy
+from .stream import OUTPUT_SIZE, PROTOCOLS, State, initial_state
+from .universal_qkd import HEX_SEED
+
+if np is not None:
+    from numpy.random import BitGenerator
+else:  # pragma: no cover - numpy is optional
+    # Stand-in base so the module (and `from gq import *`) imports without
+    # numpy; GoldenSeedBitGenerator() itself raises the install hint
+    BitGenerator = object
+
+
+# Protocol outputs generated per prefilled block
+DEFAULT_BLOCK_OUTPUTS = 1024
+
+_WORDS_PER_OUTPUT = OUTPUT_SIZE // 8
+
+_NEXT_UINT64 = ctypes.CFUNCTYPE(ctypes.c_uint64, ctypes.c_void_p)
+_NEXT_UINT32 = ctypes.CFUNCTYPE(ctypes.c_uint32, ctypes.c_void_p)
+_NEXT_DOUBLE = ctypes.CFUNCTYPE(ctypes.c_double, ctypes.c_void_p)
+
+
+class _BitGen(ctypes.Structure):
+    """NumPy's bitgen_t: a state pointer and the four draw functions."""
+
+    _fields_ = [
+        ('state', ctypes.c_void_p),
+        ('next_uint64', _NEXT_UINT64),
+        ('next_uint32', _NEXT_UINT32),
+        ('next_double', _NEXT_DOUBLE),
+        ('next_raw', _NEXT_UINT64),
+    ]
+
+
+_capsule_new = ctypes.pythonapi.PyCapsule_New
+_capsule_new.restype = ctypes.py_object
+_capsule_new.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_void_p]
+
+# NumPy only accepts capsules with this name
+_CAPSULE_NAME = b'BitGenerator'
+
+# Same fields as the interface NumPy's own bit generators return from .ctypes
+CTypesInterface = namedtuple(
+    'CTypesInterface',
+    ['state_address', 'state', 'next_uint64', 'next_uint32', 'next_double', 'bit_generator'],
+)
+
+
+def _derive(state: State, label: bytes, *values: int) -> State:
+    """Derive an independent protocol state from a state and a label."""
+    digest, counter = state
+    material = b''.join(value.to_bytes(8, 'little') for value in values)
+    return hashlib.sha256(b'gq.numpy.' + label + digest + material).digest(), counter
+
+
+class GoldenSeedBitGenerator(BitGenerator):
+    """
+    numpy.random BitGenerator drawing 64-bit words from a GoldenSeed stream.
+
+    Words are the stream's bytes read little-endian, so random_raw() on a
+    fresh generator matches GoldenStream().read() for the same protocol and
+    seed.
+
+    The bitgen_t interface is exposed through ctypes only (capsule and
+    .ctypes); there is no .cffi view.
+    """
+
+    def __init__(self, protocol: str = 'gcp1', seed_hex: str = HEX_SEED,
+                 block_outputs: int = DEFAULT_BLOCK_OUTPUTS):
+        """
+        Initialize the bit generator.
+
+        Args:
+            protocol: 'gcp1' (universal generator) or 'gqs1' (test vectors)
+            seed_hex: Hex string of the seed
+            block_outputs: Outputs generated per prefilled block
+
+        Raises:
+            ValueError: If the protocol is unknown, the seed fails checksum
+                verification or block_outputs is not positive
+            ImportError: If numpy is not installed
+        """
+        require_numpy('GoldenSeedBitGenerator')
+        if protocol not in PROTOCOLS:
+            raise ValueError(f"Unknown protocol {protocol!r}; expected one of {sorted(PROTOCOLS)}")
+        if block_outputs < 1:
+            raise ValueError(f"block_outputs must be positive, got {block_outputs}")
+        # The base class only provides the lock here; its SeedSequence is unused
+        super().__init__(0)
+
+        self._protocol = protocol
+        self._seed_hex = seed_hex
+        self._block_outputs = block_outputs
+        self._step = PROTOCOLS[protocol][1]
+        self._root = initial_state(protocol, seed_hex)
+        self._children = 0
+        self._reset(self._root)
+
+        self._next_uint64_fn = _NEXT_UINT64(self._next_uint64)
+        self._next_uint32_fn = _NEXT_UINT32(self._next_uint32)
+        self._next_double_fn = _NEXT_DOUBLE(self._next_double)
+        self._bitgen = _BitGen(
+            None, self._next_uint64_fn, self._next_uint32_fn,
+            self._next_double_fn, self._next_uint64_fn,
+        )
+        self._capsule = _capsule_new(ctypes.addressof(self._bitgen), _CAPSULE_NAME, None)
+
+    # -- Blocks -----------------------------------------------------------
+
+    def _reset(self, state: State) -> None:
+        """Position the generator at the start of the stream from state."""
+        self._block_start = state
+        self._next_state = state
+        self._block = np.empty(0, dtype=np.uint64)
+        self._words: List[int] = []
+        self._index = 0
+        self._has_uint32 = False
+        self._uinteger = 0
+
+    def _refill(self) -> None:
+        """Generate the next block of outputs."""
+        step = self._step
+        state = self._next_state
+        outputs = []
+        for _ in range(self._block_outputs):
+            output, state = step(state)
+            outputs.append(output)
+        self._block_start = self._next_state
+        self._next_state = state
+        self._block = np.frombuffer(b''.join(outputs), dtype='<u8').astype(np.uint64)
+        self._words = self._block.tolist()
+        self._index = 0
+
+    # -- bitgen_t callbacks (NumPy holds self.lock around these) -----------
+
+    def _next_uint64(self, _state=None) -> int:
+        if self._index == len(self._words):
+            self._refill()
+        value = self._words[self._index]
+        self._index += 1
+        return value
+
+    def _next_uint32(self, _state=None) -> int:
+        # Two 32-bit draws per word, low half first, as in NumPy's PCG64
+        if self._has_uint32:
+            self._has_uint32 = False
+            return self._uinteger
+        value = self._next_uint64()
+        self._has_uint32 = True
+        self._uinteger = value >> 32
+        return value & 0xFFFFFFFF
+
+    def _next_double(self, _state=None) -> float:
+        return (self._next_uint64() >> 11) * TWO_53
+
+    # -- BitGenerator interface -------------------------------------------
+
+    @property
+    def capsule(self):
+        """PyCapsule holding the bitgen_t struct NumPy draws from."""
+        return self._capsule
+
+    @property
+    def ctypes(self) -> CTypesInterface:
+        """ctypes view of the bitgen_t struct and its draw functions."""
+        return CTypesInterface(
+            ctypes.addressof(self._bitgen), ctypes.pointer(self._bitgen),
+            self._next_uint64_fn, self._next_uint32_fn, self._next_double_fn,
+            ctypes.c_void_p(ctypes.addressof(self._bitgen)),
+        )
+
+    def random_raw(self, size=None, output: bool = True):
+        """
+        Return raw 64-bit words, copied from whole blocks at a time.
+
+        Args:
+            size: Output shape, or None for a single word
+            output: If False, advance the stream and return None
+
+        Returns:
+            int, or a uint64 array of the given shape
+        """
+        with self.lock:
+            if size is None:
+                value = self._next_uint64()
+                return value if output else None
+            count = int(np.prod(size, dtype=np.int64))
+            out = np.empty(count, dtype=np.uint64)
+            filled = 0
+            while filled < count:
+                if self._index == len(self._words):
+                    self._refill()
+                take = min(count - filled, len(self._words) - self._index)
+                out[filled:filled + take] = self._block[self._index:self._index + take]
+                self._index += take
+                filled += take
+            return out.reshape(size) if output else None
+
+    @property
+    def state(self) -> Dict[str, Any]:
+        """
+        Exact stream position: the checkpoint at the start of the current
+        block, the position within it and the buffered 32-bit half word.
+        """
+        with self.lock:
+            return {
+                'bit_generator': type(self).__name__,
+                'protocol': self._protocol,
+                'seed_hex': self._seed_hex,
+                'block_outputs': self._block_outputs,
+                'root': _encode_state(self._root),
+                'children': self._children,
+                'checkpoint': _encode_state(self._block_start),
+                'position': self._index,
+                'has_uint32': int(self._has_uint32),
+                'uinteger': self._uinteger,
+            }
+
+    @state.setter
+    def state(self, value: Dict[str, Any]) -> None:
+        if not isinstance(value, dict) or value.get('bit_generator') != type(self).__name__:
+            raise ValueError(f"state must be a dict produced by {type(self).__name__}.state")
+        if (value['protocol'], value['seed_hex'], value['block_outputs']) != (
+                self._protocol, self._seed_hex, self._block_outputs):
+            raise ValueError(
+                "state was produced by a generator with a different protocol, seed or block size"
+            )
+        with self.lock:
+            self._root = _decode_state(value['root'])
+            self._children = value['children']
+            self._reset(_decode_state(value['checkpoint']))
+            if value['position']:
+                # Regenerate the current block from its checkpoint
+                self._refill()
+                self._index = value['position']
+            self._has_uint32 = bool(value['has_uint32'])
+            self._uinteger = value['uinteger']
+
+    def __reduce__(self):
+        return _restore, (self.state,)
+
+    # -- Substreams -------------------------------------------------------
+
+    def _with_root(self, root: State) -> 'GoldenSeedBitGenerator':
+        """Return a generator of the same kind starting from root."""
+        child = type(self)(self._protocol, self._seed_hex, self._block_outputs)
+        child._root = root
+        child._reset(root)
+        return child
+
+    def jumped(self, jumps: int = 1) -> 'GoldenSeedBitGenerator':
+        """
+        Return a generator on a substream derived from the current position.
+
+        A hash chain cannot be advanced without computing every step, so
+        each jump derives a new protocol state from the current checkpoint
+        and position. Jumps compose: jumped(2) equals jumped(1).jumped(1).
+        This generator is not advanced.
+
+        Args:
+            jumps: Number of jumps
+
+        Returns:
+            New GoldenSeedBitGenerator
+
+        Raises:
+            ValueError: If jumps is negative
+        """
+        if jumps < 0:
+            raise ValueError(f"jumps must be non-negative, got {jumps}")
+        if jumps == 0:
+            return _restore(self.state)
+        with self.lock:
+            state = _derive(self._block_start, b'jump', self._index)
+        for _ in range(jumps - 1):
+            state = _derive(state, b'jump', 0)
+        return self._with_root(state)
+
+    def spawn(self, n_children: int) -> List['GoldenSeedBitGenerator']:
+        """
+        Return independent child generators derived from the root state.
+
+        Children depend only on the root and how many children were spawned
+        before, not on how far this generator has been read, as with
+        SeedSequence.spawn(). Works on any numpy; Generator.spawn() on top of
+        it needs numpy >= 1.25.
+
+        Args:
+            n_children: Number of children
+
+        Returns:
+            List of new GoldenSeedBitGenerator instances
+        """
+        with self.lock:
+            first = self._children
+            self._children += n_children
+        return [self._with_root(_derive(self._root, b'spawn', i))
+                for i in range(first, first + n_children)]
+
+
+def _encode_state(state: State) -> Tuple[str, int]:
+    digest, counter = state
+    return digest.hex(), counter
+
+
+def _decode_state(value) -> State:
+    digest, counter = value
+    return bytes.fromhex(digest), int(counter)
+
+
+def _restore(state: Dict[str, Any]) -> GoldenSeedBitGenerator:
+    """Unpickle a GoldenSeedBitGenerator from its state."""
+    bit_generator = GoldenSeedBitGenerator(
+        state['protocol'], state['seed_hex'], state['block_outputs']
+    )
+    bit_generator.state = state
+    return bit_generator
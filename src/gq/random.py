@@ -0,0 +1,663 @@
+"""
+Deterministic Distributions over GoldenSeed Streams
+
+GoldenGenerator turns any GoldenSeed stream into the usual random-variate
+toolkit without the bias and waste of slicing bytes by hand
+(`chunk[0] % 10` favours small values and throws away the other 15 bytes
+of the output):
+
+- integers(): unbiased bounded integers with Lemire's multiply-shift
+  rejection method
+- random(): 53-bit floats in [0, 1)
+- normal(), exponential(): 256-layer ziggurat samplers
+- choice(): uniform or weighted choice; weights use Walker/Vose alias
+  tables, built once per call or reused through AliasTable
+- shuffle(), sample(): Fisher-Yates shuffles and samples without
+  replacement
+
+GoldenRandom is a drop-in random.Random for code that expects one: it
+draws 64-bit words from a block of GCP-1 or GQS-1 outputs generated in
+bulk, and getstate()/setstate() capture the exact stream position.
+
+Bit Reservoir:
+- Scalar calls take exactly the bits they need from a reservoir refilled
+  64 bytes at a time, so a die roll costs 11 bits of stream, not an output
+- Bounded integers use Lemire's method on (bits + 8)-bit words, which
+  rejects less than 1 draw in 256
+
+Batched Forms:
+- Passing size= returns a NumPy array filled from one bulk stream read
+  (plus a small top-up for rejected draws), with the same distributions
+- Batched and scalar calls consume the stream differently, so mixing
+  them changes which values come out, though never their distribution
+
+⚠️ NOT FOR CRYPTOGRAPHY: Values are deterministic and reproducible.
+
+Example Usage:
+    >>> from gq.random import GoldenGenerator
+    >>> rng = GoldenGenerator()
+    >>> [rng.integers(1, 7) for _ in range(8)]
+    [3, 5, 1, 4, 4, 3, 3, 2]
+    >>> 0.0 <= rng.random() < 1.0
+    True
+    >>> rng.choice(['common', 'rare', 'epic'], weights=[90, 9, 1]) in ('common', 'rare', 'epic')
+    True
+    >>> from gq.random import GoldenRandom
+    >>> stdlib_api = GoldenRandom(protocol='gqs1')
+    >>> state = stdlib_api.getstate()
+    >>> first = stdlib_api.sample(range(100), 5)
+    >>> stdlib_api.setstate(state)
+    >>> stdlib_api.sample(range(100), 5) == first
+    True
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import random
+import struct
+from typing import Any, Iterable, List, MutableSequence, Optional, Sequence
+
+from ._optional import TWO_53, np, require_numpy
+from .stream import PROTOCOLS, as_stream, initial_state
+from .universal_qkd import HEX_SEED
+
+
+# Bytes added to the bit reservoir per refill
+RESERVOIR_REFILL_BYTES = 64
+
+# Extra bits per Lemire draw beyond the bound's bit length; rejection
+# probability is below 2^-LEMIRE_SLACK_BITS
+LEMIRE_SLACK_BITS = 8
+
+# Protocol outputs (16 bytes each) generated per GoldenRandom refill
+GOLDEN_RANDOM_BLOCK_OUTPUTS = 512
+
+# Feature named when a size=... draw needs numpy
+_BATCHED = 'batched draws (size=...)'
+
+# Ziggurat parameters (Marsaglia & Tsang, 2000): 256 layers of area V,
+# base layer ending at R
+ZIGGURAT_LAYERS = 256
+_NORMAL_R = 3.6541528853610088
+_NORMAL_V = 0.00492867323399
+_EXPONENTIAL_R = 7.69711747013104972
+_EXPONENTIAL_V = 0.0039496598225815571
+
+
+def _ziggurat_tables(r: float, v: float, density, inverse):
+    """Return layer edges x[0..N] and densities f(x[i]) for a ziggurat."""
+    x = [0.0] * (ZIGGURAT_LAYERS + 1)
+    x[0] = v / density(r)
+    x[1] = r
+    for i in range(2, ZIGGURAT_LAYERS):
+        x[i] = inverse(v / x[i - 1] + density(x[i - 1]))
+    x[ZIGGURAT_LAYERS] = 0.0
+    return x, [density(value) for value in x]
+
+
+def _normal_density(x: float) -> float:
+    return math.exp(-0.5 * x * x)
+
+
+def _normal_inverse(y: float) -> float:
+    return math.sqrt(-2.0 * math.log(y))
+
+
+def _exponential_density(x: float) -> float:
+    return math.exp(-x)
+
+
+def _exponential_inverse(y: float) -> float:
+    return -math.log(y)
+
+
+_NORMAL_X, _NORMAL_F = _ziggurat_tables(_NORMAL_R, _NORMAL_V, _normal_density, _normal_inverse)
+_EXPONENTIAL_X, _EXPONENTIAL_F = _ziggurat_tables(
+    _EXPONENTIAL_R, _EXPONENTIAL_V, _exponential_density, _exponential_inverse
+)
+
+
+class AliasTable:
+    """
+    Walker/Vose alias table for O(1) weighted choice.
+
+    Build once for weights that are sampled many times and pass it to
+    GoldenGenerator.choice() as weights.
+    """
+
+    def __init__(self, weights: Iterable[float]):
+        """
+        Build the table.
+
+        Args:
+            weights: Non-negative weights with a positive sum
+
+        Raises:
+            ValueError: If weights are empty, negative or all zero
+        """
+        weights = [float(w) for w in weights]
+        n = len(weights)
+        total = math.fsum(weights)
+        if not n or total <= 0 or any(w < 0 or math.isnan(w) for w in weights):
+            raise ValueError("Weights must be non-negative with a positive sum")
+
+        scaled = [w * n / total for w in weights]
+        prob = [1.0] * n
+        alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            low = small.pop()
+            high = large.pop()
+            prob[low] = scaled[low]
+            alias[low] = high
+            scaled[high] = (scaled[high] + scaled[low]) - 1.0
+            (small if scaled[high] < 1.0 else large).append(high)
+        # Leftovers are 1 up to rounding
+
+        self.prob = prob
+        self.alias = alias
+        if np is not None:
+            self._prob_array = np.array(prob)
+            self._alias_array = np.array(alias, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.prob)
+
+
+class GoldenGenerator:
+    """
+    Random variates drawn from a GoldenSeed stream.
+
+    Methods return a Python value by default, or a NumPy array when size
+    is given.
+    """
+
+    def __init__(self, stream: Optional[Iterable[bytes]] = None):
+        """
+        Initialize the generator.
+
+        Args:
+            stream: GoldenStream, iterable of byte outputs, or None for the
+                default GCP-1 stream
+        """
+        self._stream = as_stream(stream)
+        self._bits = 0
+        self._nbits = 0
+
+    # -- Raw bits ---------------------------------------------------------
+
+    def getrandbits(self, k: int) -> int:
+        """
+        Return a non-negative integer with k random bits.
+
+        Args:
+            k: Number of bits
+
+        Returns:
+            Integer in [0, 2^k)
+        """
+        if k < 0:
+            raise ValueError(f"Number of bits must be non-negative, got {k}")
+        if self._nbits < k:
+            nbytes = max(RESERVOIR_REFILL_BYTES, (k - self._nbits + 7) // 8)
+            self._bits |= int.from_bytes(self._stream.read(nbytes), 'little') << self._nbits
+            self._nbits += 8 * nbytes
+        value = self._bits & ((1 << k) - 1)
+        self._bits >>= k
+        self._nbits -= k
+        return value
+
+    def bytes(self, n: int) -> bytes:
+        """Return n random bytes."""
+        return self.getrandbits(8 * n).to_bytes(n, 'little')
+
+    def _words(self, count: int, dtype: str = '<u8'):
+        """Read count little-endian words from the stream in one call."""
+        words = np.empty(count, dtype=dtype)
+        self._stream.readinto(words)
+        return words.astype(words.dtype.newbyteorder('='), copy=False)
+
+    # -- Uniform ----------------------------------------------------------
+
+    def _below(self, n: int) -> int:
+        """Lemire's nearly divisionless method: uniform integer in [0, n)."""
+        bits = n.bit_length() + LEMIRE_SLACK_BITS
+        product = self.getrandbits(bits) * n
+        low = product & ((1 << bits) - 1)
+        if low < n:
+            threshold = ((1 << bits) - n) % n
+            while low < threshold:
+                product = self.getrandbits(bits) * n
+                low = product & ((1 << bits) - 1)
+        return product >> bits
+
+    def _below_array(self, bounds, size):
+        """Uniform integers in [0, bounds) (scalar or per-element), batched."""
+        bounds = np.broadcast_to(np.asarray(bounds, dtype=np.uint64), size).ravel()
+        out = np.empty(bounds.size, dtype=np.uint64)
+        pending = np.arange(bounds.size)
+
+        if bounds.size and int(bounds.max()) > 1 << 32:
+            # Wide bounds: bitmask rejection on 64-bit words
+            masks = bounds - np.uint64(1)
+            for shift in (1, 2, 4, 8, 16, 32):
+                masks |= masks >> np.uint64(shift)
+            while pending.size:
+                draws = self._words(pending.size) & masks[pending]
+                ok = draws < bounds[pending]
+                out[pending[ok]] = draws[ok]
+                pending = pending[~ok]
+            return out
+
+        # Lemire on 32-bit words: 32 x 32 -> 64-bit products
+        thresholds = (np.uint64(1 << 32) - bounds) % np.maximum(bounds, np.uint64(1))
+        while pending.size:
+            product = self._words(pending.size, '<u4').astype(np.uint64) * bounds[pending]
+            ok = (product & np.uint64(0xFFFFFFFF)) >= thresholds[pending]
+            out[pending[ok]] = product[ok] >> np.uint64(32)
+            pending = pending[~ok]
+        return out
+
+    def integers(self, low: int, high: Optional[int] = None, size=None):
+        """
+        Draw uniform integers in [low, high).
+
+        Args:
+            low: Lowest value (or the exclusive upper bound if high is None)
+            high: Exclusive upper bound
+            size: Output shape for a batched draw (requires numpy)
+
+        Returns:
+            int, or an int64 array of the given shape
+
+        Raises:
+            ValueError: If the range is empty
+        """
+        if high is None:
+            low, high = 0, low
+        span = high - low
+        if span < 1:
+            raise ValueError(f"Empty range [{low}, {high})")
+        if size is None:
+            return low + self._below(span)
+        require_numpy(_BATCHED)
+        if span > 1 << 63:
+            raise ValueError("Batched ranges must fit in int64")
+        values = self._below_array(span, np.prod(size, dtype=np.int64))
+        return (values.astype(np.int64) + np.int64(low)).reshape(size)
+
+    def random(self, size=None):
+        """
+        Draw floats in [0, 1) with 53 random bits each.
+
+        Args:
+            size: Output shape for a batched draw (requires numpy)
+
+        Returns:
+            float, or a float64 array of the given shape
+        """
+        if size is None:
+            return self.getrandbits(53) * TWO_53
+        require_numpy(_BATCHED)
+        words = self._words(int(np.prod(size, dtype=np.int64)))
+        return ((words >> np.uint64(11)) * TWO_53).reshape(size)
+
+    def uniform(self, low: float = 0.0, high: float = 1.0, size=None):
+        """Draw floats in [low, high)."""
+        return low + (high - low) * self.random(size)
+
+    # -- Ziggurat ---------------------------------------------------------
+
+    def _normal_slow(self, layer: int, z: float) -> float:
+        """Finish a normal draw that missed the ziggurat's inner rectangle."""
+        while True:
+            if layer == 0:
+                # Tail beyond R (Marsaglia's method)
+                while True:
+                    x = -math.log1p(-self.random()) / _NORMAL_R
+                    y = -math.log1p(-self.random())
+                    if 2.0 * y > x * x:
+                        return _NORMAL_R + x
+            # Wedge between layers
+            f_z = _normal_density(z)
+            if _NORMAL_F[layer + 1] + self.random() * (_NORMAL_F[layer] - _NORMAL_F[layer + 1]) < f_z:
+                return z
+            layer = self.getrandbits(8)
+            z = self.getrandbits(53) * TWO_53 * _NORMAL_X[layer]
+            if z < _NORMAL_X[layer + 1]:
+                return z
+
+    def _exponential_slow(self, layer: int, z: float) -> float:
+        """Finish an exponential draw that missed the inner rectangle."""
+        while True:
+            if layer == 0:
+                # The tail of an exponential is a shifted exponential
+                return _EXPONENTIAL_R - math.log1p(-self.random())
+            f_z = _exponential_density(z)
+            if (_EXPONENTIAL_F[layer + 1]
+                    + self.random() * (_EXPONENTIAL_F[layer] - _EXPONENTIAL_F[layer + 1]) < f_z):
+                return z
+            layer = self.getrandbits(8)
+            z = self.getrandbits(53) * TWO_53 * _EXPONENTIAL_X[layer]
+            if z < _EXPONENTIAL_X[layer + 1]:
+                return z
+
+    def _standard_normal(self) -> float:
+        word = self.getrandbits(62)
+        layer = word & 0xFF
+        z = (word >> 9) * TWO_53 * _NORMAL_X[layer]
+        if z >= _NORMAL_X[layer + 1]:
+            z = self._normal_slow(layer, z)
+        return -z if word & 0x100 else z
+
+    def _standard_exponential(self) -> float:
+        word = self.getrandbits(61)
+        layer = word & 0xFF
+        z = (word >> 8) * TWO_53 * _EXPONENTIAL_X[layer]
+        if z >= _EXPONENTIAL_X[layer + 1]:
+            z = self._exponential_slow(layer, z)
+        return z
+
+    def normal(self, loc: float = 0.0, scale: float = 1.0, size=None):
+        """
+        Draw normally distributed values with the ziggurat method.
+
+        Args:
+            loc: Mean
+            scale: Standard deviation
+            size: Output shape for a batched draw (requires numpy)
+
+        Returns:
+            float, or a float64 array of the given shape
+        """
+        if size is None:
+            return loc + scale * self._standard_normal()
+        require_numpy(_BATCHED)
+        count = int(np.prod(size, dtype=np.int64))
+        words = self._words(count)
+        # Bits 0-7 pick the layer, bit 8 the sign, bits 11-63 the position
+        layers = (words & np.uint64(0xFF)).astype(np.intp)
+        z = (words >> np.uint64(11)) * TWO_53 * _NORMAL_X_ARRAY[layers]
+        slow = np.flatnonzero(z >= _NORMAL_X_ARRAY[layers + 1])
+        for i in slow:
+            z[i] = self._normal_slow(int(layers[i]), float(z[i]))
+        z[(words & np.uint64(0x100)) != 0] *= -1.0
+        return (loc + scale * z).reshape(size)
+
+    def exponential(self, scale: float = 1.0, size=None):
+        """
+        Draw exponentially distributed values with the ziggurat method.
+
+        Args:
+            scale: Mean (1 / rate)
+            size: Output shape for a batched draw (requires numpy)
+
+        Returns:
+            float, or a float64 array of the given shape
+        """
+        if size is None:
+            return scale * self._standard_exponential()
+        require_numpy(_BATCHED)
+        count = int(np.prod(size, dtype=np.int64))
+        words = self._words(count)
+        layers = (words & np.uint64(0xFF)).astype(np.intp)
+        z = (words >> np.uint64(11)) * TWO_53 * _EXPONENTIAL_X_ARRAY[layers]
+        slow = np.flatnonzero(z >= _EXPONENTIAL_X_ARRAY[layers + 1])
+        for i in slow:
+            z[i] = self._exponential_slow(int(layers[i]), float(z[i]))
+        return (scale * z).reshape(size)
+
+    # -- Sequences --------------------------------------------------------
+
+    def choice(self, population: Sequence[Any], weights=None, size=None):
+        """
+        Choose elements with replacement, uniformly or by weight.
+
+        Args:
+            population: Non-empty sequence to choose from
+            weights: Relative weights (sequence or AliasTable), or None for
+                a uniform choice
+            size: Output shape for a batched draw (requires numpy)
+
+        Returns:
+            One element, or an array of elements of the given shape
+
+        Raises:
+            ValueError: If population is empty or weights do not match it
+        """
+        n = len(population)
+        if not n:
+            raise ValueError("Cannot choose from an empty population")
+        table = None
+        if weights is not None:
+            table = weights if isinstance(weights, AliasTable) else AliasTable(weights)
+            if len(table) != n:
+                raise ValueError(f"Got {len(table)} weights for {n} elements")
+
+        if size is None:
+            i = self._below(n)
+            if table is not None and self.random() >= table.prob[i]:
+                i = table.alias[i]
+            return population[i]
+
+        require_numpy(_BATCHED)
+        count = int(np.prod(size, dtype=np.int64))
+        indices = self._below_array(n, count).astype(np.intp)
+        if table is not None:
+            accept = self.random(count) < table._prob_array[indices]
+            indices = np.where(accept, indices, table._alias_array[indices])
+        return np.asarray(population)[indices.reshape(size)]
+
+    def shuffle(self, x: MutableSequence[Any]) -> None:
+        """
+        Shuffle a mutable sequence in place (Fisher-Yates).
+
+        Lists are shuffled with scalar draws; NumPy arrays (along the first
+        axis) draw every swap index in one batched read and are permuted
+        with one fancy-indexing copy.
+
+        Args:
+            x: List, NumPy array or other mutable sequence
+        """
+        n = len(x)
+        if n < 2:
+            return
+        if np is not None and isinstance(x, np.ndarray):
+            swaps = self._below_array(np.arange(n, 1, -1, dtype=np.uint64), n - 1)
+            order = list(range(n))
+            for i, j in zip(range(n - 1, 0, -1), swaps.tolist()):
+                order[i], order[j] = order[j], order[i]
+            x[...] = x[order]
+            return
+        below = self._below
+        for i in range(n - 1, 0, -1):
+            j = below(i + 1)
+            x[i], x[j] = x[j], x[i]
+
+    def sample(self, population: Sequence[Any], k: int) -> List[Any]:
+        """
+        Choose k distinct elements (partial Fisher-Yates).
+
+        Args:
+            population: Sequence to sample from
+            k: Sample size
+
+        Returns:
+            List of k elements in selection order
+
+        Raises:
+            ValueError: If k is negative or larger than the population
+        """
+        n = len(population)
+        if not 0 <= k <= n:
+            raise ValueError(f"Sample size {k} is outside [0, {n}]")
+        indices = list(range(n))
+        below = self._below
+        for i in range(k):
+            j = i + below(n - i)
+            indices[i], indices[j] = indices[j], indices[i]
+        return [population[i] for i in indices[:k]]
+
+
+class GoldenRandom(random.Random):
+    """
+    random.Random drawing from a GCP-1 or GQS-1 stream.
+
+    Every method of random.Random (randrange, choice, shuffle, gauss, ...)
+    works unchanged on top of random() and getrandbits(). Outputs are
+    generated a block at a time and split into 64-bit words, so a call is
+    a list index rather than a generator step.
+    """
+
+    VERSION = 'gq-1'
+
+    def __init__(self, x: Any = None, protocol: str = 'gcp1',
+                 block_outputs: int = GOLDEN_RANDOM_BLOCK_OUTPUTS):
+        """
+        Initialize the generator.
+
+        Args:
+            x: Seed (see seed())
+            protocol: 'gcp1' (universal generator) or 'gqs1' (test vectors)
+            block_outputs: Protocol outputs generated per refill
+
+        Raises:
+            ValueError: If the protocol is unknown or block_outputs is not
+                positive
+        """
+        if protocol not in PROTOCOLS:
+            raise ValueError(f"Unknown protocol {protocol!r}; expected one of {sorted(PROTOCOLS)}")
+        if block_outputs < 1:
+            raise ValueError(f"block_outputs must be positive, got {block_outputs}")
+        self._protocol = protocol
+        self._step = PROTOCOLS[protocol][1]
+        self._block_outputs = block_outputs
+        super().__init__(x)
+
+    def seed(self, a: Any = None, version: int = 2) -> None:
+        """
+        Restart the stream.
+
+        None selects the protocol's own stream from its first output, as
+        GoldenStream and the published test vectors do. An int, float,
+        str, bytes or bytearray selects an independent stream derived from
+        it with SHA-256.
+
+        Args:
+            a: Seed value
+            version: Accepted for compatibility with random.Random
+
+        Raises:
+            TypeError: If the seed has another type
+        """
+        state = initial_state(self._protocol, HEX_SEED)
+        if a is not None:
+            if isinstance(a, int):
+                material = b'int:%d' % a
+            elif isinstance(a, float):
+                material = b'float:' + a.hex().encode()
+            elif isinstance(a, str):
+                material = b'str:' + a.encode('utf-8')
+            elif isinstance(a, (bytes, bytearray)):
+                material = b'bytes:' + bytes(a)
+            else:
+                raise TypeError(
+                    "The only supported seed types are: None, int, float, str, bytes, and bytearray."
+                )
+            digest, counter = state
+            state = hashlib.sha256(b'gq.random.seed.' + digest + material).digest(), counter
+        self._reset(state)
+        self.gauss_next = None
+
+    def _reset(self, state) -> None:
+        """Position the generator at the start of the stream from state."""
+        self._checkpoint = state
+        self._next_state = state
+        self._words: List[int] = []
+        self._index = 0
+
+    def _refill(self) -> None:
+        """Generate the next block of outputs and split it into words."""
+        step = self._step
+        state = self._next_state
+        outputs = []
+        for _ in range(self._block_outputs):
+            output, state = step(state)
+            outputs.append(output)
+        self._checkpoint = self._next_state
+        self._next_state = state
+        self._words = list(struct.unpack(f'<{2 * self._block_outputs}Q', b''.join(outputs)))
+        self._index = 0
+
+    def random(self) -> float:
+        """Return the top 53 bits of the next word as a float in [0, 1)."""
+        index = self._index
+        if index == len(self._words):
+            self._refill()
+            index = 0
+        self._index = index + 1
+        return (self._words[index] >> 11) * TWO_53
+
+    def getrandbits(self, k: int) -> int:
+        """
+        Return a non-negative integer with k random bits.
+
+        Takes the top k bits of the next ceil(k / 64) words, joined
+        little-endian.
+        """
+        if k < 0:
+            raise ValueError("number of bits must be non-negative")
+        words = -(-k // 64)
+        value = 0
+        for shift in range(0, 64 * words, 64):
+            index = self._index
+            if index == len(self._words):
+                self._refill()
+                index = 0
+            self._index = index + 1
+            value |= self._words[index] << shift
+        return value >> (64 * words - k)
+
+    def getstate(self):
+        """
+        Return the exact stream position: the protocol state at the start
+        of the current block, the word index within it and the cached
+        gauss() value.
+        """
+        digest, counter = self._checkpoint
+        return (self.VERSION, self._protocol, self._block_outputs,
+                digest.hex(), counter, self._index, self.gauss_next)
+
+    def setstate(self, state) -> None:
+        """
+        Restore a position returned by getstate().
+
+        Raises:
+            ValueError: If the state comes from another generator type,
+                protocol or block size
+        """
+        if not isinstance(state, tuple) or len(state) != 7 or state[0] != self.VERSION:
+            raise ValueError(f"state is not a {type(self).__name__}.getstate() value")
+        _, protocol, block_outputs, digest, counter, index, gauss_next = state
+        if (protocol, block_outputs) != (self._protocol, self._block_outputs):
+            raise ValueError(
+                f"state is for protocol {protocol!r} with {block_outputs}-output blocks, "
+                f"not {self._protocol!r} with {self._block_outputs}"
+            )
+        self._reset((bytes.fromhex(digest), counter))
+        if index:
+            # Regenerate the current block from its checkpoint
+            self._refill()
+            self._index = index
+        self.gauss_next = gauss_next
+
+    def __reduce__(self):
+        return self.__class__, (None, self._protocol, self._block_outputs), self.getstate()
+
+
+if np is not None:
+    _NORMAL_X_ARRAY = np.array(_NORMAL_X)
+    _EXPONENTIAL_X_ARRAY = np.array(_EXPONENTIAL_X)
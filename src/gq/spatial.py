@@ -0,0 +1,300 @@
+"""
+Golden-Angle Spatial Sampling for Procedural Placement
+
+Deterministic, well-spread point sets built on the golden angle, the same
+irrational rotation that drives {Z·φ} in GoldenRatioCoinFlip:
+
+- Disk: Vogel spiral, r_i = R·sqrt((i + ½)/n), θ_i = i·golden_angle
+- Sphere: Fibonacci lattice, z_i = 1 - 2(i + ½)/n, θ_i = i·golden_angle
+- Rectangle: Fibonacci lattice, (x_i, y_i) = ((i + ½)/n, {i/φ})
+
+The golden angle 2π/φ² is evaluated as 2π·(1 - {i/φ}) using the exact
+fixed-point R_1 sequence, so angles stay accurate for any index.
+
+Jitter:
+- Optional deterministic jitter breaks the visible spiral/lattice pattern
+- Offsets come from an R_2 sequence with a Cranley-Patterson shift read
+  from a GoldenSeed stream (16 bytes per call), so jitter is reproducible
+  and costs no per-point stream reads
+- The default stream always yields the same shift, so chunked calls
+  (start/count) with stream=None agree with a single large call
+
+Neighbour Queries:
+- GridIndex buckets points into uniform cells for radius queries
+
+Sampling and GridIndex need the numpy extra.
+
+⚠️ NOT FOR CRYPTOGRAPHY: This is for procedural generation only.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+from ._optional import np, require_numpy
+from .kronecker import KroneckerSequence
+
+
+# Golden angle: 2π/φ² = π(3 - √5) ≈ 2.39996 rad ≈ 137.508°
+GOLDEN_ANGLE = math.pi * (3 - math.sqrt(5))
+
+_TWO_PI = 2.0 * math.pi
+
+
+def _index_range(n: int, start: int, count: Optional[int]) -> Tuple[int, int]:
+    """Validate a chunk [start, start + count) of an n-point set."""
+    if n < 1:
+        raise ValueError(f"Number of points must be at least 1, got {n}")
+    if count is None:
+        count = n - start
+    if start < 0 or count < 0 or start + count > n:
+        raise ValueError(
+            f"Chunk [{start}, {start + count}) is outside the {n}-point set"
+        )
+    return start, count
+
+
+def _jitter_offsets(stream: Optional[Iterable[bytes]], start: int,
+                    count: int) -> np.ndarray:
+    """Draw (count, 2) jitter offsets centred on zero, in [-½, ½)."""
+    jitter_seq = KroneckerSequence(2).cranley_patterson_shift(stream)
+    return jitter_seq.points(count, start=start) - 0.5
+
+
+def _golden_angles(start: int, count: int) -> np.ndarray:
+    """Compute i·golden_angle mod 2π for i = start, ..., start + count - 1."""
+    frac = KroneckerSequence(1).points(count, start=start)[:, 0]
+    return _TWO_PI * (1.0 - frac)
+
+
+def disk_points(n: int, radius: float = 1.0,
+                center: Sequence[float] = (0.0, 0.0),
+                jitter: float = 0.0,
+                stream: Optional[Iterable[bytes]] = None,
+                start: int = 0, count: Optional[int] = None) -> np.ndarray:
+    """
+    Sample n points in a disk with the golden-angle (Vogel) spiral.
+
+    Args:
+        n: Total number of points in the set
+        radius: Disk radius
+        center: Disk centre (x, y)
+        jitter: Jitter strength in [0, 1], as a fraction of point spacing
+        stream: GoldenSeed stream for the jitter shift (default: GCP-1)
+        start: First point index of this chunk
+        count: Number of points in this chunk (default: n - start)
+
+    Returns:
+        float64 array of shape (count, 2)
+
+    Raises:
+        ValueError: If the chunk is outside the n-point set
+        ImportError: If numpy is not installed
+    """
+    require_numpy('spatial sampling')
+    start, count = _index_range(n, start, count)
+    i = np.arange(start, start + count, dtype=np.float64)
+    theta = _golden_angles(start, count)
+
+    if jitter:
+        offsets = _jitter_offsets(stream, start, count)
+        r = radius * np.sqrt((i + 0.5 + jitter * offsets[:, 0]) / n)
+        # Shift along the arc by up to half the mean point spacing
+        spacing = radius * math.sqrt(math.pi / n)
+        theta += jitter * offsets[:, 1] * spacing / np.maximum(r, spacing)
+    else:
+        r = radius * np.sqrt((i + 0.5) / n)
+
+    out = np.empty((count, 2))
+    out[:, 0] = center[0] + r * np.cos(theta)
+    out[:, 1] = center[1] + r * np.sin(theta)
+    return out
+
+
+def sphere_points(n: int, radius: float = 1.0,
+                  center: Sequence[float] = (0.0, 0.0, 0.0),
+                  jitter: float = 0.0,
+                  stream: Optional[Iterable[bytes]] = None,
+                  start: int = 0, count: Optional[int] = None) -> np.ndarray:
+    """
+    Sample n points on a sphere with the Fibonacci lattice.
+
+    Args:
+        n: Total number of points in the set
+        radius: Sphere radius
+        center: Sphere centre (x, y, z)
+        jitter: Jitter strength in [0, 1], as a fraction of point spacing
+        stream: GoldenSeed stream for the jitter shift (default: GCP-1)
+        start: First point index of this chunk
+        count: Number of points in this chunk (default: n - start)
+
+    Returns:
+        float64 array of shape (count, 3)
+
+    Raises:
+        ValueError: If the chunk is outside the n-point set
+        ImportError: If numpy is not installed
+    """
+    require_numpy('spatial sampling')
+    start, count = _index_range(n, start, count)
+    i = np.arange(start, start + count, dtype=np.float64)
+    theta = _golden_angles(start, count)
+
+    if jitter:
+        offsets = _jitter_offsets(stream, start, count)
+        z = 1.0 - 2.0 * (i + 0.5 + jitter * offsets[:, 0]) / n
+        ring = np.sqrt(np.clip(1.0 - z * z, 0.0, 1.0))
+        spacing = math.sqrt(4.0 * math.pi / n)
+        theta += jitter * offsets[:, 1] * spacing / np.maximum(ring, spacing)
+    else:
+        z = 1.0 - 2.0 * (i + 0.5) / n
+        ring = np.sqrt(1.0 - z * z)
+
+    out = np.empty((count, 3))
+    out[:, 0] = center[0] + radius * ring * np.cos(theta)
+    out[:, 1] = center[1] + radius * ring * np.sin(theta)
+    out[:, 2] = center[2] + radius * z
+    return out
+
+
+def rect_points(n: int, width: float = 1.0, height: float = 1.0,
+                origin: Sequence[float] = (0.0, 0.0),
+                jitter: float = 0.0,
+                stream: Optional[Iterable[bytes]] = None,
+                start: int = 0, count: Optional[int] = None) -> np.ndarray:
+    """
+    Sample n points in a rectangle with the Fibonacci lattice.
+
+    Jittered points wrap around the rectangle edges (toroidally), so the
+    set tiles seamlessly.
+
+    Args:
+        n: Total number of points in the set
+        width: Rectangle width (x extent)
+        height: Rectangle height (y extent)
+        origin: Lower-left corner (x, y)
+        jitter: Jitter strength in [0, 1], as a fraction of point spacing
+        stream: GoldenSeed stream for the jitter shift (default: GCP-1)
+        start: First point index of this chunk
+        count: Number of points in this chunk (default: n - start)
+
+    Returns:
+        float64 array of shape (count, 2)
+
+    Raises:
+        ValueError: If the chunk is outside the n-point set
+        ImportError: If numpy is not installed
+    """
+    require_numpy('spatial sampling')
+    start, count = _index_range(n, start, count)
+    x = (np.arange(start, start + count, dtype=np.float64) + 0.5) / n
+    y = KroneckerSequence(1).points(count, start=start)[:, 0]
+
+    if jitter:
+        offsets = _jitter_offsets(stream, start, count)
+        spacing = 1.0 / math.sqrt(n)
+        x = np.mod(x + jitter * spacing * offsets[:, 0], 1.0)
+        y = np.mod(y + jitter * spacing * offsets[:, 1], 1.0)
+
+    out = np.empty((count, 2))
+    out[:, 0] = origin[0] + width * x
+    out[:, 1] = origin[1] + height * y
+    return out
+
+
+class GridIndex:
+    """
+    Uniform grid bucket index for neighbour queries.
+
+    Points are sorted by cell so each occupied cell maps to a contiguous
+    slice of point indices.
+    """
+
+    def __init__(self, points, cell_size: float):
+        """
+        Build the index.
+
+        Args:
+            points: Array-like of shape (N, d)
+            cell_size: Edge length of a grid cell (use ~ the query radius)
+
+        Raises:
+            ValueError: If cell_size is not positive
+            ImportError: If numpy is not installed
+        """
+        require_numpy('GridIndex')
+        if cell_size <= 0:
+            raise ValueError(f"Cell size must be positive, got {cell_size}")
+
+        self.points = np.asarray(points, dtype=np.float64)
+        if self.points.ndim != 2:
+            raise ValueError("Points must be a 2-D array of shape (N, d)")
+        self.cell_size = float(cell_size)
+
+        cells = np.floor(self.points / self.cell_size).astype(np.int64)
+        self.order = np.lexsort(cells.T[::-1])
+        sorted_cells = cells[self.order]
+
+        if len(sorted_cells):
+            boundaries = np.flatnonzero(np.any(np.diff(sorted_cells, axis=0), axis=1)) + 1
+            starts = np.concatenate(([0], boundaries))
+            ends = np.concatenate((boundaries, [len(sorted_cells)]))
+        else:
+            starts = ends = np.empty(0, dtype=np.int64)
+
+        self._buckets: Dict[Tuple[int, ...], Tuple[int, int]] = {
+            tuple(sorted_cells[s].tolist()): (int(s), int(e))
+            for s, e in zip(starts, ends)
+        }
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    @property
+    def num_cells(self) -> int:
+        """Number of occupied cells."""
+        return len(self._buckets)
+
+    def query_radius(self, center: Sequence[float], radius: float) -> np.ndarray:
+        """
+        Find all points within radius of center.
+
+        Args:
+            center: Query point (d coordinates)
+            radius: Search radius
+
+        Returns:
+            Sorted array of point indices
+        """
+        center = np.asarray(center, dtype=np.float64)
+        low = np.floor((center - radius) / self.cell_size).astype(np.int64)
+        high = np.floor((center + radius) / self.cell_size).astype(np.int64)
+
+        slices = []
+        for cell in np.ndindex(*(high - low + 1)):
+            bucket = self._buckets.get(tuple((low + cell).tolist()))
+            if bucket is not None:
+                slices.append(self.order[bucket[0]:bucket[1]])
+
+        if not slices:
+            return np.empty(0, dtype=np.int64)
+
+        candidates = np.concatenate(slices)
+        deltas = self.points[candidates] - center
+        inside = np.einsum('ij,ij->i', deltas, deltas) <= radius * radius
+        return np.sort(candidates[inside])
+
+    def neighbors(self, index: int, radius: float) -> np.ndarray:
+        """
+        Find all other points within radius of point index.
+
+        Args:
+            index: Index of the query point
+            radius: Search radius
+
+        Returns:
+            Sorted array of neighbour indices (excluding index itself)
+        """
+        found = self.query_radius(self.points[index], radius)
+        return found[found != index]
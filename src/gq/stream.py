@@ -0,0 +1,242 @@
+"""
+Buffered Byte Streams over GoldenSeed Generators
+
+The generators in this package yield fixed-size outputs (16 bytes per step
+for GCP-1). Consumers that need an arbitrary number of bytes - random shifts,
+jitter, array fills - read them through GoldenStream, which buffers the
+outputs so no bytes are dropped between reads.
+
+PROTOCOLS exposes the protocols as explicit state machines - an initial
+state from the seed and a step returning (output, next state) - for code
+that checkpoints or derives streams (the stream server, the NumPy and
+random.Random adapters).
+
+⚠️ NOT FOR CRYPTOGRAPHY: Streams are deterministic and reproducible.
+
+Example Usage:
+    >>> from gq.stream import GoldenStream
+    >>> stream = GoldenStream()
+    >>> stream.read(4).hex()
+    '3c732e0d'
+    >>> stream.tell()
+    4
+"""
+
+from __future__ import annotations
+
+import hashlib
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from . import gqs1_core, universal_qkd
+from .universal_qkd import universal_qkd_generator
+
+
+# Most outputs joined per copy in readinto() (1 MiB of 16-byte outputs)
+READINTO_BATCH_OUTPUTS = 65536
+
+# Bytes per output step of every protocol
+OUTPUT_SIZE = 16
+
+# Generator state between outputs: (hash state, counter)
+State = Tuple[bytes, int]
+
+
+def _gcp1_start(seed: bytes) -> State:
+    return hashlib.sha256(seed).digest(), 0
+
+
+def _gcp1_step(state: State) -> Tuple[bytes, State]:
+    # Same path as universal_qkd_generator(), so served outputs are instrumented
+    output, digest, counter = universal_qkd.generate_output(*state)
+    return output, (digest, counter)
+
+
+def _gqs1_start(seed: bytes) -> State:
+    return seed, 1
+
+
+def _gqs1_step(state: State) -> Tuple[bytes, State]:
+    digest, counter = state
+    key, digest = gqs1_core.generate_key(digest, counter)
+    return key, (digest, counter + 1)
+
+
+# Protocol name -> (initial state from seed, one output step)
+PROTOCOLS: Dict[str, Tuple[Callable[[bytes], State], Callable[[State], Tuple[bytes, State]]]] = {
+    'gcp1': (_gcp1_start, _gcp1_step),
+    'gqs1': (_gqs1_start, _gqs1_step),
+}
+
+
+def initial_state(protocol: str, seed_hex: str) -> State:
+    """
+    Return the generator state before the first output.
+
+    Args:
+        protocol: Protocol name (see PROTOCOLS)
+        seed_hex: Hex string of the seed
+
+    Returns:
+        Initial generator state
+
+    Raises:
+        KeyError: If the protocol is unknown
+        ValueError: If the seed is not hex or fails checksum verification
+    """
+    start, _ = PROTOCOLS[protocol]
+    seed = bytes.fromhex(seed_hex)
+    if not universal_qkd.verify_seed_checksum(seed):
+        raise ValueError(
+            f"Seed checksum verification failed. "
+            f"Expected: {universal_qkd.EXPECTED_CHECKSUM}, "
+            f"Got: {hashlib.sha256(seed).hexdigest()}"
+        )
+    return start(seed)
+
+
+
+class GoldenStream:
+    """
+    Byte-oriented reader over an iterator of GoldenSeed outputs.
+
+    Reads are served from an internal buffer refilled one output at a time,
+    so consecutive reads return consecutive bytes of the underlying stream
+    regardless of read size.
+    """
+
+    def __init__(self, source: Optional[Iterable[bytes]] = None):
+        """
+        Initialize the stream.
+
+        Args:
+            source: Iterable of byte outputs (default: GCP-1 golden seed stream)
+        """
+        self._source: Iterator[bytes] = iter(
+            source if source is not None else universal_qkd_generator()
+        )
+        self._buffer = bytearray()
+        self._position = 0
+        # Bytes per source output, learned by readinto(); None until the
+        # first output has been seen
+        self._output_size: Optional[int] = None
+
+    def read(self, size: int) -> bytes:
+        """
+        Read exactly size bytes from the stream.
+
+        Args:
+            size: Number of bytes to read
+
+        Returns:
+            The next size bytes of the stream
+
+        Raises:
+            ValueError: If size is negative
+            EOFError: If a finite source is exhausted
+        """
+        if size < 0:
+            raise ValueError(f"Read size must be non-negative, got {size}")
+
+        while len(self._buffer) < size:
+            try:
+                self._buffer += next(self._source)
+            except StopIteration:
+                raise EOFError(
+                    f"Stream exhausted after {self._position + len(self._buffer)} bytes"
+                ) from None
+
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        self._position += size
+        return data
+
+    def readinto(self, buffer) -> int:
+        """
+        Fill a writable buffer with the next len(buffer) bytes.
+
+        Outputs are joined in batches of up to 1 MiB and copied with one
+        slice assignment per batch, so bulk fills cost a few Python
+        operations per megabyte instead of one per output.
+
+        Args:
+            buffer: Writable C-contiguous buffer (bytearray, memoryview,
+                numpy array, mmap)
+
+        Returns:
+            Number of bytes written (the buffer size in bytes)
+
+        Raises:
+            EOFError: If a finite source is exhausted; the stream is left
+                as it was
+        """
+        view = memoryview(buffer).cast('B')
+        size = view.nbytes
+
+        filled = min(len(self._buffer), size)
+        view[:filled] = self._buffer[:filled]
+        del self._buffer[:filled]
+
+        source = self._source
+        while filled < size:
+            # Join a batch of outputs in C rather than copying them one by one
+            if self._output_size is None:
+                # Look at one output first: sources with larger outputs
+                # (derived blocks, file chunks) must not be over-read
+                count = 1
+            else:
+                count = min(-(-(size - filled) // self._output_size), READINTO_BATCH_OUTPUTS)
+            batch = b''.join(islice(source, count))
+            if not batch:
+                # Give back what was taken so the stream is unchanged
+                self._buffer[0:0] = view[:filled]
+                raise EOFError(
+                    f"Stream exhausted after {self._position + len(self._buffer)} bytes"
+                ) from None
+            self._output_size = max(len(batch) // count, 1)
+            end = filled + len(batch)
+            if end <= size:
+                view[filled:end] = batch
+            else:
+                view[filled:] = batch[:size - filled]
+                self._buffer += batch[size - filled:]
+            filled = end
+
+        self._position += size
+        return size
+
+    def tell(self) -> int:
+        """Return the number of bytes read so far."""
+        return self._position
+
+    def __iter__(self) -> "GoldenStream":
+        return self
+
+    def __next__(self) -> bytes:
+        """Return buffered bytes, or the next output if the buffer is empty."""
+        if not self._buffer:
+            try:
+                self._buffer += next(self._source)
+            except StopIteration:
+                raise StopIteration from None
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        self._position += len(data)
+        return data
+
+
+def as_stream(stream: Optional[Iterable[bytes]] = None) -> GoldenStream:
+    """
+    Wrap a generator of outputs as a GoldenStream.
+
+    Args:
+        stream: GoldenStream, iterable of byte outputs, or None for the
+            default GCP-1 stream
+
+    Returns:
+        The stream itself if it already is a GoldenStream, otherwise a new
+        GoldenStream reading from it
+    """
+    if isinstance(stream, GoldenStream):
+        return stream
+    return GoldenStream(stream)
@@ -0,0 +1,598 @@
+#!/usr/bin/env python3
+"""
+Local Stream Server
+
+Services on one host that need the same GoldenSeed byte ranges would each
+regenerate them from the start of the stream. The stream server computes
+every range once and serves it to all local consumers over HTTP, on a TCP
+port bound to localhost or on a Unix socket:
+
+    GET /stream/{protocol}/{seed}?offset=&length=
+
+returns raw stream bytes. protocol is gcp1 (the universal generator) or
+gqs1 (test vectors); seed is the hex seed.
+
+How ranges are served:
+
+1. The stream is split into fixed-size blocks. A bounded LRU keeps hot
+   blocks, and concurrent requests for a block that is being generated
+   wait for the same result.
+2. The generator state at each block boundary is kept as a checkpoint, so
+   a miss resumes from the nearest checkpoint instead of from offset 0.
+3. Blocks are generated in a worker pool (processes by default); the event
+   loop only parses requests and copies bytes.
+4. Single byte ranges (Range: bytes=a-b, a-, -n) get 206 responses, and
+   responses larger than one block are sent with chunked transfer encoding
+   so they start streaming as soon as the first block is ready.
+5. Ranges ending past max_offset are rejected (400, or 416 for Range
+   requests), bounding the work one request can cause.
+
+GET /stats returns cache statistics as JSON.
+
+⚠️ NOT FOR CRYPTOGRAPHY: Streams are deterministic and reproducible.
+"""
+
+import asyncio
+import bisect
+import json
+import multiprocessing
+import os
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from .stream import OUTPUT_SIZE, PROTOCOLS, State, initial_state
+
+
+# Bytes per cached block (4096 outputs); checkpoints sit on block boundaries
+BLOCK_SIZE = 64 * 1024
+
+# Default bound on the hot block cache
+DEFAULT_CACHE_SIZE = 256 * 1024 * 1024
+
+# Checkpoints kept per stream before their spacing is doubled
+MAX_CHECKPOINTS = 65536
+
+# Largest response for open-ended ranges (bytes=a-)
+DEFAULT_MAX_LENGTH = 16 * 1024 * 1024
+
+# Stream positions served, from 0 (1 GiB). A miss past the last checkpoint
+# generates every block up to the requested one, so an unbounded offset
+# would tie up a worker indefinitely
+DEFAULT_MAX_OFFSET = 1024 * 1024 * 1024
+
+# Largest request head accepted
+MAX_HEADER_SIZE = 16 * 1024
+
+
+def generate_blocks(protocol: str, state: State, first_block: int, last_block: int,
+                    keep_from: int, block_size: int = BLOCK_SIZE
+                    ) -> Tuple[List[bytes], List[Tuple[int, State]]]:
+    """
+    Generate consecutive blocks from the state at the start of first_block.
+
+    Runs in worker processes, so it takes and returns plain picklable values.
+
+    Args:
+        protocol: Protocol name
+        state: Generator state at the start of first_block
+        first_block: Block the state belongs to
+        last_block: Last block to generate
+        keep_from: First block whose bytes are returned (earlier blocks are
+            only generated to advance the state)
+        block_size: Bytes per block (multiple of OUTPUT_SIZE)
+
+    Returns:
+        Tuple of (bytes of blocks keep_from..last_block, checkpoints for the
+        starts of blocks first_block + 1..last_block + 1)
+    """
+    _, step = PROTOCOLS[protocol]
+    outputs_per_block = block_size // OUTPUT_SIZE
+    blocks = []
+    checkpoints = []
+    for block in range(first_block, last_block + 1):
+        outputs = []
+        for _ in range(outputs_per_block):
+            output, state = step(state)
+            outputs.append(output)
+        if block >= keep_from:
+            blocks.append(b''.join(outputs))
+        checkpoints.append((block + 1, state))
+    return blocks, checkpoints
+
+
+class CheckpointStore:
+    """
+    Generator states at block boundaries of one stream.
+
+    Keeps at most max_checkpoints states. When full, the spacing between
+    kept checkpoints doubles, so memory stays bounded however far into the
+    stream consumers read.
+    """
+
+    def __init__(self, initial: State, max_checkpoints: int = MAX_CHECKPOINTS):
+        """
+        Initialize the store.
+
+        Args:
+            initial: Generator state at the start of block 0
+            max_checkpoints: Bound on the number of stored states
+        """
+        self.max_checkpoints = max(2, max_checkpoints)
+        self.stride = 1
+        self._blocks = [0]
+        self._states = {0: initial}
+
+    def __len__(self) -> int:
+        return len(self._blocks)
+
+    def nearest(self, block: int) -> Tuple[int, State]:
+        """Return (block index, state) of the closest checkpoint at or before block."""
+        index = bisect.bisect_right(self._blocks, block) - 1
+        start = self._blocks[index]
+        return start, self._states[start]
+
+    def add(self, block: int, state: State) -> None:
+        """Store the state at the start of a block."""
+        if block % self.stride or block in self._states:
+            return
+        bisect.insort(self._blocks, block)
+        self._states[block] = state
+        if len(self._blocks) > self.max_checkpoints:
+            self.stride *= 2
+            self._blocks = [b for b in self._blocks if b % self.stride == 0]
+            self._states = {b: self._states[b] for b in self._blocks}
+
+
+class BlockCache:
+    """
+    Block-level range cache shared by all connections of a server.
+
+    Looks up blocks in a byte-bounded LRU, joins in-flight generations, and
+    otherwise generates from the nearest checkpoint in the executor. All
+    methods run on the event loop thread.
+    """
+
+    def __init__(self, executor: Executor, cache_size: int = DEFAULT_CACHE_SIZE,
+                 block_size: int = BLOCK_SIZE, max_checkpoints: int = MAX_CHECKPOINTS):
+        """
+        Initialize the cache.
+
+        Args:
+            executor: Executor running generate_blocks()
+            cache_size: Bound on cached block bytes
+            block_size: Bytes per block (multiple of OUTPUT_SIZE)
+            max_checkpoints: Checkpoints kept per stream
+        """
+        if block_size <= 0 or block_size % OUTPUT_SIZE:
+            raise ValueError(f"Block size must be a positive multiple of {OUTPUT_SIZE}")
+        self.executor = executor
+        self.cache_size = cache_size
+        self.block_size = block_size
+        self.max_checkpoints = max_checkpoints
+        self._blocks: "OrderedDict[Tuple[str, str, int], bytes]" = OrderedDict()
+        self._cached_bytes = 0
+        self._pending: Dict[Tuple[str, str, int], asyncio.Future] = {}
+        self._checkpoints: Dict[Tuple[str, str], CheckpointStore] = {}
+        self.hits = 0
+        self.misses = 0
+        self.generated_blocks = 0
+
+    def checkpoints(self, protocol: str, seed_hex: str) -> CheckpointStore:
+        """
+        Return the checkpoint store of a stream, creating it on first use.
+
+        Raises:
+            KeyError: If the protocol is unknown
+            ValueError: If the seed is invalid
+        """
+        key = (protocol, seed_hex)
+        store = self._checkpoints.get(key)
+        if store is None:
+            store = CheckpointStore(initial_state(protocol, seed_hex), self.max_checkpoints)
+            self._checkpoints[key] = store
+        return store
+
+    def _store(self, key: Tuple[str, str, int], data: bytes) -> None:
+        if len(data) > self.cache_size or key in self._blocks:
+            return
+        self._blocks[key] = data
+        self._cached_bytes += len(data)
+        while self._cached_bytes > self.cache_size:
+            _, evicted = self._blocks.popitem(last=False)
+            self._cached_bytes -= len(evicted)
+
+    async def get_block(self, protocol: str, seed_hex: str, block: int) -> bytes:
+        """
+        Return one block of a stream.
+
+        Args:
+            protocol: Protocol name
+            seed_hex: Hex seed (lowercase)
+            block: Block index
+
+        Returns:
+            block_size bytes starting at block * block_size
+        """
+        key = (protocol, seed_hex, block)
+        data = self._blocks.get(key)
+        if data is not None:
+            self._blocks.move_to_end(key)
+            self.hits += 1
+            return data
+
+        pending = self._pending.get(key)
+        if pending is not None:
+            self.hits += 1
+            return await asyncio.shield(pending)
+
+        self.misses += 1
+        store = self.checkpoints(protocol, seed_hex)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending[key] = future
+        try:
+            start, state = store.nearest(block)
+            blocks, checkpoints = await loop.run_in_executor(
+                self.executor, generate_blocks,
+                protocol, state, start, block, block, self.block_size
+            )
+            for index, checkpoint in checkpoints:
+                store.add(index, checkpoint)
+            data = blocks[0]
+            self.generated_blocks += block - start + 1
+            self._store(key, data)
+            future.set_result(data)
+            return data
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure is not logged
+            future.exception()
+            raise
+        finally:
+            del self._pending[key]
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache statistics."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'generated_blocks': self.generated_blocks,
+            'cached_blocks': len(self._blocks),
+            'cached_bytes': self._cached_bytes,
+            'cache_size': self.cache_size,
+            'block_size': self.block_size,
+            'streams': {
+                f"{protocol}/{seed}": {'checkpoints': len(store), 'stride': store.stride}
+                for (protocol, seed), store in self._checkpoints.items()
+            },
+        }
+
+
+class HTTPError(Exception):
+    """Error answered with an HTTP status code."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+REASONS = {
+    200: 'OK',
+    206: 'Partial Content',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    416: 'Range Not Satisfiable',
+    500: 'Internal Server Error',
+}
+
+
+def parse_range(header: str, length: Optional[int], max_length: int) -> Tuple[int, int]:
+    """
+    Resolve a single-range Range header against a resource.
+
+    Args:
+        header: Range header value (e.g. 'bytes=0-99')
+        length: Resource length, or None for the unbounded stream
+        max_length: Cap on open-ended ranges of the unbounded stream
+
+    Returns:
+        Tuple of (start, end) with end exclusive
+
+    Raises:
+        HTTPError: 416 if the range is malformed or unsatisfiable
+    """
+    unit, _, spec = header.partition('=')
+    if unit.strip().lower() != 'bytes' or ',' in spec:
+        raise HTTPError(416, "Only single byte ranges are supported")
+    first, sep, last = spec.strip().partition('-')
+    if (not sep or not (first or last)
+            or (first and not first.isdigit()) or (last and not last.isdigit())):
+        raise HTTPError(416, f"Malformed range: {header}")
+
+    if first == '':
+        if length is None:
+            raise HTTPError(416, "Suffix ranges need a length query parameter")
+        suffix = int(last)
+        if suffix == 0:
+            raise HTTPError(416, f"Unsatisfiable range: {header}")
+        return max(0, length - suffix), length
+
+    start = int(first)
+    end = int(last) + 1 if last else (length if length is not None else start + max_length)
+    if length is not None:
+        if start >= length:
+            raise HTTPError(416, f"Unsatisfiable range: {header}")
+        end = min(end, length)
+    if end <= start:
+        raise HTTPError(416, f"Unsatisfiable range: {header}")
+    return start, end
+
+
+def _query_int(query: Dict[str, List[str]], name: str) -> Optional[int]:
+    values = query.get(name)
+    if not values:
+        return None
+    try:
+        value = int(values[-1])
+    except ValueError:
+        raise HTTPError(400, f"{name} must be an integer") from None
+    if value < 0:
+        raise HTTPError(400, f"{name} must be non-negative")
+    return value
+
+
+class StreamServer:
+    """
+    Asyncio HTTP/1.1 server for stream ranges.
+
+    Example Usage:
+        >>> async def main():
+        ...     server = StreamServer(port=8642)
+        ...     await server.start()
+        ...     await server.serve_forever()
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 8642,
+                 unix_path: Optional[str] = None, executor: Optional[Executor] = None,
+                 max_workers: Optional[int] = None, cache_size: int = DEFAULT_CACHE_SIZE,
+                 block_size: int = BLOCK_SIZE, max_length: int = DEFAULT_MAX_LENGTH,
+                 max_checkpoints: int = MAX_CHECKPOINTS, max_offset: int = DEFAULT_MAX_OFFSET):
+        """
+        Initialize the server.
+
+        Args:
+            host: Interface to bind (ignored with unix_path)
+            port: TCP port (0 picks a free port)
+            unix_path: Serve on this Unix socket instead of TCP
+            executor: Executor for generation (default: a process pool of
+                max_workers processes, shut down on close)
+            max_workers: Worker count of the default process pool
+            cache_size: Bound on cached block bytes
+            block_size: Bytes per block
+            max_length: Largest response to open-ended ranges
+            max_checkpoints: Checkpoints kept per stream
+            max_offset: Stream position every response must end by
+        """
+        self.host = host
+        self.port = port
+        self.unix_path = unix_path
+        self.max_length = max_length
+        self.max_offset = max_offset
+        self._owns_executor = executor is None
+        if executor is None:
+            # Forked workers would inherit client sockets and hold them open
+            method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            executor = ProcessPoolExecutor(max_workers=max_workers,
+                                           mp_context=multiprocessing.get_context(method))
+        self.cache = BlockCache(executor, cache_size, block_size, max_checkpoints)
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> None:
+        """Start listening."""
+        if self.unix_path is not None:
+            self._server = await asyncio.start_unix_server(
+                self._handle_connection, path=self.unix_path
+            )
+        else:
+            self._server = await asyncio.start_server(
+                self._handle_connection, self.host, self.port
+            )
+            self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        """Serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop listening and shut down an owned executor."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self.unix_path is not None and os.path.exists(self.unix_path):
+            os.unlink(self.unix_path)
+        if self._owns_executor:
+            self.cache.executor.shutdown(wait=False)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter) -> None:
+        try:
+            keep_alive = True
+            while keep_alive:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except asyncio.IncompleteReadError:
+                    break
+                except asyncio.LimitOverrunError:
+                    await self._send_error(writer, HTTPError(400, "Request head too large"), False)
+                    break
+                if len(head) > MAX_HEADER_SIZE:
+                    await self._send_error(writer, HTTPError(400, "Request head too large"), False)
+                    break
+                keep_alive = await self._handle_request(head, writer)
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _handle_request(self, head: bytes, writer: asyncio.StreamWriter) -> bool:
+        """Answer one request; return whether the connection stays open."""
+        lines = head.decode('latin-1').split('\r\n')
+        parts = lines[0].split()
+        if len(parts) != 3:
+            await self._send_error(writer, HTTPError(400, "Malformed request line"), False)
+            return False
+        method, target, version = parts
+        headers = {}
+        for line in lines[1:]:
+            name, sep, value = line.partition(':')
+            if sep:
+                headers[name.strip().lower()] = value.strip()
+
+        connection = headers.get('connection', '').lower()
+        keep_alive = version == 'HTTP/1.1' and connection != 'close'
+        chunked_ok = version == 'HTTP/1.1'
+
+        try:
+            if method not in ('GET', 'HEAD'):
+                raise HTTPError(405, f"Method not allowed: {method}")
+            url = urlsplit(target)
+            if url.path == '/stats':
+                body = json.dumps(self.cache.stats()).encode('utf-8')
+                await self._send(writer, 200, {'Content-Type': 'application/json'},
+                                 body if method == 'GET' else b'', len(body), keep_alive)
+                return keep_alive
+
+            path = url.path.strip('/').split('/')
+            if len(path) != 3 or path[0] != 'stream':
+                raise HTTPError(404, f"Not found: {url.path}")
+            _, protocol, seed_hex = path
+            if protocol not in PROTOCOLS:
+                raise HTTPError(404, f"Unknown protocol: {protocol}")
+            seed_hex = seed_hex.lower()
+            try:
+                self.cache.checkpoints(protocol, seed_hex)
+            except ValueError as e:
+                raise HTTPError(400, f"Invalid seed: {e}") from None
+
+            query = parse_qs(url.query)
+            offset = _query_int(query, 'offset') or 0
+            length = _query_int(query, 'length')
+
+            range_header = headers.get('range')
+            if range_header is not None:
+                start, end = parse_range(range_header, length, self.max_length)
+                status = 206
+            elif length is None:
+                raise HTTPError(400, "length query parameter or Range header required")
+            else:
+                start, end = 0, length
+                status = 200
+            if end - start > self.max_length:
+                raise HTTPError(416 if status == 206 else 400,
+                                f"Responses are limited to {self.max_length} bytes")
+            if offset + end > self.max_offset:
+                raise HTTPError(416 if status == 206 else 400,
+                                f"Ranges must end within the first {self.max_offset} bytes")
+        except HTTPError as e:
+            await self._send_error(writer, e, keep_alive)
+            return keep_alive
+
+        response_headers = {
+            'Content-Type': 'application/octet-stream',
+            'Accept-Ranges': 'bytes',
+            'Cache-Control': 'public, max-age=31536000, immutable',
+        }
+        if status == 206:
+            total = '*' if length is None else str(length)
+            response_headers['Content-Range'] = f"bytes {start}-{end - 1}/{total}"
+
+        size = end - start
+        if method == 'HEAD':
+            await self._send(writer, status, response_headers, b'', size, keep_alive)
+            return keep_alive
+
+        chunked = chunked_ok and size > self.cache.block_size
+        if chunked:
+            response_headers['Transfer-Encoding'] = 'chunked'
+        else:
+            response_headers['Content-Length'] = str(size)
+        response_headers['Connection'] = 'keep-alive' if keep_alive else 'close'
+        writer.write(self._format_head(status, response_headers))
+
+        try:
+            async for piece in self._iter_range(protocol, seed_hex, offset + start, size):
+                if chunked:
+                    writer.write(f"{len(piece):x}\r\n".encode('ascii') + piece + b'\r\n')
+                else:
+                    writer.write(piece)
+                await writer.drain()
+        except Exception:
+            # Headers are out; the only way to signal failure is to drop the connection
+            return False
+        if chunked:
+            writer.write(b'0\r\n\r\n')
+        await writer.drain()
+        return keep_alive
+
+    async def _iter_range(self, protocol: str, seed_hex: str, offset: int, size: int):
+        """Yield the bytes [offset, offset + size) of a stream, block by block."""
+        if size <= 0:
+            return
+        block_size = self.cache.block_size
+        end = offset + size
+        for block in range(offset // block_size, (end - 1) // block_size + 1):
+            data = await self.cache.get_block(protocol, seed_hex, block)
+            block_start = block * block_size
+            piece = data[max(offset, block_start) - block_start:min(end, block_start + block_size) - block_start]
+            yield piece
+
+    @staticmethod
+    def _format_head(status: int, headers: Dict[str, str]) -> bytes:
+        lines = [f"HTTP/1.1 {status} {REASONS[status]}"]
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+
+    async def _send(self, writer: asyncio.StreamWriter, status: int, headers: Dict[str, str],
+                    body: bytes, content_length: int, keep_alive: bool) -> None:
+        headers = dict(headers)
+        headers['Content-Length'] = str(content_length)
+        headers['Connection'] = 'keep-alive' if keep_alive else 'close'
+        writer.write(self._format_head(status, headers) + body)
+        await writer.drain()
+
+    async def _send_error(self, writer: asyncio.StreamWriter, error: HTTPError,
+                          keep_alive: bool) -> None:
+        body = (str(error) + '\n').encode('utf-8')
+        await self._send(writer, error.status, {'Content-Type': 'text/plain; charset=utf-8'},
+                         body, len(body), keep_alive)
+
+
+def run_server(**kwargs) -> None:
+    """
+    Run a StreamServer until interrupted.
+
+    Args:
+        **kwargs: StreamServer arguments
+    """
+    async def serve():
+        server = StreamServer(**kwargs)
+        await server.start()
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,413 @@
+"""
+Out-of-Core Tiled World Generation
+
+Maps too large for one in-memory array (64k × 64k and up) are cut into
+fixed-size tiles, rendered in parallel worker processes and written
+straight into an on-disk store:
+
+- layout='npy': one memory-mapped .npy array holding the whole map, with
+  a per-tile completion bitmap next to it (<path>.done)
+- layout='tiles': a directory with one .npy file per tile, written
+  atomically, so a tile is complete exactly when its file exists
+
+Every tile is a pure function of (world seed, tile coordinates): heights
+come from CoherentNoise evaluated at world coordinates, with noise tables
+derived from a ProceduralWorld key. Tiles rendered by different workers,
+on different machines or in different runs therefore meet without seams.
+The tables are sized to the map, so the lattice hash never repeats inside
+it.
+
+Resume:
+- A manifest (<path>.json, or manifest.json in the tile directory) records
+  the world parameters; generate() skips tiles already marked complete
+  and refuses to mix tiles from different parameters
+- Tile data is flushed before its completion mark is written, so an
+  interrupted run loses at most the tiles in flight
+
+Generating or loading a TiledWorld needs the numpy extra.
+
+⚠️ NOT FOR CRYPTOGRAPHY: This is for procedural generation only.
+
+Example Usage:
+    >>> from gq.tiles import TiledWorld
+    >>> world = TiledWorld(4096, 4096, tile_size=1024, seed=7)
+    >>> world.generate('world.npy', workers=8)  # doctest: +SKIP
+    {'tiles': 16, 'rendered': 16, 'skipped': 0, 'seconds': ...}
+    >>> heights = np.load('world.npy', mmap_mode='r')  # doctest: +SKIP
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ._optional import np, require_numpy
+from .noise import KINDS, CoherentNoise, DEFAULT_TABLE_SIZE, grid
+from .procedural import ProceduralWorld
+
+
+# Manifest format version, bumped when tile contents change
+FORMAT_VERSION = 2
+
+LAYOUTS = ('npy', 'tiles')
+
+# Output dtypes; unsigned integers quantize the noise range to full scale
+DTYPES = ('float32', 'float64', 'uint8', 'uint16')
+
+DEFAULT_TILE_SIZE = 1024
+
+# Bytes of derived table material per ProceduralWorld.derive() call
+_DERIVE_BLOCK = 64
+
+
+class TiledWorld:
+    """
+    Heightmap world rendered tile by tile into an on-disk store.
+
+    Instances are picklable and small (parameters plus the noise tables),
+    so tiles can be rendered in any process.
+    """
+
+    def __init__(self, width: int, height: int, tile_size: int = DEFAULT_TILE_SIZE,
+                 seed: int = 0, stream: Optional[Iterable[bytes]] = None,
+                 scale: float = 1 / 256, octaves: int = 6, lacunarity: float = 2.0,
+                 gain: float = 0.5, kind: str = 'gradient', ridged: bool = False,
+                 dtype: str = 'float32'):
+        """
+        Initialize the world.
+
+        Args:
+            width: Map width in pixels
+            height: Map height in pixels
+            tile_size: Tile edge in pixels (edge tiles may be smaller)
+            seed: World seed (signed 64-bit)
+            stream: GoldenSeed stream the world key is drawn from (default:
+                GCP-1 golden seed stream)
+            scale: Noise lattice units per pixel (1 / feature size)
+            octaves: Noise octaves
+            lacunarity: Frequency multiplier between octaves
+            gain: Amplitude multiplier between octaves
+            kind: Basis noise: 'value', 'gradient' or 'simplex'
+            ridged: Use ridged multifractal instead of fBm
+            dtype: Output dtype: 'float32', 'float64', 'uint8' or 'uint16'
+
+        Raises:
+            ImportError: If numpy is not installed
+            ValueError: If a parameter is invalid
+        """
+        require_numpy('tiled worlds')
+        if width < 1 or height < 1:
+            raise ValueError(f"Map size must be positive, got {width}x{height}")
+        if tile_size < 1:
+            raise ValueError(f"Tile size must be positive, got {tile_size}")
+        if kind not in KINDS:
+            raise ValueError(f"Unknown noise kind {kind!r}, expected one of {', '.join(KINDS)}")
+        if octaves < 1:
+            raise ValueError(f"Octaves must be at least 1, got {octaves}")
+        if dtype not in DTYPES:
+            raise ValueError(f"Unsupported dtype {dtype!r}, expected one of {', '.join(DTYPES)}")
+
+        self.width = width
+        self.height = height
+        self.tile_size = tile_size
+        self.seed = seed
+        self.scale = scale
+        self.octaves = octaves
+        self.lacunarity = lacunarity
+        self.gain = gain
+        self.kind = kind
+        self.ridged = ridged
+        self.dtype = dtype
+
+        # The lattice hash repeats every table_size cells; size the tables to
+        # cover the whole map so no region of it is a copy of another
+        cells = math.ceil(max(width, height) * scale)
+        self.table_size = max(DEFAULT_TABLE_SIZE, 1 << max(cells - 1, 0).bit_length())
+
+        # Noise tables are derived from the world key, so they depend only on
+        # (stream, seed) and are identical in every worker
+        world = ProceduralWorld(seed, stream, cache_size=0)
+        self.key = world.key
+        blocks = -(-12 * self.table_size // _DERIVE_BLOCK)
+        tables = b''.join(world.derive('tiles.noise', i, size=_DERIVE_BLOCK)
+                          for i in range(blocks))
+        self._noise = CoherentNoise([tables], table_size=self.table_size)
+
+    @property
+    def tiles_x(self) -> int:
+        """Number of tile columns."""
+        return -(-self.width // self.tile_size)
+
+    @property
+    def tiles_y(self) -> int:
+        """Number of tile rows."""
+        return -(-self.height // self.tile_size)
+
+    def tiles(self) -> List[Tuple[int, int]]:
+        """Return every (tile_x, tile_y), row by row."""
+        return [(tx, ty) for ty in range(self.tiles_y) for tx in range(self.tiles_x)]
+
+    def tile_bounds(self, tile_x: int, tile_y: int) -> Tuple[int, int, int, int]:
+        """
+        Return the pixel rectangle of a tile.
+
+        Args:
+            tile_x: Tile column
+            tile_y: Tile row
+
+        Returns:
+            (x0, y0, width, height) in map pixels
+
+        Raises:
+            ValueError: If the tile is outside the map
+        """
+        if not (0 <= tile_x < self.tiles_x and 0 <= tile_y < self.tiles_y):
+            raise ValueError(f"Tile ({tile_x}, {tile_y}) is outside the "
+                             f"{self.tiles_x}x{self.tiles_y} tile map")
+        x0 = tile_x * self.tile_size
+        y0 = tile_y * self.tile_size
+        return (x0, y0, min(self.tile_size, self.width - x0),
+                min(self.tile_size, self.height - y0))
+
+    def render_tile(self, tile_x: int, tile_y: int) -> np.ndarray:
+        """
+        Render one tile in this process.
+
+        Args:
+            tile_x: Tile column
+            tile_y: Tile row
+
+        Returns:
+            (height, width) array of the output dtype
+        """
+        x0, y0, width, height = self.tile_bounds(tile_x, tile_y)
+        x, y = grid(width, height, x0=x0, y0=y0, scale=self.scale)
+        fractal = self._noise.ridged if self.ridged else self._noise.fbm
+        values = fractal(x, y, octaves=self.octaves, lacunarity=self.lacunarity,
+                         gain=self.gain, kind=self.kind)
+
+        dtype = np.dtype(self.dtype)
+        if dtype.kind == 'f':
+            return values.astype(dtype)
+        # fBm spans [-1, 1] and ridged [0, 1]; map either onto [0, max]
+        if not self.ridged:
+            values = (values + 1.0) * 0.5
+        top = np.iinfo(dtype).max
+        return np.clip(np.rint(values * top), 0, top).astype(dtype)
+
+    def manifest(self, layout: str) -> Dict[str, Any]:
+        """Return the parameters recorded with a store."""
+        return {
+            'format': FORMAT_VERSION,
+            'layout': layout,
+            'width': self.width,
+            'height': self.height,
+            'tile_size': self.tile_size,
+            'world_key': self.key.hex(),
+            'scale': self.scale,
+            'table_size': self.table_size,
+            'octaves': self.octaves,
+            'lacunarity': self.lacunarity,
+            'gain': self.gain,
+            'kind': self.kind,
+            'ridged': self.ridged,
+            'dtype': self.dtype,
+        }
+
+    def generate(self, path: str, layout: str = 'npy', workers: Optional[int] = None,
+                 resume: bool = True,
+                 progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
+        """
+        Render every missing tile into a store on disk.
+
+        Args:
+            path: .npy file (layout='npy') or directory (layout='tiles')
+            layout: 'npy' or 'tiles'
+            workers: Worker processes (default: os.cpu_count(); 1 renders
+                in this process)
+            resume: Keep tiles already completed in an existing store;
+                False starts over
+            progress: Called with (completed, total) after each tile
+
+        Returns:
+            Dictionary with tiles, rendered, skipped and seconds
+
+        Raises:
+            ValueError: If layout is unknown, or an existing store was
+                generated with different parameters
+        """
+        if layout not in LAYOUTS:
+            raise ValueError(f"Unknown layout {layout!r}, expected one of {', '.join(LAYOUTS)}")
+        start = time.perf_counter()
+        store = _open_store(self, path, layout, resume)
+        pending = [tile for tile in self.tiles() if not store.is_done(*tile)]
+        total = self.tiles_x * self.tiles_y
+        completed = total - len(pending)
+
+        def finished(tile):
+            nonlocal completed
+            store.mark_done(*tile)
+            completed += 1
+            if progress is not None:
+                progress(completed, total)
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers <= 1 or len(pending) <= 1:
+            for tile in pending:
+                finished(_write_tile(self, path, layout, *tile))
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(pending))) as executor:
+                futures = [executor.submit(_write_tile, self, path, layout, *tile)
+                           for tile in pending]
+                try:
+                    for future in as_completed(futures):
+                        finished(future.result())
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
+
+        store.close()
+        return {
+            'tiles': total,
+            'rendered': len(pending),
+            'skipped': total - len(pending),
+            'seconds': time.perf_counter() - start,
+        }
+
+
+def tile_path(directory: str, tile_x: int, tile_y: int) -> str:
+    """Return the file of one tile in a layout='tiles' store."""
+    return os.path.join(directory, f'tile_{tile_y}_{tile_x}.npy')
+
+
+def _write_tile(world: TiledWorld, path: str, layout: str,
+                tile_x: int, tile_y: int) -> Tuple[int, int]:
+    """Render a tile and write it durably into the store (worker side)."""
+    tile = world.render_tile(tile_x, tile_y)
+    if layout == 'tiles':
+        final = tile_path(path, tile_x, tile_y)
+        temporary = f'{final}.{os.getpid()}.tmp'
+        with open(temporary, 'wb') as f:
+            np.save(f, tile)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, final)
+    else:
+        x0, y0, width, height = world.tile_bounds(tile_x, tile_y)
+        heights = np.load(path, mmap_mode='r+')
+        heights[y0:y0 + height, x0:x0 + width] = tile
+        heights.flush()
+        del heights
+    return tile_x, tile_y
+
+
+class _NpyStore:
+    """Single memory-mapped .npy array plus a completion bitmap."""
+
+    def __init__(self, world: TiledWorld, path: str, resume: bool):
+        self.world = world
+        manifest_path = path + '.json'
+        done_path = path + '.done'
+        manifest = world.manifest('npy')
+        count = world.tiles_x * world.tiles_y
+
+        if resume and os.path.exists(path):
+            _check_manifest(manifest_path, manifest, path)
+            if not os.path.isfile(done_path):
+                raise ValueError(f"{path} has no completion file {done_path}; pass "
+                                 f"resume=False to start over")
+            if os.path.getsize(done_path) != count:
+                raise ValueError(f"Completion file {done_path} does not match the tile map")
+        else:
+            # Creates a sparse file; untouched tiles cost no disk blocks
+            heights = np.lib.format.open_memmap(
+                path, mode='w+', dtype=world.dtype, shape=(world.height, world.width)
+            )
+            del heights
+            with open(done_path, 'wb') as f:
+                f.write(bytes(count))
+            _write_manifest(manifest_path, manifest)
+
+        self._done = open(done_path, 'r+b')
+        self._flags = bytearray(self._done.read())
+
+    def _index(self, tile_x: int, tile_y: int) -> int:
+        return tile_y * self.world.tiles_x + tile_x
+
+    def is_done(self, tile_x: int, tile_y: int) -> bool:
+        return bool(self._flags[self._index(tile_x, tile_y)])
+
+    def mark_done(self, tile_x: int, tile_y: int) -> None:
+        index = self._index(tile_x, tile_y)
+        self._flags[index] = 1
+        self._done.seek(index)
+        self._done.write(b'\x01')
+        self._done.flush()
+
+    def close(self) -> None:
+        self._done.close()
+
+
+class _TileDirectoryStore:
+    """Directory of per-tile .npy files; a tile is done when its file exists."""
+
+    def __init__(self, world: TiledWorld, path: str, resume: bool):
+        self.path = path
+        manifest_path = os.path.join(path, 'manifest.json')
+        manifest = world.manifest('tiles')
+
+        if resume and os.path.exists(manifest_path):
+            _check_manifest(manifest_path, manifest, path)
+        else:
+            os.makedirs(path, exist_ok=True)
+            names = [name for name in os.listdir(path) if name.startswith('tile_')]
+            if resume and any(name.endswith('.npy') for name in names):
+                raise ValueError(f"{path} has tiles but no manifest; pass resume=False "
+                                 f"to start over")
+            # Leftover temporaries are never complete tiles; tiles go only on resume=False
+            for name in names:
+                if name.endswith(('.npy', '.tmp')):
+                    os.remove(os.path.join(path, name))
+            _write_manifest(manifest_path, manifest)
+
+    def is_done(self, tile_x: int, tile_y: int) -> bool:
+        return os.path.exists(tile_path(self.path, tile_x, tile_y))
+
+    def mark_done(self, tile_x: int, tile_y: int) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def _open_store(world: TiledWorld, path: str, layout: str, resume: bool):
+    if layout == 'tiles':
+        return _TileDirectoryStore(world, path, resume)
+    return _NpyStore(world, path, resume)
+
+
+def _write_manifest(path: str, manifest: Dict[str, Any]) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+        f.write('\n')
+
+
+def _check_manifest(path: str, manifest: Dict[str, Any], store: str) -> None:
+    """Raise ValueError unless a store was written with these parameters."""
+    try:
+        with open(path, encoding='utf-8') as f:
+            existing = json.load(f)
+    except (OSError, ValueError):
+        raise ValueError(f"{store} has no readable manifest; pass resume=False "
+                         f"to start over") from None
+    if existing != manifest:
+        changed = sorted(key for key in set(existing) | set(manifest)
+                         if existing.get(key) != manifest.get(key))
+        raise ValueError(f"{store} was generated with different parameters "
+                         f"({', '.join(changed)}); pass resume=False to start over")
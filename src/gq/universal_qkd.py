@@ -55,6 +55,8 @@ import sys
 import struct
 from typing import Iterator, List
 
+from . import instrumentation
+
 
 def _double_pack_hex(value: float) -> str:
     """Helper function to pack a float as hex and double it to 32 bytes."""
@@ -159,13 +161,24 @@ def collect_sifted_bits(state: bytes, counter: int) -> tuple[List[int], bytes, i
     """
     sifted_bits = []
 
+    # Timing is set up once per call, so the disabled path costs one check per hash
+    timer = instrumentation.perf_counter if instrumentation.enabled else None
+    start_counter = counter
+    hash_seconds = sift_seconds = 0.0
+
     while len(sifted_bits) < 256:
         # Concatenate state with counter as UTF-8 string
         counter_str = str(counter).encode('utf-8')
         data = state + counter_str
 
         # Generate entropy and progress state
+        if timer:
+            hash_start = timer()
         entropy = hashlib.sha256(data).digest()
+        if timer:
+            sift_start = timer()
+            hash_seconds += sift_start - hash_start
+            accepted_before = len(sifted_bits)
         state = entropy
         counter += 1
 
@@ -179,9 +192,37 @@ def collect_sifted_bits(state: bytes, counter: int) -> tuple[List[int], bytes, i
                 if len(sifted_bits) >= 256:
                     break
 
+        if timer:
+            sift_seconds += timer() - sift_start
+
+    if timer:
+        _record_sifting(counter - start_counter, entropy, 256 - accepted_before,
+                        hash_seconds, sift_seconds)
+
     return sifted_bits[:256], state, counter
 
 
+def _record_sifting(hash_calls: int, last_entropy: bytes, needed_from_last: int,
+                    hash_seconds: float, sift_seconds: float) -> None:
+    """Record counters and timers of one collect_sifted_bits() call."""
+    # Bytes of the last hash examined before the 256th bit was accepted
+    examined_last = 0
+    accepted_last = 0
+    for byte in last_entropy:
+        examined_last += 1
+        if basis_match(byte):
+            accepted_last += 1
+            if accepted_last >= needed_from_last:
+                break
+    examined = 32 * (hash_calls - 1) + examined_last
+
+    instrumentation.add('gcp1_hash_calls_total', hash_calls)
+    instrumentation.add('gcp1_bits_accepted_total', 256)
+    instrumentation.add('gcp1_bits_discarded_total', examined - 256)
+    instrumentation.record('gcp1.sha256', hash_seconds, hash_calls)
+    instrumentation.record('gcp1.sift', sift_seconds)
+
+
 def xor_fold_hardening(sifted_bits: List[int]) -> bytes:
     """
     Apply XOR folding to produce 128-bit output from 256 bits.
@@ -218,6 +259,36 @@ def xor_fold_hardening(sifted_bits: List[int]) -> bytes:
     return bytes(output_bytes)
 
 
+def generate_output(state: bytes, counter: int) -> tuple[bytes, bytes, int]:
+    """
+    Generate one 16-byte output from the current state.
+
+    Layer 3 (basis-matching sifting) followed by Layer 4 (XOR folding), with
+    the gcp1.* stages and counters recorded when instrumentation is on. The
+    generator and the stream server both step through here.
+
+    Args:
+        state: Current system state (32 bytes)
+        counter: Current counter value
+
+    Returns:
+        Tuple of (output, next_state, next_counter)
+    """
+    # Layer 3: Stream Generation with Basis Matching
+    sifted_bits, state, counter = collect_sifted_bits(state, counter)
+
+    # Layer 4: Output via XOR Folding
+    if instrumentation.enabled:
+        fold_start = instrumentation.perf_counter()
+        output = xor_fold_hardening(sifted_bits)
+        instrumentation.record('gcp1.fold', instrumentation.perf_counter() - fold_start)
+        instrumentation.add('gcp1_outputs_total')
+    else:
+        output = xor_fold_hardening(sifted_bits)
+
+    return output, state, counter
+
+
 def universal_qkd_generator(seed_hex: str = HEX_SEED) -> Iterator[bytes]:
     """
     Universal deterministic stream generator - infinite stream of 128-bit outputs.
@@ -264,12 +335,7 @@ def universal_qkd_generator(seed_hex: str = HEX_SEED) -> Iterator[bytes]:
 
     # Infinite stream
     while True:
-        # Layer 3: Stream Generation with Basis Matching
-        sifted_bits, state, counter = collect_sifted_bits(state, counter)
-
-        # Layer 4: Output via XOR Folding
-        output = xor_fold_hardening(sifted_bits)
-
+        output, state, counter = generate_output(state, counter)
         yield output
 
 
@@ -287,6 +353,16 @@ def generate_keys(num_keys: int, seed_hex: str = HEX_SEED) -> List[str]:
     generator = universal_qkd_generator(seed_hex)
     outputs = []
 
+    if instrumentation.enabled:
+        hex_seconds = 0.0
+        for _ in range(num_keys):
+            output = next(generator)
+            hex_start = instrumentation.perf_counter()
+            outputs.append(output.hex())
+            hex_seconds += instrumentation.perf_counter() - hex_start
+        instrumentation.record('gcp1.hex', hex_seconds, num_keys)
+        return outputs
+
     for _ in range(num_keys):
         output = next(generator)
         outputs.append(output.hex())
@@ -7,20 +7,44 @@ data into binary files generated by this repository. The watermark embeds
 traceable data into reserved byte sections without affecting deterministic
 properties.
 
+Trailer Versions:
+- v1 signs the trailer fields only
+- v2 also stores and signs the SHA-256 of the payload (the data before the
+  trailer), so a trailer cannot be moved onto different content and one
+  streaming pass verifies both licence and integrity
+- New embeds write v2; v1 trailers remain readable
+
 Compliance: Strictly adheres to COMMERCIAL_LICENSE.md requirements for
 authorized commercial data distribution.
 
 ⚠️ NOT FOR CRYPTOGRAPHIC USE: This is for licensing and traceability only.
 """
 
+import csv
 import hashlib
 import hmac
 import json
+import mmap
+import os
+import stat
 import struct
+import sys
 import time
-from typing import Dict, Optional, Tuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 from datetime import datetime
 
+PathLike = Union[str, "os.PathLike[str]"]
+
+# Linux ioctl that shares the source's extents with the destination (reflink)
+_FICLONE = 0x40049409
+
+# Chunk size for the read/write copy fallback
+COPY_CHUNK_SIZE = 1 << 20
+
 
 class WatermarkError(Exception):
     """Base exception for watermark operations."""
@@ -40,18 +64,21 @@ class WatermarkData:
     
     # Magic bytes to identify watermarked binaries
     MAGIC = b'SEED'
-    VERSION = 1
+    VERSION = 2  # Written by embedders; v1 trailers are still read
     
     # Field size limits (in bytes)
     LICENSE_ID_SIZE = 64
     USER_INFO_SIZE = 128
     TIMESTAMP_SIZE = 8
+    PAYLOAD_DIGEST_SIZE = 32  # v2 only: SHA-256 of the payload
     SIGNATURE_SIZE = 32
     
-    # Total watermark size
+    # Total watermark size (v1), v2 size, and the largest trailer
     HEADER_SIZE = len(MAGIC) + 1  # Magic + version byte
     WATERMARK_SIZE = (HEADER_SIZE + LICENSE_ID_SIZE + 
                      USER_INFO_SIZE + TIMESTAMP_SIZE + SIGNATURE_SIZE)
+    WATERMARK_SIZE_V2 = WATERMARK_SIZE + PAYLOAD_DIGEST_SIZE
+    MAX_WATERMARK_SIZE = WATERMARK_SIZE_V2
     
     def __init__(self, license_id: str, user_info: str, 
                  timestamp: Optional[float] = None):
@@ -79,6 +106,26 @@ class WatermarkData:
         self.user_info = user_info
         self.timestamp = timestamp if timestamp is not None else time.time()
         self.signature = b''
+        self.payload_digest = b''  # Set for v2 trailers
+    
+    @property
+    def version(self) -> int:
+        """Trailer version: 2 if a payload digest is attached, else 1."""
+        return 2 if self.payload_digest else 1
+    
+    @classmethod
+    def trailer_size(cls, version: int) -> int:
+        """
+        Size in bytes of a trailer of the given version.
+        
+        Raises:
+            WatermarkError: If the version is not supported
+        """
+        if version == 1:
+            return cls.WATERMARK_SIZE
+        if version == 2:
+            return cls.WATERMARK_SIZE_V2
+        raise WatermarkError(f"Unsupported version: {version}")
     
     def to_dict(self) -> Dict:
         """Convert watermark data to dictionary."""
@@ -112,21 +159,25 @@ def _calculate_signature(data: bytes, secret: str) -> bytes:
     return hmac.new(key, data, hashlib.sha256).digest()
 
 
-def encode_watermark(watermark: WatermarkData, secret: str) -> bytes:
+def encode_watermark(watermark: WatermarkData, secret: str,
+                     payload_digest: Optional[bytes] = None) -> bytes:
     """
     Encode watermark data into binary format with cryptographic signature.
     
     The binary format:
         - 4 bytes: Magic bytes ('SEED')
-        - 1 byte: Version
+        - 1 byte: Version (1, or 2 with a payload digest)
         - 64 bytes: License ID (null-padded)
         - 128 bytes: User info (null-padded)
         - 8 bytes: Timestamp (double, big-endian)
-        - 32 bytes: HMAC-SHA256 signature
+        - 32 bytes: SHA-256 of the payload (v2 only)
+        - 32 bytes: HMAC-SHA256 signature over all preceding bytes
     
     Args:
         watermark: Watermark data to encode
         secret: Secret key for signature generation
+        payload_digest: SHA-256 of the data the trailer is appended to;
+            produces a v2 trailer (default: v1 trailer)
         
     Returns:
         Binary watermark data
@@ -134,13 +185,19 @@ def encode_watermark(watermark: WatermarkData, secret: str) -> bytes:
     Raises:
         WatermarkError: If encoding fails
     """
+    if (payload_digest is not None
+            and len(payload_digest) != WatermarkData.PAYLOAD_DIGEST_SIZE):
+        raise WatermarkError(
+            f"Payload digest must be {WatermarkData.PAYLOAD_DIGEST_SIZE} bytes"
+        )
+    
     try:
         # Create payload without signature
         payload = bytearray()
         
         # Magic and version
         payload.extend(WatermarkData.MAGIC)
-        payload.append(WatermarkData.VERSION)
+        payload.append(1 if payload_digest is None else 2)
         
         # License ID (null-padded)
         license_bytes = watermark.license_id.encode('utf-8')
@@ -155,6 +212,10 @@ def encode_watermark(watermark: WatermarkData, secret: str) -> bytes:
         # Timestamp (double, big-endian)
         payload.extend(struct.pack('>d', watermark.timestamp))
         
+        # Payload digest (v2)
+        if payload_digest is not None:
+            payload.extend(payload_digest)
+        
         # Calculate and append signature
         signature = _calculate_signature(bytes(payload), secret)
         payload.extend(signature)
@@ -165,75 +226,245 @@ def encode_watermark(watermark: WatermarkData, secret: str) -> bytes:
         raise WatermarkError(f"Failed to encode watermark: {e}")
 
 
-def decode_watermark(data: bytes, secret: str) -> WatermarkData:
+def _parse_watermark(data: bytes) -> Tuple[WatermarkData, bytes, bytes]:
     """
-    Decode and verify watermark data from binary format.
+    Parse watermark fields without verifying the signature.
     
     Args:
         data: Binary watermark data
-        secret: Secret key for signature verification
         
     Returns:
-        Decoded watermark data
+        Tuple of (watermark_data, signed_bytes, stored_signature)
         
     Raises:
-        WatermarkError: If decoding or verification fails
+        WatermarkError: If the data is malformed
     """
-    if len(data) < WatermarkData.WATERMARK_SIZE:
+    if len(data) < WatermarkData.HEADER_SIZE:
         raise WatermarkError(
             f"Invalid watermark size: {len(data)} bytes "
             f"(expected {WatermarkData.WATERMARK_SIZE})"
         )
     
     # Check magic bytes
-    magic = data[:4]
+    magic = bytes(data[:4])
     if magic != WatermarkData.MAGIC:
         raise WatermarkError(f"Invalid magic bytes: {magic}")
     
-    # Check version
+    # Check version and size
     version = data[4]
-    if version != WatermarkData.VERSION:
-        raise WatermarkError(f"Unsupported version: {version}")
+    expected_size = WatermarkData.trailer_size(version)
+    if len(data) < expected_size:
+        raise WatermarkError(
+            f"Invalid watermark size: {len(data)} bytes "
+            f"(expected {expected_size})"
+        )
     
     offset = WatermarkData.HEADER_SIZE
     
     # Extract license ID
     license_end = offset + WatermarkData.LICENSE_ID_SIZE
     license_bytes = data[offset:license_end].rstrip(b'\x00')
-    license_id = license_bytes.decode('utf-8')
     offset = license_end
     
     # Extract user info
     user_end = offset + WatermarkData.USER_INFO_SIZE
     user_bytes = data[offset:user_end].rstrip(b'\x00')
-    user_info = user_bytes.decode('utf-8')
     offset = user_end
     
+    try:
+        license_id = license_bytes.decode('utf-8')
+        user_info = user_bytes.decode('utf-8')
+    except UnicodeDecodeError as e:
+        raise WatermarkError(f"Invalid watermark text field: {e}")
+    
     # Extract timestamp
     timestamp_end = offset + WatermarkData.TIMESTAMP_SIZE
     timestamp = struct.unpack('>d', data[offset:timestamp_end])[0]
     offset = timestamp_end
     
+    # Extract payload digest (v2)
+    payload_digest = b''
+    if version == 2:
+        digest_end = offset + WatermarkData.PAYLOAD_DIGEST_SIZE
+        payload_digest = bytes(data[offset:digest_end])
+        offset = digest_end
+    
     # Extract signature
     signature_end = offset + WatermarkData.SIGNATURE_SIZE
-    stored_signature = data[offset:signature_end]
+    stored_signature = bytes(data[offset:signature_end])
+    
+    watermark = WatermarkData(license_id, user_info, timestamp)
+    watermark.payload_digest = payload_digest
+    return watermark, bytes(data[:offset]), stored_signature
+
+
+def decode_watermark(data: bytes, secret: str) -> WatermarkData:
+    """
+    Decode and verify watermark data from binary format.
+    
+    Args:
+        data: Binary watermark data
+        secret: Secret key for signature verification
+        
+    Returns:
+        Decoded watermark data
+        
+    Raises:
+        WatermarkError: If decoding or verification fails
+    """
+    watermark, payload, stored_signature = _parse_watermark(data)
     
     # Verify signature
-    payload = data[:offset]
     expected_signature = _calculate_signature(payload, secret)
     
     if not hmac.compare_digest(stored_signature, expected_signature):
         raise WatermarkError("Signature verification failed")
     
-    # Create watermark object
-    watermark = WatermarkData(license_id, user_info, timestamp)
     watermark.signature = stored_signature
     
     return watermark
 
 
+class WatermarkKeyring:
+    """
+    Set of secrets for verifying watermarks across key rotations.
+    
+    An HMAC object is keyed once per secret; each verification copies it
+    instead of re-deriving the key, so checking many trailers costs one
+    hash of the trailer fields per secret tried.
+    """
+    
+    def __init__(self, secrets: Union[str, Sequence[str]]):
+        """
+        Initialize the keyring.
+        
+        Args:
+            secrets: Secret or secrets, tried in order (newest first is best)
+            
+        Raises:
+            WatermarkError: If no secrets are given
+        """
+        if isinstance(secrets, str):
+            secrets = [secrets]
+        if not secrets:
+            raise WatermarkError("Keyring requires at least one secret")
+        
+        # Kept so the keyring can be rebuilt in worker processes (HMAC
+        # objects do not pickle)
+        self.secrets: Tuple[str, ...] = tuple(secrets)
+        self._macs = [
+            hmac.new(secret.encode('utf-8'), digestmod=hashlib.sha256)
+            for secret in secrets
+        ]
+    
+    def __len__(self) -> int:
+        return len(self._macs)
+    
+    def verify(self, data: bytes) -> Tuple[WatermarkData, int]:
+        """
+        Decode a watermark and verify it against every secret.
+        
+        Args:
+            data: Binary watermark data
+            
+        Returns:
+            Tuple of (watermark_data, index of the matching secret)
+            
+        Raises:
+            WatermarkError: If decoding fails or no secret matches
+        """
+        watermark, payload, stored_signature = _parse_watermark(data)
+        
+        for key_index, base_mac in enumerate(self._macs):
+            mac = base_mac.copy()
+            mac.update(payload)
+            if hmac.compare_digest(stored_signature, mac.digest()):
+                watermark.signature = stored_signature
+                return watermark, key_index
+        
+        raise WatermarkError("Signature verification failed")
+
+
+def _find_trailer(tail) -> Optional[int]:
+    """
+    Locate the trailer within the last bytes of some data.
+    
+    A v2 trailer is recognised by magic and version at its fixed offset;
+    otherwise the v1 position is checked for the magic bytes.
+    
+    Returns:
+        Offset of the trailer within tail, or None if no magic is found
+    """
+    v2_offset = len(tail) - WatermarkData.WATERMARK_SIZE_V2
+    if (v2_offset >= 0 and tail[v2_offset:v2_offset + WatermarkData.HEADER_SIZE]
+            == WatermarkData.MAGIC + b'\x02'):
+        return v2_offset
+    v1_offset = len(tail) - WatermarkData.WATERMARK_SIZE
+    if (v1_offset >= 0 and tail[v1_offset:v1_offset + len(WatermarkData.MAGIC)]
+            == WatermarkData.MAGIC):
+        return v1_offset
+    return None
+
+
+def _sha256_file(path: PathLike, size: int) -> bytes:
+    """SHA-256 of the first size bytes of a file, read in chunks."""
+    digest = hashlib.sha256()
+    buffer = bytearray(COPY_CHUNK_SIZE)
+    view = memoryview(buffer)
+    remaining = size
+    with open(path, 'rb', buffering=0) as f:
+        while remaining > 0:
+            n = f.readinto(view[:min(remaining, COPY_CHUNK_SIZE)])
+            if not n:
+                raise OSError(f"File shorter than {size} bytes")
+            digest.update(view[:n])
+            remaining -= n
+    return digest.digest()
+
+
+@lru_cache(maxsize=128)
+def _cached_sha256_file(path: str, size: int, identity: Tuple[int, ...]) -> bytes:
+    """_sha256_file() memoized on the file's identity (device, inode, mtime)."""
+    return _sha256_file(path, size)
+
+
+def file_payload_digest(path: PathLike, size: Optional[int] = None) -> bytes:
+    """
+    Compute the SHA-256 of a file's first size bytes in one streaming pass.
+    
+    Results are cached by path, size, device, inode and modification time,
+    so issuing many copies of one base file hashes it only once.
+    
+    Args:
+        path: File to hash
+        size: Number of leading bytes to hash (default: whole file)
+        
+    Returns:
+        32-byte SHA-256 digest
+        
+    Raises:
+        WatermarkError: If the file cannot be read
+    """
+    try:
+        st = os.stat(path)
+        if size is None:
+            size = st.st_size
+        identity = (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+        return _cached_sha256_file(os.path.abspath(path), size, identity)
+    except OSError as e:
+        raise WatermarkError(f"Failed to hash payload: {e}")
+
+
+def _check_payload_digest(watermark: WatermarkData, digest: bytes) -> None:
+    """Raise WatermarkError if a v2 watermark does not match the payload."""
+    if watermark.payload_digest and not hmac.compare_digest(
+        watermark.payload_digest, digest
+    ):
+        raise WatermarkError("Payload digest mismatch: watermark does not belong to this data")
+
+
 def embed_watermark_in_binary(binary_data: bytes, watermark: WatermarkData, 
-                               secret: str) -> bytes:
+                               secret: str, version: int = WatermarkData.VERSION) -> bytes:
     """
     Embed a watermark into binary data without affecting deterministic properties.
     
@@ -244,6 +475,7 @@ def embed_watermark_in_binary(binary_data: bytes, watermark: WatermarkData,
         binary_data: Original binary data
         watermark: Watermark data to embed
         secret: Secret key for signature
+        version: Trailer version (2 commits to the SHA-256 of binary_data)
         
     Returns:
         Binary data with embedded watermark
@@ -251,8 +483,10 @@ def embed_watermark_in_binary(binary_data: bytes, watermark: WatermarkData,
     Raises:
         WatermarkError: If embedding fails
     """
+    WatermarkData.trailer_size(version)
     try:
-        encoded_watermark = encode_watermark(watermark, secret)
+        digest = hashlib.sha256(binary_data).digest() if version == 2 else None
+        encoded_watermark = encode_watermark(watermark, secret, digest)
         return binary_data + encoded_watermark
     except Exception as e:
         raise WatermarkError(f"Failed to embed watermark: {e}")
@@ -263,6 +497,9 @@ def extract_watermark_from_binary(binary_data: bytes,
     """
     Extract and verify watermark from binary data.
     
+    For v2 trailers the original data is also checked against the signed
+    payload digest.
+    
     Args:
         binary_data: Binary data with embedded watermark
         secret: Secret key for verification
@@ -277,12 +514,19 @@ def extract_watermark_from_binary(binary_data: bytes,
         raise WatermarkError("Binary data too small to contain watermark")
     
     # Extract watermark from end of data
-    watermark_offset = len(binary_data) - WatermarkData.WATERMARK_SIZE
+    tail_offset = max(len(binary_data) - WatermarkData.MAX_WATERMARK_SIZE, 0)
+    found = _find_trailer(binary_data[tail_offset:])
+    if found is None:
+        watermark_offset = len(binary_data) - WatermarkData.WATERMARK_SIZE
+    else:
+        watermark_offset = tail_offset + found
     original_data = binary_data[:watermark_offset]
     watermark_bytes = binary_data[watermark_offset:]
     
     # Decode and verify watermark
     watermark = decode_watermark(watermark_bytes, secret)
+    if watermark.payload_digest:
+        _check_payload_digest(watermark, hashlib.sha256(original_data).digest())
     
     return original_data, watermark
 
@@ -297,10 +541,614 @@ def check_watermark_present(binary_data: bytes) -> bool:
     Returns:
         True if watermark magic bytes are present
     """
-    if len(binary_data) < WatermarkData.WATERMARK_SIZE:
+    tail = binary_data[-WatermarkData.MAX_WATERMARK_SIZE:]
+    return _find_trailer(tail) is not None
+
+
+def embed_watermark_in_file(path: PathLike, watermark: WatermarkData,
+                            secret: str, version: int = WatermarkData.VERSION) -> int:
+    """
+    Append a watermark trailer to a file in place.
+    
+    Only the trailer is written; the existing file contents are never
+    copied. A v2 trailer hashes them in one streaming pass first.
+    
+    Args:
+        path: File to watermark
+        watermark: Watermark data to embed
+        secret: Secret key for signature
+        version: Trailer version (2 commits to the SHA-256 of the contents)
+        
+    Returns:
+        Size of the original (unwatermarked) data in bytes
+        
+    Raises:
+        WatermarkError: If embedding fails
+    """
+    WatermarkData.trailer_size(version)
+    try:
+        with open(path, 'ab') as f:
+            original_size = f.seek(0, os.SEEK_END)
+            digest = _sha256_file(path, original_size) if version == 2 else None
+            f.write(encode_watermark(watermark, secret, digest))
+        return original_size
+    except OSError as e:
+        raise WatermarkError(f"Failed to embed watermark: {e}")
+
+
+def _read_trailer(f) -> Tuple[int, int, bytes]:
+    """
+    Read the trailer of an open binary file with a single tail read.
+    
+    Returns:
+        Tuple of (file_size, original_data_size, trailer_bytes); if no magic
+        is found the trailer is the last WATERMARK_SIZE bytes (or the whole
+        file if it is smaller)
+    """
+    file_size = f.seek(0, os.SEEK_END)
+    tail_size = min(file_size, WatermarkData.MAX_WATERMARK_SIZE)
+    f.seek(file_size - tail_size)
+    tail = f.read(tail_size)
+    offset = _find_trailer(tail)
+    if offset is None:
+        offset = max(len(tail) - WatermarkData.WATERMARK_SIZE, 0)
+    return file_size, file_size - tail_size + offset, tail[offset:]
+
+
+def read_watermark_trailer(path: PathLike) -> Tuple[int, bytes]:
+    """
+    Read the watermark trailer at the end of a file.
+    
+    Only the last MAX_WATERMARK_SIZE bytes are read.
+    
+    Args:
+        path: Watermarked file
+        
+    Returns:
+        Tuple of (original_data_size, trailer_bytes)
+        
+    Raises:
+        WatermarkError: If the file is too small or cannot be read
+    """
+    try:
+        with open(path, 'rb') as f:
+            _, original_size, trailer = _read_trailer(f)
+    except OSError as e:
+        raise WatermarkError(f"Failed to read watermark: {e}")
+    if len(trailer) < WatermarkData.WATERMARK_SIZE:
+        raise WatermarkError("Binary data too small to contain watermark")
+    return original_size, trailer
+
+
+def extract_watermark_from_file(path: PathLike, secret: str,
+                                verify_payload: bool = True) -> Tuple[int, WatermarkData]:
+    """
+    Extract and verify the watermark of a file.
+    
+    The trailer is read and its signature checked first. For v2 trailers
+    the payload is then hashed in one streaming pass and compared with the
+    signed digest, unless verify_payload is False (trailer-only check).
+    
+    Args:
+        path: Watermarked file
+        secret: Secret key for verification
+        verify_payload: Check a v2 payload digest against the file contents
+        
+    Returns:
+        Tuple of (original_data_size, watermark_data)
+        
+    Raises:
+        WatermarkError: If extraction or verification fails
+    """
+    original_size, trailer = read_watermark_trailer(path)
+    watermark = decode_watermark(trailer, secret)
+    if verify_payload and watermark.payload_digest:
+        _check_payload_digest(watermark, file_payload_digest(path, original_size))
+    return original_size, watermark
+
+
+def check_watermark_in_file(path: PathLike) -> bool:
+    """
+    Check if a file ends with a watermark without verifying it.
+    
+    Args:
+        path: File to check
+        
+    Returns:
+        True if watermark magic bytes are present
+    """
+    try:
+        _, trailer = read_watermark_trailer(path)
+    except WatermarkError:
+        return False
+    return trailer[:len(WatermarkData.MAGIC)] == WatermarkData.MAGIC
+
+
+@contextmanager
+def open_watermarked_file(path: PathLike, secret: str,
+                          verify_payload: bool = True
+                          ) -> Iterator[Tuple[memoryview, WatermarkData]]:
+    """
+    Verify a watermarked file and map its original data without copying.
+    
+    The trailer is verified first; the payload is then exposed as a
+    read-only memoryview over a memory map of the file. For v2 trailers the
+    mapped payload is hashed and checked against the signed digest unless
+    verify_payload is False. The view is only valid inside the with-block.
+    
+    Example:
+        >>> with open_watermarked_file('seed.bin', secret) as (payload, wm):
+        ...     digest = hashlib.sha256(payload).hexdigest()
+    
+    Args:
+        path: Watermarked file
+        secret: Secret key for verification
+        verify_payload: Check a v2 payload digest against the mapped data
+        
+    Yields:
+        Tuple of (payload_memoryview, watermark_data)
+        
+    Raises:
+        WatermarkError: If extraction or verification fails
+    """
+    original_size, watermark = extract_watermark_from_file(
+        path, secret, verify_payload=False
+    )
+    
+    try:
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError) as e:
+        raise WatermarkError(f"Failed to map watermarked file: {e}")
+    
+    view = memoryview(mapped)
+    payload = view[:original_size]
+    try:
+        if verify_payload and watermark.payload_digest:
+            _check_payload_digest(watermark, hashlib.sha256(payload).digest())
+        yield payload, watermark
+    finally:
+        payload.release()
+        view.release()
+        mapped.close()
+
+
+def _is_regular_file(path: str, follow_symlinks: bool) -> bool:
+    """True for regular files; FIFOs, sockets and devices would block open()."""
+    try:
+        st = os.stat(path) if follow_symlinks else os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISREG(st.st_mode)
+
+
+def iter_files(paths: Iterable[PathLike]) -> Iterator[str]:
+    """
+    Walk files and directories recursively in a stable order.
+    
+    Symbolic links found while walking are not followed. Only regular
+    files are yielded; FIFOs, sockets and devices are skipped, as opening
+    them could block an audit. Paths given explicitly that do not exist
+    are still yielded, so the caller reports them.
+    
+    Args:
+        paths: Files and/or directories
+        
+    Yields:
+        Path of every regular file found
+    """
+    for path in paths:
+        path = os.fspath(path)
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    file_path = os.path.join(root, name)
+                    if _is_regular_file(file_path, follow_symlinks=False):
+                        yield file_path
+        elif not os.path.lexists(path) or _is_regular_file(path, follow_symlinks=True):
+            yield path
+
+
+def audit_watermark_file(path: PathLike, keyring: WatermarkKeyring,
+                         verify_payload: bool = False) -> Dict[str, Any]:
+    """
+    Verify the watermark of one file against a keyring.
+    
+    Only the trailer is read unless verify_payload is set, in which case
+    the payload of a v2 trailer is hashed and checked as well. Errors are
+    reported in the result rather than raised, so one bad file never stops
+    an audit.
+    
+    Args:
+        path: File to audit
+        keyring: Secrets to try
+        verify_payload: Check v2 payload digests against the file contents
+        
+    Returns:
+        Dictionary with file, file_size, watermarked, verified, key_index,
+        version, payload_verified (None if not checked), original_size,
+        watermark and error
+    """
+    result: Dict[str, Any] = {
+        'file': os.fspath(path),
+        'file_size': None,
+        'watermarked': False,
+        'verified': False,
+        'key_index': None,
+        'version': None,
+        'payload_verified': None,
+        'original_size': None,
+        'watermark': None,
+        'error': None,
+    }
+    
+    try:
+        with open(path, 'rb') as f:
+            result['file_size'], original_size, trailer = _read_trailer(f)
+    except OSError as e:
+        result['error'] = f"Failed to read watermark: {e}"
+        return result
+    
+    if trailer[:len(WatermarkData.MAGIC)] != WatermarkData.MAGIC:
+        result['error'] = 'No watermark found in binary file'
+        return result
+    
+    result['watermarked'] = True
+    try:
+        watermark, key_index = keyring.verify(trailer)
+    except WatermarkError as e:
+        result['error'] = str(e)
+        return result
+    
+    result['key_index'] = key_index
+    result['version'] = watermark.version
+    result['original_size'] = original_size
+    result['watermark'] = watermark.to_dict()
+    
+    if verify_payload and watermark.payload_digest:
+        try:
+            _check_payload_digest(watermark, file_payload_digest(path, original_size))
+        except WatermarkError as e:
+            result['payload_verified'] = False
+            result['error'] = str(e)
+            return result
+        result['payload_verified'] = True
+    
+    result['verified'] = True
+    return result
+
+
+def audit_watermarks(paths: Iterable[PathLike], keyring: WatermarkKeyring,
+                     max_workers: Optional[int] = None,
+                     verify_payload: bool = False) -> Iterator[Dict[str, Any]]:
+    """
+    Audit every file under the given paths in a thread pool.
+    
+    Trailer reads and HMAC checks run concurrently; results are yielded in
+    walk order as soon as they are ready. At most a few results per worker
+    are held in flight, so memory stays bounded for any tree size.
+    
+    Example:
+        >>> keyring = WatermarkKeyring([new_secret, old_secret])
+        >>> for result in audit_watermarks(['mirror/'], keyring):
+        ...     print(json.dumps(result))
+    
+    Args:
+        paths: Files and/or directories to walk
+        keyring: Secrets to try
+        max_workers: Thread count (default: min(32, CPU count + 4))
+        verify_payload: Also hash v2 payloads (reads whole files)
+        
+    Yields:
+        Result dictionaries from audit_watermark_file()
+    """
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) + 4)
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+    
+    window = 4 * max_workers
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: deque = deque()
+        for path in iter_files(paths):
+            pending.append(executor.submit(audit_watermark_file, path, keyring,
+                                           verify_payload))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def summarize_audit(results: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Summarize audit results.
+    
+    Args:
+        results: Result dictionaries from audit_watermarks()
+        
+    Returns:
+        Dictionary of counts: total, verified, failed (watermarked but not
+        verified), unwatermarked, errors (unreadable files) and
+        verified_by_key (key index -> count)
+    """
+    summary: Dict[str, Any] = {
+        'total': 0,
+        'verified': 0,
+        'failed': 0,
+        'unwatermarked': 0,
+        'errors': 0,
+        'verified_by_key': {},
+    }
+    for result in results:
+        summary['total'] += 1
+        if result['verified']:
+            summary['verified'] += 1
+            key = result['key_index']
+            summary['verified_by_key'][key] = summary['verified_by_key'].get(key, 0) + 1
+        elif result['watermarked']:
+            summary['failed'] += 1
+        elif result['file_size'] is None:
+            summary['errors'] += 1
+        else:
+            summary['unwatermarked'] += 1
+    return summary
+
+
+def _reflink(src_fd: int, dst_fd: int) -> bool:
+    """Clone src into dst with FICLONE; False if unsupported."""
+    if not sys.platform.startswith('linux'):
+        return False
+    try:
+        import fcntl
+        fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+    except (ImportError, OSError):
         return False
+    return True
+
+
+def _copy_fd(src_fd: int, dst_fd: int, size: int) -> None:
+    """
+    Copy size bytes between file descriptors in the kernel where possible.
+    
+    Tries copy_file_range, then sendfile, then a chunked read/write loop,
+    resuming each fallback where the previous method stopped.
+    """
+    copied = 0
+    
+    if hasattr(os, 'copy_file_range'):
+        try:
+            while copied < size:
+                n = os.copy_file_range(src_fd, dst_fd, size - copied, copied, copied)
+                if not n:
+                    break
+                copied += n
+        except OSError:
+            pass
+    
+    if copied < size and hasattr(os, 'sendfile'):
+        try:
+            os.lseek(dst_fd, copied, os.SEEK_SET)
+            while copied < size:
+                n = os.sendfile(dst_fd, src_fd, copied, size - copied)
+                if not n:
+                    break
+                copied += n
+        except OSError:
+            pass
+    
+    if copied < size:
+        os.lseek(src_fd, copied, os.SEEK_SET)
+        os.lseek(dst_fd, copied, os.SEEK_SET)
+        while copied < size:
+            chunk = os.read(src_fd, min(COPY_CHUNK_SIZE, size - copied))
+            if not chunk:
+                break
+            view = memoryview(chunk)
+            while view:
+                view = view[os.write(dst_fd, view):]
+            copied += len(chunk)
+    
+    if copied != size:
+        raise OSError(f"Source changed during copy: copied {copied} of {size} bytes")
+
+
+def _copy_with_trailer(src: PathLike, dst: PathLike, trailer: bytes) -> int:
+    """
+    Copy src to dst and append trailer, without reading src into Python.
+    
+    Uses a reflink where the filesystem supports it, otherwise an in-kernel
+    copy. The copy is written under a temporary name and renamed into place,
+    so dst never holds a partial file.
+    
+    Returns:
+        Size of src in bytes
+    """
+    dst = os.fspath(dst)
+    tmp = f"{dst}.tmp"
+    try:
+        with open(src, 'rb') as fsrc, open(tmp, 'wb') as fdst:
+            src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+            size = os.fstat(src_fd).st_size
+            if not _reflink(src_fd, dst_fd):
+                _copy_fd(src_fd, dst_fd, size)
+            os.lseek(dst_fd, size, os.SEEK_SET)
+            view = memoryview(trailer)
+            while view:
+                view = view[os.write(dst_fd, view):]
+        os.replace(tmp, dst)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    return size
+
+
+def write_watermarked_copy(src: PathLike, dst: PathLike,
+                           watermark: WatermarkData, secret: str,
+                           version: int = WatermarkData.VERSION) -> int:
+    """
+    Write a watermarked copy of src to dst.
+    
+    The base file is copied by the operating system (reflink,
+    copy_file_range or sendfile) and the trailer appended, so the base is
+    never loaded into memory. A v2 trailer uses the cached base digest from
+    file_payload_digest(). watermark.signature (and payload_digest for v2)
+    is set on success.
+    
+    Args:
+        src: Base (unwatermarked) file
+        dst: Output file
+        watermark: Watermark data to embed
+        secret: Secret key for signature
+        version: Trailer version (2 commits to the SHA-256 of src)
+        
+    Returns:
+        Size of the original (unwatermarked) data in bytes
+        
+    Raises:
+        WatermarkError: If encoding or copying fails
+    """
+    WatermarkData.trailer_size(version)
+    digest = file_payload_digest(src) if version == 2 else None
+    encoded_watermark = encode_watermark(watermark, secret, digest)
+    try:
+        original_size = _copy_with_trailer(src, dst, encoded_watermark)
+    except OSError as e:
+        raise WatermarkError(f"Failed to write watermarked copy: {e}")
+    watermark.signature = encoded_watermark[-WatermarkData.SIGNATURE_SIZE:]
+    watermark.payload_digest = digest or b''
+    return original_size
+
+
+def load_watermark_records(path: PathLike) -> List[WatermarkData]:
+    """
+    Load watermark records from a CSV or JSON file.
+    
+    CSV files need license_id and user_info columns; JSON files hold a list
+    of objects with the same keys. An optional timestamp (Unix time) is
+    honoured; otherwise the current time is used.
+    
+    Args:
+        path: .csv or .json file
+        
+    Returns:
+        List of watermark records
+        
+    Raises:
+        WatermarkError: If the file cannot be parsed or a record is invalid
+    """
+    path = os.fspath(path)
+    try:
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            if path.lower().endswith('.csv'):
+                rows = list(csv.DictReader(f))
+            else:
+                rows = json.load(f)
+    except (OSError, ValueError, csv.Error) as e:
+        raise WatermarkError(f"Failed to read watermark records: {e}")
+    
+    if not isinstance(rows, list):
+        raise WatermarkError("Watermark records must be a list")
+    
+    records = []
+    for number, row in enumerate(rows, 1):
+        try:
+            timestamp = row.get('timestamp')
+            records.append(WatermarkData(
+                row['license_id'],
+                row['user_info'],
+                float(timestamp) if timestamp not in (None, '') else None,
+            ))
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            raise WatermarkError(f"Invalid watermark record {number}: {e!r}")
+    return records
+
+
+def issue_watermarked_copies(base: PathLike, records: Sequence[WatermarkData],
+                             secret: str, output_dir: PathLike,
+                             name_template: str = "{stem}-{license_id}{suffix}",
+                             manifest_path: Optional[PathLike] = None,
+                             max_workers: Optional[int] = None,
+                             version: int = WatermarkData.VERSION) -> List[Dict[str, Any]]:
+    """
+    Issue one watermarked copy of a base file per license.
+    
+    Each copy is produced by write_watermarked_copy(); copies are encoded,
+    signed and written concurrently in a thread pool. For v2 trailers the
+    base is hashed once, before any copy is written. Output names are
+    checked up front, so a bad or duplicate name fails before any copy is
+    written.
+    
+    Args:
+        base: Base (unwatermarked) file
+        records: Watermark data, one per copy
+        secret: Secret key for signatures
+        output_dir: Directory for the copies (created if missing)
+        name_template: Output file name; may use {stem}, {suffix},
+            {license_id} and {index}
+        manifest_path: Optional JSON manifest of the issued copies
+        max_workers: Thread count (default: min(32, CPU count + 4))
+        version: Trailer version
+        
+    Returns:
+        Manifest entries in record order: file, license_id, user_info,
+        timestamp, version, payload_sha256 (hex, v2 only), signature (hex)
+        and original_size
+        
+    Raises:
+        WatermarkError: If a name is invalid or any copy fails
+    """
+    base = os.fspath(base)
+    stem, suffix = os.path.splitext(os.path.basename(base))
+    
+    names = []
+    for index, watermark in enumerate(records):
+        name = name_template.format(stem=stem, suffix=suffix,
+                                    license_id=watermark.license_id, index=index)
+        if (name in ('', '.', '..') or os.path.basename(name) != name
+                or (os.altsep and os.altsep in name)):
+            raise WatermarkError(f"Invalid output file name: {name!r}")
+        names.append(name)
+    if len(set(names)) != len(names):
+        raise WatermarkError("Output file names are not unique")
+    
+    try:
+        os.makedirs(output_dir, exist_ok=True)
+    except OSError as e:
+        raise WatermarkError(f"Failed to create output directory: {e}")
+    paths = [os.path.join(output_dir, name) for name in names]
+    
+    if version == 2:
+        file_payload_digest(base)  # Hash the base once, before the workers start
+    
+    def issue(index: int) -> Dict[str, Any]:
+        watermark = records[index]
+        original_size = write_watermarked_copy(base, paths[index], watermark,
+                                               secret, version)
+        return {
+            'file': paths[index],
+            'license_id': watermark.license_id,
+            'user_info': watermark.user_info,
+            'timestamp': watermark.timestamp,
+            'version': watermark.version,
+            'payload_sha256': watermark.payload_digest.hex() or None,
+            'signature': watermark.signature.hex(),
+            'original_size': original_size,
+        }
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        manifest = list(executor.map(issue, range(len(records))))
     
-    watermark_offset = len(binary_data) - WatermarkData.WATERMARK_SIZE
-    magic = binary_data[watermark_offset:watermark_offset + 4]
+    if manifest_path is not None:
+        document = {'base': base, 'copies': manifest}
+        try:
+            with open(manifest_path, 'w', encoding='utf-8') as f:
+                json.dump(document, f, indent=2)
+                f.write('\n')
+        except OSError as e:
+            raise WatermarkError(f"Failed to write manifest: {e}")
     
-    return magic == WatermarkData.MAGIC
+    return manifest
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+License Registry for Watermark Tracing
+
+A local SQLite index of issued watermarks, keyed by signature prefix. When a
+leaked binary turns up, its trailer is decoded and verified with
+decode_watermark() and the signature looked up in the registry to find the
+license and customer it was issued to.
+
+Every issued trailer has a distinct HMAC signature, so the first 8 bytes of
+the signature (stored as a signed 64-bit integer) identify a record; the
+full signature is compared as well, so prefix collisions are harmless.
+
+Example Usage:
+    >>> with LicenseRegistry('licenses.db') as registry:
+    ...     registry.ingest_manifest('output/licensed/manifest.json')
+    ...     match = registry.lookup_file('leaked.bin', secret)
+    ...     match['license']['user_info']
+    'Acme Corp'
+
+⚠️ NOT FOR CRYPTOGRAPHIC USE: This is for licensing and traceability only.
+"""
+
+import json
+import os
+import sqlite3
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from .watermark import (
+    PathLike,
+    WatermarkData,
+    WatermarkError,
+    decode_watermark,
+    encode_watermark,
+    read_watermark_trailer,
+)
+
+
+# Bytes of the signature used as the lookup key
+PREFIX_SIZE = 8
+
+# Signatures per IN (...) query in batch lookups (below SQLite's variable limit)
+LOOKUP_BATCH_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS licenses (
+    prefix INTEGER NOT NULL,
+    signature BLOB NOT NULL UNIQUE,
+    license_id TEXT NOT NULL,
+    user_info TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    version INTEGER NOT NULL,
+    payload_sha256 BLOB,
+    file TEXT
+);
+CREATE INDEX IF NOT EXISTS licenses_prefix ON licenses (prefix);
+CREATE INDEX IF NOT EXISTS licenses_license_id ON licenses (license_id);
+"""
+
+_COLUMNS = ("signature, license_id, user_info, timestamp, version, "
+            "payload_sha256, file")
+
+
+def _signature_prefix(signature: bytes) -> int:
+    """Key for a signature: its first PREFIX_SIZE bytes as a signed integer."""
+    return int.from_bytes(signature[:PREFIX_SIZE], 'big', signed=True)
+
+
+def _row_to_dict(row: Sequence[Any]) -> Dict[str, Any]:
+    """Convert a licenses row to a result dictionary."""
+    signature, license_id, user_info, timestamp, version, payload, file = row
+    return {
+        'license_id': license_id,
+        'user_info': user_info,
+        'timestamp': timestamp,
+        'version': version,
+        'payload_sha256': payload.hex() if payload else None,
+        'signature': signature.hex(),
+        'file': file,
+    }
+
+
+class LicenseRegistry:
+    """
+    SQLite-backed registry of issued watermarks.
+
+    Lookups are single indexed queries on the signature prefix; batch
+    lookups resolve thousands of trailers with a handful of queries.
+    """
+
+    def __init__(self, path: PathLike = ':memory:'):
+        """
+        Open (or create) a registry.
+
+        Args:
+            path: SQLite database file (default: in-memory registry)
+        """
+        self.path = os.fspath(path)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "LicenseRegistry":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM licenses").fetchone()[0]
+
+    def ingest(self, records: Iterable[WatermarkData], secret: Optional[str] = None,
+               files: Optional[Iterable[Optional[str]]] = None) -> int:
+        """
+        Bulk-insert issued watermarks in a single transaction.
+
+        Records carry their signature (set by write_watermarked_copy());
+        records without one are signed with secret. Records already in the
+        registry are skipped.
+
+        Args:
+            records: Issued watermark data
+            secret: Secret key to sign records lacking a signature
+            files: Optional issued file path per record
+
+        Returns:
+            Number of records inserted
+
+        Raises:
+            WatermarkError: If a record has no signature and no secret is given
+        """
+        files_iter = iter(files) if files is not None else None
+
+        def rows():
+            for watermark in records:
+                file = next(files_iter, None) if files_iter is not None else None
+                signature = watermark.signature
+                if not signature:
+                    if secret is None:
+                        raise WatermarkError(
+                            f"Record {watermark.license_id!r} has no signature; "
+                            f"a secret is required to sign it"
+                        )
+                    encoded = encode_watermark(watermark, secret,
+                                               watermark.payload_digest or None)
+                    signature = encoded[-WatermarkData.SIGNATURE_SIZE:]
+                yield (_signature_prefix(signature), signature, watermark.license_id,
+                       watermark.user_info, watermark.timestamp, watermark.version,
+                       watermark.payload_digest or None, file)
+
+        with self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                f"INSERT OR IGNORE INTO licenses (prefix, {_COLUMNS}) "
+                f"VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows()
+            )
+            return self._conn.total_changes - before
+
+    def ingest_manifest(self, manifest_path: PathLike) -> int:
+        """
+        Ingest a manifest written by issue_watermarked_copies().
+
+        Args:
+            manifest_path: JSON manifest file
+
+        Returns:
+            Number of records inserted
+
+        Raises:
+            WatermarkError: If the manifest cannot be read
+        """
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                copies = json.load(f)['copies']
+            records = []
+            for entry in copies:
+                watermark = WatermarkData(entry['license_id'], entry['user_info'],
+                                          entry['timestamp'])
+                watermark.signature = bytes.fromhex(entry['signature'])
+                watermark.payload_digest = bytes.fromhex(entry.get('payload_sha256') or '')
+                records.append(watermark)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            raise WatermarkError(f"Failed to read manifest: {e!r}")
+        return self.ingest(records, files=[entry.get('file') for entry in copies])
+
+    def lookup_signature(self, signature: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Find the issued record with this signature.
+
+        Args:
+            signature: 32-byte HMAC signature
+
+        Returns:
+            Record dictionary, or None if not registered
+        """
+        row = self._conn.execute(
+            f"SELECT {_COLUMNS} FROM licenses WHERE prefix = ? AND signature = ?",
+            (_signature_prefix(signature), bytes(signature))
+        ).fetchone()
+        return _row_to_dict(row) if row is not None else None
+
+    def lookup_trailer(self, trailer: bytes, secret: str) -> Dict[str, Any]:
+        """
+        Verify a trailer with decode_watermark() and look up its license.
+
+        Args:
+            trailer: Watermark trailer bytes
+            secret: Secret key for verification
+
+        Returns:
+            Dictionary with verified, registered, license (record or None)
+            and error
+        """
+        return self.lookup_trailers([trailer], secret)[0]
+
+    def lookup_file(self, path: PathLike, secret: str) -> Dict[str, Any]:
+        """
+        Verify a file's trailer and look up its license.
+
+        Only the trailer is read.
+
+        Args:
+            path: Watermarked file
+            secret: Secret key for verification
+
+        Returns:
+            Result dictionary as for lookup_trailer()
+        """
+        try:
+            _, trailer = read_watermark_trailer(path)
+        except WatermarkError as e:
+            return {'verified': False, 'registered': False,
+                    'license': None, 'error': str(e)}
+        return self.lookup_trailer(trailer, secret)
+
+    def lookup_trailers(self, trailers: Sequence[bytes],
+                        secret: str) -> List[Dict[str, Any]]:
+        """
+        Verify and look up many trailers in one call.
+
+        Each trailer is verified with decode_watermark(); verified
+        signatures are then resolved LOOKUP_BATCH_SIZE at a time with
+        IN (...) queries on the prefix index.
+
+        Args:
+            trailers: Watermark trailer bytes
+            secret: Secret key for verification
+
+        Returns:
+            One result dictionary per trailer, in input order, as for
+            lookup_trailer()
+        """
+        results: List[Dict[str, Any]] = []
+        signatures: Dict[bytes, List[int]] = {}
+        for index, trailer in enumerate(trailers):
+            result: Dict[str, Any] = {'verified': False, 'registered': False,
+                                      'license': None, 'error': None}
+            results.append(result)
+            try:
+                watermark = decode_watermark(trailer, secret)
+            except WatermarkError as e:
+                result['error'] = str(e)
+                continue
+            result['verified'] = True
+            signatures.setdefault(watermark.signature, []).append(index)
+
+        pending = list(signatures)
+        for start in range(0, len(pending), LOOKUP_BATCH_SIZE):
+            batch = pending[start:start + LOOKUP_BATCH_SIZE]
+            placeholders = ', '.join('?' * len(batch))
+            rows = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM licenses WHERE prefix IN ({placeholders})",
+                [_signature_prefix(signature) for signature in batch]
+            )
+            for row in rows:
+                for index in signatures.get(bytes(row[0]), ()):
+                    results[index]['registered'] = True
+                    results[index]['license'] = _row_to_dict(row)
+
+        for result in results:
+            if result['verified'] and not result['registered']:
+                result['error'] = 'Signature not found in registry'
+        return results
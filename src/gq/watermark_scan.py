@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Embedded Watermark Scanner
+
+check_watermark_present() only looks at the end of a file. When a
+watermarked binary is repackaged into an archive, container image or
+installer, its trailer ends up somewhere in the middle. This scanner finds
+trailers anywhere in arbitrarily large files:
+
+1. The file is memory-mapped and searched for MAGIC with mmap.find() over
+   fixed-size windows. Windows overlap by MAX_WATERMARK_SIZE, so a trailer
+   straddling a window boundary is still seen whole; each offset is
+   reported by the window it starts in.
+2. Each candidate is validated structurally (version, zero padding of the
+   text fields, UTF-8, finite timestamp), which rejects almost all chance
+   occurrences of the magic bytes without touching a key.
+3. Surviving candidates are verified against a keyring. HMAC over a
+   trailer-sized input holds the GIL, so large candidate sets are split
+   across worker processes (which get the secrets, not the keyring);
+   smaller ones are verified serially.
+
+The search runs at memory bandwidth on page-cached files; only candidate
+trailers are copied out of the map.
+
+Payload digests of embedded v2 trailers are not checked: the start of an
+embedded payload is unknown.
+
+⚠️ NOT FOR CRYPTOGRAPHIC USE: This is for licensing and traceability only.
+"""
+
+import math
+import mmap
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .watermark import (
+    PathLike,
+    WatermarkData,
+    WatermarkError,
+    WatermarkKeyring,
+)
+
+
+# Bytes searched per window
+SCAN_WINDOW_SIZE = 64 * 1024 * 1024
+
+# Candidates verified per worker task
+VERIFY_BATCH_SIZE = 1024
+
+# Fewest candidates verified in worker processes. Verification costs about
+# 10 µs per candidate and secret tried, so below this starting a process
+# pool costs more than it saves
+PARALLEL_VERIFY_MIN_CANDIDATES = 8192
+
+# (key_index, watermark, error) of one verified candidate
+_Verification = Tuple[Optional[int], Optional[Dict[str, Any]], Optional[str]]
+
+_LICENSE_OFFSET = WatermarkData.HEADER_SIZE
+_USER_OFFSET = _LICENSE_OFFSET + WatermarkData.LICENSE_ID_SIZE
+_TIMESTAMP_OFFSET = _USER_OFFSET + WatermarkData.USER_INFO_SIZE
+
+
+def find_magic_offsets(buffer, window_size: int = SCAN_WINDOW_SIZE) -> Iterator[int]:
+    """
+    Find every occurrence of MAGIC in a buffer, window by window.
+
+    Args:
+        buffer: bytes, bytearray or mmap (anything with find(sub, start, end))
+        window_size: Bytes searched per window
+
+    Yields:
+        Offsets of MAGIC in increasing order
+    """
+    if window_size < 1:
+        raise ValueError(f"Window size must be positive, got {window_size}")
+
+    magic = WatermarkData.MAGIC
+    size = len(buffer)
+    for window_start in range(0, size, window_size):
+        window_end = min(window_start + window_size, size)
+        # Overlap into the next window so trailers across the boundary are whole
+        search_end = min(window_end + WatermarkData.MAX_WATERMARK_SIZE, size)
+        offset = buffer.find(magic, window_start, search_end)
+        while 0 <= offset < window_end:
+            yield offset
+            offset = buffer.find(magic, offset + 1, search_end)
+
+
+def _padded_text(field: bytes) -> Optional[str]:
+    """Decode a null-padded text field, or None if the padding is malformed."""
+    text = field.rstrip(b'\x00')
+    if b'\x00' in text:
+        return None
+    try:
+        return text.decode('utf-8')
+    except UnicodeDecodeError:
+        return None
+
+
+def validate_trailer_structure(candidate: bytes) -> Optional[int]:
+    """
+    Check that bytes starting with MAGIC are laid out like a trailer.
+
+    Args:
+        candidate: Bytes from a MAGIC occurrence onwards (at least the
+            trailer size for its version)
+
+    Returns:
+        Trailer version if the structure is valid, otherwise None
+    """
+    if len(candidate) < WatermarkData.HEADER_SIZE:
+        return None
+    version = candidate[4]
+    try:
+        size = WatermarkData.trailer_size(version)
+    except WatermarkError:
+        return None
+    if len(candidate) < size:
+        return None
+
+    if _padded_text(candidate[_LICENSE_OFFSET:_USER_OFFSET]) is None:
+        return None
+    if _padded_text(candidate[_USER_OFFSET:_TIMESTAMP_OFFSET]) is None:
+        return None
+
+    timestamp = struct.unpack_from('>d', candidate, _TIMESTAMP_OFFSET)[0]
+    if not math.isfinite(timestamp) or timestamp < 0:
+        return None
+    return version
+
+
+def _verify_trailers(trailers: Sequence[bytes],
+                     keyring: WatermarkKeyring) -> List[_Verification]:
+    """Verify trailers against a keyring."""
+    results = []
+    for trailer in trailers:
+        try:
+            watermark, key_index = keyring.verify(trailer)
+        except WatermarkError as e:
+            results.append((None, None, str(e)))
+            continue
+        results.append((key_index, watermark.to_dict(), None))
+    return results
+
+
+def _verify_trailers_with_secrets(trailers: Sequence[bytes],
+                                  secrets: Sequence[str]) -> List[_Verification]:
+    """Verify trailers in a worker process, rebuilding the keyring there."""
+    return _verify_trailers(trailers, WatermarkKeyring(secrets))
+
+
+def scan_buffer(buffer, keyring: Optional[Union[str, Sequence[str], WatermarkKeyring]] = None,
+                window_size: int = SCAN_WINDOW_SIZE,
+                max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Find and verify every watermark trailer embedded in a buffer.
+
+    Args:
+        buffer: bytes, bytearray or mmap
+        keyring: Secret(s) or WatermarkKeyring to verify with (default:
+            structural validation only)
+        window_size: Bytes searched per window
+        max_workers: Verification process count for large candidate
+            sets (default: ProcessPoolExecutor default; 1 verifies serially)
+
+    Returns:
+        One dictionary per structurally valid trailer, in offset order,
+        with offset, version, verified (None without a keyring), key_index,
+        watermark and error
+    """
+    if keyring is not None and not isinstance(keyring, WatermarkKeyring):
+        keyring = WatermarkKeyring(keyring)
+
+    found = []
+    for offset in find_magic_offsets(buffer, window_size):
+        trailer = bytes(buffer[offset:offset + WatermarkData.MAX_WATERMARK_SIZE])
+        version = validate_trailer_structure(trailer)
+        if version is None:
+            continue
+        found.append({
+            'offset': offset,
+            'version': version,
+            'verified': None if keyring is None else False,
+            'key_index': None,
+            'watermark': None,
+            'error': None,
+            'trailer': trailer[:WatermarkData.trailer_size(version)],
+        })
+
+    if keyring is None:
+        for candidate in found:
+            del candidate['trailer']
+        return found
+
+    trailers = [candidate.pop('trailer') for candidate in found]
+    if len(trailers) < PARALLEL_VERIFY_MIN_CANDIDATES or max_workers == 1:
+        results = _verify_trailers(trailers, keyring)
+    else:
+        batches = [trailers[i:i + VERIFY_BATCH_SIZE]
+                   for i in range(0, len(trailers), VERIFY_BATCH_SIZE)]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = [result for batch in executor.map(
+                _verify_trailers_with_secrets, batches, repeat(keyring.secrets)
+            ) for result in batch]
+
+    for candidate, (key_index, watermark, error) in zip(found, results):
+        candidate['error'] = error
+        if error is None:
+            candidate['verified'] = True
+            candidate['key_index'] = key_index
+            candidate['watermark'] = watermark
+    return found
+
+
+def scan_file(path: PathLike,
+              keyring: Optional[Union[str, Sequence[str], WatermarkKeyring]] = None,
+              window_size: int = SCAN_WINDOW_SIZE,
+              max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Find and verify every watermark trailer embedded anywhere in a file.
+
+    The file is memory-mapped, so files larger than RAM are scanned
+    without being read into memory.
+
+    Args:
+        path: File to scan
+        keyring: Secret(s) or WatermarkKeyring to verify with (default:
+            structural validation only)
+        window_size: Bytes searched per window
+        max_workers: Verification process count (see scan_buffer())
+
+    Returns:
+        Result dictionaries as for scan_buffer()
+
+    Raises:
+        WatermarkError: If the file cannot be read
+    """
+    try:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return []
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError) as e:
+        raise WatermarkError(f"Failed to map file for scanning: {e}")
+
+    try:
+        return scan_buffer(mapped, keyring, window_size, max_workers)
+    finally:
+        mapped.close()
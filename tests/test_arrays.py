@@ -0,0 +1,130 @@
+"""
+Unit tests for NumPy array fills from GoldenSeed streams.
+
+Tests validate:
+- Integer arrays hold raw stream bytes, little-endian on every platform
+- Float arrays lie in [0, 1)
+- C- and Fortran-contiguous arrays are filled in memory order
+- Chunked fills of memory-mapped arrays match one-shot fills
+- Rejection of non-contiguous, read-only and unsupported arrays
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+# Add repository root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gq.stream import GoldenStream
+
+try:
+    import numpy as np
+    from gq.arrays import array, fill_array
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestIntegerFills(unittest.TestCase):
+    """Test integer dtypes receive raw stream bytes."""
+
+    def test_uint8_matches_stream_bytes(self):
+        """Test a uint8 array equals the next bytes of the stream."""
+        values = array((8, 12), np.uint8)
+        expected = GoldenStream().read(96)
+        self.assertEqual(values.tobytes(), expected)
+
+    def test_wide_integers_are_little_endian(self):
+        """Test every integer width decodes stream bytes little-endian."""
+        raw = GoldenStream().read(64)
+        for dtype in ('<u2', '>u2', '<i4', '>i4', '<u8', '>u8', '<i8'):
+            with self.subTest(dtype=dtype):
+                values = array(64 // np.dtype(dtype).itemsize, dtype)
+                expected = np.frombuffer(raw, dtype=np.dtype(dtype).newbyteorder('<'))
+                np.testing.assert_array_equal(values, expected)
+
+    def test_consecutive_fills_continue_stream(self):
+        """Test fills from a shared stream do not repeat or skip bytes."""
+        stream = GoldenStream()
+        first = array(10, np.uint8, stream)
+        second = array(20, np.uint8, stream)
+        self.assertEqual(first.tobytes() + second.tobytes(), GoldenStream().read(30))
+        self.assertEqual(stream.tell(), 30)
+
+    def test_default_dtype_is_uint8(self):
+        """Test array() defaults to uint8."""
+        self.assertEqual(array(4).dtype, np.uint8)
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestFloatFills(unittest.TestCase):
+    """Test float dtypes are filled with values in [0, 1)."""
+
+    def test_unit_interval(self):
+        """Test float16, float32 and float64 values lie in [0, 1)."""
+        for dtype in (np.float16, np.float32, np.float64):
+            with self.subTest(dtype=dtype):
+                values = array(4096, dtype)
+                self.assertEqual(values.dtype, dtype)
+                self.assertTrue((values >= 0).all() and (values < 1).all())
+                self.assertGreater(values.std(), 0.25)
+
+    def test_float64_uses_top_53_bits(self):
+        """Test float64 values are the top 53 bits of one 64-bit word."""
+        word = int.from_bytes(GoldenStream().read(8), 'little')
+        self.assertEqual(array(1, np.float64)[0], (word >> 11) / 2.0 ** 53)
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestLayouts(unittest.TestCase):
+    """Test memory layouts, chunking and memmaps."""
+
+    def test_fortran_order_filled_in_memory_order(self):
+        """Test a Fortran-ordered array receives bytes in memory order."""
+        out = np.empty((6, 5), dtype=np.uint8, order='F')
+        fill_array(out)
+        self.assertEqual(out.tobytes(order='F'), GoldenStream().read(30))
+
+    def test_chunked_fill_matches_single_fill(self):
+        """Test small chunk sizes do not change the result."""
+        for dtype in (np.uint8, np.uint32, np.float32):
+            with self.subTest(dtype=dtype):
+                np.testing.assert_array_equal(
+                    array(1000, dtype, chunk_size=24), array(1000, dtype)
+                )
+
+    def test_memmap_fill(self):
+        """Test a memory-mapped array is filled chunk by chunk on disk."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'noise.dat')
+            mapped = np.memmap(path, dtype=np.uint16, mode='w+', shape=(64, 32))
+            fill_array(mapped, chunk_size=256)
+            mapped.flush()
+            del mapped
+            with open(path, 'rb') as f:
+                self.assertEqual(f.read(), GoldenStream().read(64 * 32 * 2))
+
+    def test_non_contiguous_rejected(self):
+        """Test strided views are rejected."""
+        with self.assertRaises(ValueError):
+            fill_array(np.zeros((4, 4), dtype=np.uint8)[:, ::2])
+
+    def test_read_only_rejected(self):
+        """Test read-only arrays are rejected."""
+        out = np.zeros(4, dtype=np.uint8)
+        out.flags.writeable = False
+        with self.assertRaises(ValueError):
+            fill_array(out)
+
+    def test_unsupported_dtype_rejected(self):
+        """Test non-numeric dtypes are rejected."""
+        for dtype in (np.bool_, np.complex64, 'U4'):
+            with self.subTest(dtype=dtype):
+                with self.assertRaises(TypeError):
+                    fill_array(np.zeros(4, dtype=dtype))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Tests for the benchmark suite
+
+Tests validate:
+- Case selection by group, validator and case name
+- Timing statistics and percentiles
+- Baseline comparison and regression detection
+- The gq bench JSON and --compare modes
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.gq.benchmark import (
+    BenchmarkCase,
+    VALIDATORS,
+    VALIDATOR_SIZES,
+    compare_results,
+    load_results,
+    percentile,
+    results_document,
+    run_case,
+    select_cases,
+    summarize_timings,
+)
+
+
+class TestCaseSelection(unittest.TestCase):
+    """Test suite for selecting benchmark cases."""
+
+    def test_all_cases(self):
+        """Test the default selection covers every group."""
+        cases = select_cases()
+        groups = {case.group for case in cases}
+        self.assertEqual(groups, {'universal', 'gqs1', 'coin-flip', 'validators', 'watermark'})
+        self.assertEqual(len([c for c in cases if c.group == 'validators']),
+                         len(VALIDATORS) * len(VALIDATOR_SIZES))
+        self.assertEqual(len({case.name for case in cases}), len(cases))
+
+    def test_select_by_name(self):
+        """Test selection by group, validator and full case name."""
+        self.assertEqual([c.name for c in select_cases(['gqs1'])], ['gqs1'])
+        self.assertEqual([c.name for c in select_cases(['runs_test'])],
+                         [f'validators.runs_test/{size}' for size in VALIDATOR_SIZES])
+        self.assertEqual([c.name for c in select_cases(['validators.gap_test/1000'])],
+                         ['validators.gap_test/1000'])
+        self.assertEqual(len(select_cases(['watermark'])), 2)
+
+    def test_scale_and_unknown(self):
+        """Test scaling sizes and rejecting unknown names."""
+        cases = select_cases(['runs_test'], scale=0.01)
+        self.assertEqual([c.items for c in cases], [10, 100, 1000])
+        with self.assertRaises(ValueError):
+            select_cases(['nope'])
+        with self.assertRaises(ValueError):
+            select_cases(scale=0)
+
+    def test_cases_run(self):
+        """Test every case runs at a tiny scale."""
+        for case in select_cases(scale=0.001):
+            result = run_case(case, warmup=0, repetitions=1)
+            self.assertGreater(result['items_per_second'], 0, case.name)
+
+
+class TestStatistics(unittest.TestCase):
+    """Test suite for timing statistics."""
+
+    def test_percentile(self):
+        """Test interpolated percentiles."""
+        values = [4.0, 1.0, 3.0, 2.0, 5.0]
+        self.assertEqual(percentile(values, 0.0), 1.0)
+        self.assertEqual(percentile(values, 0.5), 3.0)
+        self.assertEqual(percentile(values, 1.0), 5.0)
+        self.assertAlmostEqual(percentile(values, 0.9), 4.6)
+        self.assertEqual(percentile([7.0], 0.9), 7.0)
+
+    def test_summarize_timings(self):
+        """Test the summary uses the median for throughput."""
+        summary = summarize_timings([0.1, 0.2, 0.4], items=100)
+        self.assertEqual(summary['repetitions'], 3)
+        self.assertEqual(summary['median'], 0.2)
+        self.assertEqual(summary['min'], 0.1)
+        self.assertEqual(summary['max'], 0.4)
+        self.assertAlmostEqual(summary['items_per_second'], 500.0)
+
+    def test_run_case_warmup_and_repetitions(self):
+        """Test warmup runs are untimed and setup runs once."""
+        calls = {'setup': 0, 'run': 0}
+
+        def setup():
+            calls['setup'] += 1
+
+            def run():
+                calls['run'] += 1
+            return run
+
+        result = run_case(BenchmarkCase('noop', 'test', 'items', 10, setup),
+                          warmup=2, repetitions=3)
+        self.assertEqual(calls, {'setup': 1, 'run': 5})
+        self.assertEqual(result['repetitions'], 3)
+        self.assertEqual(result['group'], 'test')
+
+
+class TestComparison(unittest.TestCase):
+    """Test suite for baseline comparison."""
+
+    def test_statuses(self):
+        """Test regression, improvement, ok and new statuses."""
+        baseline = {'a': {'items_per_second': 100.0}, 'b': {'items_per_second': 100.0},
+                    'c': {'items_per_second': 100.0}}
+        current = {'a': {'items_per_second': 80.0}, 'b': {'items_per_second': 125.0},
+                   'c': {'items_per_second': 95.0}, 'd': {'items_per_second': 1.0}}
+        statuses = {entry['name']: entry['status']
+                    for entry in compare_results(current, baseline, threshold=0.1)}
+        self.assertEqual(statuses, {'a': 'regression', 'b': 'improvement', 'c': 'ok', 'd': 'new'})
+
+        loose = compare_results(current, baseline, threshold=0.25)
+        self.assertEqual(loose[0]['status'], 'ok')
+        self.assertAlmostEqual(loose[0]['change'], -0.2)
+
+    def test_load_results(self):
+        """Test loading results documents."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'results.json')
+            with open(path, 'w') as f:
+                json.dump(results_document({'a': {'items_per_second': 1.0}}, scale=1.0), f)
+            self.assertEqual(load_results(path), {'a': {'items_per_second': 1.0}})
+
+            with open(path, 'w') as f:
+                json.dump([1, 2], f)
+            with self.assertRaises(ValueError):
+                load_results(path)
+
+
+class TestBenchCLI(unittest.TestCase):
+    """Test suite for gq bench."""
+
+    def run_bench(self, *args):
+        return subprocess.run(
+            [sys.executable, "-m", "gq.cli.main", "bench", *args],
+            capture_output=True, text=True
+        )
+
+    def test_json_and_compare(self):
+        """Test writing JSON and failing on a regression against a baseline."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'baseline.json')
+            result = self.run_bench("gqs1", "--scale", "0.01", "-r", "2", "--json", path)
+            self.assertEqual(result.returncode, 0, result.stderr)
+            with open(path) as f:
+                document = json.load(f)
+            self.assertEqual(document['config'], {'warmup': 1, 'repetitions': 2, 'scale': 0.01})
+            self.assertEqual(list(document['results']), ['gqs1'])
+            self.assertEqual(document['results']['gqs1']['repetitions'], 2)
+
+            # A baseline far faster than possible must be flagged
+            document['results']['gqs1']['items_per_second'] *= 1000
+            with open(path, 'w') as f:
+                json.dump(document, f)
+            result = self.run_bench("gqs1", "--scale", "0.01", "--compare", path)
+            self.assertEqual(result.returncode, 1)
+            self.assertIn("regression", result.stdout)
+
+    def test_json_stdout_and_list(self):
+        """Test JSON on stdout and listing cases."""
+        result = self.run_bench("coin-flip", "--scale", "0.001", "--json", "-")
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn('coin-flip', json.loads(result.stdout)['results'])
+
+        listing = self.run_bench("--list", "watermark")
+        self.assertEqual(listing.returncode, 0)
+        self.assertEqual(len(listing.stdout.strip().splitlines()), 2)
+
+    def test_invalid_arguments(self):
+        """Test invalid arguments exit with status 1."""
+        self.assertEqual(self.run_bench("nope").returncode, 1)
+        self.assertEqual(self.run_bench("-r", "0").returncode, 1)
+        self.assertEqual(self.run_bench("--compare", "/nonexistent.json").returncode, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
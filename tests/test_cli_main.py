@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Tests for the unified gq command
+
+Tests validate:
+- Dispatch to each subcommand with output identical to the standalone tools
+- Lazy import of subcommand modules
+- Startup time of a minimal key generation call
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.gq.cli.main import SUBCOMMANDS, format_usage
+
+
+# Wall-clock budget for `gq universal -n 1 -q`, interpreter startup included
+STARTUP_BUDGET_SECONDS = 1.0
+
+# Best of this many runs is compared with the budget, to absorb machine noise
+STARTUP_RUNS = 5
+
+
+def run_gq(*args, **kwargs):
+    """Run the gq command through the module entry point."""
+    return subprocess.run(
+        [sys.executable, "-m", "gq.cli.main", *args],
+        capture_output=True, text=True, **kwargs
+    )
+
+
+class TestDispatch(unittest.TestCase):
+    """Test suite for subcommand dispatch."""
+
+    def test_universal_matches_standalone(self):
+        """Test gq universal prints the same keys as gq-universal."""
+        unified = run_gq("universal", "-n", "3", "-q")
+        standalone = subprocess.run(
+            [sys.executable, "-m", "gq.cli.universal", "-n", "3", "-q"],
+            capture_output=True, text=True
+        )
+        self.assertEqual(unified.returncode, 0, unified.stderr)
+        self.assertEqual(unified.stdout, standalone.stdout)
+        self.assertTrue(unified.stdout.startswith("3c732e0d04dac163a5cc2b15c7caf42c"))
+
+    def test_gqs1_and_coin_flip(self):
+        """Test gq gqs1 and gq coin-flip dispatch."""
+        gqs1 = run_gq("gqs1", "-n", "1", "-q")
+        self.assertEqual(gqs1.returncode, 0, gqs1.stderr)
+        self.assertIn("a01611f01e8207a27c1529c3650c4838", gqs1.stdout)
+
+        coin = run_gq("coin-flip", "-n", "10", "-q")
+        self.assertEqual(coin.returncode, 0, coin.stderr)
+        self.assertEqual(coin.stdout.strip(), "1010010110")
+
+    def test_subcommand_exit_codes(self):
+        """Test subcommand exit codes are propagated."""
+        self.assertEqual(run_gq("coin-flip", "-n", "0", "-q").returncode, 1)
+        self.assertEqual(run_gq("universal", "-n", "0", "-q").returncode, 1)
+
+    def test_help_and_unknown_command(self):
+        """Test top-level help, missing and unknown commands."""
+        help_run = run_gq("--help")
+        self.assertEqual(help_run.returncode, 0)
+        for name in SUBCOMMANDS:
+            self.assertIn(name, help_run.stdout)
+        self.assertEqual(help_run.stdout.strip(), format_usage())
+
+        self.assertEqual(run_gq().returncode, 2)
+        unknown = run_gq("nope")
+        self.assertEqual(unknown.returncode, 2)
+        self.assertIn("unknown command 'nope'", unknown.stderr)
+
+    def test_subcommand_help_prog(self):
+        """Test subcommand help shows the gq program name."""
+        result = run_gq("gqs1", "--help")
+        self.assertEqual(result.returncode, 0)
+        self.assertIn("usage: gq gqs1", result.stdout)
+
+    def test_python_m_gq(self):
+        """Test python -m gq dispatches like gq."""
+        result = subprocess.run([sys.executable, "-m", "gq", "--version"],
+                                capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0)
+        self.assertTrue(result.stdout.startswith("gq "))
+
+    def test_watermark_roundtrip(self):
+        """Test gq watermark embed and verify."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir) / "seed.bin"
+            source.write_bytes(bytes(range(256)) * 10)
+            output = Path(tmpdir) / "licensed.bin"
+            env = dict(os.environ, WATERMARK_SECRET="cli-secret")
+
+            embed = run_gq("watermark", "embed", str(source), str(output),
+                           "--license-id", "LIC-CLI", "--user-info", "CLI User", env=env)
+            self.assertEqual(embed.returncode, 0, embed.stderr)
+
+            verify = run_gq("watermark", "verify", str(output),
+                            "--secret", "old", "--secret", "cli-secret")
+            self.assertEqual(verify.returncode, 0, verify.stderr)
+            result = json.loads(verify.stdout)
+            self.assertEqual(result['key_index'], 1)
+            self.assertEqual(result['watermark']['license_id'], "LIC-CLI")
+
+            wrong = run_gq("watermark", "verify", str(output), "--secret", "old")
+            self.assertEqual(wrong.returncode, 1)
+
+    def test_watermark_exit_codes(self):
+        """Test verify and scan exit 2 when there is no watermark, like the script."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            plain = Path(tmpdir) / "plain.bin"
+            plain.write_bytes(bytes(range(256)) * 10)
+            script = Path(__file__).resolve().parent.parent / "scripts" / "verify_watermark.py"
+
+            verify = run_gq("watermark", "verify", str(plain), "--secret", "s")
+            self.assertEqual(verify.returncode, 2, verify.stderr)
+            self.assertFalse(json.loads(verify.stdout)['verified'])
+
+            scan = run_gq("watermark", "scan", str(plain), "--secret", "s")
+            self.assertEqual(scan.returncode, 2, scan.stderr)
+            self.assertEqual(json.loads(scan.stdout.splitlines()[-1])['summary']['trailers'], 0)
+            legacy = subprocess.run([sys.executable, str(script), "--scan", str(plain),
+                                     "--secret", "s"], capture_output=True, text=True)
+            self.assertEqual(legacy.returncode, scan.returncode)
+            self.assertEqual(legacy.stdout, scan.stdout)
+
+    def test_bench(self):
+        """Test gq bench runs selected benchmarks."""
+        result = run_gq("bench", "gqs1", "--scale", "0.01")
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("vectors/s", result.stdout)
+        self.assertEqual(run_gq("bench", "nope").returncode, 1)
+
+
+class TestLazyDispatch(unittest.TestCase):
+    """Test suite for lazy subcommand imports and startup time."""
+
+    def test_only_dispatched_module_imported(self):
+        """Test dispatching universal imports no other subcommand module."""
+        code = (
+            "import sys\n"
+            "from gq.cli.main import main\n"
+            "sys.argv = ['gq', 'universal', '-n', '1', '-q']\n"
+            "main()\n"
+            "print(sorted(m for m in sys.modules if m.startswith('gq.cli')))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        loaded = result.stdout.strip().splitlines()[-1]
+        self.assertEqual(loaded, "['gq.cli', 'gq.cli.main', 'gq.cli.universal']")
+
+    def test_startup_budget(self):
+        """Test `gq universal -n 1 -q` stays within its wall-clock budget."""
+        timings = []
+        for _ in range(STARTUP_RUNS):
+            start = time.perf_counter()
+            result = run_gq("universal", "-n", "1", "-q")
+            timings.append(time.perf_counter() - start)
+            self.assertEqual(result.returncode, 0, result.stderr)
+
+        self.assertLess(
+            min(timings), STARTUP_BUDGET_SECONDS,
+            f"gq universal -n 1 -q took {min(timings):.3f}s "
+            f"(budget {STARTUP_BUDGET_SECONDS}s)"
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,6 +8,12 @@ Author: GitHub Copilot
 Date: 2026-01-05
 """
 
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import tracemalloc
 import unittest
 import math
 from src.gq.golden_ratio_coin_flip import (
@@ -18,7 +24,15 @@ from src.gq.golden_ratio_coin_flip import (
     PerformanceMetricsValidator,
     fractional_part,
     PHI,
-    comprehensive_validation
+    MAX_PATTERN_LENGTH,
+    comprehensive_validation,
+    pack_flips
+)
+from src.gq import golden_ratio_coin_flip as coin_flip_module
+from src.gq.cli.golden_ratio_coin_flip import (
+    format_flips,
+    format_packed_flips,
+    write_flips,
 )
 
 
@@ -203,6 +217,208 @@ class TestQuasirandomnessValidator(unittest.TestCase):
         self.assertIn('passed', result)
 
 
+class TestRollingPatternCounts(unittest.TestCase):
+    """Test rolling window code serial and poker tests."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.flips = GoldenRatioCoinFlip().generate_sequence(5000)
+    
+    def reference_serial_chi_square(self, flips, length):
+        """Chi-square over all patterns using explicit tuple counting."""
+        counts = {}
+        for i in range(len(flips) - length + 1):
+            pattern = tuple(flips[i:i + length])
+            counts[pattern] = counts.get(pattern, 0) + 1
+        expected = (len(flips) - length + 1) / 2 ** length
+        missing = 2 ** length - len(counts)
+        return (sum((c - expected) ** 2 / expected for c in counts.values())
+                + missing * expected)
+    
+    def test_serial_matches_tuple_counting(self):
+        """Test window codes agree with explicit pattern counting."""
+        for length in [1, 2, 3, 6]:
+            result = QuasirandomnessValidator.serial_test(self.flips, length)
+            self.assertAlmostEqual(
+                result['chi_square'],
+                self.reference_serial_chi_square(self.flips, length),
+                places=6
+            )
+    
+    def test_quasirandom_pattern_complexity(self):
+        """Test {Z·φ} flips show only 2L distinct patterns of length L."""
+        for length in [3, 8, 12]:
+            result = QuasirandomnessValidator.serial_test(self.flips, length)
+            self.assertEqual(result['observed_patterns'], 2 * length)
+            self.assertFalse(result['passed'])
+    
+    def test_packed_input_matches_list(self):
+        """Test packed bytes give the same results as a list of flips."""
+        flips = self.flips[:4997]  # Not a multiple of 8
+        packed = pack_flips(flips)
+        for overlapping in [True, False]:
+            self.assertEqual(
+                QuasirandomnessValidator.serial_test(
+                    packed, 5, overlapping, num_flips=len(flips)),
+                QuasirandomnessValidator.serial_test(flips, 5, overlapping)
+            )
+            self.assertEqual(
+                QuasirandomnessValidator.poker_test(
+                    packed, 5, overlapping, num_flips=len(flips)),
+                QuasirandomnessValidator.poker_test(flips, 5, overlapping)
+            )
+    
+    def test_non_overlapping_window_count(self):
+        """Test non-overlapping mode counts disjoint blocks."""
+        result = QuasirandomnessValidator.serial_test(self.flips, 7, overlapping=False)
+        self.assertEqual(result['total_patterns'], len(self.flips) // 7)
+        
+        result = QuasirandomnessValidator.poker_test(self.flips, 4, overlapping=True)
+        self.assertEqual(result['num_hands'], len(self.flips) - 3)
+    
+    def test_max_pattern_length(self):
+        """Test the longest supported patterns and rejection beyond it."""
+        result = QuasirandomnessValidator.serial_test(self.flips, MAX_PATTERN_LENGTH)
+        self.assertEqual(result['num_patterns'], 2 ** MAX_PATTERN_LENGTH)
+        self.assertEqual(result['observed_patterns'], 2 * MAX_PATTERN_LENGTH)
+        
+        with self.assertRaises(ValueError):
+            QuasirandomnessValidator.serial_test(self.flips, MAX_PATTERN_LENGTH + 1)
+        with self.assertRaises(ValueError):
+            QuasirandomnessValidator.poker_test(self.flips, 0)
+    
+    @unittest.skipIf(coin_flip_module.np is None, "numpy not installed")
+    def test_pure_python_fallback_matches_numpy(self):
+        """Test the pure Python counting path gives identical statistics."""
+        packed = pack_flips(self.flips)
+        expected_serial = QuasirandomnessValidator.serial_test(self.flips, 9)
+        expected_poker = QuasirandomnessValidator.poker_test(packed, 6, True)
+        
+        np_module = coin_flip_module.np
+        coin_flip_module.np = None
+        try:
+            serial = QuasirandomnessValidator.serial_test(self.flips, 9)
+            poker = QuasirandomnessValidator.poker_test(packed, 6, True)
+        finally:
+            coin_flip_module.np = np_module
+        
+        self.assertAlmostEqual(serial['chi_square'], expected_serial['chi_square'], places=6)
+        self.assertEqual(serial['observed_patterns'], expected_serial['observed_patterns'])
+        self.assertAlmostEqual(poker['chi_square'], expected_poker['chi_square'], places=6)
+
+
+class TestPackedFlips(unittest.TestCase):
+    """Test ranged and packed flip generation."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.generator = GoldenRatioCoinFlip()
+    
+    def test_generate_range(self):
+        """Test ranged generation matches per-Z coin flips."""
+        flips = self.generator.generate_range(1000, 50)
+        self.assertEqual(flips, [self.generator.coin_flip(z) for z in range(1000, 1050)])
+        self.assertEqual(self.generator.generate_range(1, 300),
+                         self.generator.generate_sequence(300))
+    
+    def test_pack_flips(self):
+        """Test packing is MSB first with zero padding."""
+        self.assertEqual(pack_flips([1, 0, 1, 1, 0, 0, 0, 1, 1]), bytes([0xB1, 0x80]))
+        self.assertEqual(pack_flips([]), b'')
+    
+    def test_generate_packed_matches_sequence(self):
+        """Test packed generation equals packing the flip list."""
+        for count, start in [(1, 1), (8, 1), (1001, 1), (333, 98765)]:
+            self.assertEqual(
+                self.generator.generate_packed(count, start),
+                pack_flips(self.generator.generate_range(start, count))
+            )
+    
+    def test_generate_packed_chunks_concatenate(self):
+        """Test byte-aligned chunks concatenate to one long packed run."""
+        whole = self.generator.generate_packed(4096)
+        chunks = b''.join(self.generator.generate_packed(512, start)
+                          for start in range(1, 4097, 512))
+        self.assertEqual(whole, chunks)
+
+
+class TestCoinFlipCLI(unittest.TestCase):
+    """Test streaming output of the coin flip CLI."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.generator = GoldenRatioCoinFlip()
+    
+    def run_cli(self, args, text=True):
+        """Helper method to run CLI and capture output."""
+        return subprocess.run(
+            [sys.executable, "-m", "gq.cli.golden_ratio_coin_flip"] + args,
+            capture_output=True,
+            text=text
+        )
+    
+    def test_format_packed_matches_format_flips(self):
+        """Test formatting packed flips matches formatting the list."""
+        flips = self.generator.generate_sequence(123)
+        packed = pack_flips(flips)
+        for fmt in ['binary', 'text', 'list']:
+            self.assertEqual(format_packed_flips(packed, 123, fmt),
+                             format_flips(flips, fmt))
+    
+    def test_chunked_writes_match_single_chunk(self):
+        """Test output is independent of the chunk size."""
+        for fmt in ['binary', 'text', 'list']:
+            whole, chunked = io.StringIO(), io.StringIO()
+            heads = write_flips(whole, self.generator, 1000, 7, fmt)
+            chunked_heads = write_flips(chunked, self.generator, 1000, 7, fmt,
+                                        chunk_size=160)
+            self.assertEqual(whole.getvalue(), chunked.getvalue())
+            self.assertEqual(heads, chunked_heads)
+        
+        raw = io.BytesIO()
+        heads = write_flips(raw, self.generator, 1000, 7, 'raw', chunk_size=64)
+        self.assertEqual(raw.getvalue(), self.generator.generate_packed(1000, 7))
+        self.assertEqual(heads, self.generator.generate_range(7, 1000).count(0))
+    
+    def test_cli_raw_output(self):
+        """Test raw output is pure packed flips with stats on stderr."""
+        result = self.run_cli(["-n", "1000", "--format", "raw", "--start", "42"],
+                              text=False)
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual(result.stdout, self.generator.generate_packed(1000, 42))
+        self.assertIn(b"Statistics:", result.stderr)
+    
+    def test_cli_raw_file_output(self):
+        """Test raw output to a file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "flips.bin")
+            result = self.run_cli(["-n", "20000", "--format", "raw", "-q", "-o", path])
+            self.assertEqual(result.returncode, 0)
+            with open(path, 'rb') as f:
+                self.assertEqual(f.read(), self.generator.generate_packed(20000))
+    
+    def test_cli_binary_output(self):
+        """Test default quiet output is 80-character lines of flips."""
+        result = self.run_cli(["-n", "200", "-q"])
+        self.assertEqual(result.returncode, 0)
+        lines = result.stdout.split('\n')
+        self.assertEqual([len(line) for line in lines], [80, 80, 40, 0])
+        self.assertEqual(''.join(lines), format_flips(self.generator.generate_sequence(200)))
+    
+    def test_cli_budgeted_validation(self):
+        """Test budgeted validation reports stages as it goes."""
+        result = self.run_cli(["--validate", "--memory-budget", "1", "-q"])
+        self.assertEqual(result.returncode, 0)
+        self.assertIn("Stage z_max=1000", result.stderr)
+        self.assertIn("Stage z_max=10000", result.stderr)
+        self.assertNotIn("Stage z_max=100000", result.stderr)
+    
+    def test_cli_invalid_num_flips(self):
+        """Test a non-positive flip count is rejected."""
+        result = self.run_cli(["-n", "0"])
+        self.assertEqual(result.returncode, 1)
+
+
 class TestPerformanceMetricsValidator(unittest.TestCase):
     """Test performance metrics validation."""
     
@@ -223,6 +439,40 @@ class TestPerformanceMetricsValidator(unittest.TestCase):
             self.assertLessEqual(last_deviation, first_deviation * 1.5,
                                "Deviation increased significantly, not converging")
     
+    def test_progressive_validation_memory_budget(self):
+        """Test stages stop before exceeding the memory budget."""
+        budget = 20000 * PerformanceMetricsValidator.VALIDATION_BYTES_PER_Z
+        stages = list(PerformanceMetricsValidator.progressive_validation(
+            memory_budget=budget))
+        self.assertEqual([r['z_max'] for r in stages], [1000, 10000])
+        self.assertTrue(all('elapsed_seconds' in r for r in stages))
+    
+    def test_validation_memory_estimate(self):
+        """Test VALIDATION_BYTES_PER_Z covers the traced peak of a stage."""
+        z_max = 50000
+        tracemalloc.start()
+        try:
+            PerformanceMetricsValidator.large_scale_validation(z_max)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertLessEqual(peak, z_max * PerformanceMetricsValidator.VALIDATION_BYTES_PER_Z)
+    
+    def test_progressive_validation_max_z(self):
+        """Test the final stage is capped at max_z."""
+        stages = PerformanceMetricsValidator.progressive_validation(
+            max_z=5000, growth=4)
+        self.assertEqual([r['z_max'] for r in stages], [1000, 4000, 5000])
+    
+    def test_progressive_validation_time_budget(self):
+        """Test a zero time budget still reports the first stage."""
+        stages = list(PerformanceMetricsValidator.progressive_validation(
+            time_budget=0.0))
+        self.assertEqual(len(stages), 1)
+        
+        with self.assertRaises(ValueError):
+            next(PerformanceMetricsValidator.progressive_validation())
+    
     def test_large_scale_validation(self):
         """Test large-scale comprehensive validation."""
         result = PerformanceMetricsValidator.large_scale_validation(10000)
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Tests for opt-in generator instrumentation
+
+Tests validate:
+- Nothing is recorded while instrumentation is off
+- Counters and stage timers of GCP-1, GQS-1 and the validators
+- Outputs are identical with instrumentation on
+- Snapshot and Prometheus formats, and the GQ_INSTRUMENT variable
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.gq import instrumentation
+from src.gq.universal_qkd import generate_keys
+from src.gq.gqs1_core import generate_test_vectors
+from src.gq.stream import PROTOCOLS, initial_state
+from src.gq.universal_qkd import HEX_SEED
+from src.gq.golden_ratio_coin_flip import CoinFlipValidator, QuasirandomnessValidator
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Test suite for counters and stage timers."""
+
+    def setUp(self):
+        self.was_enabled = instrumentation.enabled
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def tearDown(self):
+        instrumentation.enabled = self.was_enabled
+        instrumentation.reset()
+
+    def test_disabled_records_nothing(self):
+        """Test generators record nothing while disabled."""
+        generate_keys(3)
+        generate_test_vectors(3)
+        CoinFlipValidator.runs_test([0, 1] * 10)
+        stats = instrumentation.snapshot()
+        self.assertEqual(stats['counters'], {})
+        self.assertEqual(stats['stages'], {})
+        self.assertFalse(stats['enabled'])
+
+    def test_gcp1_counters(self):
+        """Test GCP-1 counters are consistent with the sifting process."""
+        with instrumentation.instrumented():
+            keys = generate_keys(20)
+        self.assertEqual(keys, generate_keys(20))
+
+        stats = instrumentation.snapshot()
+        counters = stats['counters']
+        self.assertEqual(counters['gcp1_outputs_total'], 20)
+        self.assertEqual(counters['gcp1_bits_accepted_total'], 20 * 256)
+        hashes = counters['gcp1_hash_calls_total']
+        self.assertGreaterEqual(hashes, 20 * 8)
+        # Every examined byte is either accepted or discarded
+        examined = counters['gcp1_bits_accepted_total'] + counters['gcp1_bits_discarded_total']
+        self.assertLessEqual(examined, hashes * 32)
+        self.assertGreater(examined, (hashes - 20) * 32)
+
+        stages = stats['stages']
+        self.assertEqual(stages['gcp1.sha256']['calls'], hashes)
+        for stage in ('gcp1.sift', 'gcp1.fold', 'gcp1.hex'):
+            self.assertEqual(stages[stage]['calls'], 20, stage)
+            self.assertGreaterEqual(stages[stage]['seconds'], 0.0)
+
+    def test_gqs1_counters(self):
+        """Test GQS-1 counters and identical vectors."""
+        with instrumentation.instrumented():
+            vectors = generate_test_vectors(7)
+        self.assertEqual(vectors, generate_test_vectors(7))
+
+        stats = instrumentation.snapshot()
+        self.assertEqual(stats['counters'], {'gqs1_hash_calls_total': 7, 'gqs1_outputs_total': 7})
+        for stage in ('gqs1.sha256', 'gqs1.sift', 'gqs1.fold', 'gqs1.hex'):
+            self.assertEqual(stats['stages'][stage]['calls'], 7, stage)
+
+    def test_stream_server_steps(self):
+        """Test outputs served by the stream server are counted too."""
+        with instrumentation.instrumented():
+            for protocol in ('gcp1', 'gqs1'):
+                _, step = PROTOCOLS[protocol]
+                state = initial_state(protocol, HEX_SEED)
+                for _ in range(5):
+                    _, state = step(state)
+        stats = instrumentation.snapshot()
+        self.assertEqual(stats['counters']['gcp1_outputs_total'], 5)
+        self.assertEqual(stats['counters']['gqs1_outputs_total'], 5)
+        self.assertEqual(stats['stages']['gcp1.fold']['calls'], 5)
+        self.assertEqual(stats['stages']['gqs1.sift']['calls'], 5)
+
+    def test_validator_stages(self):
+        """Test validator calls are timed per method."""
+        with instrumentation.instrumented():
+            CoinFlipValidator.runs_test([0, 1, 1, 0] * 25)
+            CoinFlipValidator.runs_test([1, 0] * 50)
+            QuasirandomnessValidator.serial_test([0, 1, 1, 0] * 25)
+        stages = instrumentation.snapshot()['stages']
+        self.assertEqual(stages['coin_flip.runs_test']['calls'], 2)
+        self.assertEqual(stages['coin_flip.serial_test']['calls'], 1)
+        self.assertEqual(CoinFlipValidator.runs_test.__name__, 'runs_test')
+
+    def test_context_manager_restores_state(self):
+        """Test nesting and the reset_first flag."""
+        with instrumentation.instrumented():
+            generate_test_vectors(1)
+            with instrumentation.instrumented(reset_first=False):
+                generate_test_vectors(1)
+            self.assertTrue(instrumentation.enabled)
+        self.assertFalse(instrumentation.enabled)
+        self.assertEqual(instrumentation.snapshot()['counters']['gqs1_outputs_total'], 2)
+
+        instrumentation.enable()
+        generate_test_vectors(1)
+        instrumentation.disable()
+        self.assertEqual(instrumentation.snapshot()['counters']['gqs1_outputs_total'], 3)
+
+    def test_prometheus_format(self):
+        """Test the Prometheus exposition text."""
+        self.assertEqual(instrumentation.to_prometheus(), "")
+        with instrumentation.instrumented():
+            generate_test_vectors(2)
+        text = instrumentation.to_prometheus()
+        lines = text.splitlines()
+        self.assertIn("# TYPE gq_gqs1_outputs_total counter", lines)
+        self.assertIn("gq_gqs1_outputs_total 2", lines)
+        self.assertIn('gq_stage_calls_total{stage="gqs1.sha256"} 2', lines)
+        self.assertTrue(any(line.startswith('gq_stage_seconds_total{stage="gqs1.fold"} ')
+                            for line in lines))
+        self.assertTrue(text.endswith("\n"))
+
+    def test_environment_variable(self):
+        """Test GQ_INSTRUMENT enables instrumentation at import."""
+        code = (
+            "from gq import instrumentation\n"
+            "from gq.gqs1_core import generate_test_vectors\n"
+            "generate_test_vectors(3)\n"
+            "print(instrumentation.enabled, instrumentation.snapshot()['counters'].get('gqs1_outputs_total'))\n"
+        )
+        for value, expected in (('1', 'True 3'), ('on', 'True 3'), ('0', 'False None'), ('', 'False None')):
+            env = dict(os.environ, GQ_INSTRUMENT=value)
+            result = subprocess.run([sys.executable, "-c", code], capture_output=True,
+                                    text=True, env=env)
+            self.assertEqual(result.returncode, 0, result.stderr)
+            self.assertEqual(result.stdout.strip(), expected, value)
+
+
+if __name__ == '__main__':
+    unittest.main()
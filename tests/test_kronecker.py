@@ -0,0 +1,167 @@
+"""
+Unit tests for the R_d Kronecker low-discrepancy sequence.
+
+Tests validate:
+- Generalized golden ratios and fixed-point step sizes
+- Agreement with the 1-D golden ratio sequence {Z·φ}
+- Exact fixed-point stepping at arbitrary offsets
+- Batched (N×d) output
+- Cranley-Patterson shifts drawn from GoldenSeed streams
+- L2-star discrepancy estimation
+"""
+
+import math
+import os
+import sys
+import unittest
+
+# Add repository root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gq.golden_ratio_coin_flip import GoldenRatioCoinFlip
+from gq.kronecker import (
+    FIXED_ONE,
+    KroneckerSequence,
+    generalized_golden_ratio,
+    kronecker_alphas_fixed,
+    l2_star_discrepancy,
+)
+from gq.stream import GoldenStream
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestGeneralizedGoldenRatio(unittest.TestCase):
+    """Test generalized golden ratio constants."""
+
+    def test_known_values(self):
+        """Test golden ratio and plastic number."""
+        self.assertAlmostEqual(generalized_golden_ratio(1), (1 + math.sqrt(5)) / 2, places=15)
+        self.assertAlmostEqual(generalized_golden_ratio(2), 1.324717957244746, places=15)
+
+    def test_defining_equation(self):
+        """Test φ_d^(d+1) = φ_d + 1."""
+        for d in range(1, 10):
+            phi_d = generalized_golden_ratio(d)
+            self.assertAlmostEqual(phi_d ** (d + 1), phi_d + 1, places=12)
+
+    def test_fixed_point_alphas(self):
+        """Test fixed-point step sizes are φ_d^(-i) scaled by 2^64."""
+        phi_3 = generalized_golden_ratio(3)
+        for i, a in enumerate(kronecker_alphas_fixed(3), 1):
+            self.assertTrue(0 < a < FIXED_ONE)
+            self.assertAlmostEqual(a / FIXED_ONE, phi_3 ** -i, places=15)
+
+    def test_invalid_dimensions(self):
+        """Test dimensions below 1 are rejected."""
+        with self.assertRaises(ValueError):
+            KroneckerSequence(0)
+
+
+class TestKroneckerSequence(unittest.TestCase):
+    """Test single-point R_d generation."""
+
+    def test_one_dimension_matches_coin_flip_sequence(self):
+        """Test R_1 reproduces {Z·φ}."""
+        seq = KroneckerSequence(1)
+        coin = GoldenRatioCoinFlip()
+        for z in range(1, 200):
+            self.assertAlmostEqual(seq.point(z)[0], coin.fractional_value(z), places=12)
+
+    def test_points_in_unit_cube(self):
+        """Test all coordinates lie in [0, 1)."""
+        seq = KroneckerSequence(5)
+        for z in range(-50, 50):
+            point = seq.point(z)
+            self.assertEqual(len(point), 5)
+            self.assertTrue(all(0.0 <= c < 1.0 for c in point))
+
+    def test_exact_stepping_at_large_offsets(self):
+        """Test fixed-point points are additive: x_(a+b) = x_a + b·α mod 1."""
+        seq = KroneckerSequence(3)
+        base = 10 ** 40
+        for k in range(10):
+            expected = tuple((c + k * a) % FIXED_ONE
+                             for c, a in zip(seq.point_fixed(base), seq.alphas_fixed))
+            self.assertEqual(seq.point_fixed(base + k), expected)
+
+    def test_explicit_shift(self):
+        """Test an explicit shift moves every coordinate modulo 1."""
+        plain = KroneckerSequence(2)
+        shifted = KroneckerSequence(2, shift=[0.5, 0.25])
+        for z in range(1, 20):
+            for p, s, offset in zip(plain.point(z), shifted.point(z), (0.5, 0.25)):
+                self.assertAlmostEqual((p + offset) % 1.0, s, places=12)
+
+        with self.assertRaises(ValueError):
+            KroneckerSequence(2, shift=[0.5])
+
+    def test_cranley_patterson_shift_from_stream(self):
+        """Test random shifts are drawn deterministically from the stream."""
+        seq = KroneckerSequence(3)
+        stream = GoldenStream()
+        shifted = seq.cranley_patterson_shift(stream)
+        self.assertEqual(stream.tell(), 24)
+
+        raw = GoldenStream().read(24)
+        expected = [int.from_bytes(raw[i:i + 8], 'big') for i in range(0, 24, 8)]
+        self.assertEqual(shifted.shift_fixed, expected)
+        self.assertEqual(seq.shift_fixed, [0, 0, 0])
+
+        again = seq.cranley_patterson_shift()
+        self.assertEqual(again.shift_fixed, expected)
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestBatchedKronecker(unittest.TestCase):
+    """Test batched NumPy output and discrepancy estimation."""
+
+    def test_batched_matches_single_points(self):
+        """Test (N×d) output agrees with point() at an arbitrary start."""
+        seq = KroneckerSequence(4).cranley_patterson_shift()
+        start = 2 ** 70 + 12345
+        batch = seq.points(100, start=start)
+        self.assertEqual(batch.shape, (100, 4))
+        for i in range(100):
+            self.assertEqual(tuple(batch[i]), seq.point(start + i))
+
+    def test_batched_fixed_points_exact(self):
+        """Test fixed-point batches are exact integers."""
+        seq = KroneckerSequence(2)
+        batch = seq.points_fixed(50, start=-7)
+        for i in range(50):
+            self.assertEqual(tuple(int(c) for c in batch[i]), seq.point_fixed(i - 7))
+
+    def test_one_dimensional_discrepancy(self):
+        """Test the estimator against the closed-form 1-D L2-star discrepancy."""
+        n = 400
+        x = np.sort(KroneckerSequence(1).points(n)[:, 0])
+        expected = math.sqrt(
+            1 / (12 * n * n)
+            + np.sum((x - (2 * np.arange(1, n + 1) - 1) / (2 * n)) ** 2) / n
+        )
+        self.assertAlmostEqual(l2_star_discrepancy(x), expected, places=12)
+
+    def test_block_size_does_not_change_result(self):
+        """Test blocked evaluation gives the same discrepancy."""
+        points = KroneckerSequence(3).points(300)
+        self.assertAlmostEqual(
+            l2_star_discrepancy(points, block_size=7),
+            l2_star_discrepancy(points),
+            places=12
+        )
+
+    def test_lower_discrepancy_than_stream_bytes(self):
+        """Test R_d points beat uniform points built from stream bytes."""
+        n, d = 2000, 3
+        raw = np.frombuffer(GoldenStream().read(n * d * 2), dtype='>u2')
+        pseudo = raw.reshape(n, d) / 65536.0
+        qmc = KroneckerSequence(d).points(n)
+        self.assertLess(l2_star_discrepancy(qmc), l2_star_discrepancy(pseudo) / 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
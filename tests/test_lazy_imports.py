@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Tests for lazy attribute loading in the gq package
+
+Tests validate:
+- `import gq` imports no submodules, numpy or stdlib heavyweights
+- Every name in __all__ resolves to the submodule object
+- Import time stays within a budget (measured with python -X importtime)
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import src.gq as gq_package
+
+
+# Budget for the cumulative `import gq` time reported by -X importtime
+IMPORT_BUDGET_SECONDS = 0.05
+
+# Best of this many runs is compared with the budget, to absorb machine noise
+IMPORT_RUNS = 5
+
+# Modules `import gq` must not pull in
+HEAVY_MODULES = ('numpy', 'argparse', 'json', 'hmac', 'datetime', 'sqlite3')
+
+
+def run_python(code, *flags):
+    """Run code in a fresh interpreter and return the completed process."""
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        capture_output=True, text=True
+    )
+
+
+def gq_import_time():
+    """Return the cumulative `import gq` time in seconds from -X importtime."""
+    result = run_python("import gq", "-X", "importtime")
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        fields = line.split('|')
+        if len(fields) == 3 and fields[2].strip() == 'gq':
+            return int(fields[1]) / 1e6
+    raise AssertionError(f"gq not found in -X importtime output:\n{result.stderr}")
+
+
+class TestLazyImports(unittest.TestCase):
+    """Test suite for PEP 562 lazy loading."""
+
+    def test_import_loads_no_submodules(self):
+        """Test `import gq` leaves submodules and heavy modules unloaded."""
+        code = (
+            "import sys\n"
+            f"before = set(m for m in {HEAVY_MODULES!r} if m in sys.modules)\n"
+            "import gq\n"
+            "print(sorted(m for m in sys.modules if m.startswith('gq')))\n"
+            f"print(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules and m not in before))\n"
+        )
+        result = run_python(code)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        gq_modules, heavy = result.stdout.strip().splitlines()
+        self.assertEqual(gq_modules, "['gq']")
+        self.assertEqual(heavy, "[]")
+
+    def test_attribute_loads_only_its_submodule(self):
+        """Test accessing UniversalQKD imports only universal_qkd."""
+        code = (
+            "import sys\n"
+            "import gq\n"
+            "print(next(gq.UniversalQKD()).hex())\n"
+            "print(sorted(m for m in sys.modules if m.startswith('gq')))\n"
+        )
+        result = run_python(code)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        key, modules = result.stdout.strip().splitlines()
+        self.assertEqual(key, "3c732e0d04dac163a5cc2b15c7caf42c")
+        self.assertEqual(modules, "['gq', 'gq.instrumentation', 'gq.universal_qkd']")
+
+    def test_all_names_resolve(self):
+        """Test every name in __all__ resolves to the submodule's object."""
+        self.assertEqual(set(gq_package.__all__), set(gq_package._LAZY_ATTRIBUTES))
+        for name in gq_package.__all__:
+            module_name, attribute = gq_package._LAZY_ATTRIBUTES[name]
+            module = sys.modules.get('src.gq' + module_name) or __import__(
+                'src.gq' + module_name, fromlist=[attribute]
+            )
+            self.assertIs(getattr(gq_package, name), getattr(module, attribute), name)
+
+    def test_star_import_and_dir(self):
+        """Test star import and dir() expose every public name."""
+        namespace = {}
+        exec("from src.gq import *", namespace)
+        for name in gq_package.__all__:
+            self.assertIn(name, namespace)
+            self.assertIn(name, dir(gq_package))
+
+    def test_unknown_attribute(self):
+        """Test unknown attributes raise AttributeError."""
+        with self.assertRaises(AttributeError):
+            gq_package.no_such_name
+        self.assertFalse(hasattr(gq_package, 'no_such_name'))
+
+    def test_import_time_budget(self):
+        """Test `import gq` stays within its import-time budget."""
+        best = min(gq_import_time() for _ in range(IMPORT_RUNS))
+        self.assertLess(
+            best, IMPORT_BUDGET_SECONDS,
+            f"import gq took {best * 1000:.1f}ms (budget {IMPORT_BUDGET_SECONDS * 1000:.0f}ms)"
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
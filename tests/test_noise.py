@@ -0,0 +1,190 @@
+"""
+Unit tests for GoldenSeed-seeded coherent noise.
+
+Tests validate:
+- Deterministic tables drawn from GoldenSeed streams
+- Value, gradient and simplex noise ranges and continuity
+- Tiles at world offsets matching one large grid
+- Periodic wrapping of value and gradient noise
+- fBm and ridged octave sums
+"""
+
+import os
+import sys
+import unittest
+
+# Add repository root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gq.stream import GoldenStream
+from gq.universal_qkd import universal_qkd_generator
+
+try:
+    import numpy as np
+    from gq.noise import KINDS, CoherentNoise, grid
+except ImportError:
+    np = None
+
+
+def sample_points(count=20000, extent=300.0):
+    """Evenly spread sample coordinates covering many lattice cells."""
+    from gq.kronecker import KroneckerSequence
+    points = KroneckerSequence(2).points(count) * (2 * extent) - extent
+    return points[:, 0], points[:, 1]
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestCoherentNoise(unittest.TestCase):
+    """Test the basis noise functions."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.noise = CoherentNoise()
+
+    def test_deterministic_tables(self):
+        """Test the same stream gives the same noise and another stream differs."""
+        x, y = sample_points(500)
+        other_stream = GoldenStream(universal_qkd_generator())
+        other_stream.read(16)
+        for kind in KINDS:
+            with self.subTest(kind=kind):
+                basis = getattr(self.noise, kind)
+                np.testing.assert_array_equal(basis(x, y), getattr(CoherentNoise(), kind)(x, y))
+                self.assertFalse(np.array_equal(basis(x, y),
+                                                getattr(CoherentNoise(other_stream), kind)(x, y)))
+
+    def test_ranges(self):
+        """Test every basis stays within [-1, 1] and is not degenerate."""
+        x, y = sample_points()
+        for kind in KINDS:
+            with self.subTest(kind=kind):
+                values = getattr(self.noise, kind)(x, y)
+                self.assertLessEqual(np.abs(values).max(), 1.0)
+                self.assertGreater(values.std(), 0.15)
+
+    def test_gradient_zero_on_lattice(self):
+        """Test gradient noise vanishes at integer lattice points."""
+        x, y = np.meshgrid(np.arange(-5, 5), np.arange(-5, 5))
+        np.testing.assert_allclose(self.noise.gradient(x, y), 0.0, atol=1e-12)
+
+    def test_continuity(self):
+        """Test small coordinate steps give small changes (coherence)."""
+        x, y = sample_points(5000)
+        for kind in KINDS:
+            with self.subTest(kind=kind):
+                basis = getattr(self.noise, kind)
+                change = np.abs(basis(x + 1e-3, y) - basis(x, y)).max()
+                self.assertLess(change, 0.02)
+
+    def test_broadcasting(self):
+        """Test coordinate arrays broadcast and scalars are accepted."""
+        values = self.noise.gradient(np.linspace(0, 3, 7)[None, :], np.linspace(0, 2, 5)[:, None])
+        self.assertEqual(values.shape, (5, 7))
+        self.assertEqual(self.noise.simplex(0.3, 0.7).shape, ())
+
+    def test_invalid_table_size(self):
+        """Test table sizes must be powers of two."""
+        for size in (0, 1, 100):
+            with self.subTest(size=size):
+                with self.assertRaises(ValueError):
+                    CoherentNoise(table_size=size)
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestTiling(unittest.TestCase):
+    """Test world offsets and periodic wrapping."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.noise = CoherentNoise()
+
+    def test_grid(self):
+        """Test grid coordinates follow pixel offsets and scale."""
+        x, y = grid(3, 2, x0=10, y0=-4, scale=0.5)
+        np.testing.assert_array_equal(x, [[5.0, 5.5, 6.0], [5.0, 5.5, 6.0]])
+        np.testing.assert_array_equal(y, [[-2.0, -2.0, -2.0], [-1.5, -1.5, -1.5]])
+
+    def test_tiles_match_large_grid(self):
+        """Test tiles generated separately equal the region of one grid."""
+        scale = 1 / 32
+        whole = self.noise.fbm(*grid(128, 96, x0=-64, y0=1000, scale=scale), kind='simplex')
+        for row in (0, 48):
+            for col in (0, 64):
+                with self.subTest(row=row, col=col):
+                    tile = self.noise.fbm(
+                        *grid(64, 48, x0=-64 + col, y0=1000 + row, scale=scale), kind='simplex'
+                    )
+                    np.testing.assert_array_equal(tile, whole[row:row + 48, col:col + 64])
+
+    def test_far_world_offsets(self):
+        """Test coordinates far from the origin stay coherent."""
+        x, y = grid(64, 64, x0=1e9, y0=-1e9, scale=1 / 16)
+        values = self.noise.gradient(x, y)
+        self.assertLessEqual(np.abs(values).max(), 1.0)
+        self.assertLess(np.abs(np.diff(values, axis=1)).max(), 0.5)
+
+    def test_period_wraps(self):
+        """Test value and gradient noise repeat with the given period."""
+        x, y = sample_points(2000, extent=20.0)
+        for kind in ('value', 'gradient'):
+            with self.subTest(kind=kind):
+                basis = getattr(self.noise, kind)
+                np.testing.assert_allclose(basis(x + 5, y - 10, period=5), basis(x, y, period=5),
+                                           atol=1e-9)
+                np.testing.assert_allclose(
+                    self.noise.fbm(x + 3, y, octaves=4, kind=kind, period=3),
+                    self.noise.fbm(x, y, octaves=4, kind=kind, period=3), atol=1e-9
+                )
+
+    def test_invalid_periods(self):
+        """Test unsupported periods are rejected."""
+        with self.assertRaises(ValueError):
+            self.noise.simplex(0.0, 0.0, period=4)
+        with self.assertRaises(ValueError):
+            self.noise.value(0.0, 0.0, period=0)
+        with self.assertRaises(ValueError):
+            self.noise.fbm(0.0, 0.0, lacunarity=1.5, period=4)
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestFractalSums(unittest.TestCase):
+    """Test fBm and ridged octave sums."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.noise = CoherentNoise()
+
+    def test_single_octave_is_basis(self):
+        """Test one octave of fBm equals the basis noise."""
+        x, y = sample_points(1000)
+        np.testing.assert_array_equal(self.noise.fbm(x, y, octaves=1, kind='value'),
+                                      self.noise.value(x, y))
+
+    def test_ranges(self):
+        """Test fBm stays in [-1, 1] and ridged in [0, 1]."""
+        x, y = sample_points(5000)
+        for kind in KINDS:
+            with self.subTest(kind=kind):
+                fbm = self.noise.fbm(x, y, octaves=5, kind=kind)
+                ridged = self.noise.ridged(x, y, octaves=5, kind=kind)
+                self.assertLessEqual(np.abs(fbm).max(), 1.0)
+                self.assertGreaterEqual(ridged.min(), 0.0)
+                self.assertLessEqual(ridged.max(), 1.0)
+
+    def test_octaves_add_detail(self):
+        """Test more octaves add high-frequency variation."""
+        x, y = grid(256, 1, scale=1 / 64)
+        coarse = self.noise.fbm(x, y, octaves=1)
+        fine = self.noise.fbm(x, y, octaves=6)
+        self.assertGreater(np.abs(np.diff(fine)).sum(), np.abs(np.diff(coarse)).sum())
+
+    def test_invalid_arguments(self):
+        """Test unknown kinds and octave counts are rejected."""
+        with self.assertRaises(ValueError):
+            self.noise.fbm(0.0, 0.0, kind='worley')
+        with self.assertRaises(ValueError):
+            self.noise.ridged(0.0, 0.0, octaves=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,202 @@
+"""
+Unit tests for the NumPy BitGenerator over GoldenSeed streams.
+
+Tests validate:
+- Raw words are the stream's bytes read little-endian, across blocks
+- numpy.random.Generator draws through the ctypes capsule
+- State get/set and pickling replay the stream exactly
+- jumped() and spawn() give reproducible, distinct substreams
+- Rejection of unknown protocols and foreign states
+"""
+
+import os
+import pickle
+import sys
+import unittest
+
+# Add repository root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gq.stream import PROTOCOLS, GoldenStream, initial_state
+from gq.universal_qkd import HEX_SEED
+
+try:
+    import numpy as np
+    from gq.numpy import GoldenSeedBitGenerator
+except ImportError:
+    np = None
+
+
+def gqs1_bytes(size):
+    """First size bytes of the GQS-1 stream."""
+    _, step = PROTOCOLS['gqs1']
+    state = initial_state('gqs1', HEX_SEED)
+    outputs = []
+    for _ in range(-(-size // 16)):
+        output, state = step(state)
+        outputs.append(output)
+    return b''.join(outputs)[:size]
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestRawWords(unittest.TestCase):
+    """Test raw words follow the stream."""
+
+    def test_gcp1_matches_stream(self):
+        """Test GCP-1 words equal GoldenStream bytes across block edges."""
+        raw = GoldenSeedBitGenerator(block_outputs=3).random_raw(20)
+        expected = np.frombuffer(GoldenStream().read(160), dtype='<u8')
+        np.testing.assert_array_equal(raw, expected)
+
+    def test_gqs1_matches_test_vectors(self):
+        """Test GQS-1 words equal the test vector stream."""
+        raw = GoldenSeedBitGenerator('gqs1', block_outputs=4).random_raw((3, 4))
+        self.assertEqual(raw.shape, (3, 4))
+        self.assertEqual(raw.astype('<u8').tobytes(), gqs1_bytes(96))
+
+    def test_scalar_and_batched_interleave(self):
+        """Test scalar draws and batched draws share one position."""
+        bit_generator = GoldenSeedBitGenerator('gqs1', block_outputs=2)
+        words = [bit_generator.random_raw()] + bit_generator.random_raw(6).tolist()
+        words.append(bit_generator.random_raw())
+        expected = np.frombuffer(gqs1_bytes(64), dtype='<u8').tolist()
+        self.assertEqual(words, expected)
+
+    def test_output_false_advances(self):
+        """Test random_raw(output=False) advances without returning words."""
+        bit_generator = GoldenSeedBitGenerator('gqs1')
+        self.assertIsNone(bit_generator.random_raw(5, output=False))
+        expected = np.frombuffer(gqs1_bytes(48), dtype='<u8')[5]
+        self.assertEqual(bit_generator.random_raw(), expected)
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestGenerator(unittest.TestCase):
+    """Test numpy.random.Generator on top of the bit generator."""
+
+    def test_distributions(self):
+        """Test NumPy distributions draw deterministic, sane values."""
+        first = np.random.Generator(GoldenSeedBitGenerator('gqs1'))
+        second = np.random.default_rng(GoldenSeedBitGenerator('gqs1'))
+        values = first.standard_normal(20000)
+        np.testing.assert_array_equal(values, second.standard_normal(20000))
+        self.assertAlmostEqual(values.mean(), 0.0, delta=0.03)
+        self.assertAlmostEqual(values.std(), 1.0, delta=0.03)
+        ints = first.integers(0, 6, size=6000)
+        self.assertEqual(set(ints.tolist()), set(range(6)))
+
+    def test_random_uses_top_53_bits(self):
+        """Test Generator.random() is the top 53 bits of one word."""
+        word = int(np.frombuffer(gqs1_bytes(8), dtype='<u8')[0])
+        rng = np.random.Generator(GoldenSeedBitGenerator('gqs1'))
+        self.assertEqual(rng.random(), (word >> 11) / 2.0 ** 53)
+
+    def test_ctypes_interface(self):
+        """Test the ctypes draw functions read the same words."""
+        interface = GoldenSeedBitGenerator('gqs1').ctypes
+        expected = np.frombuffer(gqs1_bytes(16), dtype='<u8').tolist()
+        self.assertEqual([interface.next_uint64(None), interface.next_uint64(None)], expected)
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestState(unittest.TestCase):
+    """Test state capture, restore and pickling."""
+
+    def test_state_round_trip(self):
+        """Test restoring a state mid-block replays the same values."""
+        rng = np.random.Generator(GoldenSeedBitGenerator('gqs1', block_outputs=8))
+        rng.integers(0, 2 ** 32, size=5, dtype=np.uint32)
+        saved = rng.bit_generator.state
+        expected = rng.random(40)
+        rng.random(100)
+        rng.bit_generator.state = saved
+        np.testing.assert_array_equal(rng.random(40), expected)
+
+    def test_pickle(self):
+        """Test pickled generators continue from the same position."""
+        rng = np.random.Generator(GoldenSeedBitGenerator('gqs1', block_outputs=8))
+        rng.random(13)
+        copy = pickle.loads(pickle.dumps(rng))
+        np.testing.assert_array_equal(copy.random(30), rng.random(30))
+
+    def test_foreign_state_rejected(self):
+        """Test states from other generators or settings are rejected."""
+        bit_generator = GoldenSeedBitGenerator('gqs1')
+        with self.assertRaises(ValueError):
+            bit_generator.state = np.random.PCG64(0).state
+        with self.assertRaises(ValueError):
+            bit_generator.state = GoldenSeedBitGenerator('gqs1', block_outputs=2).state
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestSubstreams(unittest.TestCase):
+    """Test jumped() and spawn()."""
+
+    def test_jumps_compose(self):
+        """Test jumped(2) equals jumped(1).jumped(1) and differs from the parent."""
+        bit_generator = GoldenSeedBitGenerator('gqs1', block_outputs=4)
+        bit_generator.random_raw(3)
+        twice = bit_generator.jumped(2).random_raw(8)
+        np.testing.assert_array_equal(twice, bit_generator.jumped(1).jumped(1).random_raw(8))
+        self.assertFalse(np.array_equal(twice, bit_generator.jumped(1).random_raw(8)))
+        self.assertFalse(np.array_equal(twice, bit_generator.random_raw(8)))
+
+    def test_jump_depends_on_position(self):
+        """Test jumping from different positions gives different substreams."""
+        bit_generator = GoldenSeedBitGenerator('gqs1')
+        before = bit_generator.jumped().random_raw(4)
+        bit_generator.random_raw()
+        self.assertFalse(np.array_equal(before, bit_generator.jumped().random_raw(4)))
+
+    def test_jumped_zero_is_copy(self):
+        """Test jumped(0) continues from the current position."""
+        bit_generator = GoldenSeedBitGenerator('gqs1', block_outputs=4)
+        bit_generator.random_raw(5)
+        np.testing.assert_array_equal(bit_generator.jumped(0).random_raw(6), bit_generator.random_raw(6))
+
+    def test_spawn(self):
+        """Test children are reproducible, distinct and independent of reads."""
+        parent = GoldenSeedBitGenerator('gqs1')
+        children = parent.spawn(2)
+        parent.random_raw(10)
+        later = parent.spawn(1)[0]
+
+        fresh = GoldenSeedBitGenerator('gqs1')
+        replay = fresh.spawn(3)
+        words = [child.random_raw(4) for child in children + [later]]
+        for child, expected in zip(replay, words):
+            np.testing.assert_array_equal(child.random_raw(4), expected)
+        self.assertFalse(np.array_equal(words[0], words[1]))
+        self.assertFalse(np.array_equal(words[1], words[2]))
+
+    @unittest.skipIf(np is not None and not hasattr(np.random.Generator, 'spawn'),
+                     "Generator.spawn needs numpy >= 1.25")
+    def test_generator_spawn(self):
+        """Test Generator.spawn() wraps spawned bit generators."""
+        children = np.random.Generator(GoldenSeedBitGenerator('gqs1')).spawn(2)
+        self.assertIsInstance(children[0].bit_generator, GoldenSeedBitGenerator)
+        self.assertNotEqual(children[0].random(), children[1].random())
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestValidation(unittest.TestCase):
+    """Test argument validation."""
+
+    def test_unknown_protocol(self):
+        """Test unknown protocols are rejected."""
+        with self.assertRaises(ValueError):
+            GoldenSeedBitGenerator('mt19937')
+
+    def test_block_outputs(self):
+        """Test non-positive block sizes are rejected."""
+        with self.assertRaises(ValueError):
+            GoldenSeedBitGenerator(block_outputs=0)
+
+    def test_negative_jumps(self):
+        """Test negative jump counts are rejected."""
+        with self.assertRaises(ValueError):
+            GoldenSeedBitGenerator('gqs1').jumped(-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Tests for coordinate-addressed procedural worlds
+
+Tests validate:
+- Chunks and entities are pure functions of seed and address
+- Generation order does not matter
+- Attribute ranges, the LRU cache and region() batches
+"""
+
+import os
+import sys
+import unittest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.gq.procedural import (
+    CHUNK_ATTRIBUTES,
+    ENTITY_ATTRIBUTES,
+    ProceduralWorld,
+)
+
+
+class TestProceduralWorld(unittest.TestCase):
+    """Test suite for ProceduralWorld."""
+
+    def setUp(self):
+        self.world = ProceduralWorld(seed=42)
+
+    def test_order_independence(self):
+        """Test chunks do not depend on which chunks were generated first."""
+        coords = [(x, z) for x in range(-3, 4) for z in range(-3, 4)]
+        forward = {c: ProceduralWorld(seed=42, cache_size=0).chunk(*c) for c in coords}
+        other = ProceduralWorld(seed=42, cache_size=0)
+        backward = {c: other.chunk(*c) for c in reversed(coords)}
+        self.assertEqual(forward, backward)
+
+    def test_seed_and_coordinates_matter(self):
+        """Test different seeds and coordinates give different chunks."""
+        chunks = {tuple(self.world.chunk(x, 0).values()) for x in range(50)}
+        self.assertGreater(len(chunks), 45)
+        self.assertNotEqual(ProceduralWorld(seed=1).key, ProceduralWorld(seed=2).key)
+        self.assertNotEqual(
+            [ProceduralWorld(seed=1).chunk(x, 0) for x in range(5)],
+            [ProceduralWorld(seed=2).chunk(x, 0) for x in range(5)],
+        )
+
+    def test_stream_determines_key(self):
+        """Test the world key is drawn from the given stream."""
+        stream = [bytes(range(16)), bytes(range(16, 32))]
+        self.assertEqual(ProceduralWorld(stream=stream).key, ProceduralWorld(stream=list(stream)).key)
+        self.assertNotEqual(ProceduralWorld(stream=stream).key, ProceduralWorld().key)
+
+    def test_attribute_ranges(self):
+        """Test attributes stay within their declared ranges."""
+        for x in range(-20, 20):
+            chunk = self.world.chunk(x, 3 * x)
+            self.assertEqual(list(chunk), list(CHUNK_ATTRIBUTES))
+            for name, (low, high) in CHUNK_ATTRIBUTES.items():
+                self.assertTrue(low <= chunk[name] < high, name)
+
+        for spawn_id in range(40):
+            entity = self.world.entity('monster', spawn_id)
+            self.assertEqual(entity['type'], 'monster')
+            self.assertEqual(entity['spawn_id'], spawn_id)
+            for name, (low, high) in ENTITY_ATTRIBUTES.items():
+                self.assertTrue(low <= entity[name] < high, name)
+
+    def test_biome_distribution(self):
+        """Test every biome value occurs over many chunks."""
+        biomes = [self.world.chunk(x, z)['biome'] for x in range(40) for z in range(40)]
+        counts = [biomes.count(b) for b in range(10)]
+        self.assertTrue(all(100 < count < 220 for count in counts), counts)
+
+    def test_entities_do_not_advance_state(self):
+        """Test entity generation is repeatable and independent of call history."""
+        first = self.world.entity('monster', 7)
+        for spawn_id in range(20):
+            self.world.entity('npc', spawn_id)
+        self.assertEqual(self.world.entity('monster', 7), first)
+        self.assertNotEqual(self.world.entity('npc', 7)['health'], first['health'])
+
+    def test_custom_attributes(self):
+        """Test custom attribute specs and their validation."""
+        world = ProceduralWorld(chunk_attributes={'height': (-64, 320), 'flag': (0, 2)})
+        chunk = world.chunk(5, 5)
+        self.assertEqual(set(chunk), {'height', 'flag'})
+        self.assertTrue(-64 <= chunk['height'] < 320)
+
+        with self.assertRaises(ValueError):
+            ProceduralWorld(chunk_attributes={})
+        with self.assertRaises(ValueError):
+            ProceduralWorld(chunk_attributes={'bad': (5, 5)})
+        with self.assertRaises(ValueError):
+            ProceduralWorld(chunk_attributes={f'a{i}': (0, 2) for i in range(17)})
+
+    def test_cache(self):
+        """Test the LRU cache bound and that callers get fresh dictionaries."""
+        world = ProceduralWorld(cache_size=8)
+        chunk = world.chunk(0, 0)
+        chunk['biome'] = -1
+        self.assertNotEqual(world.chunk(0, 0)['biome'], -1)
+        info = world.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+        for x in range(20):
+            world.chunk(x, 1)
+        self.assertEqual(world.cache_info().currsize, 8)
+        world.cache_clear()
+        self.assertEqual(world.cache_info().currsize, 0)
+
+    def test_region(self):
+        """Test region() matches per-chunk calls in x-major order."""
+        region = self.world.region(-2, 5, 1, 8)
+        expected = [(x, z) for x in range(-2, 1) for z in range(5, 8)]
+        self.assertEqual(list(region), expected)
+        for (x, z), chunk in region.items():
+            self.assertEqual(chunk, self.world.chunk(x, z))
+        self.assertEqual(self.world.region(3, 3, 3, 10), {})
+
+    def test_derive(self):
+        """Test derived bytes by domain, coordinates and size."""
+        self.assertEqual(len(self.world.derive('level', 1, size=16)), 16)
+        self.assertEqual(self.world.derive('level', 1), self.world.derive('level', 1))
+        self.assertNotEqual(self.world.derive('level', 1), self.world.derive('loot', 1))
+        self.assertNotEqual(self.world.derive('level', 1, 2), self.world.derive('level', 2, 1))
+        with self.assertRaises(ValueError):
+            self.world.derive('level', size=65)
+        with self.assertRaises(ValueError):
+            self.world.derive('level', 1 << 63)
+        with self.assertRaises(ValueError):
+            self.world.chunk(1 << 63, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,405 @@
+"""
+Unit tests for GoldenGenerator and GoldenRandom.
+
+Tests validate:
+- Determinism for the default stream and explicit streams
+- Exact bit accounting of the reservoir
+- Unbiased bounded integers (scalar and batched, narrow and wide ranges)
+- Float, normal and exponential distributions
+- Weighted choice through alias tables
+- Shuffle and sample produce valid, uniform permutations
+- Rejection of invalid arguments
+- GoldenRandom follows the stream and replays from getstate()
+"""
+
+import hashlib
+import math
+import os
+import pickle
+import random
+import struct
+import sys
+import unittest
+from collections import Counter
+
+# Add repository root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gq.random import AliasTable, GoldenGenerator, GoldenRandom
+from gq.stream import PROTOCOLS, GoldenStream, initial_state
+from gq.universal_qkd import HEX_SEED
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def hash_source(label=b'test'):
+    """Fast deterministic byte source (SHA-512 in counter mode)."""
+    counter = 0
+    while True:
+        yield b''.join(
+            hashlib.sha512(label + (counter + i).to_bytes(8, 'little')).digest()
+            for i in range(64)
+        )
+        counter += 64
+
+
+def chi_square(counts, expected):
+    """Pearson chi-square statistic for counts against a flat expectation."""
+    return sum((c - expected) ** 2 / expected for c in counts)
+
+
+class TestDeterminism(unittest.TestCase):
+    """Test generators are reproducible."""
+
+    def test_default_stream_rolls(self):
+        """Test the default stream produces the documented die rolls."""
+        rng = GoldenGenerator()
+        self.assertEqual([rng.integers(1, 7) for _ in range(8)], [3, 5, 1, 4, 4, 3, 3, 2])
+
+    def test_same_stream_same_values(self):
+        """Test two generators over equal streams agree."""
+        a = GoldenGenerator(hash_source())
+        b = GoldenGenerator(hash_source())
+        self.assertEqual(
+            [a.integers(1000) for _ in range(50)] + [a.random() for _ in range(5)],
+            [b.integers(1000) for _ in range(50)] + [b.random() for _ in range(5)],
+        )
+
+    def test_accepts_golden_stream(self):
+        """Test a GoldenStream can be passed directly."""
+        rng = GoldenGenerator(GoldenStream())
+        self.assertEqual(rng.getrandbits(32), int.from_bytes(GoldenStream().read(4), 'little'))
+
+
+class TestBitReservoir(unittest.TestCase):
+    """Test the reservoir spends exactly the bits requested."""
+
+    def test_bits_are_consecutive(self):
+        """Test successive getrandbits calls read consecutive stream bits."""
+        rng = GoldenGenerator(hash_source())
+        widths = [1, 3, 7, 11, 17, 64, 5, 200, 13]
+        values = [rng.getrandbits(k) for k in widths]
+        raw = GoldenGenerator(hash_source()).getrandbits(sum(widths))
+        for k, value in zip(widths, values):
+            self.assertEqual(value, raw & ((1 << k) - 1))
+            raw >>= k
+
+    def test_small_draws_share_an_output(self):
+        """Test many small draws consume only whole refills of the stream."""
+        stream = GoldenStream(hash_source())
+        rng = GoldenGenerator(stream)
+        for _ in range(40):
+            rng.integers(1, 7)
+        # 40 draws of 11 bits fit in one 64-byte refill
+        self.assertEqual(stream.tell(), 64)
+
+    def test_bytes(self):
+        """Test bytes() returns stream bytes in order."""
+        rng = GoldenGenerator(hash_source())
+        self.assertEqual(rng.bytes(100), GoldenStream(hash_source()).read(100))
+
+    def test_negative_bits_rejected(self):
+        """Test negative bit counts are rejected."""
+        with self.assertRaises(ValueError):
+            GoldenGenerator(hash_source()).getrandbits(-1)
+
+
+class TestIntegers(unittest.TestCase):
+    """Test bounded integers are in range and unbiased."""
+
+    def test_bounds(self):
+        """Test integers stay in [low, high)."""
+        rng = GoldenGenerator(hash_source())
+        values = [rng.integers(-3, 4) for _ in range(2000)]
+        self.assertEqual(set(values), set(range(-3, 4)))
+
+    def test_single_argument_is_upper_bound(self):
+        """Test integers(n) draws from [0, n)."""
+        rng = GoldenGenerator(hash_source())
+        self.assertTrue(all(0 <= rng.integers(5) < 5 for _ in range(500)))
+        self.assertEqual(rng.integers(1), 0)
+
+    def test_uniformity(self):
+        """Test a non-power-of-two bound is uniform (chi-square, 9 dof)."""
+        rng = GoldenGenerator(hash_source())
+        counts = Counter(rng.integers(10) for _ in range(20000))
+        self.assertLess(chi_square([counts[i] for i in range(10)], 2000), 27.9)
+
+    def test_huge_bound(self):
+        """Test arbitrary-precision bounds split evenly around the midpoint."""
+        rng = GoldenGenerator(hash_source())
+        bound = 3 * (1 << 200)
+        values = [rng.integers(bound) for _ in range(2000)]
+        self.assertTrue(all(0 <= v < bound for v in values))
+        self.assertLess(abs(sum(v < bound // 2 for v in values) - 1000), 150)
+
+    def test_empty_range_rejected(self):
+        """Test empty ranges are rejected."""
+        rng = GoldenGenerator(hash_source())
+        for args in ((0,), (5, 5), (5, 2)):
+            with self.subTest(args=args):
+                with self.assertRaises(ValueError):
+                    rng.integers(*args)
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestBatchedDraws(unittest.TestCase):
+    """Test batched draws fill arrays with the right distributions."""
+
+    def setUp(self):
+        self.rng = GoldenGenerator(hash_source())
+
+    def test_integer_shape_and_bounds(self):
+        """Test batched integers have the requested shape and range."""
+        values = self.rng.integers(-5, 5, size=(100, 30))
+        self.assertEqual(values.shape, (100, 30))
+        self.assertEqual(values.dtype, np.int64)
+        self.assertEqual(values.min(), -5)
+        self.assertEqual(values.max(), 4)
+
+    def test_integer_uniformity(self):
+        """Test batched integers are uniform (chi-square, 6 dof)."""
+        counts = np.bincount(self.rng.integers(7, size=70000), minlength=7)
+        self.assertLess(chi_square(counts, 10000), 22.5)
+
+    def test_wide_integer_bounds(self):
+        """Test ranges wider than 32 bits use the full range."""
+        bound = 3 << 40
+        values = self.rng.integers(bound, size=20000)
+        self.assertTrue(((values >= 0) & (values < bound)).all())
+        self.assertLess(abs((values < bound // 2).mean() - 0.5), 0.02)
+
+    def test_random_unit_interval(self):
+        """Test batched floats lie in [0, 1) with mean 1/2."""
+        values = self.rng.random(50000)
+        self.assertTrue(((values >= 0) & (values < 1)).all())
+        self.assertAlmostEqual(values.mean(), 0.5, delta=0.01)
+
+    def test_normal_moments(self):
+        """Test batched normals match the first four moments."""
+        values = self.rng.normal(2.0, 3.0, size=100000)
+        z = (values - 2.0) / 3.0
+        self.assertAlmostEqual(z.mean(), 0.0, delta=0.02)
+        self.assertAlmostEqual(z.std(), 1.0, delta=0.02)
+        self.assertAlmostEqual((z ** 4).mean(), 3.0, delta=0.15)
+        # Tail beyond the ziggurat base (R = 3.654) is sampled
+        self.assertGreater((np.abs(z) > 3.7).sum(), 0)
+
+    def test_exponential_moments(self):
+        """Test batched exponentials have the right mean and variance."""
+        values = self.rng.exponential(2.0, size=100000)
+        self.assertTrue((values >= 0).all())
+        self.assertAlmostEqual(values.mean(), 2.0, delta=0.04)
+        self.assertAlmostEqual(values.var(), 4.0, delta=0.2)
+
+    def test_weighted_choice(self):
+        """Test batched weighted choice matches the weights."""
+        picks = self.rng.choice(['a', 'b', 'c'], weights=[6, 3, 1], size=30000)
+        counts = Counter(picks.tolist())
+        self.assertAlmostEqual(counts['a'] / 30000, 0.6, delta=0.02)
+        self.assertAlmostEqual(counts['c'] / 30000, 0.1, delta=0.01)
+
+    def test_shuffle_array(self):
+        """Test arrays are shuffled along the first axis."""
+        x = np.arange(40).reshape(20, 2)
+        self.rng.shuffle(x)
+        self.assertEqual(sorted(x[:, 0].tolist()), list(range(0, 40, 2)))
+        np.testing.assert_array_equal(x[:, 1], x[:, 0] + 1)
+        self.assertFalse((x[:, 0] == np.arange(0, 40, 2)).all())
+
+
+class TestScalarDistributions(unittest.TestCase):
+    """Test scalar continuous draws."""
+
+    def test_random_unit_interval(self):
+        """Test random() lies in [0, 1)."""
+        rng = GoldenGenerator(hash_source())
+        values = [rng.random() for _ in range(5000)]
+        self.assertTrue(all(0.0 <= v < 1.0 for v in values))
+        self.assertAlmostEqual(sum(values) / 5000, 0.5, delta=0.02)
+
+    def test_uniform_range(self):
+        """Test uniform() is scaled to [low, high)."""
+        rng = GoldenGenerator(hash_source())
+        self.assertTrue(all(-2.0 <= rng.uniform(-2.0, 3.0) < 3.0 for _ in range(1000)))
+
+    def test_normal_moments(self):
+        """Test scalar normals have mean 0 and variance 1."""
+        rng = GoldenGenerator(hash_source())
+        values = [rng.normal() for _ in range(20000)]
+        mean = sum(values) / len(values)
+        var = sum((v - mean) ** 2 for v in values) / len(values)
+        self.assertAlmostEqual(mean, 0.0, delta=0.03)
+        self.assertAlmostEqual(var, 1.0, delta=0.04)
+
+    def test_exponential_moments(self):
+        """Test scalar exponentials have mean 1 and are non-negative."""
+        rng = GoldenGenerator(hash_source())
+        values = [rng.exponential() for _ in range(20000)]
+        self.assertTrue(all(v >= 0 for v in values))
+        self.assertAlmostEqual(sum(values) / len(values), 1.0, delta=0.03)
+
+
+class TestChoiceAndSampling(unittest.TestCase):
+    """Test choice, alias tables, shuffle and sample."""
+
+    def test_alias_table_probabilities(self):
+        """Test alias table columns reproduce the weights exactly."""
+        weights = [5, 0, 2, 1, 8]
+        table = AliasTable(weights)
+        n = len(weights)
+        mass = [0.0] * n
+        for i in range(n):
+            mass[i] += table.prob[i] / n
+            mass[table.alias[i]] += (1.0 - table.prob[i]) / n
+        for m, w in zip(mass, weights):
+            self.assertAlmostEqual(m, w / sum(weights))
+
+    def test_invalid_weights_rejected(self):
+        """Test empty, negative and all-zero weights are rejected."""
+        for weights in ([], [1, -1], [0, 0]):
+            with self.subTest(weights=weights):
+                with self.assertRaises(ValueError):
+                    AliasTable(weights)
+
+    def test_weighted_choice(self):
+        """Test scalar weighted choice follows the weights."""
+        rng = GoldenGenerator(hash_source())
+        table = AliasTable([90, 9, 1])
+        counts = Counter(rng.choice('xyz', weights=table) for _ in range(10000))
+        self.assertAlmostEqual(counts['x'] / 10000, 0.9, delta=0.015)
+        self.assertNotIn('w', counts)
+
+    def test_zero_weight_never_chosen(self):
+        """Test elements with zero weight are never chosen."""
+        rng = GoldenGenerator(hash_source())
+        self.assertNotIn('b', {rng.choice('abc', weights=[1, 0, 1]) for _ in range(2000)})
+
+    def test_choice_errors(self):
+        """Test empty populations and mismatched weights are rejected."""
+        rng = GoldenGenerator(hash_source())
+        with self.assertRaises(ValueError):
+            rng.choice([])
+        with self.assertRaises(ValueError):
+            rng.choice('abc', weights=[1, 2])
+
+    def test_shuffle_permutations_uniform(self):
+        """Test all 24 orders of four items are equally likely."""
+        rng = GoldenGenerator(hash_source())
+        counts = Counter()
+        for _ in range(12000):
+            items = [0, 1, 2, 3]
+            rng.shuffle(items)
+            counts[tuple(items)] += 1
+        self.assertEqual(len(counts), 24)
+        self.assertLess(chi_square(counts.values(), 500), 49.7)
+
+    def test_sample(self):
+        """Test samples are distinct members of the population."""
+        rng = GoldenGenerator(hash_source())
+        picked = rng.sample(range(100), 10)
+        self.assertEqual(len(set(picked)), 10)
+        self.assertTrue(all(0 <= p < 100 for p in picked))
+        self.assertEqual(sorted(rng.sample('abc', 3)), ['a', 'b', 'c'])
+        self.assertEqual(rng.sample('abc', 0), [])
+        with self.assertRaises(ValueError):
+            rng.sample('abc', 4)
+
+
+class TestGoldenRandom(unittest.TestCase):
+    """Test the random.Random drop-in."""
+
+    @staticmethod
+    def gqs1_words(count):
+        """First count 64-bit words of the GQS-1 stream."""
+        _, step = PROTOCOLS['gqs1']
+        state = initial_state('gqs1', HEX_SEED)
+        outputs = []
+        for _ in range(-(-count // 2)):
+            output, state = step(state)
+            outputs.append(output)
+        return list(struct.unpack(f'<{count}Q', b''.join(outputs)[:8 * count]))
+
+    def test_is_random_instance(self):
+        """Test GoldenRandom can stand in for random.Random."""
+        rng = GoldenRandom(protocol='gqs1')
+        self.assertIsInstance(rng, random.Random)
+        self.assertTrue(1 <= rng.randint(1, 6) <= 6)
+        self.assertIn(rng.choice('abc'), 'abc')
+        self.assertIsInstance(rng.gauss(0.0, 1.0), float)
+
+    @unittest.skipIf(sys.version_info < (3, 9), "random.Random.randbytes needs Python 3.9")
+    def test_randbytes(self):
+        """Test the inherited randbytes() draws through getrandbits()."""
+        self.assertEqual(len(GoldenRandom(protocol='gqs1').randbytes(5)), 5)
+
+    def test_words_follow_stream(self):
+        """Test random() and getrandbits() read consecutive stream words."""
+        rng = GoldenRandom(protocol='gqs1', block_outputs=2)
+        words = self.gqs1_words(8)
+        self.assertEqual(rng.random(), (words[0] >> 11) / 2.0 ** 53)
+        self.assertEqual(rng.getrandbits(64), words[1])
+        self.assertEqual(rng.getrandbits(5), words[2] >> 59)
+        self.assertEqual(rng.getrandbits(100), (words[3] | words[4] << 64) >> 28)
+        self.assertEqual(rng.getrandbits(0), 0)
+        self.assertEqual(rng.random(), (words[5] >> 11) / 2.0 ** 53)
+
+    def test_default_stream_is_gcp1(self):
+        """Test the default generator reads the GoldenStream bytes."""
+        word = int.from_bytes(GoldenStream().read(8), 'little')
+        self.assertEqual(GoldenRandom(block_outputs=1).getrandbits(64), word)
+
+    def test_state_replay(self):
+        """Test setstate() replays from the exact position, mid-block."""
+        rng = GoldenRandom(protocol='gqs1', block_outputs=4)
+        rng.random()
+        rng.gauss(0.0, 1.0)
+        state = rng.getstate()
+        expected = [rng.random() for _ in range(20)] + [rng.gauss(0.0, 1.0)]
+        rng.setstate(state)
+        self.assertEqual([rng.random() for _ in range(20)] + [rng.gauss(0.0, 1.0)], expected)
+
+    def test_pickle(self):
+        """Test pickled generators continue from the same position."""
+        rng = GoldenRandom(protocol='gqs1', block_outputs=4)
+        rng.shuffle(list(range(10)))
+        copy = pickle.loads(pickle.dumps(rng))
+        self.assertEqual([copy.random() for _ in range(12)], [rng.random() for _ in range(12)])
+
+    def test_seeds(self):
+        """Test seeds select reproducible, distinct streams."""
+        draws = {}
+        for seed in (None, 1, 2, 1.5, 'level-1', b'level-1'):
+            rng = GoldenRandom(seed, protocol='gqs1')
+            first = rng.random()
+            rng.seed(seed)
+            self.assertEqual(rng.random(), first)
+            draws[seed] = first
+        self.assertEqual(len(set(draws.values())), len(draws))
+        self.assertEqual(GoldenRandom(True, protocol='gqs1').random(), draws[1])
+        with self.assertRaises(TypeError):
+            GoldenRandom([1, 2], protocol='gqs1')
+
+    def test_foreign_state_rejected(self):
+        """Test states from other generators or settings are rejected."""
+        rng = GoldenRandom(protocol='gqs1')
+        with self.assertRaises(ValueError):
+            rng.setstate(random.Random(1).getstate())
+        with self.assertRaises(ValueError):
+            rng.setstate(GoldenRandom(protocol='gqs1', block_outputs=2).getstate())
+
+    def test_invalid_arguments(self):
+        """Test unknown protocols and block sizes are rejected."""
+        with self.assertRaises(ValueError):
+            GoldenRandom(protocol='mt19937')
+        with self.assertRaises(ValueError):
+            GoldenRandom(block_outputs=0)
+        with self.assertRaises(ValueError):
+            GoldenRandom(protocol='gqs1').getrandbits(-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
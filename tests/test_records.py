@@ -0,0 +1,258 @@
+"""
+Unit tests for schema-driven columnar record generation.
+
+Tests validate:
+- Field layout: fixed words per record, dtypes and column order
+- Every field kind stays in range and follows its distribution
+- Structured arrays, column dicts and chunked writes agree
+- CSV, JSON lines and .npy exports round-trip
+- Rejection of invalid schemas, counts and formats
+"""
+
+import csv
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Add repository root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gq.stream import GoldenStream
+
+try:
+    import numpy as np
+    from gq.records import RecordSchema, write_records
+except ImportError:
+    np = None
+
+
+def hash_source(label=b'records'):
+    """Fast deterministic byte source (SHA-512 in counter mode)."""
+    counter = 0
+    while True:
+        yield b''.join(
+            hashlib.sha512(label + (counter + i).to_bytes(8, 'little')).digest()
+            for i in range(64)
+        )
+        counter += 64
+
+
+MIXED_FIELDS = {
+    'health': (1, 1001),
+    'speed': ('uniform', 0.5, 2.0),
+    'aggression': ('normal', 0.5, 0.1),
+    'respawn': ('exponential', 30.0),
+    'kind': ('choice', ['goblin', 'orc', 'troll'], [6, 3, 1]),
+    'level': ('choice', [1, 2, 3]),
+    'elite': ('bool', 0.05),
+    'seed': ('uint64',),
+}
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestLayout(unittest.TestCase):
+    """Test schema parsing and stream layout."""
+
+    def test_dtype_and_words(self):
+        """Test column order, dtypes and words per record."""
+        schema = RecordSchema(MIXED_FIELDS)
+        self.assertEqual(schema.names, tuple(MIXED_FIELDS))
+        self.assertEqual(schema.dtype['health'], np.int32)
+        self.assertEqual(schema.dtype['kind'], np.dtype('<U6'))
+        self.assertEqual(schema.dtype['elite'], np.bool_)
+        self.assertEqual(schema.dtype['seed'], np.uint64)
+        # normal takes two words, every other field one
+        self.assertEqual(schema.words_per_record, 9)
+        self.assertEqual(schema.record_size, 72)
+
+    def test_consumes_fixed_bytes(self):
+        """Test N records consume exactly N * record_size stream bytes."""
+        schema = RecordSchema(MIXED_FIELDS)
+        stream = GoldenStream(hash_source())
+        schema.array(1000, stream)
+        self.assertEqual(stream.tell(), 1000 * schema.record_size)
+
+    def test_raw_words(self):
+        """Test uint64 fields are the stream's little-endian words."""
+        schema = RecordSchema({'a': ('uint64',), 'b': ('uint64',)})
+        records = schema.array(10, hash_source())
+        expected = np.frombuffer(GoldenStream(hash_source()).read(160), dtype='<u8')
+        np.testing.assert_array_equal(records['a'], expected[0::2])
+        np.testing.assert_array_equal(records['b'], expected[1::2])
+
+    def test_default_stream(self):
+        """Test records default to the GCP-1 stream."""
+        records = RecordSchema({'seed': ('uint64',)}).array(2)
+        expected = np.frombuffer(GoldenStream().read(16), dtype='<u8')
+        np.testing.assert_array_equal(records['seed'], expected)
+
+    def test_wide_integers_use_int64(self):
+        """Test ranges outside int32 get an int64 column."""
+        schema = RecordSchema({'big': (1 << 40, (1 << 40) + 10), 'full': (0, 1 << 32)})
+        self.assertEqual(schema.dtype['big'], np.int64)
+        self.assertEqual(schema.dtype['full'], np.int64)
+        records = schema.array(2000, hash_source())
+        self.assertTrue(((records['big'] >= 1 << 40) & (records['big'] < (1 << 40) + 10)).all())
+        self.assertGreater(records['full'].max(), 1 << 31)
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestDistributions(unittest.TestCase):
+    """Test field kinds follow their distributions."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.records = RecordSchema(MIXED_FIELDS).array(100000, hash_source())
+
+    def test_int_range_uniform(self):
+        """Test integer fields cover [low, high) evenly."""
+        health = self.records['health']
+        self.assertEqual(health.min(), 1)
+        self.assertEqual(health.max(), 1000)
+        counts = np.bincount(health // 100, minlength=11)[:10]
+        self.assertLess(abs(counts / 10000 - 1).max(), 0.05)
+
+    def test_uniform(self):
+        """Test uniform fields lie in [low, high) with the right mean."""
+        speed = self.records['speed']
+        self.assertTrue(((speed >= 0.5) & (speed < 2.0)).all())
+        self.assertAlmostEqual(speed.mean(), 1.25, delta=0.01)
+
+    def test_normal(self):
+        """Test normal fields have the requested mean and deviation."""
+        aggression = self.records['aggression']
+        self.assertAlmostEqual(aggression.mean(), 0.5, delta=0.002)
+        self.assertAlmostEqual(aggression.std(), 0.1, delta=0.002)
+
+    def test_exponential(self):
+        """Test exponential fields are non-negative with mean scale."""
+        respawn = self.records['respawn']
+        self.assertTrue((respawn >= 0).all())
+        self.assertAlmostEqual(respawn.mean(), 30.0, delta=0.5)
+
+    def test_weighted_choice(self):
+        """Test weighted choices follow the weights."""
+        kind = self.records['kind']
+        for value, share in (('goblin', 0.6), ('orc', 0.3), ('troll', 0.1)):
+            self.assertAlmostEqual((kind == value).mean(), share, delta=0.01)
+
+    def test_uniform_choice(self):
+        """Test unweighted choices are uniform over the values."""
+        counts = np.bincount(self.records['level'], minlength=4)
+        self.assertEqual(counts[0], 0)
+        self.assertLess(abs(counts[1:] / (100000 / 3) - 1).max(), 0.03)
+
+    def test_bool(self):
+        """Test bool fields are True with probability p."""
+        self.assertAlmostEqual(self.records['elite'].mean(), 0.05, delta=0.005)
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestOutputs(unittest.TestCase):
+    """Test arrays, columns and file exports agree."""
+
+    def setUp(self):
+        self.schema = RecordSchema(MIXED_FIELDS)
+        self.expected = self.schema.array(500, hash_source())
+
+    def test_columns_match_array(self):
+        """Test columns() returns the same values as array()."""
+        columns = self.schema.columns(500, hash_source())
+        self.assertEqual(list(columns), list(MIXED_FIELDS))
+        for name in MIXED_FIELDS:
+            np.testing.assert_array_equal(columns[name], self.expected[name])
+            self.assertEqual(columns[name].dtype, self.expected.dtype[name])
+
+    def test_consecutive_calls_continue_stream(self):
+        """Test two calls on one stream equal one larger call."""
+        stream = GoldenStream(hash_source())
+        parts = np.concatenate([self.schema.array(200, stream), self.schema.array(300, stream)])
+        np.testing.assert_array_equal(parts, self.expected)
+
+    def test_npy_export(self):
+        """Test chunked .npy export equals the in-memory array."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'records.npy')
+            self.assertEqual(self.schema.write(path, 500, hash_source(), chunk_records=64), 500)
+            np.testing.assert_array_equal(np.load(path), self.expected)
+
+    def test_csv_export(self):
+        """Test CSV export has a header row and exact values."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'records.csv')
+            self.schema.write(path, 500, hash_source(), chunk_records=77)
+            with open(path, newline='') as f:
+                rows = list(csv.reader(f))
+        self.assertEqual(tuple(rows[0]), self.schema.names)
+        self.assertEqual(len(rows), 501)
+        first = rows[1]
+        self.assertEqual(int(first[0]), self.expected['health'][0])
+        self.assertEqual(float(first[2]), self.expected['aggression'][0])
+        self.assertEqual(first[4], self.expected['kind'][0])
+        self.assertEqual(int(first[7]), int(self.expected['seed'][0]))
+
+    def test_jsonl_export(self):
+        """Test JSON lines export writes one object per record."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'records.jsonl')
+            self.schema.write(path, 500, hash_source())
+            with open(path) as f:
+                rows = [json.loads(line) for line in f]
+        self.assertEqual(len(rows), 500)
+        self.assertEqual(rows[-1]['kind'], self.expected['kind'][-1])
+        self.assertIs(rows[0]['elite'], bool(self.expected['elite'][0]))
+        self.assertEqual(rows[0]['seed'], int(self.expected['seed'][0]))
+
+    def test_write_records_from_columns(self):
+        """Test write_records() accepts a dict of columns."""
+        columns = self.schema.columns(500, hash_source())
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'columns.data')
+            self.assertEqual(write_records(columns, path, format='npy'), 500)
+            np.testing.assert_array_equal(np.load(path), self.expected)
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestValidation(unittest.TestCase):
+    """Test rejection of invalid schemas and arguments."""
+
+    def test_invalid_fields(self):
+        """Test malformed field specs are rejected."""
+        for spec in ((5, 5), (0, (1 << 32) + 1), ('uniform', 2.0, 1.0), ('normal', 0.0, -1.0),
+                     ('exponential', 0.0), ('choice', []), ('choice', ['a', 'b'], [1]),
+                     ('bool', 1.5), ('uint64', 3), ('gamma', 1.0), 'int', ()):
+            with self.subTest(spec=spec):
+                with self.assertRaises(ValueError):
+                    RecordSchema({'field': spec})
+
+    def test_empty_schema(self):
+        """Test a schema needs at least one field."""
+        with self.assertRaises(ValueError):
+            RecordSchema({})
+
+    def test_negative_count(self):
+        """Test negative record counts are rejected."""
+        with self.assertRaises(ValueError):
+            RecordSchema(MIXED_FIELDS).array(-1, hash_source())
+
+    def test_unknown_format(self):
+        """Test unknown formats and extensions are rejected."""
+        schema = RecordSchema(MIXED_FIELDS)
+        with tempfile.TemporaryDirectory() as tmp:
+            with self.assertRaises(ValueError):
+                schema.write(os.path.join(tmp, 'records.parquet'), 10, hash_source())
+            with self.assertRaises(ValueError):
+                schema.write(os.path.join(tmp, 'records.csv'), 10, hash_source(), format='xml')
+
+    def test_mismatched_columns(self):
+        """Test write_records() rejects columns of different lengths."""
+        with tempfile.TemporaryDirectory() as tmp:
+            with self.assertRaises(ValueError):
+                write_records({'a': np.zeros(3), 'b': np.zeros(4)}, os.path.join(tmp, 'x.npy'))
+
+
+if __name__ == '__main__':
+    unittest.main()
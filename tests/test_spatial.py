@@ -0,0 +1,183 @@
+"""
+Unit tests for golden-angle spatial sampling.
+
+Tests validate:
+- Disk, sphere and rectangle samplers stay inside their domains
+- Deterministic output and chunked generation
+- Jitter reproducibility from GoldenSeed streams
+- Spacing compared with raw stream-byte placement
+- Grid bucket neighbour queries against brute force
+- Importing without numpy, with an install hint on use
+"""
+
+import math
+import os
+import subprocess
+import sys
+import unittest
+
+# Add repository root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gq.stream import GoldenStream
+
+try:
+    import numpy as np
+    from gq.spatial import (
+        GOLDEN_ANGLE,
+        GridIndex,
+        disk_points,
+        rect_points,
+        sphere_points,
+    )
+except ImportError:
+    np = None
+
+
+def min_pair_distance(points):
+    """Smallest distance between two distinct points (brute force)."""
+    deltas = points[:, None, :] - points[None, :, :]
+    distances = np.sqrt((deltas ** 2).sum(axis=2))
+    np.fill_diagonal(distances, np.inf)
+    return distances.min()
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestSamplers(unittest.TestCase):
+    """Test golden-angle samplers."""
+
+    def test_golden_angle(self):
+        """Test the golden angle is 2π/φ²."""
+        phi = (1 + math.sqrt(5)) / 2
+        self.assertAlmostEqual(GOLDEN_ANGLE, 2 * math.pi / phi ** 2, places=14)
+
+    def test_disk_matches_vogel_spiral(self):
+        """Test unjittered disk points follow r = sqrt((i+½)/n), θ = i·golden_angle."""
+        n = 50
+        points = disk_points(n, radius=2.0, center=(1.0, -1.0))
+        for i in range(n):
+            r = 2.0 * math.sqrt((i + 0.5) / n)
+            theta = i * GOLDEN_ANGLE
+            self.assertAlmostEqual(points[i, 0], 1.0 + r * math.cos(theta), places=9)
+            self.assertAlmostEqual(points[i, 1], -1.0 + r * math.sin(theta), places=9)
+
+    def test_points_inside_domains(self):
+        """Test jittered samples stay inside the disk, sphere and rectangle."""
+        disk = disk_points(5000, radius=3.0, jitter=1.0)
+        self.assertTrue(np.all(np.hypot(disk[:, 0], disk[:, 1]) <= 3.0))
+
+        sphere = sphere_points(5000, radius=2.0, jitter=1.0)
+        self.assertTrue(np.allclose(np.linalg.norm(sphere, axis=1), 2.0))
+
+        rect = rect_points(5000, width=40.0, height=10.0, origin=(5.0, 5.0), jitter=1.0)
+        self.assertTrue(np.all((rect[:, 0] >= 5.0) & (rect[:, 0] < 45.0)))
+        self.assertTrue(np.all((rect[:, 1] >= 5.0) & (rect[:, 1] < 15.0)))
+
+    def test_deterministic(self):
+        """Test repeated calls give identical points."""
+        for sampler in (disk_points, sphere_points, rect_points):
+            np.testing.assert_array_equal(sampler(1000, jitter=0.5),
+                                          sampler(1000, jitter=0.5))
+
+    def test_chunked_generation(self):
+        """Test chunks concatenate to the full point set."""
+        for sampler in (disk_points, sphere_points, rect_points):
+            full = sampler(1000, jitter=0.3)
+            chunks = np.vstack([sampler(1000, jitter=0.3, start=s, count=250)
+                                for s in range(0, 1000, 250)])
+            np.testing.assert_array_equal(full, chunks)
+
+        with self.assertRaises(ValueError):
+            disk_points(100, start=90, count=20)
+
+    def test_jitter_follows_stream(self):
+        """Test jitter is drawn from the given stream."""
+        stream = GoldenStream()
+        stream.read(16)
+        shifted = rect_points(500, jitter=0.5, stream=stream)
+        self.assertEqual(stream.tell(), 32)
+        self.assertFalse(np.array_equal(shifted, rect_points(500, jitter=0.5)))
+        self.assertFalse(np.array_equal(rect_points(500), rect_points(500, jitter=0.5)))
+
+    def test_better_spread_than_raw_bytes(self):
+        """Test lattice placement avoids the clumping of byte % 100 placement."""
+        n = 1000
+        raw = np.frombuffer(GoldenStream().read(2 * n), dtype=np.uint8)
+        byte_points = (raw.reshape(n, 2) % 100) / 100.0
+        lattice = rect_points(n, jitter=0.5)
+
+        self.assertEqual(min_pair_distance(byte_points), 0.0)
+        self.assertGreater(min_pair_distance(lattice), 0.3 / math.sqrt(n))
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestGridIndex(unittest.TestCase):
+    """Test grid bucket neighbour queries."""
+
+    def brute_force(self, points, center, radius):
+        deltas = points - np.asarray(center)
+        return np.flatnonzero((deltas ** 2).sum(axis=1) <= radius * radius)
+
+    def test_query_radius_2d(self):
+        """Test 2-D radius queries match brute force."""
+        points = rect_points(20000, width=100.0, height=100.0, jitter=0.5)
+        index = GridIndex(points, cell_size=1.0)
+        self.assertEqual(len(index), 20000)
+        for center, radius in [((50, 50), 1.0), ((0, 0), 2.5), ((99.5, 3.2), 0.7)]:
+            np.testing.assert_array_equal(index.query_radius(center, radius),
+                                          self.brute_force(points, center, radius))
+
+    def test_query_radius_3d(self):
+        """Test 3-D radius queries on the sphere match brute force."""
+        points = sphere_points(5000, radius=10.0)
+        index = GridIndex(points, cell_size=0.5)
+        center = points[123]
+        np.testing.assert_array_equal(index.query_radius(center, 0.8),
+                                      self.brute_force(points, center, 0.8))
+
+    def test_neighbors_excludes_self(self):
+        """Test neighbour lists exclude the query point."""
+        points = disk_points(2000, radius=20.0)
+        index = GridIndex(points, cell_size=1.0)
+        found = index.neighbors(10, 1.5)
+        self.assertNotIn(10, found)
+        expected = self.brute_force(points, points[10], 1.5)
+        np.testing.assert_array_equal(found, expected[expected != 10])
+
+    def test_empty_and_invalid(self):
+        """Test empty indexes and invalid cell sizes."""
+        index = GridIndex(np.empty((0, 2)), cell_size=1.0)
+        self.assertEqual(index.num_cells, 0)
+        self.assertEqual(len(index.query_radius((0, 0), 5.0)), 0)
+        with self.assertRaises(ValueError):
+            GridIndex(np.zeros((3, 2)), cell_size=0)
+
+
+class TestWithoutNumpy(unittest.TestCase):
+    """Test gq.spatial when numpy is not installed."""
+
+    def test_import_and_install_hint(self):
+        """Test the module imports and samplers raise ImportError."""
+        code = (
+            "import sys\n"
+            "sys.modules['numpy'] = None\n"
+            f"sys.path = {sys.path!r}\n"
+            "import gq.spatial as spatial\n"
+            "for call in (lambda: spatial.disk_points(4),\n"
+            "             lambda: spatial.GridIndex([[0.0, 0.0]], 1.0)):\n"
+            "    try:\n"
+            "        call()\n"
+            "    except ImportError as error:\n"
+            "        print(error)\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code],
+                                capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        lines = result.stdout.strip().splitlines()
+        self.assertEqual(len(lines), 2)
+        for line in lines:
+            self.assertIn("pip install golden-seed[numpy]", line)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+"""
+Unit tests for buffered GoldenSeed byte streams.
+
+Tests validate:
+- Reads of arbitrary size return consecutive stream bytes
+- Position tracking
+- Wrapping of existing generators
+- Behaviour with finite sources
+- readinto() bulk fills
+"""
+
+import os
+import sys
+import unittest
+
+# Add repository root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gq.stream import GoldenStream, as_stream
+from gq.universal_qkd import universal_qkd_generator, generate_keys
+
+
+class TestGoldenStream(unittest.TestCase):
+    """Test GoldenStream reads."""
+
+    def test_reads_match_generator_outputs(self):
+        """Test reads of mixed sizes concatenate to the raw stream."""
+        expected = b''.join(bytes.fromhex(k) for k in generate_keys(10))
+        stream = GoldenStream()
+        data = b''.join(stream.read(size) for size in (1, 15, 3, 40, 0, 21, 80))
+        self.assertEqual(data, expected)
+        self.assertEqual(stream.tell(), 160)
+
+    def test_default_source_is_gcp1(self):
+        """Test the default stream starts with the first GCP-1 output."""
+        self.assertEqual(GoldenStream().read(16), next(universal_qkd_generator()))
+
+    def test_iteration_continues_after_partial_read(self):
+        """Test iteration yields the buffered remainder, then whole outputs."""
+        keys = [bytes.fromhex(k) for k in generate_keys(3)]
+        stream = GoldenStream()
+        stream.read(5)
+        self.assertEqual(next(stream), keys[0][5:])
+        self.assertEqual(next(stream), keys[1])
+        self.assertEqual(stream.tell(), 32)
+
+    def test_as_stream(self):
+        """Test wrapping generators and passing streams through."""
+        stream = GoldenStream()
+        self.assertIs(as_stream(stream), stream)
+        wrapped = as_stream(universal_qkd_generator())
+        self.assertIsInstance(wrapped, GoldenStream)
+        self.assertEqual(wrapped.read(16), next(universal_qkd_generator()))
+
+    def test_finite_source(self):
+        """Test exhausted sources raise EOFError and StopIteration."""
+        stream = GoldenStream([b'abc', b'de'])
+        self.assertEqual(stream.read(4), b'abcd')
+        with self.assertRaises(EOFError):
+            stream.read(2)
+        self.assertEqual(list(GoldenStream([b'ab'])), [b'ab'])
+
+    def test_negative_read(self):
+        """Test negative read sizes are rejected."""
+        with self.assertRaises(ValueError):
+            GoldenStream().read(-1)
+
+
+class TestReadInto(unittest.TestCase):
+    """Test GoldenStream.readinto()."""
+
+    def test_matches_read(self):
+        """Test readinto() interleaves with read() over the same bytes."""
+        expected = GoldenStream().read(200)
+        stream = GoldenStream()
+        head = stream.read(5)
+        buffer = bytearray(100)
+        self.assertEqual(stream.readinto(buffer), 100)
+        tail = stream.read(95)
+        self.assertEqual(head + bytes(buffer) + tail, expected)
+        self.assertEqual(stream.tell(), 200)
+
+    def test_memoryview_slice(self):
+        """Test filling part of a larger buffer through a memoryview."""
+        buffer = bytearray(40)
+        GoldenStream().readinto(memoryview(buffer)[8:24])
+        self.assertEqual(bytes(buffer[8:24]), next(universal_qkd_generator()))
+        self.assertEqual(bytes(buffer[:8]) + bytes(buffer[24:]), bytes(24))
+
+    def test_batches_larger_than_limit(self):
+        """Test fills spanning several batches stay consecutive."""
+        from gq import stream as stream_module
+        original = stream_module.READINTO_BATCH_OUTPUTS
+        stream_module.READINTO_BATCH_OUTPUTS = 3
+        try:
+            buffer = bytearray(157)
+            GoldenStream().readinto(buffer)
+        finally:
+            stream_module.READINTO_BATCH_OUTPUTS = original
+        self.assertEqual(bytes(buffer), GoldenStream().read(157))
+
+    def test_large_outputs_not_over_read(self):
+        """Test sources with large outputs are pulled only as far as needed."""
+        pulled = []
+
+        def source():
+            for i in range(100):
+                pulled.append(i)
+                yield bytes([i]) * 1024
+
+        stream = GoldenStream(source())
+        buffer = bytearray(3000)
+        stream.readinto(buffer)
+        self.assertEqual(bytes(buffer), b'\x00' * 1024 + b'\x01' * 1024 + b'\x02' * 952)
+        self.assertEqual(len(pulled), 3)
+
+    def test_eof_keeps_output_size(self):
+        """Test an exhausted fill does not reset the learned output size."""
+        pending = [b'\x01' * 1024]
+
+        class Source:
+            # Like a queue or a tailed file: empty for now, more later
+            def __iter__(self):
+                return self
+
+            def __next__(self):
+                if not pending:
+                    raise StopIteration
+                return pending.pop(0)
+
+        stream = GoldenStream(Source())
+        stream.readinto(bytearray(1024))
+        with self.assertRaises(EOFError):
+            stream.readinto(bytearray(8))
+        pending.extend(bytes([i]) * 1024 for i in range(2, 12))
+        buffer = bytearray(8)
+        stream.readinto(buffer)
+        self.assertEqual(bytes(buffer), b'\x02' * 8)
+        self.assertEqual(len(pending), 9)
+
+    def test_eof_leaves_stream_unchanged(self):
+        """Test a failed fill restores the stream position and contents."""
+        stream = GoldenStream([b'abc', b'de'])
+        stream.read(1)
+        with self.assertRaises(EOFError):
+            stream.readinto(bytearray(8))
+        self.assertEqual(stream.tell(), 1)
+        self.assertEqual(stream.read(4), b'bcde')
+
+
+if __name__ == '__main__':
+    unittest.main()
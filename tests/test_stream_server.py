@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Tests for the local stream server
+
+Tests validate:
+- Block generation from checkpoints matches the reference generators
+- Checkpoint thinning and the hot block cache
+- HTTP semantics: query ranges, Range headers, chunked responses,
+  keep-alive, errors, and Unix sockets
+"""
+
+import asyncio
+import http.client
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.gq.universal_qkd import HEX_SEED, universal_qkd_generator
+from src.gq.gqs1_core import generate_test_vectors
+from src.gq.stream_server import (
+    CheckpointStore,
+    HTTPError,
+    StreamServer,
+    generate_blocks,
+    initial_state,
+    parse_range,
+)
+
+
+# 4 outputs per block keeps generation fast while crossing many blocks
+TEST_BLOCK_SIZE = 64
+
+
+def reference_bytes(protocol, length):
+    """Return the first length bytes of a stream from the reference code."""
+    if protocol == 'gqs1':
+        count = -(-length // 16)
+        return bytes.fromhex(''.join(generate_test_vectors(count)))[:length]
+    generator = universal_qkd_generator()
+    data = bytearray()
+    while len(data) < length:
+        data += next(generator)
+    return bytes(data[:length])
+
+
+class TestGeneration(unittest.TestCase):
+    """Test suite for block generation and checkpoints."""
+
+    def test_blocks_match_reference(self):
+        """Test generated blocks equal the reference streams."""
+        for protocol in ('gcp1', 'gqs1'):
+            state = initial_state(protocol, HEX_SEED)
+            blocks, checkpoints = generate_blocks(protocol, state, 0, 3, 0, TEST_BLOCK_SIZE)
+            self.assertEqual(b''.join(blocks), reference_bytes(protocol, 4 * TEST_BLOCK_SIZE))
+            self.assertEqual([index for index, _ in checkpoints], [1, 2, 3, 4])
+
+            # Resuming from a checkpoint continues the same stream
+            resumed, _ = generate_blocks(protocol, checkpoints[1][1], 2, 3, 3, TEST_BLOCK_SIZE)
+            self.assertEqual(resumed, blocks[3:])
+
+    def test_invalid_seed(self):
+        """Test seeds failing the checksum are rejected."""
+        with self.assertRaises(ValueError):
+            initial_state('gcp1', '00' * 32)
+        with self.assertRaises(ValueError):
+            initial_state('gcp1', 'not-hex')
+
+    def test_checkpoint_thinning(self):
+        """Test the store stays bounded by doubling its stride."""
+        store = CheckpointStore((b'0', 0), max_checkpoints=4)
+        for block in range(1, 20):
+            store.add(block, (b'', block))
+        self.assertLessEqual(len(store), 4)
+        self.assertEqual(store.stride, 8)
+        self.assertEqual(store.nearest(15), (8, (b'', 8)))
+        self.assertEqual(store.nearest(3)[0], 0)
+
+
+class TestParseRange(unittest.TestCase):
+    """Test suite for Range header parsing."""
+
+    def test_forms(self):
+        """Test closed, open-ended and suffix ranges."""
+        self.assertEqual(parse_range('bytes=0-99', None, 1000), (0, 100))
+        self.assertEqual(parse_range('bytes=10-', None, 1000), (10, 1010))
+        self.assertEqual(parse_range('bytes=10-', 50, 1000), (10, 50))
+        self.assertEqual(parse_range('bytes=-20', 50, 1000), (30, 50))
+        self.assertEqual(parse_range('bytes=40-99', 50, 1000), (40, 50))
+
+    def test_unsatisfiable(self):
+        """Test malformed and unsatisfiable ranges raise 416."""
+        for header, length in [('bytes=5-1', None), ('bytes=0-1,4-5', None),
+                               ('items=0-1', None), ('bytes=-5', None),
+                               ('bytes=50-', 50), ('bytes=a-b', None), ('bytes=-', None)]:
+            with self.assertRaises(HTTPError) as ctx:
+                parse_range(header, length, 1000)
+            self.assertEqual(ctx.exception.status, 416, header)
+
+
+class ServerThread:
+    """Run a StreamServer on a background event loop."""
+
+    def __init__(self, **kwargs):
+        self.loop = asyncio.new_event_loop()
+        self.server = StreamServer(**kwargs)
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        self.call(self.server.start())
+
+    def call(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout=30)
+
+    def stop(self):
+        self.call(self.server.close())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout=5)
+        self.loop.close()
+
+
+class TestStreamServer(unittest.TestCase):
+    """Test suite for the HTTP server."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.executor = ThreadPoolExecutor(max_workers=2)
+        cls.running = ServerThread(port=0, executor=cls.executor,
+                                   block_size=TEST_BLOCK_SIZE, max_length=4096,
+                                   max_offset=1 << 20)
+        cls.reference = reference_bytes('gcp1', 1024)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.running.stop()
+        cls.executor.shutdown()
+
+    def request(self, path, headers=None, method='GET', connection=None):
+        conn = connection or http.client.HTTPConnection('127.0.0.1', self.running.server.port,
+                                                        timeout=30)
+        conn.request(method, path, headers=headers or {})
+        response = conn.getresponse()
+        body = response.read()
+        if connection is None:
+            conn.close()
+        return response, body
+
+    def test_query_range(self):
+        """Test offset and length select a slice of the stream."""
+        response, body = self.request(f'/stream/gcp1/{HEX_SEED}?offset=37&length=50')
+        self.assertEqual(response.status, 200)
+        self.assertEqual(body, self.reference[37:87])
+        self.assertEqual(response.getheader('Content-Length'), '50')
+        self.assertEqual(response.getheader('Accept-Ranges'), 'bytes')
+
+    def test_gqs1_protocol(self):
+        """Test the gqs1 protocol serves test vector bytes."""
+        response, body = self.request(f'/stream/gqs1/{HEX_SEED}?length=48')
+        self.assertEqual(response.status, 200)
+        self.assertEqual(body, reference_bytes('gqs1', 48))
+
+    def test_range_header(self):
+        """Test Range requests get 206 with Content-Range."""
+        response, body = self.request(f'/stream/gcp1/{HEX_SEED}?offset=100&length=500',
+                                      {'Range': 'bytes=10-19'})
+        self.assertEqual(response.status, 206)
+        self.assertEqual(body, self.reference[110:120])
+        self.assertEqual(response.getheader('Content-Range'), 'bytes 10-19/500')
+
+        response, body = self.request(f'/stream/gcp1/{HEX_SEED}', {'Range': 'bytes=1000-'})
+        self.assertEqual(response.status, 206)
+        self.assertEqual(response.getheader('Content-Range'), 'bytes 1000-5095/*')
+        self.assertEqual(body[:24], self.reference[1000:1024])
+        self.assertEqual(len(body), 4096)
+
+    def test_chunked_large_response(self):
+        """Test responses larger than a block use chunked encoding."""
+        response, body = self.request(f'/stream/gcp1/{HEX_SEED}?offset=5&length=1000')
+        self.assertEqual(response.getheader('Transfer-Encoding'), 'chunked')
+        self.assertIsNone(response.getheader('Content-Length'))
+        self.assertEqual(body, self.reference[5:1005])
+
+    def test_keep_alive_and_head(self):
+        """Test several requests on one connection, including HEAD."""
+        conn = http.client.HTTPConnection('127.0.0.1', self.running.server.port, timeout=30)
+        try:
+            for offset in (0, 200, 400):
+                response, body = self.request(
+                    f'/stream/gcp1/{HEX_SEED}?offset={offset}&length=300', connection=conn
+                )
+                self.assertEqual(body, self.reference[offset:offset + 300])
+            response, body = self.request(f'/stream/gcp1/{HEX_SEED}?length=300',
+                                          method='HEAD', connection=conn)
+            self.assertEqual(response.status, 200)
+            self.assertEqual(body, b'')
+            self.assertEqual(response.getheader('Content-Length'), '300')
+        finally:
+            conn.close()
+
+    def test_errors(self):
+        """Test error statuses."""
+        cases = [
+            ('/nope', {}, 'GET', 404),
+            (f'/stream/nope/{HEX_SEED}?length=1', {}, 'GET', 404),
+            ('/stream/gcp1/0000?length=1', {}, 'GET', 400),
+            (f'/stream/gcp1/{HEX_SEED}', {}, 'GET', 400),
+            (f'/stream/gcp1/{HEX_SEED}?length=-1', {}, 'GET', 400),
+            (f'/stream/gcp1/{HEX_SEED}?length=99999', {}, 'GET', 400),
+            (f'/stream/gcp1/{HEX_SEED}?length=10', {'Range': 'bytes=20-30'}, 'GET', 416),
+            (f'/stream/gcp1/{HEX_SEED}?length=10', {}, 'POST', 405),
+            (f'/stream/gcp1/{HEX_SEED}?offset={1 << 20}&length=1', {}, 'GET', 400),
+            (f'/stream/gcp1/{HEX_SEED}?offset={10 ** 30}&length=1', {}, 'GET', 400),
+            (f'/stream/gcp1/{HEX_SEED}', {'Range': f'bytes={1 << 20}-'}, 'GET', 416),
+        ]
+        for path, headers, method, status in cases:
+            response, _ = self.request(path, headers, method)
+            self.assertEqual(response.status, status, path)
+
+    def test_stats_and_cache(self):
+        """Test repeated ranges are served from the cache."""
+        path = f'/stream/gcp1/{HEX_SEED}?offset=2048&length=64'
+        self.request(path)
+        _, before = self.request('/stats')
+        _, body = self.request(path)
+        _, after = self.request('/stats')
+        before, after = json.loads(before), json.loads(after)
+        self.assertEqual(body, reference_bytes('gcp1', 2112)[2048:])
+        self.assertEqual(after['misses'], before['misses'])
+        self.assertGreater(after['hits'], before['hits'])
+        self.assertGreaterEqual(after['streams'][f'gcp1/{HEX_SEED}']['checkpoints'], 33)
+
+    def test_concurrent_requests_share_generation(self):
+        """Test concurrent requests for a cold block generate it once."""
+        async def fetch_all():
+            cache = self.running.server.cache
+            misses = cache.misses
+            results = await asyncio.gather(*[
+                cache.get_block('gcp1', HEX_SEED, 100) for _ in range(5)
+            ])
+            return results, cache.misses - misses
+
+        results, new_misses = self.running.call(fetch_all())
+        self.assertEqual(new_misses, 1)
+        self.assertEqual(len(set(results)), 1)
+
+
+class TestUnixSocketServer(unittest.TestCase):
+    """Test suite for serving on a Unix socket with the process pool."""
+
+    @unittest.skipUnless(hasattr(socket, 'AF_UNIX'), "Unix sockets unavailable")
+    def test_unix_socket(self):
+        """Test a request over a Unix socket served by worker processes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'gq.sock')
+            running = ServerThread(unix_path=path, max_workers=1, block_size=TEST_BLOCK_SIZE)
+            try:
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                    sock.settimeout(30)
+                    sock.connect(path)
+                    sock.sendall(
+                        f'GET /stream/gcp1/{HEX_SEED}?offset=16&length=32 HTTP/1.0\r\n\r\n'.encode()
+                    )
+                    response = b''
+                    while True:
+                        data = sock.recv(65536)
+                        if not data:
+                            break
+                        response += data
+            finally:
+                running.stop()
+            self.assertFalse(os.path.exists(path))
+
+        head, _, body = response.partition(b'\r\n\r\n')
+        self.assertTrue(head.startswith(b'HTTP/1.1 200 OK'))
+        self.assertIn(b'Connection: close', head)
+        self.assertEqual(body, reference_bytes('gcp1', 48)[16:])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,196 @@
+"""
+Unit tests for out-of-core tiled world generation.
+
+Tests validate:
+- Tiles are pure functions of (seed, tile coordinates) and meet seamlessly
+- .npy and per-tile directory stores hold the same map
+- Parallel workers produce the same bytes as a single process
+- Resume skips completed tiles and rejects mismatched parameters
+- Integer quantization of heights
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Add repository root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+try:
+    import numpy as np
+    from gq.noise import grid
+    from gq.tiles import TiledWorld, tile_path
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestTiles(unittest.TestCase):
+    """Test tile geometry and rendering."""
+
+    def setUp(self):
+        self.world = TiledWorld(100, 70, tile_size=32, seed=3, scale=1 / 16, octaves=3)
+
+    def test_tile_grid(self):
+        """Test the tile map covers the map with smaller edge tiles."""
+        self.assertEqual((self.world.tiles_x, self.world.tiles_y), (4, 3))
+        self.assertEqual(len(self.world.tiles()), 12)
+        self.assertEqual(self.world.tile_bounds(3, 2), (96, 64, 4, 6))
+        with self.assertRaises(ValueError):
+            self.world.tile_bounds(4, 0)
+
+    def test_tiles_are_seamless(self):
+        """Test tiles equal the matching region of one whole-map render."""
+        noise = self.world._noise
+        whole = noise.fbm(*grid(100, 70, scale=1 / 16), octaves=3).astype(np.float32)
+        for tx, ty in self.world.tiles():
+            x0, y0, width, height = self.world.tile_bounds(tx, ty)
+            np.testing.assert_array_equal(self.world.render_tile(tx, ty),
+                                          whole[y0:y0 + height, x0:x0 + width])
+
+    def test_no_repeat_across_large_maps(self):
+        """Test tiles 65,536 px apart differ once the map outgrows 256 cells."""
+        world = TiledWorld(65536 + 64, 64, tile_size=64, seed=3)
+        self.assertEqual(world.table_size, 512)
+        self.assertFalse(np.array_equal(world.render_tile(1024, 0), world.render_tile(0, 0)))
+
+    def test_seed_determinism(self):
+        """Test equal seeds give equal tiles and different seeds differ."""
+        tile = self.world.render_tile(1, 1)
+        same = TiledWorld(100, 70, tile_size=32, seed=3, scale=1 / 16, octaves=3)
+        other = TiledWorld(100, 70, tile_size=32, seed=4, scale=1 / 16, octaves=3)
+        np.testing.assert_array_equal(same.render_tile(1, 1), tile)
+        self.assertFalse(np.array_equal(other.render_tile(1, 1), tile))
+
+    def test_integer_quantization(self):
+        """Test unsigned dtypes use the full range without wrapping."""
+        for dtype, ridged in (('uint8', False), ('uint16', True)):
+            with self.subTest(dtype=dtype, ridged=ridged):
+                world = TiledWorld(64, 64, tile_size=64, scale=1 / 8, dtype=dtype, ridged=ridged)
+                tile = world.render_tile(0, 0)
+                self.assertEqual(tile.dtype, np.dtype(dtype))
+                self.assertGreater(int(tile.max()) - int(tile.min()),
+                                   np.iinfo(dtype).max // 4)
+
+    def test_invalid_parameters(self):
+        """Test invalid parameters are rejected."""
+        for kwargs in ({'tile_size': 0}, {'kind': 'worley'}, {'dtype': 'int8'},
+                       {'octaves': 0}):
+            with self.subTest(kwargs=kwargs):
+                with self.assertRaises(ValueError):
+                    TiledWorld(10, 10, **kwargs)
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestGenerate(unittest.TestCase):
+    """Test writing tile stores."""
+
+    def setUp(self):
+        self.world = TiledWorld(100, 70, tile_size=32, seed=3, scale=1 / 16, octaves=3)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def expected(self):
+        heights = np.empty((70, 100), dtype=np.float32)
+        for tx, ty in self.world.tiles():
+            x0, y0, width, height = self.world.tile_bounds(tx, ty)
+            heights[y0:y0 + height, x0:x0 + width] = self.world.render_tile(tx, ty)
+        return heights
+
+    def test_npy_store(self):
+        """Test the .npy store holds every tile and a manifest."""
+        calls = []
+        stats = self.world.generate(self.path('map.npy'), workers=1,
+                                    progress=lambda done, total: calls.append((done, total)))
+        self.assertEqual((stats['tiles'], stats['rendered'], stats['skipped']), (12, 12, 0))
+        self.assertEqual(calls[-1], (12, 12))
+        np.testing.assert_array_equal(np.load(self.path('map.npy')), self.expected())
+        with open(self.path('map.npy.json')) as f:
+            self.assertEqual(json.load(f)['world_key'], self.world.key.hex())
+
+    def test_tile_directory_store(self):
+        """Test the directory store writes one file per tile."""
+        self.world.generate(self.path('tiles'), layout='tiles', workers=1)
+        expected = self.expected()
+        for tx, ty in self.world.tiles():
+            x0, y0, width, height = self.world.tile_bounds(tx, ty)
+            np.testing.assert_array_equal(np.load(tile_path(self.path('tiles'), tx, ty)),
+                                          expected[y0:y0 + height, x0:x0 + width])
+
+    def test_parallel_matches_serial(self):
+        """Test worker processes write the same map as one process."""
+        self.world.generate(self.path('serial.npy'), workers=1)
+        stats = self.world.generate(self.path('parallel.npy'), workers=2)
+        self.assertEqual(stats['rendered'], 12)
+        with open(self.path('serial.npy'), 'rb') as a, open(self.path('parallel.npy'), 'rb') as b:
+            self.assertEqual(a.read(), b.read())
+
+    def test_resume_skips_completed_tiles(self):
+        """Test an interrupted run only renders the missing tiles."""
+        path = self.path('map.npy')
+        self.world.generate(path, workers=1)
+        # Simulate an interruption after five tiles
+        with open(path + '.done', 'r+b') as f:
+            f.seek(5)
+            f.write(bytes(7))
+        heights = np.load(path, mmap_mode='r+')
+        heights[32:64, 32:] = 0
+        heights[64:, :] = 0
+        heights.flush()
+        del heights
+
+        stats = self.world.generate(path, workers=1)
+        self.assertEqual((stats['rendered'], stats['skipped']), (7, 5))
+        np.testing.assert_array_equal(np.load(path), self.expected())
+        self.assertEqual(self.world.generate(path, workers=1)['rendered'], 0)
+
+    def test_resume_tile_directory(self):
+        """Test missing tile files are re-rendered on resume."""
+        path = self.path('tiles')
+        self.world.generate(path, layout='tiles', workers=1)
+        os.remove(tile_path(path, 2, 1))
+        stats = self.world.generate(path, layout='tiles', workers=1)
+        self.assertEqual((stats['rendered'], stats['skipped']), (1, 11))
+
+    def test_resume_without_completion_file(self):
+        """Test a .npy store missing its completion file is rejected."""
+        path = self.path('map.npy')
+        self.world.generate(path, workers=1)
+        os.remove(path + '.done')
+        with self.assertRaisesRegex(ValueError, 'resume=False'):
+            self.world.generate(path, workers=1)
+        self.assertEqual(self.world.generate(path, workers=1, resume=False)['rendered'], 12)
+
+    def test_resume_tile_directory_without_manifest(self):
+        """Test tiles are kept, not wiped, when a directory lost its manifest."""
+        path = self.path('tiles')
+        self.world.generate(path, layout='tiles', workers=1)
+        os.remove(os.path.join(path, 'manifest.json'))
+        with self.assertRaisesRegex(ValueError, 'resume=False'):
+            self.world.generate(path, layout='tiles', workers=1)
+        self.assertTrue(os.path.exists(tile_path(path, 0, 0)))
+        stats = self.world.generate(path, layout='tiles', workers=1, resume=False)
+        self.assertEqual(stats['rendered'], 12)
+
+    def test_mismatched_parameters_rejected(self):
+        """Test resuming with other parameters fails unless starting over."""
+        path = self.path('map.npy')
+        self.world.generate(path, workers=1)
+        other = TiledWorld(100, 70, tile_size=32, seed=4, scale=1 / 16, octaves=3)
+        with self.assertRaisesRegex(ValueError, 'world_key'):
+            other.generate(path, workers=1)
+        self.assertEqual(other.generate(path, workers=1, resume=False)['rendered'], 12)
+
+    def test_unknown_layout(self):
+        """Test unknown layouts are rejected."""
+        with self.assertRaises(ValueError):
+            self.world.generate(self.path('map'), layout='zarr')
+
+
+if __name__ == '__main__':
+    unittest.main()
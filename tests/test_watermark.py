@@ -10,11 +10,16 @@ Tests validate:
 - Compliance with COMMERCIAL_LICENSE.md requirements
 """
 
+import hashlib
+import json
 import unittest
+import tempfile
 import time
+import subprocess
 import sys
 import os
 from pathlib import Path
+from unittest import mock
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -27,7 +32,22 @@ from src.gq.watermark import (
     embed_watermark_in_binary,
     extract_watermark_from_binary,
     check_watermark_present,
+    embed_watermark_in_file,
+    read_watermark_trailer,
+    extract_watermark_from_file,
+    check_watermark_in_file,
+    open_watermarked_file,
+    WatermarkKeyring,
+    iter_files,
+    audit_watermarks,
+    summarize_audit,
+    write_watermarked_copy,
+    load_watermark_records,
+    issue_watermarked_copies,
 )
+from src.gq import watermark as watermark_module
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
 
 
 class TestWatermarkData(unittest.TestCase):
@@ -132,8 +152,34 @@ class TestWatermarkEncoding(unittest.TestCase):
         # Check magic bytes
         self.assertEqual(encoded[:4], WatermarkData.MAGIC)
         
-        # Check version
+        # Check version (v1 without a payload digest)
+        self.assertEqual(encoded[4], 1)
+    
+    def test_encode_v2_watermark(self):
+        """Test a payload digest produces a v2 trailer that round-trips."""
+        digest = hashlib.sha256(b"payload").digest()
+        encoded = encode_watermark(self.watermark, self.secret, digest)
+        
+        self.assertEqual(len(encoded), WatermarkData.WATERMARK_SIZE_V2)
         self.assertEqual(encoded[4], WatermarkData.VERSION)
+        decoded = decode_watermark(encoded, self.secret)
+        self.assertEqual(decoded.payload_digest, digest)
+        self.assertEqual(decoded.version, 2)
+        self.assertEqual(decoded.license_id, self.watermark.license_id)
+    
+    def test_v2_digest_is_signed(self):
+        """Test tampering with the stored payload digest breaks the signature."""
+        encoded = bytearray(encode_watermark(
+            self.watermark, self.secret, hashlib.sha256(b"payload").digest()
+        ))
+        encoded[WatermarkData.WATERMARK_SIZE] ^= 0xFF
+        with self.assertRaises(WatermarkError):
+            decode_watermark(bytes(encoded), self.secret)
+    
+    def test_encode_rejects_bad_digest(self):
+        """Test payload digests must be 32 bytes."""
+        with self.assertRaises(WatermarkError):
+            encode_watermark(self.watermark, self.secret, b"short")
     
     def test_decode_watermark(self):
         """Test decoding a watermark."""
@@ -232,7 +278,7 @@ class TestBinaryEmbedding(unittest.TestCase):
         self.assertGreater(len(watermarked), len(self.binary_data))
         self.assertEqual(
             len(watermarked),
-            len(self.binary_data) + WatermarkData.WATERMARK_SIZE
+            len(self.binary_data) + WatermarkData.WATERMARK_SIZE_V2
         )
         
         # Original data should be at the beginning
@@ -356,7 +402,7 @@ class TestEdgeCases(unittest.TestCase):
         watermarked = embed_watermark_in_binary(b'', watermark, secret)
         
         # Should contain only the watermark
-        self.assertEqual(len(watermarked), WatermarkData.WATERMARK_SIZE)
+        self.assertEqual(len(watermarked), WatermarkData.WATERMARK_SIZE_V2)
         
         # Should be extractable
         original, extracted = extract_watermark_from_binary(watermarked, secret)
@@ -410,5 +456,543 @@ class TestEdgeCases(unittest.TestCase):
         self.assertAlmostEqual(decoded.timestamp, timestamp, places=6)
 
 
+class TestWatermarkFiles(unittest.TestCase):
+    """Test suite for tail-only file watermark APIs."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmpdir.name) / "artifact.bin"
+        self.original = bytes(range(256)) * 4000
+        self.path.write_bytes(self.original)
+        self.secret = "file-secret"
+        self.watermark = WatermarkData("LICENSE-FILE-001", "File User", 1700000000.5)
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def test_embed_in_file_matches_in_memory(self):
+        """Test in-place embedding produces the in-memory result."""
+        original_size = embed_watermark_in_file(self.path, self.watermark, self.secret)
+        
+        self.assertEqual(original_size, len(self.original))
+        self.assertEqual(
+            self.path.read_bytes(),
+            embed_watermark_in_binary(self.original, self.watermark, self.secret)
+        )
+    
+    def test_extract_reads_only_trailer(self):
+        """Test trailer-only extraction reads one tail, not the whole file."""
+        embed_watermark_in_file(self.path, self.watermark, self.secret)
+        
+        real_open = open
+        reads = []
+        
+        def tracking_open(*args, **kwargs):
+            f = real_open(*args, **kwargs)
+            real_read = f.read
+            
+            def read(size=-1):
+                data = real_read(size)
+                reads.append(len(data))
+                return data
+            f.read = read
+            return f
+        
+        with mock.patch('builtins.open', tracking_open):
+            original_size, decoded = extract_watermark_from_file(
+                self.path, self.secret, verify_payload=False
+            )
+        
+        self.assertEqual(reads, [WatermarkData.MAX_WATERMARK_SIZE])
+        self.assertEqual(original_size, len(self.original))
+        self.assertEqual(decoded.license_id, "LICENSE-FILE-001")
+        self.assertEqual(decoded.timestamp, 1700000000.5)
+    
+    def test_read_trailer(self):
+        """Test the trailer and original size are returned."""
+        embed_watermark_in_file(self.path, self.watermark, self.secret)
+        original_size, trailer = read_watermark_trailer(self.path)
+        
+        self.assertEqual(original_size, len(self.original))
+        self.assertEqual(trailer, encode_watermark(
+            self.watermark, self.secret, hashlib.sha256(self.original).digest()
+        ))
+    
+    def test_check_watermark_in_file(self):
+        """Test presence checks on watermarked, plain and tiny files."""
+        self.assertFalse(check_watermark_in_file(self.path))
+        embed_watermark_in_file(self.path, self.watermark, self.secret)
+        self.assertTrue(check_watermark_in_file(self.path))
+        
+        tiny = Path(self.tmpdir.name) / "tiny.bin"
+        tiny.write_bytes(b"SEED")
+        self.assertFalse(check_watermark_in_file(tiny))
+        self.assertFalse(check_watermark_in_file(Path(self.tmpdir.name) / "missing"))
+    
+    def test_extract_errors(self):
+        """Test wrong secrets, unwatermarked and tiny files raise WatermarkError."""
+        with self.assertRaises(WatermarkError):
+            extract_watermark_from_file(self.path, self.secret)
+        
+        embed_watermark_in_file(self.path, self.watermark, self.secret)
+        with self.assertRaises(WatermarkError):
+            extract_watermark_from_file(self.path, "wrong-secret")
+        
+        tiny = Path(self.tmpdir.name) / "tiny.bin"
+        tiny.write_bytes(b"x")
+        with self.assertRaises(WatermarkError):
+            read_watermark_trailer(tiny)
+    
+    def test_open_watermarked_file_payload_view(self):
+        """Test the mapped payload is a zero-copy view of the original data."""
+        embed_watermark_in_file(self.path, self.watermark, self.secret)
+        
+        with open_watermarked_file(self.path, self.secret) as (payload, decoded):
+            self.assertIsInstance(payload, memoryview)
+            self.assertTrue(payload.readonly)
+            self.assertEqual(len(payload), len(self.original))
+            self.assertEqual(hashlib.sha256(payload).digest(),
+                             hashlib.sha256(self.original).digest())
+            self.assertEqual(decoded.user_info, "File User")
+        
+        with self.assertRaises(ValueError):
+            payload[0]  # Released on exit
+    
+    def test_open_watermarked_file_empty_payload(self):
+        """Test a file holding only a trailer maps to an empty payload."""
+        self.path.write_bytes(b"")
+        embed_watermark_in_file(self.path, self.watermark, self.secret)
+        with open_watermarked_file(self.path, self.secret) as (payload, _):
+            self.assertEqual(len(payload), 0)
+    
+    def test_scripts_create_and_verify(self):
+        """Test the create and verify scripts use the file APIs end to end."""
+        output = Path(self.tmpdir.name) / "out" / "licensed.bin"
+        create = subprocess.run(
+            [sys.executable, str(REPO_ROOT / "scripts" / "create_watermarked_binary.py"),
+             "--input", str(self.path), "--output", str(output),
+             "--license-id", "LIC-SCRIPT", "--user-info", "Script User",
+             "--secret", self.secret],
+            capture_output=True, text=True, cwd=REPO_ROOT
+        )
+        self.assertEqual(create.returncode, 0, create.stderr)
+        self.assertEqual(self.path.read_bytes(), self.original)
+        self.assertEqual(output.stat().st_size,
+                         len(self.original) + WatermarkData.WATERMARK_SIZE_V2)
+        
+        verify = subprocess.run(
+            [sys.executable, str(REPO_ROOT / "scripts" / "verify_watermark.py"),
+             "--input", str(output), "--secret", self.secret, "--json"],
+            capture_output=True, text=True, cwd=REPO_ROOT
+        )
+        self.assertEqual(verify.returncode, 0, verify.stderr)
+        self.assertIn('"license_id": "LIC-SCRIPT"', verify.stdout)
+        self.assertIn(f'"original_size": {len(self.original)}', verify.stdout)
+
+    def test_verify_script_no_watermark(self):
+        """Test unwatermarked and too-small files verify as not watermarked."""
+        tiny = Path(self.tmpdir.name) / "tiny.bin"
+        tiny.write_bytes(b"ab")
+        for path in (self.path, tiny):
+            verify = subprocess.run(
+                [sys.executable, str(REPO_ROOT / "scripts" / "verify_watermark.py"),
+                 "--input", str(path), "--secret", self.secret, "--json"],
+                capture_output=True, text=True, cwd=REPO_ROOT
+            )
+            self.assertIn('"watermarked": false', verify.stdout)
+            self.assertIn('"error": "No watermark found in binary file"', verify.stdout)
+
+
+
+class TestWatermarkPayloadDigest(unittest.TestCase):
+    """Test suite for v2 trailers committing to the payload."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        self.secret = "digest-secret"
+        self.watermark = WatermarkData("LIC-V2", "Digest User", 1700000000.0)
+        self.data_a = b"A" * 5000
+        self.data_b = b"B" * 5000
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def moved_trailer(self):
+        """Return data_b carrying the trailer issued for data_a."""
+        issued = embed_watermark_in_binary(self.data_a, self.watermark, self.secret)
+        return self.data_b + issued[len(self.data_a):]
+    
+    def test_v2_detects_moved_trailer(self):
+        """Test a v2 trailer moved onto other content fails verification."""
+        with self.assertRaises(WatermarkError) as context:
+            extract_watermark_from_binary(self.moved_trailer(), self.secret)
+        self.assertIn("Payload digest mismatch", str(context.exception))
+    
+    def test_v2_detects_moved_trailer_in_file(self):
+        """Test file extraction and mapping check the payload digest."""
+        path = self.root / "moved.bin"
+        path.write_bytes(self.moved_trailer())
+        
+        with self.assertRaises(WatermarkError):
+            extract_watermark_from_file(path, self.secret)
+        with self.assertRaises(WatermarkError):
+            with open_watermarked_file(path, self.secret):
+                pass
+        
+        # The trailer itself is still authentic
+        _, decoded = extract_watermark_from_file(path, self.secret, verify_payload=False)
+        self.assertEqual(decoded.license_id, "LIC-V2")
+    
+    def test_v1_trailers_still_read(self):
+        """Test v1 trailers are decoded by every reader."""
+        watermarked = embed_watermark_in_binary(self.data_a, self.watermark,
+                                                self.secret, version=1)
+        self.assertEqual(len(watermarked), len(self.data_a) + WatermarkData.WATERMARK_SIZE)
+        self.assertTrue(check_watermark_present(watermarked))
+        original, decoded = extract_watermark_from_binary(watermarked, self.secret)
+        self.assertEqual(original, self.data_a)
+        self.assertEqual(decoded.version, 1)
+        
+        path = self.root / "v1.bin"
+        path.write_bytes(self.data_a)
+        embed_watermark_in_file(path, self.watermark, self.secret, version=1)
+        self.assertEqual(path.read_bytes(), watermarked)
+        self.assertEqual(extract_watermark_from_file(path, self.secret)[0], len(self.data_a))
+        with open_watermarked_file(path, self.secret) as (payload, wm):
+            self.assertEqual(bytes(payload), self.data_a)
+            self.assertEqual(wm.payload_digest, b"")
+    
+    def test_embed_in_file_matches_in_memory(self):
+        """Test streamed file hashing matches the in-memory digest."""
+        path = self.root / "v2.bin"
+        path.write_bytes(self.data_a)
+        with mock.patch.object(watermark_module, "COPY_CHUNK_SIZE", 999):
+            embed_watermark_in_file(path, self.watermark, self.secret)
+        self.assertEqual(
+            path.read_bytes(),
+            embed_watermark_in_binary(self.data_a, self.watermark, self.secret)
+        )
+    
+    def test_unsupported_version_rejected(self):
+        """Test embedding with an unknown version fails."""
+        with self.assertRaises(WatermarkError):
+            embed_watermark_in_binary(self.data_a, self.watermark, self.secret, version=3)
+    
+    def test_base_digest_cached(self):
+        """Test bulk issuance hashes the base file once."""
+        base = self.root / "base.bin"
+        base.write_bytes(self.data_a)
+        records = [WatermarkData(f"LIC-{i}", "User") for i in range(5)]
+        
+        with mock.patch.object(watermark_module, "_sha256_file",
+                               wraps=watermark_module._sha256_file) as hashed:
+            watermark_module._cached_sha256_file.cache_clear()
+            manifest = issue_watermarked_copies(base, records, self.secret,
+                                                self.root / "out", max_workers=3)
+        
+        self.assertEqual(hashed.call_count, 1)
+        expected = hashlib.sha256(self.data_a).hexdigest()
+        self.assertTrue(all(m['payload_sha256'] == expected for m in manifest))
+        for entry in manifest:
+            self.assertEqual(extract_watermark_from_file(entry['file'], self.secret)[0],
+                             len(self.data_a))
+    
+    def test_audit_verify_payload(self):
+        """Test audits check payload digests only when asked."""
+        path = self.root / "moved.bin"
+        path.write_bytes(self.moved_trailer())
+        keyring = WatermarkKeyring(self.secret)
+        
+        quick = next(audit_watermarks([path], keyring))
+        self.assertTrue(quick['verified'])
+        self.assertIsNone(quick['payload_verified'])
+        self.assertEqual(quick['version'], 2)
+        
+        full = next(audit_watermarks([path], keyring, verify_payload=True))
+        self.assertFalse(full['verified'])
+        self.assertFalse(full['payload_verified'])
+
+
+class TestWatermarkAudit(unittest.TestCase):
+    """Test suite for keyring verification and directory audits."""
+    
+    def setUp(self):
+        """Build a small mirror tree with mixed files."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        self.old_secret = "old-secret"
+        self.new_secret = "new-secret"
+        
+        self.files = {
+            "a/new.bin": self.new_secret,
+            "a/b/old.bin": self.old_secret,
+            "a/b/rogue.bin": "unknown-secret",
+            "c/plain.bin": None,
+            "c/tiny.bin": None,
+        }
+        for name, secret in self.files.items():
+            path = self.root / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b"x" if name.endswith("tiny.bin") else b"payload" * 100)
+            if secret is not None:
+                watermark = WatermarkData(f"LIC-{path.stem}", "Mirror", 1700000000.0)
+                embed_watermark_in_file(path, watermark, secret)
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def test_keyring_matches_decode(self):
+        """Test keyring verification agrees with decode_watermark."""
+        watermark = WatermarkData("LIC-KEY", "User", 1700000000.0)
+        encoded = encode_watermark(watermark, self.old_secret)
+        keyring = WatermarkKeyring([self.new_secret, self.old_secret])
+        
+        decoded, key_index = keyring.verify(encoded)
+        
+        self.assertEqual(key_index, 1)
+        self.assertEqual(decoded.to_dict(),
+                         decode_watermark(encoded, self.old_secret).to_dict())
+        self.assertEqual(len(keyring), 2)
+    
+    def test_keyring_is_reusable(self):
+        """Test the precomputed HMAC state is not consumed by verification."""
+        keyring = WatermarkKeyring(self.new_secret)
+        for i in range(3):
+            encoded = encode_watermark(WatermarkData(f"LIC-{i}", "User"), self.new_secret)
+            self.assertEqual(keyring.verify(encoded)[0].license_id, f"LIC-{i}")
+    
+    def test_keyring_rejects_unknown_secret(self):
+        """Test verification fails when no secret matches."""
+        encoded = encode_watermark(WatermarkData("LIC", "User"), "other")
+        with self.assertRaises(WatermarkError):
+            WatermarkKeyring([self.new_secret, self.old_secret]).verify(encoded)
+    
+    def test_keyring_requires_secret(self):
+        """Test an empty keyring is rejected."""
+        with self.assertRaises(WatermarkError):
+            WatermarkKeyring([])
+    
+    def test_iter_files_walks_in_order(self):
+        """Test recursive walking yields every file in a stable order."""
+        found = [os.path.relpath(p, self.root) for p in iter_files([self.root])]
+        self.assertEqual(found, [os.path.normpath(n) for n in self.files])
+    
+    @unittest.skipUnless(hasattr(os, 'mkfifo'), "FIFOs not supported")
+    def test_iter_files_skips_special_files(self):
+        """Test FIFOs are skipped instead of blocking the audit."""
+        fifo = self.root / "a" / "pipe"
+        os.mkfifo(fifo)
+        try:
+            self.assertNotIn(str(fifo), list(iter_files([self.root])))
+            self.assertEqual(list(iter_files([fifo])), [])
+            keyring = WatermarkKeyring([self.new_secret, self.old_secret])
+            audited = list(audit_watermarks([self.root], keyring, max_workers=2))
+            self.assertEqual(len(audited), len(self.files))
+        finally:
+            os.unlink(fifo)
+    
+    def test_audit_results(self):
+        """Test each file is classified correctly."""
+        keyring = WatermarkKeyring([self.new_secret, self.old_secret])
+        results = {
+            os.path.relpath(r['file'], self.root).replace(os.sep, "/"): r
+            for r in audit_watermarks([self.root], keyring, max_workers=3)
+        }
+        
+        self.assertEqual(set(results), set(self.files))
+        self.assertEqual(results["a/new.bin"]['key_index'], 0)
+        self.assertEqual(results["a/b/old.bin"]['key_index'], 1)
+        self.assertEqual(results["a/b/old.bin"]['watermark']['license_id'], "LIC-old")
+        self.assertEqual(results["a/b/old.bin"]['original_size'], 700)
+        self.assertTrue(results["a/b/rogue.bin"]['watermarked'])
+        self.assertFalse(results["a/b/rogue.bin"]['verified'])
+        self.assertFalse(results["c/plain.bin"]['watermarked'])
+        self.assertEqual(results["c/tiny.bin"]['file_size'], 1)
+    
+    def test_audit_order_independent_of_workers(self):
+        """Test results stream in walk order for any thread count."""
+        keyring = WatermarkKeyring([self.new_secret, self.old_secret])
+        serial = list(audit_watermarks([self.root], keyring, max_workers=1))
+        parallel = list(audit_watermarks([self.root], keyring, max_workers=8))
+        self.assertEqual(serial, parallel)
+        self.assertEqual([r['file'] for r in serial], list(iter_files([self.root])))
+    
+    def test_audit_missing_file(self):
+        """Test unreadable paths are reported, not raised."""
+        keyring = WatermarkKeyring(self.new_secret)
+        results = list(audit_watermarks([self.root / "missing.bin"], keyring))
+        self.assertEqual(len(results), 1)
+        self.assertIsNone(results[0]['file_size'])
+        self.assertIn("Failed to read watermark", results[0]['error'])
+    
+    def test_summarize_audit(self):
+        """Test summary counts."""
+        keyring = WatermarkKeyring([self.new_secret, self.old_secret])
+        paths = [self.root, self.root / "missing.bin"]
+        summary = summarize_audit(audit_watermarks(paths, keyring))
+        
+        self.assertEqual(summary['total'], 6)
+        self.assertEqual(summary['verified'], 2)
+        self.assertEqual(summary['failed'], 1)
+        self.assertEqual(summary['unwatermarked'], 2)
+        self.assertEqual(summary['errors'], 1)
+        self.assertEqual(summary['verified_by_key'], {0: 1, 1: 1})
+    
+    def test_verify_script_audit(self):
+        """Test the verify script streams JSON lines and a summary."""
+        keyring_file = self.root / "keyring.txt"
+        keyring_file.write_text(f"# rotated keys\n{self.old_secret}\n")
+        audit = subprocess.run(
+            [sys.executable, str(REPO_ROOT / "scripts" / "verify_watermark.py"),
+             "--audit", str(self.root / "a"), "--secret", self.new_secret,
+             "--keyring", str(keyring_file), "--workers", "2"],
+            capture_output=True, text=True, cwd=REPO_ROOT
+        )
+        
+        # rogue.bin fails verification, so the audit exits non-zero
+        self.assertEqual(audit.returncode, 1, audit.stderr)
+        lines = [json.loads(line) for line in audit.stdout.splitlines()]
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(lines[-1]['summary']['verified'], 2)
+        self.assertEqual(lines[-1]['summary']['failed'], 1)
+        self.assertIn("Audited 3 files", audit.stderr)
+
+
+
+class TestWatermarkIssuance(unittest.TestCase):
+    """Test suite for bulk issuance of watermarked copies."""
+    
+    def setUp(self):
+        """Set up a base file and records."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        self.base = self.root / "seed.bin"
+        self.original = bytes(range(256)) * 5000
+        self.base.write_bytes(self.original)
+        self.secret = "issue-secret"
+        self.records = [
+            WatermarkData(f"LIC-{i:03d}", f"Customer {i}", 1700000000.0 + i)
+            for i in range(12)
+        ]
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def test_write_copy_matches_in_memory(self):
+        """Test a copy equals the in-memory embedding and sets the signature."""
+        output = self.root / "copy.bin"
+        watermark = self.records[0]
+        
+        original_size = write_watermarked_copy(self.base, output, watermark, self.secret)
+        
+        self.assertEqual(original_size, len(self.original))
+        expected = embed_watermark_in_binary(self.original, watermark, self.secret)
+        self.assertEqual(output.read_bytes(), expected)
+        self.assertEqual(watermark.signature, expected[-WatermarkData.SIGNATURE_SIZE:])
+        self.assertFalse(Path(f"{output}.tmp").exists())
+    
+    def test_copy_fallbacks_match(self):
+        """Test the sendfile and read/write fallbacks produce identical copies."""
+        expected = embed_watermark_in_binary(self.original, self.records[0], self.secret)
+        unsupported = mock.Mock(side_effect=OSError("not supported"))
+        with mock.patch.object(watermark_module, "_reflink", return_value=False), \
+                mock.patch.object(watermark_module, "COPY_CHUNK_SIZE", 4096):
+            for failing in (["copy_file_range"], ["copy_file_range", "sendfile"]):
+                output = self.root / f"copy-{len(failing)}.bin"
+                patches = [mock.patch.object(os, name, unsupported, create=True)
+                           for name in failing]
+                for patch in patches:
+                    patch.start()
+                try:
+                    write_watermarked_copy(self.base, output, self.records[0], self.secret)
+                finally:
+                    for patch in patches:
+                        patch.stop()
+                self.assertEqual(output.read_bytes(), expected)
+    
+    def test_issue_copies_and_manifest(self):
+        """Test every copy verifies and the manifest records its signature."""
+        out_dir = self.root / "out"
+        manifest_path = self.root / "manifest.json"
+        
+        manifest = issue_watermarked_copies(
+            self.base, self.records, self.secret, out_dir,
+            manifest_path=manifest_path, max_workers=4
+        )
+        
+        self.assertEqual([m['license_id'] for m in manifest],
+                         [r.license_id for r in self.records])
+        for entry in manifest:
+            self.assertEqual(Path(entry['file']).name, f"seed-{entry['license_id']}.bin")
+            original_size, watermark = extract_watermark_from_file(entry['file'], self.secret)
+            self.assertEqual(original_size, len(self.original))
+            self.assertEqual(watermark.license_id, entry['license_id'])
+            self.assertEqual(watermark.signature.hex(), entry['signature'])
+        
+        document = json.loads(manifest_path.read_text())
+        self.assertEqual(document['copies'], manifest)
+        self.assertEqual(self.base.read_bytes(), self.original)
+    
+    def test_issue_rejects_bad_names(self):
+        """Test unsafe or duplicate output names fail before writing."""
+        out_dir = self.root / "out"
+        bad = [WatermarkData("../escape", "User")]
+        with self.assertRaises(WatermarkError):
+            issue_watermarked_copies(self.base, bad, self.secret, out_dir)
+        with self.assertRaises(WatermarkError):
+            issue_watermarked_copies(self.base, self.records, self.secret, out_dir,
+                                     name_template="same.bin")
+        self.assertFalse(out_dir.exists())
+    
+    def test_load_records_csv_and_json(self):
+        """Test CSV and JSON record files load identically."""
+        csv_path = self.root / "licenses.csv"
+        csv_path.write_text("license_id,user_info,timestamp\n"
+                            "LIC-A,Acme Corp,1700000000.5\n"
+                            "LIC-B,\"Beta, Inc\",\n")
+        json_path = self.root / "licenses.json"
+        json_path.write_text(json.dumps([
+            {"license_id": "LIC-A", "user_info": "Acme Corp", "timestamp": 1700000000.5},
+            {"license_id": "LIC-B", "user_info": "Beta, Inc"},
+        ]))
+        
+        for path in (csv_path, json_path):
+            records = load_watermark_records(path)
+            self.assertEqual([r.license_id for r in records], ["LIC-A", "LIC-B"])
+            self.assertEqual(records[1].user_info, "Beta, Inc")
+            self.assertEqual(records[0].timestamp, 1700000000.5)
+    
+    def test_load_records_invalid(self):
+        """Test malformed records raise WatermarkError."""
+        path = self.root / "bad.json"
+        path.write_text(json.dumps([{"license_id": "LIC"}]))
+        with self.assertRaises(WatermarkError):
+            load_watermark_records(path)
+        path.write_text(json.dumps({"license_id": "LIC"}))
+        with self.assertRaises(WatermarkError):
+            load_watermark_records(path)
+    
+    def test_issue_script(self):
+        """Test the bulk issuance script end to end."""
+        records = self.root / "licenses.csv"
+        records.write_text("license_id,user_info\nLIC-1,One\nLIC-2,Two\n")
+        out_dir = self.root / "licensed"
+        
+        issue = subprocess.run(
+            [sys.executable, str(REPO_ROOT / "scripts" / "issue_watermarked_binaries.py"),
+             "--input", str(self.base), "--records", str(records),
+             "--output-dir", str(out_dir), "--secret", self.secret, "--workers", "2"],
+            capture_output=True, text=True, cwd=REPO_ROOT
+        )
+        
+        self.assertEqual(issue.returncode, 0, issue.stderr)
+        manifest = json.loads((out_dir / "manifest.json").read_text())
+        self.assertEqual(len(manifest['copies']), 2)
+        self.assertTrue(check_watermark_in_file(out_dir / "seed-LIC-2.bin"))
+
+
 if __name__ == '__main__':
     unittest.main()
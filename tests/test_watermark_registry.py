@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the License Registry
+
+Tests validate:
+- Bulk ingestion of issued watermarks and manifests
+- Signature, trailer and file lookups
+- Batch lookups with verification via decode_watermark
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.gq import watermark_registry
+from src.gq.watermark import (
+    WatermarkData,
+    WatermarkError,
+    encode_watermark,
+    issue_watermarked_copies,
+)
+from src.gq.watermark_registry import LicenseRegistry
+
+
+class TestLicenseRegistry(unittest.TestCase):
+    """Test suite for LicenseRegistry."""
+
+    def setUp(self):
+        """Set up a registry with issued records."""
+        self.secret = "registry-secret"
+        self.records = [
+            WatermarkData(f"LIC-{i:04d}", f"Customer {i}", 1700000000.0 + i)
+            for i in range(50)
+        ]
+        self.trailers = [encode_watermark(r, self.secret) for r in self.records]
+        self.registry = LicenseRegistry()
+        self.registry.ingest(self.records, secret=self.secret)
+
+    def tearDown(self):
+        self.registry.close()
+
+    def test_ingest_count(self):
+        """Test all records are inserted once."""
+        self.assertEqual(len(self.registry), 50)
+        self.assertEqual(self.registry.ingest(self.records, secret=self.secret), 0)
+        self.assertEqual(len(self.registry), 50)
+
+    def test_ingest_requires_signature_or_secret(self):
+        """Test unsigned records need a secret."""
+        with self.assertRaises(WatermarkError):
+            self.registry.ingest([WatermarkData("LIC-NEW", "User")])
+
+    def test_lookup_signature(self):
+        """Test signatures resolve to their license."""
+        signature = self.trailers[7][-WatermarkData.SIGNATURE_SIZE:]
+        record = self.registry.lookup_signature(signature)
+        self.assertEqual(record['license_id'], "LIC-0007")
+        self.assertEqual(record['user_info'], "Customer 7")
+        self.assertEqual(record['signature'], signature.hex())
+        self.assertIsNone(self.registry.lookup_signature(b"\x00" * 32))
+
+    def test_lookup_trailer(self):
+        """Test a verified trailer resolves to its license."""
+        result = self.registry.lookup_trailer(self.trailers[3], self.secret)
+        self.assertTrue(result['verified'])
+        self.assertTrue(result['registered'])
+        self.assertEqual(result['license']['license_id'], "LIC-0003")
+        self.assertIsNone(result['error'])
+
+    def test_lookup_trailer_wrong_secret(self):
+        """Test trailers failing verification are not resolved."""
+        result = self.registry.lookup_trailer(self.trailers[3], "wrong-secret")
+        self.assertFalse(result['verified'])
+        self.assertIsNone(result['license'])
+        self.assertIn("Signature verification failed", result['error'])
+
+    def test_lookup_unregistered(self):
+        """Test a valid but unissued trailer is reported as unregistered."""
+        trailer = encode_watermark(WatermarkData("LIC-ROGUE", "Nobody"), self.secret)
+        result = self.registry.lookup_trailer(trailer, self.secret)
+        self.assertTrue(result['verified'])
+        self.assertFalse(result['registered'])
+        self.assertIn("not found", result['error'])
+
+    def test_batch_lookup_matches_single(self):
+        """Test batch lookups agree with single lookups, in input order."""
+        trailers = list(reversed(self.trailers)) + [b"junk", self.trailers[0]]
+        original_batch = watermark_registry.LOOKUP_BATCH_SIZE
+        watermark_registry.LOOKUP_BATCH_SIZE = 7
+        try:
+            results = self.registry.lookup_trailers(trailers, self.secret)
+        finally:
+            watermark_registry.LOOKUP_BATCH_SIZE = original_batch
+
+        self.assertEqual(len(results), len(trailers))
+        for trailer, result in zip(trailers, results):
+            self.assertEqual(result, self.registry.lookup_trailer(trailer, self.secret))
+        self.assertEqual(results[0]['license']['license_id'], "LIC-0049")
+        self.assertFalse(results[-2]['verified'])
+        self.assertEqual(results[-1]['license']['license_id'], "LIC-0000")
+
+    def test_persistent_registry(self):
+        """Test a file-backed registry keeps its records."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "licenses.db"
+            with LicenseRegistry(path) as registry:
+                registry.ingest(self.records[:5], secret=self.secret)
+            with LicenseRegistry(path) as registry:
+                self.assertEqual(len(registry), 5)
+                result = registry.lookup_trailer(self.trailers[4], self.secret)
+                self.assertEqual(result['license']['license_id'], "LIC-0004")
+
+
+class TestRegistryManifest(unittest.TestCase):
+    """Test suite for ingesting issuance manifests."""
+
+    def test_manifest_to_file_lookup(self):
+        """Test issued copies are traced back through the manifest."""
+        secret = "manifest-secret"
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            base = root / "seed.bin"
+            base.write_bytes(bytes(range(256)) * 64)
+            records = [WatermarkData(f"LIC-{i}", f"Org {i}") for i in range(6)]
+            manifest_path = root / "manifest.json"
+            issue_watermarked_copies(base, records, secret, root / "out",
+                                     manifest_path=manifest_path)
+
+            with LicenseRegistry() as registry:
+                self.assertEqual(registry.ingest_manifest(manifest_path), 6)
+                leaked = root / "out" / "seed-LIC-4.bin"
+                result = registry.lookup_file(leaked, secret)
+
+                self.assertTrue(result['registered'])
+                self.assertEqual(result['license']['user_info'], "Org 4")
+                self.assertEqual(result['license']['version'], 2)
+                self.assertEqual(result['license']['file'], str(leaked))
+
+                missing = registry.lookup_file(root / "missing.bin", secret)
+                self.assertFalse(missing['verified'])
+
+    def test_manifest_errors(self):
+        """Test unreadable manifests raise WatermarkError."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "manifest.json"
+            path.write_text('{"copies": [{"license_id": "LIC"}]}')
+            with LicenseRegistry() as registry:
+                with self.assertRaises(WatermarkError):
+                    registry.ingest_manifest(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
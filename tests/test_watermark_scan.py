@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Embedded Watermark Scanner
+
+Tests validate:
+- Windowed MAGIC search, including matches across window boundaries
+- Structural validation of candidate trailers
+- Keyring verification of embedded v1 and v2 trailers
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.gq.watermark import (
+    WatermarkData,
+    WatermarkError,
+    WatermarkKeyring,
+    embed_watermark_in_binary,
+    encode_watermark,
+)
+from src.gq.watermark_scan import (
+    find_magic_offsets,
+    validate_trailer_structure,
+    scan_buffer,
+    scan_file,
+)
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+class TestFindMagic(unittest.TestCase):
+    """Test suite for windowed MAGIC search."""
+
+    def test_offsets_independent_of_window(self):
+        """Test every window size finds the same offsets exactly once."""
+        data = bytearray(b"\x00" * 1000)
+        expected = [0, 97, 98 + 3, 500, 996]
+        for offset in expected:
+            data[offset:offset + 4] = WatermarkData.MAGIC
+        data = bytes(data)
+        reference = [i for i in range(len(data)) if data.startswith(WatermarkData.MAGIC, i)]
+
+        for window in (1, 3, 4, 5, 64, 99, 100, 1000, 4096):
+            self.assertEqual(list(find_magic_offsets(data, window)), reference, window)
+
+    def test_invalid_window(self):
+        """Test non-positive window sizes are rejected."""
+        with self.assertRaises(ValueError):
+            list(find_magic_offsets(b"SEED", 0))
+
+
+class TestTrailerStructure(unittest.TestCase):
+    """Test suite for structural validation."""
+
+    def setUp(self):
+        self.trailer = encode_watermark(WatermarkData("LIC-1", "User", 1700000000.0), "s")
+
+    def test_valid_trailers(self):
+        """Test real v1 and v2 trailers validate."""
+        self.assertEqual(validate_trailer_structure(self.trailer), 1)
+        v2 = encode_watermark(WatermarkData("LIC-2", "User"), "s", b"\x11" * 32)
+        self.assertEqual(validate_trailer_structure(v2), 2)
+
+    def test_rejects_malformed(self):
+        """Test chance MAGIC occurrences are rejected."""
+        self.assertIsNone(validate_trailer_structure(b"SEED\x01"))
+        self.assertIsNone(validate_trailer_structure(b"SEED\x07" + b"\x00" * 300))
+
+        garbage_padding = bytearray(self.trailer)
+        garbage_padding[60] = 0x41  # Non-zero byte after the license ID padding
+        self.assertIsNone(validate_trailer_structure(bytes(garbage_padding)))
+
+        bad_utf8 = bytearray(self.trailer)
+        bad_utf8[5] = 0xFF
+        self.assertIsNone(validate_trailer_structure(bytes(bad_utf8)))
+
+        bad_time = bytearray(self.trailer)
+        bad_time[197:205] = b"\x7f\xf8" + b"\x00" * 6  # NaN
+        self.assertIsNone(validate_trailer_structure(bytes(bad_time)))
+
+
+class TestScanner(unittest.TestCase):
+    """Test suite for scanning buffers and files."""
+
+    def setUp(self):
+        """Build a container holding several watermarked binaries."""
+        self.secret = "scan-secret"
+        self.parts = []
+        blob = bytearray(b"header" + b"SEED-noise" * 10)
+        self.offsets = []
+        for i, version in enumerate((1, 2, 2)):
+            payload = bytes(range(256)) * (i + 3)
+            watermarked = embed_watermark_in_binary(
+                payload, WatermarkData(f"LIC-{i}", f"Org {i}", 1700000000.0 + i),
+                self.secret, version=version
+            )
+            self.offsets.append(len(blob) + len(payload))
+            blob += watermarked + b"\x00padding\x00" * 5
+        self.blob = bytes(blob)
+
+    def test_scan_finds_all(self):
+        """Test every embedded trailer is found and verified."""
+        results = scan_buffer(self.blob, self.secret)
+        self.assertEqual([r['offset'] for r in results], self.offsets)
+        self.assertEqual([r['version'] for r in results], [1, 2, 2])
+        self.assertTrue(all(r['verified'] for r in results))
+        self.assertEqual([r['watermark']['license_id'] for r in results],
+                         ["LIC-0", "LIC-1", "LIC-2"])
+        self.assertNotIn('trailer', results[0])
+
+    def test_scan_across_windows_and_workers(self):
+        """Test tiny windows and process-parallel verification give the same result."""
+        import src.gq.watermark_scan as watermark_scan
+        reference = scan_buffer(self.blob, self.secret)
+        original = watermark_scan.VERIFY_BATCH_SIZE, watermark_scan.PARALLEL_VERIFY_MIN_CANDIDATES
+        # Force the process pool path with one candidate per task
+        watermark_scan.VERIFY_BATCH_SIZE = watermark_scan.PARALLEL_VERIFY_MIN_CANDIDATES = 1
+        try:
+            for window in (7, 100, 237):
+                self.assertEqual(
+                    scan_buffer(self.blob, self.secret, window_size=window, max_workers=3),
+                    reference
+                )
+            self.assertEqual(scan_buffer(self.blob, WatermarkKeyring(["old", self.secret]),
+                                         max_workers=2)[0]['key_index'], 1)
+        finally:
+            (watermark_scan.VERIFY_BATCH_SIZE,
+             watermark_scan.PARALLEL_VERIFY_MIN_CANDIDATES) = original
+
+    def test_scan_without_keyring(self):
+        """Test structural scanning without secrets."""
+        results = scan_buffer(self.blob)
+        self.assertEqual(len(results), 3)
+        self.assertTrue(all(r['verified'] is None for r in results))
+
+    def test_scan_keyring_and_wrong_secret(self):
+        """Test keyrings and failed verification."""
+        keyring = WatermarkKeyring(["other", self.secret])
+        self.assertTrue(all(r['key_index'] == 1 for r in scan_buffer(self.blob, keyring)))
+
+        failed = scan_buffer(self.blob, "wrong")
+        self.assertFalse(any(r['verified'] for r in failed))
+        self.assertIn("Signature verification failed", failed[0]['error'])
+
+    def test_scan_file(self):
+        """Test memory-mapped file scanning matches buffer scanning."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "bundle.tar"
+            path.write_bytes(self.blob)
+            self.assertEqual(scan_file(path, self.secret, window_size=4096),
+                             scan_buffer(self.blob, self.secret))
+
+            empty = Path(tmpdir) / "empty.bin"
+            empty.write_bytes(b"")
+            self.assertEqual(scan_file(empty, self.secret), [])
+
+            with self.assertRaises(WatermarkError):
+                scan_file(Path(tmpdir) / "missing.bin")
+
+    def test_verify_script_scan(self):
+        """Test the verify script reports embedded trailers as JSON lines."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "bundle.tar"
+            path.write_bytes(self.blob)
+            scan = subprocess.run(
+                [sys.executable, str(REPO_ROOT / "scripts" / "verify_watermark.py"),
+                 "--scan", str(path), "--secret", self.secret],
+                capture_output=True, text=True, cwd=REPO_ROOT
+            )
+
+        self.assertEqual(scan.returncode, 0, scan.stderr)
+        lines = [json.loads(line) for line in scan.stdout.splitlines()]
+        self.assertEqual([line['offset'] for line in lines[:-1]], self.offsets)
+        self.assertEqual(lines[-1]['summary']['verified'], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()